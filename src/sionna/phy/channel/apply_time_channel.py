@@ -5,7 +5,6 @@
 
 import tensorflow as tf
 import numpy as np
-import scipy
 
 from sionna.phy import Block
 from sionna.phy.utils import insert_dims
@@ -38,6 +37,12 @@ class ApplyTimeChannel(Block):
     For multiple-input multiple-output (MIMO) links, the channel output is computed for each antenna
     of each receiver and by summing over all the antennas of all transmitters.
 
+    The channel outputs are computed in blocks of ``block_size`` time samples
+    (overlap-add). For each block, only the required
+    ``block_size`` :math:`\times` ``l_tot`` channel inputs are gathered, which
+    bounds the memory of the intermediate tensors for long inputs and large
+    delay spreads. The outputs do not depend on the block size.
+
     Parameters
     ----------
     num_time_samples : `int`
@@ -46,6 +51,14 @@ class ApplyTimeChannel(Block):
     l_tot : `int`
         Length of the channel filter (:math:`L_{\text{tot}} = L_{\text{max}} - L_{\text{min}} + 1`)
 
+    block_size : "auto" (default) | `None` | `int`
+        Number of channel output samples computed at once.
+        If "auto", all samples are computed at once if
+        (``num_time_samples`` + ``l_tot`` - 1) :math:`\times` ``l_tot`` does
+        not exceed :math:`2^{18}`, otherwise the block size is set to
+        :math:`\lfloor 2^{18}/` ``l_tot`` :math:`\rfloor`.
+        If `None`, all samples are computed at once.
+
     precision : `None` (default) | "single" | "double"
         Precision used for internal calculations and outputs.
         If set to `None`,
@@ -82,10 +95,29 @@ class ApplyTimeChannel(Block):
         ``l_tot``.
     """
 
-    def __init__(self, num_time_samples, l_tot, precision=None, **kwargs):
+    # Maximum number of gathered channel inputs per link and block if
+    # ``block_size`` is "auto"
+    _MAX_BLOCK_ELEMENTS = 2**18
+
+    def __init__(self, num_time_samples, l_tot, block_size="auto",
+                 precision=None, **kwargs):
         super().__init__(precision=precision, **kwargs)
         self._awgn = AWGN(precision=self.precision)
 
+        num_out_samples = num_time_samples + l_tot - 1
+        if block_size == "auto":
+            if num_out_samples*l_tot <= self._MAX_BLOCK_ELEMENTS:
+                block_size = None
+            else:
+                block_size = max(self._MAX_BLOCK_ELEMENTS // l_tot, 1)
+        elif block_size is not None:
+            if not isinstance(block_size, int) or block_size < 1:
+                raise ValueError("`block_size` must be 'auto', None, "
+                                 "or a positive integer")
+        if block_size is None:
+            block_size = num_out_samples
+        self._block_size = block_size
+
         # The channel transfert function is implemented by first gathering from
         # the vector of transmitted baseband symbols
         # x = [x_0,...,x_{num_time_samples-1}]^T  the symbols that are then
@@ -113,10 +145,22 @@ class ApplyTimeChannel(Block):
         # In this example, the index `num_time_samples`=10 corresponds to the
         # zero symbol. The vector of transmitted symbols is padded with one
         # zero at the end.
-        first_colum = np.concatenate([  np.arange(0, num_time_samples),
-                                        np.full([l_tot-1], num_time_samples)])
-        first_row = np.concatenate([[0], np.full([l_tot-1], num_time_samples)])
-        self._g = scipy.linalg.toeplitz(first_colum, first_row)
+        # G is split into blocks of `block_size` rows, i.e., one block per
+        # block of channel outputs.
+        self._g = []
+        for start in range(0, num_out_samples, block_size):
+            ind = np.arange(start, min(start+block_size, num_out_samples))
+            g = ind[:, None] - np.arange(l_tot)
+            g = np.where((g >= 0) & (g < num_time_samples), g,
+                         num_time_samples)
+            self._g.append(g)
+
+    @property
+    def block_size(self):
+        """
+        `int` : Number of channel output samples computed at once
+        """
+        return self._block_size
 
     def call(self, x, h_time, no=None):
 
@@ -124,11 +168,17 @@ class ApplyTimeChannel(Block):
         x = tf.pad(x, [[0,0], [0,0], [0,0], [0,1]])
         x = insert_dims(x, 2, axis=1)
 
-        x = tf.gather(x, self._g, axis=-1)
-
-        # Apply the channel response
-        y = tf.reduce_sum(h_time*x, axis=-1)
-        y = tf.reduce_sum(tf.reduce_sum(y, axis=4), axis=3)
+        # Apply the channel response block by block. Each block requires
+        # the rows of G corresponding to its output samples.
+        y = []
+        start = 0
+        for g in self._g:
+            x_block = tf.gather(x, g, axis=-1)
+            h_block = h_time[..., start:start+g.shape[0], :]
+            y_block = tf.reduce_sum(h_block*x_block, axis=-1)
+            y.append(tf.reduce_sum(tf.reduce_sum(y_block, axis=4), axis=3))
+            start += g.shape[0]
+        y = tf.concat(y, axis=-1)
 
         # Add AWGN if requested
         if no is not None:
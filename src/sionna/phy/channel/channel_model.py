@@ -5,6 +5,7 @@
 
 from abc import abstractmethod
 from sionna.phy.block import Object
+from sionna.phy.channel.utils import cir_to_ofdm_channel
 
 class ChannelModel(Object):
     # pylint: disable=line-too-long
@@ -44,6 +45,12 @@ class ChannelModel(Object):
 
     tau : [batch size, num_rx, num_tx, num_paths], `tf.float`
         Path delays [s]
+
+    Note
+    ----
+    Channel models can optionally provide channel frequency responses
+    directly through :meth:`frequency_response`, which is used by
+    :class:`~sionna.phy.channel.GenerateOFDMChannel`.
     """
     def __init__(self, precision=None, **kwargs):
         super().__init__(precision=precision, **kwargs)
@@ -52,3 +59,45 @@ class ChannelModel(Object):
     def __call__(self,  batch_size, num_time_steps, sampling_frequency):
 
         return NotImplemented
+
+    def frequency_response(self,
+                           batch_size,
+                           num_time_steps,
+                           sampling_frequency,
+                           frequencies):
+        # pylint: disable=line-too-long
+        r"""
+        Computes channel frequency responses at a set of frequencies
+
+        Only the requested ``frequencies`` are evaluated, e.g., the
+        effective subcarriers of a resource grid or the subcarriers of an
+        allocation, so that the complexity scales with the number of
+        frequencies rather than with the FFT size.
+
+        The default implementation samples channel impulse responses and
+        computes their frequency responses using
+        :func:`~sionna.phy.channel.cir_to_ofdm_channel`. Channel models that
+        can compute the frequency responses more efficiently can override
+        this method.
+
+        Input
+        -----
+        batch_size : `int`
+            Batch size
+
+        num_time_steps : `int`
+            Number of time steps
+
+        sampling_frequency : `float`
+            Sampling frequency [Hz]
+
+        frequencies : [num_frequencies], `tf.float`
+            Baseband frequencies at which to compute the channel response [Hz]
+
+        Output
+        ------
+        h_freq : [batch size, num_rx, num_rx_ant, num_tx, num_tx_ant, num_time_steps, num_frequencies], `tf.complex`
+            Channel frequency responses
+        """
+        h, tau = self(batch_size, num_time_steps, sampling_frequency)
+        return cir_to_ofdm_channel(frequencies, h, tau)
@@ -3,8 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0#
 """Class for generating channel frequency responses"""
 
+import numpy as np
+import tensorflow as tf
 from sionna.phy.block import Object
-from sionna.phy.channel.utils import subcarrier_frequencies, cir_to_ofdm_channel
+from sionna.phy.channel.channel_model import ChannelModel
+from sionna.phy.channel.utils import subcarrier_frequencies, \
+                                     cir_to_ofdm_channel, \
+                                     _normalize_ofdm_channel
 
 class GenerateOFDMChannel(Object):
     # pylint: disable=line-too-long
@@ -26,6 +31,14 @@ class GenerateOFDMChannel(Object):
     next in the event of mobility, even if it is assumed static over the duration
     of an OFDM symbol.
 
+    If the ``channel_model`` is a :class:`~sionna.phy.channel.ChannelModel`,
+    the frequency responses are obtained from its
+    :meth:`~sionna.phy.channel.ChannelModel.frequency_response` method, which
+    allows channel models to compute them directly. Using ``subcarrier_ind``,
+    the frequency responses can be restricted to a subset of the
+    subcarriers, e.g., the effective subcarriers or the subcarriers of an
+    allocation, which reduces complexity and memory proportionally.
+
     Parameters
     ----------
     channel_model : :class:`~sionna.phy.channel.ChannelModel`
@@ -37,12 +50,21 @@ class GenerateOFDMChannel(Object):
     normalize_channel : `bool`, (default `False`)
         If set to `True`, the channel is normalized over the resource grid
         to ensure unit average energy per resource element.
+        If ``subcarrier_ind`` is provided, the normalization is performed
+        over the selected subcarriers only.
 
     precision : `None` (default) | "single" | "double"
         Precision used for internal calculations and outputs.
         If set to `None`,
         :attr:`~sionna.phy.config.Config.precision` is used.
 
+    subcarrier_ind : `None` (default) | "effective" | [num_subcarriers], `int`
+        Indices of the subcarriers, ranging from 0 to ``fft_size`` - 1, at
+        which the frequency responses are computed. If `"effective"`, the
+        effective subcarriers of the ``resource_grid``, i.e., excluding the
+        guard carriers and the DC carrier, are used. If `None`, all
+        ``fft_size`` subcarriers are used.
+
     Input
     -----
     batch_size : `None` (default) | `int`
@@ -51,10 +73,11 @@ class GenerateOFDMChannel(Object):
     Output
     -------
     h_freq : [batch size, num_rx, num_rx_ant, num_tx, num_tx_ant, num_ofdm_symbols, num_subcarriers], `tf.complex`
-        Channel frequency responses
+        Channel frequency responses. If ``subcarrier_ind`` is provided,
+        `num_subcarriers` is the number of selected subcarriers.
     """
     def __init__(self, channel_model, resource_grid, normalize_channel=False,
-                 precision=None, **kwargs):
+                 precision=None, subcarrier_ind=None, **kwargs):
         super().__init__(precision=precision, **kwargs)
 
         # Callable used to sample channel input responses
@@ -72,14 +95,49 @@ class GenerateOFDMChannel(Object):
                                                    self._subcarrier_spacing,
                                                    self.precision)
 
-    def __call__(self, batch_size=None):
+        # Restrict the frequencies to the selected subcarriers
+        if isinstance(subcarrier_ind, str):
+            if subcarrier_ind != "effective":
+                raise ValueError("`subcarrier_ind` must be None, 'effective'"\
+                                 " or a list of indices")
+            subcarrier_ind = resource_grid.effective_subcarrier_ind
+        if subcarrier_ind is not None:
+            subcarrier_ind = np.asarray(subcarrier_ind)
+            if subcarrier_ind.ndim != 1:
+                raise ValueError("`subcarrier_ind` must be a 1D tensor")
+            if np.any(subcarrier_ind >= self._num_subcarriers):
+                raise ValueError("`subcarrier_ind` must be smaller than "\
+                                 "fft_size")
+            if np.any(subcarrier_ind < 0):
+                raise ValueError("`subcarrier_ind` must be non-negative")
+            subcarrier_ind = tf.constant(subcarrier_ind, tf.int32)
+            self._frequencies = tf.gather(self._frequencies, subcarrier_ind)
+        self._subcarrier_ind = subcarrier_ind
+
+    @property
+    def subcarrier_ind(self):
+        """Indices of the subcarriers at which the frequency responses are
+        computed, or `None` if all subcarriers are used"""
+        return self._subcarrier_ind
 
-        # Sample channel impulse responses
-        h, tau = self._cir_sampler( batch_size,
-                                    self._num_ofdm_symbols,
-                                    self._sampling_frequency)
+    def __call__(self, batch_size=None):
 
-        h_freq = cir_to_ofdm_channel(self._frequencies, h, tau,
-                                     self._normalize_channel)
+        if isinstance(self._cir_sampler, ChannelModel):
+            # Let the channel model compute the frequency responses
+            h_freq = self._cir_sampler.frequency_response(
+                                                    batch_size,
+                                                    self._num_ofdm_symbols,
+                                                    self._sampling_frequency,
+                                                    self._frequencies)
+        else:
+            # Sample channel impulse responses
+            h, tau = self._cir_sampler( batch_size,
+                                        self._num_ofdm_symbols,
+                                        self._sampling_frequency)
+
+            h_freq = cir_to_ofdm_channel(self._frequencies, h, tau)
+
+        if self._normalize_channel:
+            h_freq = _normalize_ofdm_channel(h_freq)
 
         return h_freq
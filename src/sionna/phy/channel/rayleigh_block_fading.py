@@ -109,3 +109,41 @@ class RayleighBlockFading(ChannelModel):
         # Tile the response over the block
         h = tf.tile(h, [1, 1, 1, 1, 1, 1, num_time_steps])
         return h, delays
+
+    def frequency_response(self,
+                           batch_size,
+                           num_time_steps,
+                           sampling_frequency,
+                           frequencies):
+        # pylint: disable=line-too-long
+        r"""
+        Computes channel frequency responses at a set of frequencies
+
+        As the channel consists of a single path with zero delay, the
+        frequency response is flat and no phase terms need to be computed.
+
+        Input
+        -----
+        batch_size : `int`
+            Batch size
+
+        num_time_steps : `int`
+            Number of time steps
+
+        sampling_frequency : `float`
+            Sampling frequency [Hz]
+
+        frequencies : [num_frequencies], `tf.float`
+            Baseband frequencies at which to compute the channel response [Hz]
+
+        Output
+        ------
+        h_freq : [batch size, num_rx, num_rx_ant, num_tx, num_tx_ant, num_time_steps, num_frequencies], `tf.complex`
+            Channel frequency responses
+        """
+        h, _ = self(batch_size, num_time_steps, sampling_frequency)
+        # [batch size, num_rx, num_rx_ant, num_tx, num_tx_ant,
+        #  num_time_steps, 1]
+        h = tf.expand_dims(h[...,0,:], axis=-1)
+        shape = tf.concat([tf.shape(h)[:-1], tf.shape(frequencies)], axis=0)
+        return tf.broadcast_to(h, shape)
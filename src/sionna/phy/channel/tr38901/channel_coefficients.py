@@ -514,10 +514,10 @@ class ChannelCoefficientsGenerator(Object):
 
         return h_phase
 
-    def _step_11_doppler_matrix(self, topology, aoa, zoa, t):
+    def _step_11_doppler_rate(self, topology, aoa, zoa):
         # pylint: disable=line-too-long
         r"""
-        Compute matrix with phase shifts due to mobility in (7.5-22)
+        Compute the rate of the phase shifts due to mobility in (7.5-22)
 
         Input
         -----
@@ -530,19 +530,16 @@ class ChannelCoefficientsGenerator(Object):
         zoa : [batch size, num TXs, num RXs, num clusters, num rays], tf.float
             Zenith angles of arrivals [radian]
 
-        t : [number of time steps]
-            Time steps at which the channel is sampled
-
         Output
         ------
-        h_doppler : [batch size, num_tx, num rx, num clusters, num rays, num time steps], tf.complex
-            Matrix with phase shifts due to mobility in (7.5-22)
+        rate : [batch size, num_tx, num rx, num clusters, num rays], tf.float
+            Phase shifts due to mobility per unit time [radian/s]
         """
         lambda_0 = self._lambda_0
         velocities = topology.velocities
 
-        # Add an extra dimension to make v_bar broadcastable with the time
-        # dimension
+        # Add an extra dimension to make v_bar broadcastable with the unit
+        # sphere vectors
         # v_bar [batch size, num tx or num rx, 3, 1]
         v_bar = velocities
         v_bar = tf.expand_dims(v_bar, axis=-1)
@@ -563,9 +560,39 @@ class ChannelCoefficientsGenerator(Object):
         # v_bar [batch size, num_tx, num rx, num clusters, num rays, 3, 1]
         r_hat_rx = self._unit_sphere_vector(zoa, aoa)
 
+        # [batch size, num_tx, num rx, num clusters, num rays]
+        rate = 2*PI/lambda_0*tf.reduce_sum(r_hat_rx*v_bar, [-2, -1])
+        return rate
+
+    def _step_11_doppler_matrix(self, topology, aoa, zoa, t):
+        # pylint: disable=line-too-long
+        r"""
+        Compute matrix with phase shifts due to mobility in (7.5-22)
+
+        Input
+        -----
+        topology : Topology
+            Topology of the network
+
+        aoa : [batch size, num TXs, num RXs, num clusters, num rays], tf.float
+            Azimuth angles of arrivals [radian]
+
+        zoa : [batch size, num TXs, num RXs, num clusters, num rays], tf.float
+            Zenith angles of arrivals [radian]
+
+        t : [number of time steps]
+            Time steps at which the channel is sampled
+
+        Output
+        ------
+        h_doppler : [batch size, num_tx, num rx, num clusters, num rays, num time steps], tf.complex
+            Matrix with phase shifts due to mobility in (7.5-22)
+        """
+        rate = self._step_11_doppler_rate(topology, aoa, zoa)
+
         # Compute phase shift due to doppler
         # [batch size, num_tx, num rx, num clusters, num rays, num time steps]
-        exponent = 2*PI/lambda_0*tf.reduce_sum(r_hat_rx*v_bar, -2)*t
+        exponent = tf.expand_dims(rate, -1)*t
         h_doppler = tf.exp(tf.complex(tf.constant(0.,
                                     self.rdtype), exponent))
 
@@ -854,28 +881,8 @@ class ChannelCoefficientsGenerator(Object):
 
         if self._subclustering:
 
-            powers = rays.powers
-            delays = rays.delays
-
-            # Sort all clusters along their power
-            strongest_clusters = tf.argsort(powers, axis=-1,
-                direction="DESCENDING")
-
-            # Sort delays according to the same ordering
-            delays_sorted = tf.gather(delays, strongest_clusters,
-                batch_dims=3, axis=3)
-
-            # Split into delays for strong and weak clusters
-            delays_strong = delays_sorted[...,:2]
-            delays_weak = delays_sorted[...,2:]
-
-            # Compute delays for sub-clusters
-            offsets = tf.reshape(self._sub_cl_delay_offsets,
-                (delays_strong.shape.rank-1)*[1]+[-1]+[1])
-            delays_sub_cl = (tf.expand_dims(delays_strong, -2) +
-                offsets*tf.expand_dims(tf.expand_dims(c_ds, axis=-1), axis=-1))
-            delays_sub_cl = tf.reshape(delays_sub_cl,
-                tf.concat([tf.shape(delays_sub_cl)[:-2], [-1]],0))
+            strongest_clusters, delays_nlos = self._step_11_sub_cl_delays(
+                                                                rays, c_ds)
 
             # Select the strongest two clusters for sub-cluster splitting
             h_strong = tf.gather(h_full, strongest_clusters[...,:2],
@@ -896,15 +903,86 @@ class ChannelCoefficientsGenerator(Object):
             # Sum all rays for the weak clusters
             h_weak = tf.reduce_sum(h_weak, axis=4)
 
-            # Concatenate the channel and delay tensors
+            # Concatenate the channel tensors
             h_nlos = tf.concat([h_sub_cl_1, h_sub_cl_2, h_sub_cl_3, h_weak],
                 axis=3)
-            delays_nlos = tf.concat([delays_sub_cl, delays_weak], axis=3)
         else:
             # Sum over rays
             h_nlos = tf.reduce_sum(h_full, axis=4)
             delays_nlos = rays.delays
 
+        return self._step_11_sort_nlos(h_nlos, delays_nlos)
+
+    def _step_11_sub_cl_delays(self, rays, c_ds):
+        # pylint: disable=line-too-long
+        r"""
+        Compute the delays of the sub-clusters of the two strongest clusters
+        (7.5-26)
+
+        Input
+        ------
+        rays : Rays
+            Rays
+
+        c_ds : [batch size, num TX, num RX], tf.float
+            Cluster delay spread
+
+        Output
+        -------
+        strongest_clusters : [batch size, num_tx, num rx, num clusters], tf.int32
+            Cluster indices sorted by descending power
+
+        delays_nlos : [batch size, num_tx, num rx, num clusters + 4], tf.float
+            Delays of the three sub-clusters of the two strongest clusters,
+            followed by the delays of the weak clusters
+        """
+        powers = rays.powers
+        delays = rays.delays
+
+        # Sort all clusters along their power
+        strongest_clusters = tf.argsort(powers, axis=-1,
+            direction="DESCENDING")
+
+        # Sort delays according to the same ordering
+        delays_sorted = tf.gather(delays, strongest_clusters,
+            batch_dims=3, axis=3)
+
+        # Split into delays for strong and weak clusters
+        delays_strong = delays_sorted[...,:2]
+        delays_weak = delays_sorted[...,2:]
+
+        # Compute delays for sub-clusters
+        offsets = tf.reshape(self._sub_cl_delay_offsets,
+            (delays_strong.shape.rank-1)*[1]+[-1]+[1])
+        delays_sub_cl = (tf.expand_dims(delays_strong, -2) +
+            offsets*tf.expand_dims(tf.expand_dims(c_ds, axis=-1), axis=-1))
+        delays_sub_cl = tf.reshape(delays_sub_cl,
+            tf.concat([tf.shape(delays_sub_cl)[:-2], [-1]],0))
+
+        delays_nlos = tf.concat([delays_sub_cl, delays_weak], axis=3)
+        return strongest_clusters, delays_nlos
+
+    def _step_11_sort_nlos(self, h_nlos, delays_nlos):
+        # pylint: disable=line-too-long
+        r"""
+        Order the NLOS paths by ascending delays
+
+        Input
+        ------
+        h_nlos : [batch size, num_tx, num rx, num paths, num rx antennas, num tx antennas, num time steps], tf.complex
+            Paths NLoS coefficients
+
+        delays_nlos : [batch size, num_tx, num rx, num paths], tf.float
+            Paths NLoS delays
+
+        Output
+        -------
+        h_nlos : [batch size, num_tx, num rx, num paths, num rx antennas, num tx antennas, num time steps], tf.complex
+            Paths NLoS coefficients ordered by ascending delays
+
+        delays_nlos : [batch size, num_tx, num rx, num paths], tf.float
+            Paths NLoS delays in ascending order
+        """
         # Order the delays in ascending orders
         delays_ind = tf.argsort(delays_nlos, axis=-1,
             direction="ASCENDING")
@@ -916,6 +994,219 @@ class ChannelCoefficientsGenerator(Object):
 
         return h_nlos, delays_nlos
 
+    def _step_11_nlos_contracted(self, phi, topology, rays, t, c_ds):
+        # pylint: disable=line-too-long
+        r"""
+        Compute the final NLOS matrix in (7.5-27) without forming the full
+        NLOS channel matrix
+
+        Yields the same outputs as :meth:`_step_11_reduce_nlos` applied to
+        the output of :meth:`_step_11_nlos`. However, the sum over the rays
+        (and sub-clusters) is computed as a matrix product of the
+        time-invariant ray coefficients of shape
+        [num rx antennas x num tx antennas, num rays] with the Doppler matrix
+        of shape [num rays, num time steps] for each cluster. Hence, the
+        tensor of shape [..., num rays, num rx antennas, num tx antennas,
+        num time steps] is never formed.
+
+        Input
+        -----
+        phi: [batch size, num TXs, num RXs, num clusters, num rays, 4], tf.float
+            Random initial phases [radian]
+
+        topology : Topology
+            Topology of the network
+
+        rays : Rays
+            Rays
+
+        t : [num time samples], tf.float
+            Time samples
+
+        c_ds : [batch size, num TX, num RX], tf.float
+            Cluster delay spread
+
+        Output
+        -------
+        h_nlos : [batch size, num_tx, num rx, num clusters, num rx antennas, num tx antennas, num time steps], tf.complex
+            Paths NLoS coefficients
+
+        delays_nlos : [batch size, num_tx, num rx, num clusters], tf.float
+            Paths NLoS delays
+        """
+        h_ray, cluster_ind, delays_nlos = self._step_11_nlos_static(
+                                                    phi, topology, rays, c_ds)
+        return self._step_11_nlos_dynamic(h_ray, cluster_ind, delays_nlos,
+                                          topology, rays, t)
+
+    def _step_11_nlos_static(self, phi, topology, rays, c_ds):
+        # pylint: disable=line-too-long
+        r"""
+        Compute the time-invariant ray coefficients of the NLOS matrix
+
+        Input
+        -----
+        phi: [batch size, num TXs, num RXs, num clusters, num rays, 4], tf.float
+            Random initial phases [radian]
+
+        topology : Topology
+            Topology of the network
+
+        rays : Rays
+            Rays
+
+        c_ds : [batch size, num TX, num RX], tf.float
+            Cluster delay spread
+
+        Output
+        -------
+        h_ray : [batch size, num_tx, num rx, num clusters, num rays, num rx antennas x num tx antennas], tf.complex
+            Time-invariant ray coefficients, i.e., field and array responses
+            with random phases and power scaling. If sub-clustering is used,
+            the clusters are sorted by descending power.
+
+        cluster_ind : [batch size, num_tx, num rx, num clusters], tf.int32
+            Cluster indices of ``h_ray``
+
+        delays_nlos : [batch size, num_tx, num rx, num paths], tf.float
+            Paths NLoS delays (unsorted)
+        """
+        h_phase = self._step_11_phase_matrix(phi, rays)
+        h_field = self._step_11_field_matrix(topology, rays.aoa, rays.aod,
+                                                    rays.zoa, rays.zod, h_phase)
+        h_array = self._step_11_array_offsets(topology, rays.aoa, rays.aod,
+                                                            rays.zoa, rays.zod)
+
+        # Time-invariant part of the ray coefficients
+        # [batch size, num_tx, num rx, num clusters, num rays,
+        #  num rx antennas, num tx antennas]
+        h_ray = h_field*h_array
+        num_rays = tf.shape(h_ray)[4]
+        power_scaling = tf.complex(tf.sqrt(rays.powers/
+            tf.cast(num_rays, self.rdtype)), tf.constant(0., self.rdtype))
+        h_ray *= power_scaling[...,tf.newaxis,tf.newaxis,tf.newaxis]
+
+        # Flatten the antenna dimensions
+        # [batch size, num_tx, num rx, num clusters, num rays,
+        #  num rx antennas x num tx antennas]
+        s = tf.shape(h_ray)
+        h_ray = tf.reshape(h_ray, tf.concat([s[:5], [-1]], 0))
+
+        if self._subclustering:
+            cluster_ind, delays_nlos = self._step_11_sub_cl_delays(rays,
+                                                                   c_ds)
+            # Sort clusters by descending power
+            h_ray = tf.gather(h_ray, cluster_ind, batch_dims=3, axis=3)
+        else:
+            cluster_ind = tf.broadcast_to(tf.range(tf.shape(h_ray)[3]),
+                                          tf.shape(h_ray)[:4])
+            delays_nlos = rays.delays
+
+        return h_ray, cluster_ind, delays_nlos
+
+    def _step_11_nlos_dynamic(self, h_ray, cluster_ind, delays_nlos,
+                              topology, rays, t):
+        # pylint: disable=line-too-long
+        r"""
+        Compute the final NLOS matrix in (7.5-27) from the time-invariant ray
+        coefficients and the Doppler matrix
+
+        Input
+        -----
+        h_ray : [batch size, num_tx, num rx, num clusters, num rays, num rx antennas x num tx antennas], tf.complex
+            Time-invariant ray coefficients
+
+        cluster_ind : [batch size, num_tx, num rx, num clusters], tf.int32
+            Cluster indices of ``h_ray``
+
+        delays_nlos : [batch size, num_tx, num rx, num paths], tf.float
+            Paths NLoS delays (unsorted)
+
+        topology : Topology
+            Topology of the network
+
+        rays : Rays
+            Rays
+
+        t : [num time samples], tf.float
+            Time samples
+
+        Output
+        -------
+        h_nlos : [batch size, num_tx, num rx, num paths, num rx antennas, num tx antennas, num time steps], tf.complex
+            Paths NLoS coefficients
+
+        delays_nlos : [batch size, num_tx, num rx, num paths], tf.float
+            Paths NLoS delays
+        """
+        # [batch size, num_tx, num rx, num clusters, num rays, num time steps]
+        h_doppler = self._step_11_doppler_matrix(topology, rays.aoa, rays.zoa,
+                                                                            t)
+
+        if self._subclustering:
+
+            h_doppler = tf.gather(h_doppler, cluster_ind, batch_dims=3,
+                                  axis=3)
+
+            # The strongest two clusters are split into sub-clusters
+            h_strong = h_ray[:,:,:,:2]
+            d_strong = h_doppler[:,:,:,:2]
+
+            # The other clusters are the weak clusters
+            h_weak = h_ray[:,:,:,2:]
+            d_weak = h_doppler[:,:,:,2:]
+
+            # Fold the assignment of rays to sub-clusters into the Doppler
+            # matrix, such that a single matrix product computes all
+            # sub-clusters
+            # [num rays, 3]
+            num_rays = tf.shape(h_ray)[4]
+            sub_cl_mask = tf.stack([
+                tf.scatter_nd(ind[:,tf.newaxis],
+                              tf.ones(tf.shape(ind), self.cdtype),
+                              [num_rays])
+                for ind in (self._sub_cl_1_ind,
+                            self._sub_cl_2_ind,
+                            self._sub_cl_3_ind)], axis=-1)
+            # [batch size, num_tx, num rx, 2, num rays, 3 x num time steps]
+            d_strong = tf.expand_dims(d_strong, -2)*sub_cl_mask[...,tf.newaxis]
+            s = tf.shape(d_strong)
+            d_strong = tf.reshape(d_strong, tf.concat([s[:5], [-1]], 0))
+
+            # [batch size, num_tx, num rx, 2,
+            #  num rx antennas x num tx antennas, 3 x num time steps]
+            h_strong = tf.matmul(h_strong, d_strong, transpose_a=True)
+
+            # Put sub-clusters first to match the ordering of the delays
+            # [batch size, num_tx, num rx, 3, 2,
+            #  num rx antennas x num tx antennas, num time steps]
+            s = tf.shape(h_strong)
+            h_strong = tf.reshape(h_strong,
+                                  tf.concat([s[:5], [3, -1]], 0))
+            h_strong = tf.transpose(h_strong, [0, 1, 2, 5, 3, 4, 6])
+            s = tf.shape(h_strong)
+            h_strong = tf.reshape(h_strong,
+                                  tf.concat([s[:3], [-1], s[5:]], 0))
+
+            # Sum all rays for the weak clusters
+            h_weak = tf.matmul(h_weak, d_weak, transpose_a=True)
+
+            h_nlos = tf.concat([h_strong, h_weak], axis=3)
+        else:
+            # Sum over rays
+            h_nlos = tf.matmul(h_ray, h_doppler, transpose_a=True)
+
+        # Restore the antenna dimensions
+        # [batch size, num_tx, num rx, num clusters, num rx antennas,
+        #  num tx antennas, num time steps]
+        s = tf.shape(h_nlos)
+        h_nlos = tf.reshape(h_nlos, tf.concat([s[:4],
+                                               [self._rx_array.num_ant,
+                                                self._tx_array.num_ant],
+                                               s[5:]], 0))
+
+        return self._step_11_sort_nlos(h_nlos, delays_nlos)
+
     def _step_11_los(self, topology, t):
         # pylint: disable=line-too-long
         r"""Compute the LOS channels from (7.5-29)
@@ -933,7 +1224,12 @@ class ChannelCoefficientsGenerator(Object):
         h_los : [batch size, num_tx, num rx, 1, num rx antennas, num tx antennas, num time steps], tf.complex
             Paths LoS coefficients
         """
+        return self._step_11_los_static(topology)*\
+            self._step_11_los_doppler(topology, t)
 
+    def _step_11_los_angles(self, topology):
+        """LoS angles of arrival and departure with a cluster and a ray
+        dimension"""
         aoa = topology.los_aoa
         aod = topology.los_aod
         zoa = topology.los_zoa
@@ -944,6 +1240,23 @@ class ChannelCoefficientsGenerator(Object):
         zoa = tf.expand_dims(tf.expand_dims(zoa, axis=3), axis=4)
         aod = tf.expand_dims(tf.expand_dims(aod, axis=3), axis=4)
         zod = tf.expand_dims(tf.expand_dims(zod, axis=3), axis=4)
+        return aoa, aod, zoa, zod
+
+    def _step_11_los_static(self, topology):
+        # pylint: disable=line-too-long
+        r"""Compute the time-invariant part of the LOS channels from (7.5-29)
+
+        Input
+        ------
+        topology : Topology
+            Network topology
+
+        Output
+        ------
+        h_los : [batch size, num_tx, num rx, 1, num rx antennas, num tx antennas, 1], tf.complex
+            Time-invariant part of the paths LoS coefficients
+        """
+        aoa, aod, zoa, zod = self._step_11_los_angles(topology)
 
         # Field matrix
         h_phase = tf.reshape(tf.constant([[1.,0.],
@@ -956,9 +1269,6 @@ class ChannelCoefficientsGenerator(Object):
         # Array offset matrix
         h_array = self._step_11_array_offsets(topology, aoa, aod, zoa, zod)
 
-        # Doppler matrix
-        h_doppler = self._step_11_doppler_matrix(topology, aoa, zoa, t)
-
         # Phase shift due to propagation delay
         d3d = topology.distance_3d
         lambda_0 = self._lambda_0
@@ -968,12 +1278,31 @@ class ChannelCoefficientsGenerator(Object):
         # Combining all to compute channel coefficient
         h_field = tf.expand_dims(tf.squeeze(h_field, axis=4), axis=-1)
         h_array = tf.expand_dims(tf.squeeze(h_array, axis=4), axis=-1)
-        h_doppler = tf.expand_dims(h_doppler, axis=4)
         h_delay = tf.expand_dims(tf.expand_dims(tf.expand_dims(
             tf.expand_dims(h_delay, axis=3), axis=4), axis=5), axis=6)
 
-        h_los = h_field*h_array*h_doppler*h_delay
-        return h_los
+        return h_field*h_array*h_delay
+
+    def _step_11_los_doppler(self, topology, t):
+        # pylint: disable=line-too-long
+        r"""Compute the Doppler matrix of the LOS channels from (7.5-29)
+
+        Input
+        ------
+        topology : Topology
+            Network topology
+
+        t : [num time samples], tf.float
+            Number of time samples
+
+        Output
+        ------
+        h_doppler : [batch size, num_tx, num rx, 1, 1, 1, num time steps], tf.complex
+            Phase shifts due to mobility
+        """
+        aoa, _, zoa, _ = self._step_11_los_angles(topology)
+        h_doppler = self._step_11_doppler_matrix(topology, aoa, zoa, t)
+        return tf.expand_dims(h_doppler, axis=4)
 
     def _step_11(self, phi, topology, k_factor, rays, t, c_ds):
         # pylint: disable=line-too-long
@@ -1000,13 +1329,74 @@ class ChannelCoefficientsGenerator(Object):
         c_ds : [batch size, num TX, num RX], tf.float
             Cluster delay spread
         """
+        static = self._step_11_static(phi, topology, k_factor, rays, c_ds)
+        return self._step_11_dynamic(static, topology, rays, t)
+
+    def _step_11_static(self, phi, topology, k_factor, rays, c_ds):
+        # pylint: disable=line-too-long
+        r"""
+        Compute the time-invariant terms of (7.5-30)
+
+        Together with :meth:`_step_11_dynamic`, this allows to evaluate the
+        channel coefficients of the same rays at different time samples
+        without recomputing the field and array responses.
+
+        Input
+        -----
+        phi: [batch size, num TXs, num RXs, num clusters, num rays, 4], tf.float
+            Random initial phases
+
+        topology : Topology
+            Network topology
+
+        k_factor : [batch size, num TX, num RX], tf.float
+            Rician K-factor
+
+        rays : Rays
+            Rays
+
+        c_ds : [batch size, num TX, num RX], tf.float
+            Cluster delay spread
+
+        Output
+        ------
+        static : `tuple`
+            Time-invariant terms, to be provided to :meth:`_step_11_dynamic`
+        """
+        h_ray, cluster_ind, delays_nlos = self._step_11_nlos_static(
+                                                    phi, topology, rays, c_ds)
+        h_los_static = self._step_11_los_static(topology)
+        return h_ray, cluster_ind, delays_nlos, h_los_static, k_factor
+
+    def _step_11_dynamic(self, static, topology, rays, t):
+        # pylint: disable=line-too-long
+        r"""
+        Combine LOS and NLOS components to compute (7.5-30) from the
+        time-invariant terms computed by :meth:`_step_11_static`
+
+        Input
+        -----
+        static : `tuple`
+            Time-invariant terms
+
+        topology : Topology
+            Network topology
+
+        rays : Rays
+            Rays
+
+        t : [num time samples], tf.float
+            Number of time samples
+        """
+        h_ray, cluster_ind, delays_nlos, h_los_static, k_factor = static
 
-        h_full = self._step_11_nlos(phi, topology, rays, t)
-        h_nlos, delays_nlos = self._step_11_reduce_nlos(h_full, rays, c_ds)
+        h_nlos, delays_nlos = self._step_11_nlos_dynamic(h_ray, cluster_ind,
+                                                         delays_nlos,
+                                                         topology, rays, t)
 
         ####  LoS scenario
 
-        h_los_los_comp = self._step_11_los(topology, t)
+        h_los_los_comp = h_los_static*self._step_11_los_doppler(topology, t)
         k_factor = tf.reshape(k_factor, tf.concat([tf.shape(k_factor),
             tf.ones([tf.rank(h_los_los_comp)-tf.rank(k_factor)], tf.int32)],0))
         k_factor = tf.complex(k_factor, tf.constant(0.,
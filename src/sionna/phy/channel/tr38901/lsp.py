@@ -9,7 +9,7 @@ Class for sampling large scale parameters (LSPs) and pathloss following the
 
 import tensorflow as tf
 from sionna.phy.utils import log10
-from sionna.phy import config
+from sionna.phy import config, PI
 from sionna.phy.block import Object
 
 class LSP(Object):
@@ -50,7 +50,7 @@ class LSP(Object):
         super().__init__()
 
 class LSPGenerator(Object):
-    """
+    r"""
     Sample large scale parameters (LSP) and pathloss given a channel scenario,
     e.g., UMa, UMi, RMa
 
@@ -65,11 +65,31 @@ class LSPGenerator(Object):
     The batch size is set by the ``scenario`` given as argument when
     constructing the class.
 
+    The LSPs of UTs in the same state are spatially correlated. With the
+    "cholesky" spatial correlation method, the square root of the
+    (number of UTs)x(number of UTs) correlation matrix is computed, which
+    requires :math:`\mathcal{O}(N^3)` operations and
+    :math:`\mathcal{O}(N^2)` memory for :math:`N` UTs. With the "sos" method,
+    the LSPs are instead sampled from spatially correlated random fields
+    generated as sums of ``num_sinusoids`` sinusoids, whose wave
+    vectors are drawn from the spectral density of the exponential
+    correlation function. The complexity is then
+    :math:`\mathcal{O}(N)`, and the correlation between UTs matches the
+    exponential model on average over the realizations. However, the LSPs are
+    only approximately Gaussian for a finite number of sinusoids. The "sos"
+    method must therefore be explicitly selected.
+
     Parameters
     ----------
     scenario : :class:`~sionna.phy.channel.tr38901.SystemLevelScenario``
         Scenario used to generate LSPs
 
+    spatial_correlation_method : "cholesky" (default) | "sos"
+        Method used to spatially correlate the LSPs
+
+    num_sinusoids : `int`, (default 64)
+        Number of sinusoids of the random fields if the "sos" method is used
+
     Input
     -----
     None
@@ -78,10 +98,25 @@ class LSPGenerator(Object):
     ------
     An `LSP` instance storing realization of LSPs
     """
-    def __init__(self, scenario):
+
+    # Maximum number of elements of the intermediate tensors of the "sos"
+    # method, which are computed for blocks of sinusoids
+    _MAX_SOS_ELEMENTS = 2**24
+
+    def __init__(self, scenario, spatial_correlation_method="cholesky",
+                 num_sinusoids=64):
         self._scenario = scenario
         super().__init__(precision=scenario.precision)
 
+        if spatial_correlation_method not in ("cholesky", "sos"):
+            raise ValueError("`spatial_correlation_method` must be "
+                             "'cholesky' or 'sos'")
+        self._use_sos = spatial_correlation_method == "sos"
+
+        if num_sinusoids < 1:
+            raise ValueError("`num_sinusoids` must be positive")
+        self._num_sinusoids = num_sinusoids
+
     def sample_pathloss(self):
         """
         Generate pathlosses [dB] for each BS-UT link.
@@ -117,21 +152,25 @@ class LSPGenerator(Object):
         # distribution), where they are correlated as indicated in TR38901
         # specification (Section 7.5, step 4)
 
-        s = config.tf_rng.normal(shape=[self._scenario.batch_size,
-                                        self._scenario.num_bs,
-                                        self._scenario.num_ut, 7],
-                                        dtype=self.rdtype)
-
-        ## Applyting cross-LSP correlation
-        s = tf.expand_dims(s, axis=4)
-        s = self._cross_lsp_correlation_matrix_sqrt@s
-        s = tf.squeeze(s, axis=4)
-
-        ## Applying spatial correlation
-        s = tf.expand_dims(tf.transpose(s, [0, 1, 3, 2]), axis=3)
-        s = tf.matmul(s, self._spatial_lsp_correlation_matrix_sqrt,
-                      transpose_b=True)
-        s = tf.transpose(tf.squeeze(s, axis=3), [0, 1, 3, 2])
+        if self._use_sos:
+            ## Sampling cross-LSP and spatially correlated LSPs
+            s = self._sample_sos_fields()
+        else:
+            s = config.tf_rng.normal(shape=[self._scenario.batch_size,
+                                            self._scenario.num_bs,
+                                            self._scenario.num_ut, 7],
+                                            dtype=self.rdtype)
+
+            ## Applyting cross-LSP correlation
+            s = tf.expand_dims(s, axis=4)
+            s = self._cross_lsp_correlation_matrix_sqrt@s
+            s = tf.squeeze(s, axis=4)
+
+            ## Applying spatial correlation
+            s = tf.expand_dims(tf.transpose(s, [0, 1, 3, 2]), axis=3)
+            s = tf.matmul(s, self._spatial_lsp_correlation_matrix_sqrt,
+                          transpose_b=True)
+            s = tf.transpose(tf.squeeze(s, axis=3), [0, 1, 3, 2])
 
         ## Scaling and transposing LSPs to the right mean and variance
         lsp_log_mean = self._scenario.lsp_log_mean
@@ -177,8 +216,12 @@ class LSPGenerator(Object):
         # Compute cross-LSP correlation matrix
         self._compute_cross_lsp_correlation_matrix()
 
-        # Compute LSP spatial correlation matrix
-        self._compute_lsp_spatial_correlation_sqrt()
+        # Compute LSP spatial correlation matrix, or the quantities
+        # required to sample the random fields
+        if self._use_sos:
+            self._compute_lsp_spatial_correlation_sos()
+        else:
+            self._compute_lsp_spatial_correlation_sqrt()
 
     ########################################
     # Internal utility methods
@@ -390,6 +433,143 @@ class LSPGenerator(Object):
         self._spatial_lsp_correlation_matrix_sqrt = tf.linalg.cholesky(
                 spatial_lsp_correlation)
 
+    def _compute_lsp_spatial_correlation_sos(self):
+        r"""
+        Compute the quantities required to sample the LSPs from spatially
+        correlated random fields.
+
+        As with the "cholesky" method, the cross-LSP correlation is applied to
+        spatially white noise, which is then filtered by the spatial
+        correlation of each LSP. For every BS and UT state (LoS, NLoS, O2I),
+        each of the 7 independent noise components :math:`j` is represented
+        by :math:`M` sinusoids, and LSP :math:`X` is obtained as
+
+        .. math::
+            X(\mathbf{r}) = \sqrt{\frac{2}{M}} \sum_{j=1}^{7} A_{X,j}
+                \sum_{m=1}^{M} a_X(\mathbf{k}_{j,m})
+                \cos\left(\mathbf{k}_{j,m}^{\mathsf{T}}\mathbf{r}
+                + \phi_{j,m}\right)
+
+        where :math:`\mathbf{r}` is the location of the UT in the X-Y plane,
+        :math:`\mathbf{A}` the square root of the cross-LSP correlation
+        matrix, and :math:`\phi_{j,m}` a phase uniformly distributed in
+        :math:`[0, 2\pi)`.
+        The wave vectors :math:`\mathbf{k}_{j,m}` have a uniformly
+        distributed direction and are drawn from the spectral density
+        :math:`S_{D_0}` of the correlation function :math:`e^{-d/D_0}`, where
+        :math:`D_0` is the geometric mean of the correlation distances of the
+        7 LSPs. The weights
+        :math:`a_X(\mathbf{k}) = \sqrt{S_{D_X}(\mathbf{k})/S_{D_0}(\mathbf{k})}`,
+        where :math:`D_X` is the correlation distance of LSP :math:`X`, ensure
+        that the spatial correlation of LSP :math:`X` is
+        :math:`e^{-d/D_X}`.
+        Every UT reads the sinusoids corresponding to its state, such that only
+        UTs in the same state are correlated.
+
+        This function stores the state of every link, the locations of the
+        UTs normalized by :math:`D_0`, and the ratios :math:`D_X/D_0`.
+
+        Input
+        ------
+        None
+
+        Output
+        -------
+        None
+        """
+        # State of each link: 0 for LoS, 1 for NLoS, and 2 for indoor
+        indoor = tf.tile(tf.expand_dims(self._scenario.indoor, axis=1),
+                         [1, self._scenario.num_bs, 1])
+        state = tf.where(self._scenario.los, 0, 1)
+        # [batch size, num_bs, num_ut]
+        self._sos_state = tf.where(indoor, 2, state)
+
+        # Correlation distances
+        # [batch size, num_bs, num_ut, 7]
+        corr_dist = tf.stack([self._scenario.get_param(parameter_name)
+            for parameter_name in ('corrDistDS', 'corrDistASD', 'corrDistASA',
+                'corrDistSF', 'corrDistK', 'corrDistZSA', 'corrDistZSD')],
+            axis=3)
+        # Reference correlation distance, which only depends on the state
+        # [batch size, num_bs, num_ut, 1]
+        ref_dist = tf.exp(tf.reduce_mean(tf.math.log(corr_dist), axis=3,
+                                         keepdims=True))
+        self._sos_dist_ratio = corr_dist/ref_dist
+
+        # Normalized locations of the UTs in the X-Y plane
+        # [batch size, num_bs, num_ut, 1, 2]
+        ut_loc_xy = self._scenario.ut_loc[:,:,:2]
+        ut_loc_xy = tf.expand_dims(tf.expand_dims(ut_loc_xy, axis=1), axis=3)
+        self._sos_loc = ut_loc_xy/tf.expand_dims(ref_dist, axis=4)
+
+        # Number of sinusoids processed at once
+        num_elements = 7*7*3
+        for dim in (self._scenario.ut_loc.shape[0],
+                    self._scenario.ut_loc.shape[1],
+                    self._scenario.bs_loc.shape[1]):
+            if dim is not None:
+                num_elements *= dim
+        self._sos_block_size = min(max(self._MAX_SOS_ELEMENTS//num_elements, 1),
+                                   self._num_sinusoids)
+
+    def _sample_sos_fields(self):
+        """
+        Sample cross-LSP and spatially correlated LSPs with zero mean and unit
+        variance from sum-of-sinusoids random fields.
+
+        Input
+        ------
+        None
+
+        Output
+        -------
+        s : [batch size, num_bs, num_ut, 7], tf.float
+            Correlated LSPs
+        """
+        num_sinusoids = self._num_sinusoids
+        two_pi = tf.constant(2.*PI, self.rdtype)
+
+        # Random wave vectors normalized by the reference correlation
+        # distance, and phases
+        # [batch size, num_bs, 3, 7, num_sinusoids]
+        shape = [self._scenario.batch_size, self._scenario.num_bs, 3, 7,
+                 num_sinusoids]
+        u = config.tf_rng.uniform(shape, dtype=self.rdtype)
+        k = tf.sqrt(tf.math.reciprocal(tf.square(1.-u)) - 1.)
+        alpha = config.tf_rng.uniform(shape, maxval=two_pi, dtype=self.rdtype)
+        phi = config.tf_rng.uniform(shape, maxval=two_pi, dtype=self.rdtype)
+        # [batch size, num_bs, 3, 7, num_sinusoids, 4]
+        params = tf.stack([k*tf.cos(alpha), k*tf.sin(alpha), phi,
+                           tf.square(k)], axis=5)
+
+        # [batch size, num_bs, num_ut, 1, 1, 2]
+        loc = tf.expand_dims(self._sos_loc, axis=4)
+        # [batch size, num_bs, num_ut, 7, 1, 1]
+        ratio = self._sos_dist_ratio[...,tf.newaxis,tf.newaxis]
+
+        # [batch size, num_bs, num_ut, 7, 7]
+        s = tf.zeros(tf.concat([tf.shape(self._sos_dist_ratio), [7]], axis=0),
+                     self.rdtype)
+        for start in range(0, num_sinusoids, self._sos_block_size):
+            # Every UT reads the sinusoids of its state
+            # [batch size, num_bs, num_ut, 7, block size, 4]
+            p = tf.gather(params[:,:,:,:,start:start+self._sos_block_size],
+                          self._sos_state, axis=2, batch_dims=2)
+            # [batch size, num_bs, num_ut, 7, block size]
+            c = tf.cos(tf.reduce_sum(p[...,:2]*loc, axis=5) + p[...,2])
+            # Weights of the sinusoids for every LSP
+            # [batch size, num_bs, num_ut, 7 (LSP), 7 (noise), block size]
+            k_sq = tf.expand_dims(p[...,3], axis=3)
+            a = ratio*tf.pow((1.+k_sq)/(1.+tf.square(ratio)*k_sq), 0.75)
+            s += tf.reduce_sum(a*tf.expand_dims(c, axis=3), axis=5)
+        s *= tf.sqrt(tf.constant(2./num_sinusoids, self.rdtype))
+
+        ## Applyting cross-LSP correlation
+        # [batch size, num_bs, num_ut, 7]
+        s = tf.reduce_sum(self._cross_lsp_correlation_matrix_sqrt*s, axis=4)
+
+        return s
+
     def _o2i_low_loss(self):
         """
         Compute for each BS-UT link the pathloss due to the O2I penetration loss
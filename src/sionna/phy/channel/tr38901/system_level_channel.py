@@ -9,10 +9,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from . import LSPGenerator
-from . import RaysGenerator
+from . import Rays, RaysGenerator
 from . import Topology, ChannelCoefficientsGenerator
+from sionna.phy import PI
 from sionna.phy.channel import ChannelModel
 from sionna.phy.channel.utils import deg_2_rad
+from sionna.phy.utils import flatten_dims
 
 class SystemLevelChannel(ChannelModel):
     # pylint: disable=line-too-long
@@ -30,6 +32,36 @@ class SystemLevelChannel(ChannelModel):
         new generation of channel impulse responses. Otherwise, always reuse
         the same LSPs, except if the topology is changed.
 
+    num_strongest_links : `None` (default) | `int`
+        If not `None`, LSPs and pathlosses are computed for all BS-UT links,
+        but the path coefficients are only generated for the
+        ``num_strongest_links`` links of every UT with the largest
+        large scale gain, i.e., pathloss and shadow fading.
+        The BS dimension of the outputs then indexes the selected links of
+        every UT, which are given by :attr:`link_ind`. The large scale gains
+        :attr:`pl_gain` of all links allow to account for the remaining
+        links, e.g., as pathloss-only interference.
+
+    drop_mode : `bool`, (default `False`)
+        If `True`, the channel evolves continuously over consecutive calls.
+        LSPs, rays and random phases are sampled only once per drop, i.e.,
+        when the topology is first set or when :meth:`new_drop` is called,
+        and the
+        time-invariant parts of the channel coefficients are stored. Every
+        call then only advances the Doppler phase terms, starting from the
+        time at which the previous call ended (see :attr:`drop_time`).
+        Updating the topology with :meth:`set_topology` within a drop, e.g.,
+        to account for moving UTs, updates the pathlosses and all
+        geometry-dependent terms, while the LSPs and rays of the drop are
+        kept. The Doppler phases accumulated until the update are kept, such
+        that the phases evolve continuously. If the number of BSs or UTs
+        changes, a new drop is started.
+
+    spatial_correlation_method : "cholesky" (default) | "sos"
+        Method used to spatially correlate the LSPs. The "sos" method scales
+        to large numbers of UTs at the cost of an approximation. See
+        :class:`~sionna.phy.channel.tr38901.LSPGenerator`.
+
     Input
     -----
     num_time_samples : `int`
@@ -41,23 +73,44 @@ class SystemLevelChannel(ChannelModel):
     Output
     -------
     a : [batch size, num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths, num_time_samples], `tf.complex`
-        Path coefficients
+        Path coefficients. If ``num_strongest_links`` is not `None`,
+        num_tx (downlink) or num_rx (uplink) is equal to
+        ``num_strongest_links``.
 
     tau : [batch size, num_rx, num_tx, num_paths], `tf.float`
-        Path delays [s]
+        Path delays [s]. If ``num_strongest_links`` is not `None`,
+        num_tx (downlink) or num_rx (uplink) is equal to
+        ``num_strongest_links``.
 
     rays : :class:`~sionna.phy.channel.tr38901.RaysGenerator`
-        Sampled rays. Only returned if ``self.return_rays`` is `True` 
+        Sampled rays. Only returned if ``self.return_rays`` is `True`.
+        If ``num_strongest_links`` is not `None`, only the rays of the
+        selected links are returned, and num_tx (downlink) or num_rx (uplink)
+        is equal to ``num_strongest_links``.
+
+    Note
+    ----
+    In drop mode, the state of a drop is kept in `tf.Variable` objects such
+    that the channel can be generated within functions decorated with
+    `@tf.function`. As these variables are created when a drop is sampled
+    by :meth:`set_topology` or :meth:`new_drop`, these methods should be
+    called in eager mode. If the shapes of the state change, e.g., because the number of
+    UTs changed, the decorated functions need to be traced again.
     """
     def __init__(self,
                  scenario,
                  always_generate_lsp=False,
-                 precision=None):
+                 num_strongest_links=None,
+                 precision=None,
+                 drop_mode=False,
+                 spatial_correlation_method="cholesky"):
 
         super().__init__(precision=scenario.precision)
 
         self._scenario = scenario
-        self._lsp_sampler = LSPGenerator(scenario)
+        self._lsp_sampler = LSPGenerator(
+                    scenario,
+                    spatial_correlation_method=spatial_correlation_method)
         self._ray_sampler = RaysGenerator(scenario)
         self._set_topology_called = False
         self._return_rays = False
@@ -77,6 +130,76 @@ class SystemLevelChannel(ChannelModel):
         # Are new LSPs needed
         self._always_generate_lsp = always_generate_lsp
 
+        if num_strongest_links is not None:
+            if num_strongest_links < 1:
+                raise ValueError("`num_strongest_links` must be positive")
+        self._num_strongest_links = num_strongest_links
+        # Selected links and large scale gains of the last call
+        self._link_ind = None
+        self._pl_gain = None
+
+        # State of the current drop
+        self._drop_mode = drop_mode
+        self._drop_sample = None
+        self._drop_state = None
+        self._drop_time = tf.Variable(tf.constant(0., self.rdtype),
+                                      trainable=False)
+        # Doppler phases accumulated until the last topology update
+        self._drop_doppler = None
+        self._drop_update_time = tf.Variable(tf.constant(0., self.rdtype),
+                                             trainable=False)
+
+    @property
+    def drop_mode(self):
+        r"""
+        `bool` : Indicates whether the channel evolves continuously over
+        consecutive calls
+        """
+        return self._drop_mode
+
+    @property
+    def drop_time(self):
+        r"""
+        `tf.float` : Get/set the time [s] since the beginning of the current
+        drop, from which the next call continues. Only used in drop mode.
+        """
+        return self._drop_time.value()
+
+    @drop_time.setter
+    def drop_time(self, value):
+        self._drop_time.assign(tf.cast(value, self.rdtype))
+
+    @property
+    def num_strongest_links(self):
+        r"""
+        `None` | `int` : Number of links per UT for which path coefficients
+        are generated. If `None`, all links are generated.
+        """
+        return self._num_strongest_links
+
+    @property
+    def link_ind(self):
+        r"""
+        [batch size, num_ut, num_strongest_links], `tf.int32` (read-only) :
+        For every UT, indices of the BSs of the links selected by the last
+        call, sorted by decreasing large scale gain. `None` if
+        ``num_strongest_links`` is `None`.
+        """
+        if self._link_ind is None:
+            return None
+        return self._link_ind.value()
+
+    @property
+    def pl_gain(self):
+        r"""
+        [batch size, num_rx, num_tx], `tf.float` (read-only) : Large scale
+        power gain, i.e., pathloss and shadow fading, of all links at the
+        last call. `None` if ``num_strongest_links`` is `None`.
+        """
+        if self._pl_gain is None:
+            return None
+        return self._pl_gain.value()
+
     @property
     def return_rays(self):
         r"""
@@ -166,9 +289,53 @@ class SystemLevelChannel(ChannelModel):
             if not self._always_generate_lsp:
                 self._lsp = self._lsp_sampler()
 
+            # Variables storing the selected links and large scale gains
+            if self._num_strongest_links is not None:
+                self._init_link_variables()
+
+            # Continue the current drop with the updated topology, or start a
+            # new one if there is none or if the number of links changed
+            if self._drop_mode:
+                same_links = self._drop_sample is not None
+                if same_links:
+                    num_links = tf.shape(self._drop_sample[2])[:3]
+                    same_links = tf.reduce_all(num_links == tf.stack(
+                                                [self._scenario.batch_size,
+                                                 self._scenario.num_bs,
+                                                 self._scenario.num_ut]))
+                if same_links:
+                    self._update_drop()
+                else:
+                    self.new_drop()
+
         if not self._set_topology_called:
             self._set_topology_called = True
 
+    def new_drop(self):
+        r"""
+        Starts a new drop
+
+        Samples the LSPs (if ``always_generate_lsp`` is `True`, otherwise the
+        LSPs of the current topology are used), rays and random phases of all
+        links, computes the time-invariant parts of the channel coefficients,
+        and resets :attr:`drop_time` to zero. Only used in drop mode.
+        """
+        if self._always_generate_lsp:
+            lsp = self._lsp_sampler()
+        else:
+            lsp = self._lsp
+
+        # Sample rays
+        rays = self._ray_sampler(lsp)
+
+        # Random initial phases of all links (step 10)
+        phi = self._cir_sampler._step_10(tf.shape(rays.aoa))
+
+        self._drop_sample = (lsp, rays, phi)
+        self._drop_doppler = None
+        self._drop_time.assign(tf.constant(0., self.rdtype))
+        self._update_drop()
+
     def __call__(self,
                  num_time_samples,
                  sampling_frequency,
@@ -190,6 +357,9 @@ class SystemLevelChannel(ChannelModel):
 # calling the channel model is different from the one previously configured for \
 # the topology. The value specified when calling is ignored.")
 
+        if self._drop_mode:
+            return self._call_drop(num_time_samples, sampling_frequency)
+
         # Sample LSPs if required
         if self._always_generate_lsp:
             lsp = self._lsp_sampler()
@@ -199,86 +369,14 @@ class SystemLevelChannel(ChannelModel):
         # Sample rays
         rays = self._ray_sampler(lsp)
 
-        # Sample channel responses
-        # First we need to create a topology
-        # Indicates which end of the channel is moving: TX or RX
-        if self._scenario.direction == 'downlink':
-            moving_end = 'rx'
-            tx_orientations = self._scenario.bs_orientations
-            rx_orientations = self._scenario.ut_orientations
-        else : # 'uplink'
-            moving_end = 'tx'
-            tx_orientations = self._scenario.ut_orientations
-            rx_orientations = self._scenario.bs_orientations
-        topology = Topology(velocities=self._scenario.ut_velocities,
-                            moving_end=moving_end,
-                            los_aoa=deg_2_rad(self._scenario.los_aoa),
-                            los_aod=deg_2_rad(self._scenario.los_aod),
-                            los_zoa=deg_2_rad(self._scenario.los_zoa),
-                            los_zod=deg_2_rad(self._scenario.los_zod),
-                            los=self._scenario.los,
-                            distance_3d=self._scenario.distance_3d,
-                            tx_orientations=tx_orientations,
-                            rx_orientations=rx_orientations)
-
-        # The channel coefficient needs the cluster delay spread parameter in ns
-        c_ds = self._scenario.get_param("cDS")*1e-9
-
-        # According to the link direction, we need to specify which from BS
-        # and UT is uplink, and which is downlink.
-        # Default is downlink, so we need to do some tranpose to switch tx and
-        # rx and to switch angle of arrivals and departure if direction is set
-        # to uplink. Nothing needs to be done if direction is downlink
-        if self._scenario.direction == "uplink":
-            aoa = rays.aoa
-            zoa = rays.zoa
-            aod = rays.aod
-            zod = rays.zod
-            rays.aod = tf.transpose(aoa, [0, 2, 1, 3, 4])
-            rays.zod = tf.transpose(zoa, [0, 2, 1, 3, 4])
-            rays.aoa = tf.transpose(aod, [0, 2, 1, 3, 4])
-            rays.zoa = tf.transpose(zod, [0, 2, 1, 3, 4])
-            rays.powers = tf.transpose(rays.powers, [0, 2, 1, 3])
-            rays.delays = tf.transpose(rays.delays, [0, 2, 1, 3])
-            rays.xpr = tf.transpose(rays.xpr, [0, 2, 1, 3, 4])
-            los_aod = topology.los_aod
-            los_aoa = topology.los_aoa
-            los_zod = topology.los_zod
-            los_zoa = topology.los_zoa
-            topology.los_aoa = tf.transpose(los_aod, [0, 2, 1])
-            topology.los_aod = tf.transpose(los_aoa, [0, 2, 1])
-            topology.los_zoa = tf.transpose(los_zod, [0, 2, 1])
-            topology.los_zod = tf.transpose(los_zoa, [0, 2, 1])
-            topology.los = tf.transpose(topology.los, [0, 2, 1])
-            c_ds = tf.transpose(c_ds, [0, 2, 1])
-            topology.distance_3d = tf.transpose(topology.distance_3d, [0, 2, 1])
-            # Concerning LSPs, only these two are used.
-            # We do not transpose the others to reduce complexity
-            k_factor = tf.transpose(lsp.k_factor, [0, 2, 1])
-            sf = tf.transpose(lsp.sf, [0, 2, 1])
-        else:
-            k_factor = lsp.k_factor
-            sf = lsp.sf
+        rays, _, _, topology, k_factor, c_ds, gain, link_ind, pl_gain =\
+            self._prepare_links(lsp, rays)
 
         # pylint: disable=unbalanced-tuple-unpacking
         h, delays = self._cir_sampler(num_time_samples, sampling_frequency,
                                       k_factor, rays, topology, c_ds)
 
-        # Step 12
-        h = self._step_12(h, sf)
-
-        # Reshaping to match the expected output
-        h = tf.transpose(h, [0, 2, 4, 1, 5, 3, 6])
-        delays = tf.transpose(delays, [0, 2, 1, 3])
-
-        # Stop gradients to avoid useless backpropagation
-        h = tf.stop_gradient(h)
-        delays = tf.stop_gradient(delays)
-
-        if self.return_rays:
-            return h, delays, rays
-        else:
-            return h, delays
+        return self._format_outputs(h, delays, gain, link_ind, pl_gain, rays)
 
     def show_topology(self,
                       bs_index=0,
@@ -400,24 +498,22 @@ class SystemLevelChannel(ChannelModel):
     # Internal utility methods
     #####################################################
 
-    def _step_12(self,
-                 h,
-                 sf):
+    def _large_scale_gain(self, sf):
         # pylint: disable=line-too-long
-        """Apply path loss and shadow fading ``sf`` to paths coefficients ``h``.
+        """Compute the amplitude gain due to path loss and shadow fading ``sf``.
 
         Input
         ------
-        h : [batch size, num_tx, num_rx, num_paths, num_rx_ant, num_tx_ant, num_time_samples], tf.complex
-            Paths coefficients
-
-        sf : [batch size, num_tx, num_rx]
+        sf : [batch size, num_bs, num_ut], tf.float
             Shadow fading
+
+        Output
+        -------
+        gain : [batch size, num_bs, num_ut], tf.float
+            Amplitude gain
         """
         if self._scenario.pathloss_enabled:
             pl_db = self._lsp_sampler.sample_pathloss()
-            if self._scenario.direction == 'uplink':
-                pl_db = tf.transpose(pl_db, [0,2,1])
         else:
             pl_db = tf.constant(0.0, self.rdtype)
 
@@ -426,8 +522,508 @@ class SystemLevelChannel(ChannelModel):
 
         gain = tf.math.pow(tf.constant(10., self.rdtype),
             -(pl_db)/20.)*tf.sqrt(sf)
+        return gain
+
+    def _strongest_links(self, gain):
+        # pylint: disable=line-too-long
+        """Select the ``num_strongest_links`` links with the largest ``gain``
+        for every UT.
+
+        Input
+        ------
+        gain : [batch size, num_bs, num_ut], tf.float
+            Large scale gain
+
+        Output
+        -------
+        link_ind : [batch size, num_ut, num_strongest_links], tf.int32
+            BS indices of the selected links
+        """
+        k = tf.minimum(self._num_strongest_links, self._scenario.num_bs)
+        _, link_ind = tf.math.top_k(tf.transpose(gain, [0, 2, 1]), k=k)
+        return link_ind
+
+    def _gather_links(self, tensor, link_ind):
+        # pylint: disable=line-too-long
+        """Gather the selected links ``link_ind`` from ``tensor``.
+
+        Every UT is moved to a separate batch example.
+
+        Input
+        ------
+        tensor : [batch size, num_bs, num_ut, ...]
+            Tensor with one entry per link
+
+        link_ind : [batch size, num_ut, num_strongest_links], tf.int32
+            BS indices of the selected links
+
+        Output
+        -------
+        : [batch size*num_ut, num_strongest_links, 1, ...]
+            Selected links
+        """
+        perm = [0, 2, 1] + list(range(3, len(tensor.shape)))
+        tensor = tf.transpose(tensor, perm)
+        tensor = tf.gather(tensor, link_ind, axis=2, batch_dims=2)
+        tensor = flatten_dims(tensor, 2, 0)
+        return tf.expand_dims(tensor, 2)
+
+    def _restore_links(self, tensor):
+        # pylint: disable=line-too-long
+        """Restore the batch and UT dimensions of a ``tensor`` of the
+        selected links gathered by :meth:`_gather_links`, oriented according
+        to the link direction.
+
+        Input
+        ------
+        tensor : [batch size*num_ut, num_strongest_links, 1, ...] (downlink) | [batch size*num_ut, 1, num_strongest_links, ...] (uplink)
+            Tensor with one entry per selected link
+
+        Output
+        -------
+        : [batch size, num_strongest_links, num_ut, ...] (downlink) | [batch size, num_ut, num_strongest_links, ...] (uplink)
+            Selected links
+        """
+        s = tf.shape(tensor)
+        tensor = tf.reshape(tensor, tf.concat([[self._scenario.batch_size,
+                                                self._scenario.num_ut,
+                                                -1], s[3:]], 0))
+        if self._scenario.direction == "downlink":
+            perm = [0, 2, 1] + list(range(3, len(tensor.shape)))
+            tensor = tf.transpose(tensor, perm)
+        return tensor
+
+    def _init_link_variables(self):
+        """Create the variables storing the selected links and the large
+        scale gains of all links, if their shapes changed"""
+        batch_size = int(self._scenario.batch_size)
+        num_bs = int(self._scenario.num_bs)
+        num_ut = int(self._scenario.num_ut)
+        k = min(self._num_strongest_links, num_bs)
+        shape_ind = [batch_size, num_ut, k]
+        if self._scenario.direction == "downlink":
+            shape_gain = [batch_size, num_ut, num_bs]
+        else:
+            shape_gain = [batch_size, num_bs, num_ut]
+        if self._link_ind is None or self._link_ind.shape != shape_ind:
+            self._link_ind = tf.Variable(tf.zeros(shape_ind, tf.int32),
+                                         trainable=False)
+        if self._pl_gain is None or self._pl_gain.shape != shape_gain:
+            self._pl_gain = tf.Variable(tf.zeros(shape_gain, self.rdtype),
+                                        trainable=False)
+
+    def _step_12(self,
+                 h,
+                 gain):
+        # pylint: disable=line-too-long
+        """Apply the large scale ``gain``, i.e., path loss and shadow fading,
+        to paths coefficients ``h``.
+
+        Input
+        ------
+        h : [batch size, num_tx, num_rx, num_paths, num_rx_ant, num_tx_ant, num_time_samples], tf.complex
+            Paths coefficients
+
+        gain : [batch size, num_tx, num_rx], tf.float
+            Amplitude gain
+        """
         gain = tf.reshape(gain, tf.concat([tf.shape(gain),
             tf.ones([tf.rank(h)-tf.rank(gain)], tf.int32)],0))
         h *= tf.complex(gain, tf.constant(0., self.rdtype))
 
         return h
+
+    def _prepare_links(self, lsp, rays, phi=None, doppler_phase=None):
+        # pylint: disable=line-too-long
+        r"""Gather the parameters of the links for which path coefficients
+        are generated, oriented according to the link direction.
+
+        Input
+        ------
+        lsp : LSP
+            Large scale parameters
+
+        rays : Rays
+            Rays of all links
+
+        phi : `None` (default) | [batch size, num_bs, num_ut, num clusters, num rays, 4], tf.float
+            Random initial phases of all links
+
+        doppler_phase : `None` (default) | `list`, [[batch size, num_bs, num_ut, num clusters, num rays], [batch size, num_bs, num_ut, 1, 1]], tf.float
+            Doppler phases of the NLoS rays and of the LoS path of all links
+
+        Output
+        -------
+        rays : Rays
+            Rays of the selected links
+
+        phi : `None` | [batch size, num_tx, num_rx, num clusters, num rays, 4], tf.float
+            Random initial phases of the selected links
+
+        doppler_phase : `None` | `list`, [[batch size, num_tx, num_rx, num clusters, num rays], [batch size, num_tx, num_rx, 1, 1]], tf.float
+            Doppler phases of the selected links
+
+        topology : Topology
+            Topology of the selected links
+
+        k_factor : [batch size, num_tx, num_rx], tf.float
+            Rician K-factor
+
+        c_ds : [batch size, num_tx, num_rx], tf.float
+            Cluster delay spread [s]
+
+        gain : [batch size, num_tx, num_rx], tf.float
+            Large scale amplitude gain
+
+        link_ind : `None` | [batch size, num_ut, num_strongest_links], tf.int32
+            BS indices of the selected links
+
+        pl_gain : `None` | [batch size, num_rx, num_tx], tf.float
+            Large scale power gain of all links
+        """
+        link_ind = None
+        pl_gain = None
+
+        # Large scale gain of all links
+        # [batch size, num_bs, num_ut]
+        gain = self._large_scale_gain(lsp.sf)
+
+        los_aoa = deg_2_rad(self._scenario.los_aoa)
+        los_aod = deg_2_rad(self._scenario.los_aod)
+        los_zoa = deg_2_rad(self._scenario.los_zoa)
+        los_zod = deg_2_rad(self._scenario.los_zod)
+        los = self._scenario.los
+        distance_3d = self._scenario.distance_3d
+        bs_orientations = self._scenario.bs_orientations
+        ut_orientations = self._scenario.ut_orientations
+        ut_velocities = self._scenario.ut_velocities
+        k_factor = lsp.k_factor
+
+        # The channel coefficient needs the cluster delay spread parameter in ns
+        c_ds = self._scenario.get_param("cDS")*1e-9
+
+        if self._num_strongest_links is not None:
+            # Only the strongest links of every UT are generated.
+            # Every UT is handled as a separate batch example with a single
+            # UT and `num_strongest_links` BSs, such that the tensors below
+            # have shape [batch size*num_ut, num_strongest_links, 1, ...].
+            # [batch size, num_ut, num_strongest_links]
+            link_ind = self._strongest_links(gain)
+            pl_gain = tf.square(gain)
+            if self._scenario.direction == "downlink":
+                pl_gain = tf.transpose(pl_gain, [0, 2, 1])
+
+            rays = Rays(*[self._gather_links(t, link_ind)
+                          for t in [rays.delays, rays.powers, rays.aoa,
+                                    rays.aod, rays.zoa, rays.zod, rays.xpr]])
+            if phi is not None:
+                phi = self._gather_links(phi, link_ind)
+            if doppler_phase is not None:
+                doppler_phase = [self._gather_links(t, link_ind)
+                                 for t in doppler_phase]
+            los_aoa, los_aod, los_zoa, los_zod, los, distance_3d, c_ds,\
+                k_factor, gain = [self._gather_links(t, link_ind)
+                                  for t in [los_aoa, los_aod, los_zoa, los_zod,
+                                            los, distance_3d, c_ds, k_factor,
+                                            gain]]
+            # [batch size*num_ut, num_strongest_links, 3]
+            bs_orientations = flatten_dims(tf.gather(bs_orientations, link_ind,
+                                                     batch_dims=1), 2, 0)
+            # [batch size*num_ut, 1, 3]
+            ut_orientations = tf.reshape(ut_orientations, [-1, 1, 3])
+            ut_velocities = tf.reshape(ut_velocities, [-1, 1, 3])
+
+        # Sample channel responses
+        # First we need to create a topology
+        # Indicates which end of the channel is moving: TX or RX
+        if self._scenario.direction == 'downlink':
+            moving_end = 'rx'
+            tx_orientations = bs_orientations
+            rx_orientations = ut_orientations
+        else : # 'uplink'
+            moving_end = 'tx'
+            tx_orientations = ut_orientations
+            rx_orientations = bs_orientations
+        topology = Topology(velocities=ut_velocities,
+                            moving_end=moving_end,
+                            los_aoa=los_aoa,
+                            los_aod=los_aod,
+                            los_zoa=los_zoa,
+                            los_zod=los_zod,
+                            los=los,
+                            distance_3d=distance_3d,
+                            tx_orientations=tx_orientations,
+                            rx_orientations=rx_orientations)
+
+        # According to the link direction, we need to specify which from BS
+        # and UT is uplink, and which is downlink.
+        # Default is downlink, so we need to do some tranpose to switch tx and
+        # rx and to switch angle of arrivals and departure if direction is set
+        # to uplink. Nothing needs to be done if direction is downlink
+        if self._scenario.direction == "uplink":
+            # A new Rays object is created as the input rays might be reused
+            rays = Rays(delays=tf.transpose(rays.delays, [0, 2, 1, 3]),
+                        powers=tf.transpose(rays.powers, [0, 2, 1, 3]),
+                        aoa=tf.transpose(rays.aod, [0, 2, 1, 3, 4]),
+                        aod=tf.transpose(rays.aoa, [0, 2, 1, 3, 4]),
+                        zoa=tf.transpose(rays.zod, [0, 2, 1, 3, 4]),
+                        zod=tf.transpose(rays.zoa, [0, 2, 1, 3, 4]),
+                        xpr=tf.transpose(rays.xpr, [0, 2, 1, 3, 4]))
+            if phi is not None:
+                phi = tf.transpose(phi, [0, 2, 1, 3, 4, 5])
+            if doppler_phase is not None:
+                doppler_phase = [tf.transpose(t, [0, 2, 1, 3, 4])
+                                 for t in doppler_phase]
+            los_aod = topology.los_aod
+            los_aoa = topology.los_aoa
+            los_zod = topology.los_zod
+            los_zoa = topology.los_zoa
+            topology.los_aoa = tf.transpose(los_aod, [0, 2, 1])
+            topology.los_aod = tf.transpose(los_aoa, [0, 2, 1])
+            topology.los_zoa = tf.transpose(los_zod, [0, 2, 1])
+            topology.los_zod = tf.transpose(los_zoa, [0, 2, 1])
+            topology.los = tf.transpose(topology.los, [0, 2, 1])
+            c_ds = tf.transpose(c_ds, [0, 2, 1])
+            topology.distance_3d = tf.transpose(topology.distance_3d, [0, 2, 1])
+            # Concerning LSPs, only the K-factor and the large scale gain are
+            # used. We do not transpose the others to reduce complexity
+            k_factor = tf.transpose(k_factor, [0, 2, 1])
+            gain = tf.transpose(gain, [0, 2, 1])
+
+        return rays, phi, doppler_phase, topology, k_factor, c_ds, gain,\
+            link_ind, pl_gain
+
+    def _format_outputs(self, h, delays, gain, link_ind, pl_gain, rays):
+        # pylint: disable=line-too-long
+        r"""Apply the large scale gain to the path coefficients and arrange
+        the outputs.
+
+        Input
+        ------
+        h : [batch size, num_tx, num_rx, num_paths, num_rx_ant, num_tx_ant, num_time_samples], tf.complex
+            Paths coefficients
+
+        delays : [batch size, num_tx, num_rx, num_paths], tf.float
+            Paths delays
+
+        gain : [batch size, num_tx, num_rx], tf.float
+            Large scale amplitude gain
+
+        link_ind : `None` | [batch size, num_ut, num_strongest_links], tf.int32
+            BS indices of the selected links
+
+        pl_gain : `None` | [batch size, num_rx, num_tx], tf.float
+            Large scale power gain of all links
+
+        rays : Rays
+            Rays of the selected links
+
+        Output
+        -------
+        : `tuple`
+            Outputs of the channel model
+        """
+        # Step 12
+        h = self._step_12(h, gain)
+
+        # Reshaping to match the expected output
+        h = tf.transpose(h, [0, 2, 4, 1, 5, 3, 6])
+        delays = tf.transpose(delays, [0, 2, 1, 3])
+
+        if self._num_strongest_links is not None:
+            batch_size = self._scenario.batch_size
+            num_ut = self._scenario.num_ut
+            # Restore the batch and UT dimensions
+            if self._scenario.direction == "downlink":
+                # [batch size, num_ut, num_rx_ant, k, num_tx_ant, ...]
+                h = tf.reshape(h, tf.concat([[batch_size, num_ut],
+                                             tf.shape(h)[2:]], 0))
+                delays = tf.reshape(delays, tf.concat([[batch_size, num_ut],
+                                                       tf.shape(delays)[2:]],
+                                                      0))
+            else:
+                # [batch size, k, num_rx_ant, num_ut, num_tx_ant, ...]
+                k = tf.shape(link_ind)[2]
+                h = tf.reshape(h, tf.concat([[batch_size, num_ut, k],
+                                             tf.shape(h)[2:3],
+                                             tf.shape(h)[4:]], 0))
+                h = tf.transpose(h, [0, 2, 3, 1, 4, 5, 6])
+                delays = tf.reshape(delays, tf.concat([[batch_size, num_ut, k],
+                                                       tf.shape(delays)[3:]],
+                                                      0))
+                delays = tf.transpose(delays, [0, 2, 1, 3])
+
+        # Stop gradients to avoid useless backpropagation
+        h = tf.stop_gradient(h)
+        delays = tf.stop_gradient(delays)
+
+        if self._num_strongest_links is not None:
+            self._link_ind.assign(link_ind)
+            self._pl_gain.assign(tf.stop_gradient(pl_gain))
+
+        if self.return_rays:
+            if self._num_strongest_links is not None:
+                rays = Rays(*[self._restore_links(t)
+                              for t in [rays.delays, rays.powers, rays.aoa,
+                                        rays.aod, rays.zoa, rays.zod,
+                                        rays.xpr]])
+            return h, delays, rays
+        else:
+            return h, delays
+
+    def _update_drop(self):
+        r"""Compute the time-invariant state of the current drop for the
+        current topology and store it in variables"""
+        lsp, rays, phi = self._drop_sample
+
+        # Accumulate the Doppler phases since the last update with the
+        # Doppler rates of the previous topology, such that the phases are
+        # continuous if the velocities or angles change
+        rates = self._doppler_rates(rays)
+        drop_time = self._drop_time.value()
+        if self._drop_doppler is None:
+            phases = [tf.zeros_like(r) for r in rates]
+            distance_3d = self._scenario.distance_3d
+        else:
+            prev_rates, phases, update_time, distance_3d = self._drop_doppler
+            phases = [p + r*(drop_time - update_time)
+                      for p, r in zip(phases, prev_rates)]
+        self._drop_doppler = (rates, phases, drop_time, distance_3d)
+        self._drop_update_time.assign(drop_time)
+
+        # The phase progress of the LoS path due to the displacement of the
+        # UTs is already accounted for by the Doppler phase. The phase shift
+        # due to the propagation distance is hence kept at the one of the
+        # beginning of the drop.
+        phase_nlos, phase_los = phases
+        lambda_0 = self._cir_sampler._lambda_0
+        phase_los -= tf.reshape(2*PI/lambda_0*(self._scenario.distance_3d
+                                               - distance_3d),
+                                tf.shape(phase_los))
+
+        rays, phi, doppler_phase, topology, k_factor, c_ds, gain, link_ind,\
+            pl_gain = self._prepare_links(lsp, rays, phi,
+                                          [phase_nlos, phase_los])
+        h_ray, cluster_ind, delays_nlos, h_los_static, k_factor =\
+            self._cir_sampler._step_11_static(phi, topology, k_factor, rays,
+                                              c_ds)
+
+        # Apply the accumulated Doppler phases
+        phase_nlos, phase_los = doppler_phase
+        phase_nlos = tf.gather(phase_nlos, cluster_ind, batch_dims=3, axis=3)
+        zero = tf.constant(0., self.rdtype)
+        h_ray *= tf.exp(tf.complex(zero, phase_nlos))[...,tf.newaxis]
+        h_los_static *= tf.exp(tf.complex(zero, phase_los))[...,tf.newaxis,
+                                                            tf.newaxis]
+        static = (h_ray, cluster_ind, delays_nlos, h_los_static, k_factor)
+        state = {"static" : static,
+                 "rays" : [rays.delays, rays.powers, rays.aoa, rays.aod,
+                           rays.zoa, rays.zod, rays.xpr],
+                 "topology" : [topology.velocities, topology.los_aoa,
+                               topology.los_aod, topology.los_zoa,
+                               topology.los_zod, topology.los,
+                               topology.distance_3d, topology.tx_orientations,
+                               topology.rx_orientations],
+                 "gain" : gain}
+        if self._num_strongest_links is not None:
+            state["link_ind"] = link_ind
+            state["pl_gain"] = pl_gain
+
+        # Reuse the variables if the shapes of the state did not change
+        reuse = self._drop_state is not None
+        if reuse:
+            shapes = tf.nest.map_structure(lambda v: v.shape,
+                                           self._drop_state)
+            reuse = shapes == tf.nest.map_structure(lambda t: t.shape, state)
+        if reuse:
+            tf.nest.map_structure(lambda v, t: v.assign(t),
+                                  self._drop_state, state)
+        else:
+            self._drop_state = tf.nest.map_structure(
+                                lambda t: tf.Variable(t, trainable=False),
+                                state)
+
+    def _doppler_rates(self, rays):
+        # pylint: disable=line-too-long
+        r"""Compute the rates of the Doppler phases of all links
+
+        As for the generation of the channel coefficients, the angles of
+        arrival of the downlink are used for the downlink and the angles of
+        departure of the downlink for the uplink.
+
+        Input
+        ------
+        rays : Rays
+            Rays of all links
+
+        Output
+        -------
+        rate_nlos : [batch size, num_bs, num_ut, num clusters, num rays], tf.float
+            Doppler phase rates of the NLoS rays [radian/s]
+
+        rate_los : [batch size, num_bs, num_ut, 1, 1], tf.float
+            Doppler phase rates of the LoS paths [radian/s]
+        """
+        if self._scenario.direction == "downlink":
+            aoa, zoa = rays.aoa, rays.zoa
+            los_aoa = self._scenario.los_aoa
+            los_zoa = self._scenario.los_zoa
+        else:
+            aoa, zoa = rays.aod, rays.zod
+            los_aoa = self._scenario.los_aod
+            los_zoa = self._scenario.los_zod
+        los_aoa = deg_2_rad(los_aoa)[...,tf.newaxis,tf.newaxis]
+        los_zoa = deg_2_rad(los_zoa)[...,tf.newaxis,tf.newaxis]
+
+        # UTs are the moving end, i.e., the receivers in the BS-UT layout.
+        # Only the velocities are required.
+        topology = Topology(velocities=self._scenario.ut_velocities,
+                            moving_end="rx",
+                            los_aoa=None,
+                            los_aod=None,
+                            los_zoa=None,
+                            los_zod=None,
+                            los=None,
+                            distance_3d=None,
+                            tx_orientations=None,
+                            rx_orientations=None)
+        rate_nlos = self._cir_sampler._step_11_doppler_rate(topology, aoa, zoa)
+        rate_los = self._cir_sampler._step_11_doppler_rate(topology, los_aoa,
+                                                           los_zoa)
+        return [rate_nlos, rate_los]
+
+    def _call_drop(self, num_time_samples, sampling_frequency):
+        r"""Generate the channel of the current drop for the next
+        ``num_time_samples`` time samples, starting at :attr:`drop_time`"""
+        state = tf.nest.map_structure(lambda v: v.value(), self._drop_state)
+        rays = Rays(*state["rays"])
+        velocities, los_aoa, los_aod, los_zoa, los_zod, los, distance_3d,\
+            tx_orientations, rx_orientations = state["topology"]
+        moving_end = "rx" if self._scenario.direction == "downlink" else "tx"
+        topology = Topology(velocities=velocities,
+                            moving_end=moving_end,
+                            los_aoa=los_aoa,
+                            los_aod=los_aod,
+                            los_zoa=los_zoa,
+                            los_zod=los_zod,
+                            los=los,
+                            distance_3d=distance_3d,
+                            tx_orientations=tx_orientations,
+                            rx_orientations=rx_orientations)
+
+        # Sample times, continuing from the end of the previous call. The
+        # times are relative to the last topology update, as the Doppler
+        # phases accumulated until then are part of the stored state.
+        duration = tf.cast(num_time_samples, self.rdtype)/\
+                   tf.cast(sampling_frequency, self.rdtype)
+        t = self._drop_time - self._drop_update_time\
+            + tf.range(num_time_samples, dtype=self.rdtype)/\
+              tf.cast(sampling_frequency, self.rdtype)
+        self._drop_time.assign_add(duration)
+
+        h, delays = self._cir_sampler._step_11_dynamic(state["static"],
+                                                       topology, rays, t)
+
+        return self._format_outputs(h, delays, state["gain"],
+                                    state.get("link_ind"),
+                                    state.get("pl_gain"), rays)
@@ -261,7 +261,17 @@ class SystemLevelScenario(Object):
     def matrix_ut_distance_2d(self):
         r"""Distance between all pairs of UTs in the X-Y plan [m].
         [batch size, number of UTs, number of UTs]"""
-        return self._matrix_ut_distance_2d
+        # Computed on demand as it scales quadratically with the number of UTs
+        ut_loc_xy = self._ut_loc[:,:,:2]
+
+        ut_loc_xy_expanded_1 = tf.expand_dims(ut_loc_xy, axis=1)
+        ut_loc_xy_expanded_2 = tf.expand_dims(ut_loc_xy, axis=2)
+
+        delta_loc_xy = ut_loc_xy_expanded_1 - ut_loc_xy_expanded_2
+
+        matrix_ut_distance_2d = tf.sqrt(tf.reduce_sum(tf.square(delta_loc_xy),
+                                                       axis=3))
+        return matrix_ut_distance_2d
 
     @property
     def los_aod(self):
@@ -669,7 +679,6 @@ class SystemLevelScenario(Object):
         Computes the following internal values:
         * 2D distances for all BS-UT pairs in the X-Y plane
         * 3D distances for all BS-UT pairs
-        * 2D distances for all pairs of UTs in the X-Y plane
         * LoS AoA, AoD, ZoA, ZoD for all BS-UT pairs
 
         This function is called at every update of the topology.
@@ -703,18 +712,6 @@ class SystemLevelScenario(Object):
         self._los_zod = wrap_angle_0_360(rad_2_deg(los_zod))
         self._los_zoa = wrap_angle_0_360(rad_2_deg(los_zoa))
 
-        # 2D distances for all pairs of UTs in the (x-y) plane
-        ut_loc_xy = self._ut_loc[:,:,:2]
-
-        ut_loc_xy_expanded_1 = tf.expand_dims(ut_loc_xy, axis=1)
-        ut_loc_xy_expanded_2 = tf.expand_dims(ut_loc_xy, axis=2)
-
-        delta_loc_xy = ut_loc_xy_expanded_1 - ut_loc_xy_expanded_2
-
-        matrix_ut_distance_2d = tf.sqrt(tf.reduce_sum(tf.square(delta_loc_xy),
-                                                       axis=3))
-        self._matrix_ut_distance_2d = matrix_ut_distance_2d
-
     def _sample_los(self):
         r"""Set the LoS state of each UT randomly, following the procedure
         described in section 7.4.2 of TR 38.901.
@@ -90,6 +90,22 @@ class UMi(SystemLevelChannel):
         new generation of channel impulse responses. Otherwise, always reuse
         the same LSPs, except if the topology is changed.
 
+    num_strongest_links : `None` (default) | `int`
+        If not `None`, path coefficients are only generated for the
+        ``num_strongest_links`` links of every UT with the largest pathloss
+        and shadow fading gain. See
+        :class:`~sionna.phy.channel.tr38901.SystemLevelChannel` for the
+        resulting outputs.
+
+    drop_mode : `bool`, (default `False`)
+        If `True`, the channel evolves continuously over consecutive calls,
+        with LSPs and rays sampled only once per drop. See
+        :class:`~sionna.phy.channel.tr38901.SystemLevelChannel`.
+
+    spatial_correlation_method : "cholesky" (default) | "sos"
+        Method used to spatially correlate the LSPs. See
+        :class:`~sionna.phy.channel.tr38901.LSPGenerator`.
+
     precision : `None` (default) | "single" | "double"
         Precision used for internal calculations and outputs.
         If set to `None`,
@@ -113,11 +129,15 @@ class UMi(SystemLevelChannel):
     """
     def __init__(self, carrier_frequency, o2i_model, ut_array, bs_array,
         direction, enable_pathloss=True, enable_shadow_fading=True,
-        always_generate_lsp=False, precision=None):
+        always_generate_lsp=False, num_strongest_links=None,
+        precision=None, drop_mode=False,
+        spatial_correlation_method="cholesky"):
 
         # RMa scenario
         scenario = UMiScenario(carrier_frequency, o2i_model, ut_array, bs_array,
                                direction, enable_pathloss, enable_shadow_fading,
                                precision)
 
-        super().__init__(scenario, always_generate_lsp)
+        super().__init__(scenario, always_generate_lsp, num_strongest_links,
+                         drop_mode=drop_mode,
+                         spatial_correlation_method=spatial_correlation_method)
@@ -180,7 +180,8 @@ def time_lag_discrete_time_channel(bandwidth,
 def cir_to_ofdm_channel(frequencies,
                         a,
                         tau,
-                        normalize=False):
+                        normalize=False,
+                        chunk_size=None):
     # pylint: disable=line-too-long
     r"""
     Compute the frequency response of the channel at ``frequencies``
@@ -193,6 +194,13 @@ def cir_to_ofdm_channel(frequencies,
     .. math::
         \widehat{h}(f) = \sum_{m=0}^{M-1} a_{m} e^{-j2\pi f \tau_{m}}
 
+    The sum over the paths is computed as a matrix product of the path
+    coefficients and the phase terms :math:`e^{-j2\pi f \tau_{m}}`, i.e.,
+    the tensor of shape `[..., num_paths, num_time_steps, fft_size]` is
+    never materialized. The phase terms are computed once per delay and
+    frequency and reused across all time steps (and antennas if ``tau``
+    does not depend on the antennas).
+
     Input
     ------
     frequencies : [fft_size], `tf.float`
@@ -207,6 +215,12 @@ def cir_to_ofdm_channel(frequencies,
     normalize : `bool`, (default `False`)
         If set to `True`, the channel is normalized over the resource grid
 
+    chunk_size : `None` (default) | `int`
+        If not `None`, the frequency response is computed for blocks of at
+        most ``chunk_size`` subcarriers at a time. This bounds the memory
+        required for the phase terms to ``num_paths`` :math:`\times`
+        ``chunk_size`` elements per link.
+
     Output
     -------
     h_f : [batch size, num_rx, num_rx_ant, num_tx, num_tx_ant, num_time_steps, fft_size], `tf.complex`
@@ -215,44 +229,54 @@ def cir_to_ofdm_channel(frequencies,
 
     real_dtype = tau.dtype
 
+    if chunk_size is not None:
+        if not isinstance(chunk_size, int):
+            raise TypeError("`chunk_size` must be int or None")
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be positive")
+
     if len(tau.shape) == 4:
-        # Expand dims to broadcast with h. Add the following dimensions:
-        #  - number of rx antennas (2)
-        #  - number of tx antennas (4)
+        # Insert singleton dimensions for the rx and tx antennas. The phase
+        # terms are broadcasted by the matrix product.
         tau = tf.expand_dims(tf.expand_dims(tau, axis=2), axis=4)
-        # Broadcast is not supported yet by TF for such high rank tensors.
-        # We therefore do part of it manually
-        tau = tf.tile(tau, [1, 1, 1, 1, a.shape[4], 1])
 
-    # Add a time samples dimension for broadcasting
-    tau = tf.expand_dims(tau, axis=6)
-
-    # Bring all tensors to broadcastable shapes
+    # Add a frequency dimension
+    # [..., num_paths, 1]
     tau = tf.expand_dims(tau, axis=-1)
-    h = tf.expand_dims(a, axis=-1)
-    frequencies = expand_to_rank(frequencies, tf.rank(tau), axis=0)
 
-    # Compute the Fourier transforms of all cluster taps
-    # Exponential component
-    e = tf.exp(tf.complex(tf.constant(0, real_dtype),
-                          -2*PI*frequencies*tau))
-    h_f = h*e
-    # Sum over all clusters to get the channel frequency responses
-    h_f = tf.reduce_sum(h_f, axis=-3)
+    def freq_response(f):
+        # Exponential component
+        # [..., num_paths, len(f)]
+        e = tf.exp(tf.complex(tf.constant(0, real_dtype),
+                              -2*PI*f*tau))
+        # Sum over all clusters to get the channel frequency responses
+        # [..., num_time_steps, len(f)]
+        return tf.linalg.matmul(a, e, transpose_a=True)
+
+    fft_size = frequencies.shape[0]
+    if chunk_size is None or chunk_size >= fft_size:
+        h_f = freq_response(frequencies)
+    else:
+        h_f = tf.concat([freq_response(frequencies[i:i+chunk_size])
+                         for i in range(0, fft_size, chunk_size)], axis=-1)
 
     if normalize:
-        # Normalization is performed such that for each batch example and
-        # link the energy per resource grid is one.
-        # Average over TX antennas, RX antennas, OFDM symbols and
-        # subcarriers.
-        c = tf.reduce_mean(tf.square(tf.abs(h_f)), axis=(2, 4, 5, 6),
-                           keepdims=True)
-        c = tf.complex(tf.sqrt(c), tf.constant(0., real_dtype))
-        h_f = tf.math.divide_no_nan(h_f, c)
+        h_f = _normalize_ofdm_channel(h_f)
 
     return h_f
 
 
+def _normalize_ofdm_channel(h_f):
+    """Normalizes channel frequency responses such that for each batch
+    example and link the energy per resource grid is one"""
+    # Average over TX antennas, RX antennas, OFDM symbols and
+    # subcarriers.
+    c = tf.reduce_mean(tf.square(tf.abs(h_f)), axis=(2, 4, 5, 6),
+                       keepdims=True)
+    c = tf.complex(tf.sqrt(c), tf.constant(0., h_f.dtype.real_dtype))
+    return tf.math.divide_no_nan(h_f, c)
+
+
 def cir_to_time_channel(bandwidth,
                         a,
                         tau,
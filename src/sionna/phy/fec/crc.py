@@ -20,6 +20,13 @@ class CRCEncoder(Block):
         Defines the CRC polynomial to be used. Can be any value from
         `{CRC24A, CRC24B, CRC24C, CRC16, CRC11, CRC6}`.
 
+    method: str, 'matrix' (default) | 'packed'
+        Defines how the CRC parity bits are computed. For 'matrix', the
+        input bits are multiplied by a dense generator matrix in floating
+        point arithmetic. For 'packed', the rows of the generator matrix are
+        packed into integer words and the parity bits are obtained by XOR-ing
+        the words selected by the input bits. Both methods are bit-exact.
+
     precision : `None` (default) | 'single' | 'double'
         Precision used for internal calculations and outputs.
         If set to `None`, :py:attr:`~sionna.phy.config.precision` is used.
@@ -43,18 +50,32 @@ class CRCEncoder(Block):
         implementation is used for fixed `k` instead of the more common shift
         register-based operations. Thus, the encoder must trigger an
         (internal) rebuild if `k` changes.
+
+        The 'packed' method only requires one integer word per information
+        bit, instead of `crc_degree` floating point values, and does not
+        create floating point copies of the input. It is therefore preferred
+        for long sequences and for the verification of many codewords,
+        e.g., the code blocks of a transport block.
     """
 
-    def __init__(self, crc_degree, *, precision=None, **kwargs):
+    def __init__(self, crc_degree, *, method="matrix", precision=None,
+                 **kwargs):
 
         super().__init__(precision=precision, **kwargs)
 
         assert isinstance(crc_degree, str), "crc_degree must be a string."
         self._crc_degree = crc_degree
 
+        if method not in ("matrix", "packed"):
+            raise ValueError("method must be 'matrix' or 'packed'.")
+        self._method = method
+
         # init 5G CRC polynomial
         self._crc_pol, self._crc_length = self._select_crc_pol(self._crc_degree)
 
+        # packed generator matrix rows, extended on demand
+        self._g_words = np.zeros([0], np.int32)
+
         self._k = None
         self._n = None
 
@@ -77,6 +98,11 @@ class CRCEncoder(Block):
         """CRC polynomial in binary representation"""
         return self._crc_pol
 
+    @property
+    def method(self):
+        """Method used to compute the CRC parity bits"""
+        return self._method
+
     @property
     def k(self):
         """Number of information bits per codeword"""
@@ -155,6 +181,51 @@ class CRCEncoder(Block):
 
         return g_mat
 
+    def _crc_words(self, k):
+        """Rows of the generator matrix packed into integer words.
+
+        The `i`-th row of the generator matrix only depends on the distance
+        `k-i` to the end of the sequence. Thus, the words of the longest
+        sequence seen so far are stored and the last ``k`` words are returned.
+        The MSB of the `crc_length` least significant bits of each word
+        corresponds to the first parity bit.
+        """
+        if k > self._g_words.shape[0]:
+            g_mat = self._gen_crc_mat(k, self.crc_pol).astype(np.int64)
+            weights = 2**np.arange(self._crc_length-1, -1, -1, dtype=np.int64)
+            self._g_words = (g_mat @ weights).astype(np.int32)
+        return tf.constant(self._g_words[self._g_words.shape[0]-k:], tf.int32)
+
+    def _crc_register(self, bits):
+        """Computes the packed CRC remainder of ``bits`` along the last
+        dimension in integer arithmetic.
+
+        Input
+        -----
+        bits : [...,k], tf.float | tf.int
+            Binary tensor
+
+        Output
+        ------
+        : [...], tf.int32
+            CRC remainder, where the MSB of the `crc_length` least
+            significant bits corresponds to the first parity bit
+        """
+        k = bits.shape[-1]
+        assert k is not None, "Shape of last dimension cannot be None."
+
+        # select the words of all non-zero bits
+        x = tf.cast(bits, tf.int32) * self._crc_words(k)
+
+        # XOR-reduction of the selected words along the last dimension
+        rank = len(bits.shape)
+        while x.shape[-1] > 1:
+            if x.shape[-1] % 2 == 1:
+                x = tf.pad(x, [[0, 0]]*(rank-1) + [[0, 1]])
+            l = x.shape[-1] // 2
+            x = tf.bitwise.bitwise_xor(x[..., :l], x[..., l:])
+        return x[..., 0]
+
     ########################
     # Sionna Block functions
     ########################
@@ -166,11 +237,12 @@ class CRCEncoder(Block):
         """
         k = input_shape[-1] # we perform the CRC check on the last dimension
         assert k is not None, "Shape of last dimension cannot be None."
-        g_mat_crc = self._gen_crc_mat(k, self.crc_pol)
-        self._g_mat_crc = tf.constant(g_mat_crc, dtype=self.rdtype)
+        if self._method == "matrix":
+            g_mat_crc = self._gen_crc_mat(k, self.crc_pol)
+            self._g_mat_crc = tf.constant(g_mat_crc, dtype=self.rdtype)
 
         self._k = k
-        self._n = k + g_mat_crc.shape[1]
+        self._n = k + self._crc_length
 
     def call(self, bits, /):
         """Cyclic Redundancy Check (CRC) function.
@@ -188,9 +260,19 @@ class CRCEncoder(Block):
         """
 
         # re-init if shape has changed, update generator matrix
-        if bits.shape[-1] != self._g_mat_crc.shape[0]:
+        if bits.shape[-1] != self._k:
             self.build(bits.shape)
 
+        if self._method == "packed":
+            # CRC remainder of the information bits
+            crc = self._crc_register(bits)
+            # unpack the parity bits
+            shifts = tf.range(self._crc_length-1, -1, -1, dtype=tf.int32)
+            x_crc = tf.bitwise.bitwise_and(
+                tf.bitwise.right_shift(tf.expand_dims(crc, -1), shifts), 1)
+            x_crc = tf.cast(x_crc, dtype=bits.dtype)
+            return tf.concat([bits, x_crc], -1)
+
         # note: as the code is systematic, we only encode the crc positions
         # thus, the generator matrix is non-sparse and a "full" matrix
         # multiplication is probably the fastest TF implementation.
@@ -306,6 +388,13 @@ class CRCDecoder(Block):
         if x_crc.shape[-1] != self._bit_shape:
             self.build(x_crc.shape)
 
+        if self._encoder.method == "packed":
+            # the CRC remainder of a valid codeword is zero
+            x_info = x_crc[...,0:-self._encoder.crc_length]
+            crc = self._encoder._crc_register(x_crc) # pylint: disable=protected-access
+            crc_check = tf.expand_dims(tf.equal(crc, 0), axis=-1)
+            return x_info, crc_check
+
         # re-encode information bits of x and verify that CRC bits are correct
         x_info = x_crc[...,0:-self._encoder.crc_length]
         x_parity = self._encoder(x_crc)[...,-self._encoder.crc_length:]
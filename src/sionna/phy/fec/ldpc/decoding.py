@@ -98,13 +98,22 @@ class LDPCBPDecoder(Block):
         `num_update_steps` subiterations, thus the decoder's level of
         parallelization is lower and usually the decoding throughput decreases.
 
+    edge_layout: "ragged" (default) | "dense"
+        Memory layout of the messages during the node updates. "ragged"
+        uses ragged tensors to account for irregular node degrees. "dense"
+        stores the messages as padded tensors of shape
+        `[num_nodes, max_degree, batch_size]` together with a mask. The
+        "dense" layout supports XLA (`jit_compile=True`) for all check node
+        updates and yields the same results as the "ragged" layout. It
+        requires ``cn_update`` and ``vn_update`` to be one of the built-in
+        update rules and does not support callbacks.
+
     hard_out: `bool`, (default `True`)
         If `True`,  the decoder provides hard-decided codeword bits instead of
         soft-values.
 
     num_iter: int
-        Defining the number of decoder iteration (due to batching, no early
-        stopping used at the moment!).
+        Defining the (maximum) number of decoder iterations.
 
     llr_max: float (default 20) | `None`
         Internal clipping value for all internal messages. If `None`, no
@@ -131,6 +140,24 @@ class LDPCBPDecoder(Block):
         second input when calling the decoder.
         This can be used for iterative demapping and decoding.
 
+    early_stop: `bool`, (default `False`)
+        If `True`, the syndrome of the current hard-decided estimate is
+        evaluated after each iteration. Codewords that fulfill all parity
+        checks are frozen, i.e., their messages and estimates are not updated
+        anymore, and decoding stops as soon as all codewords of the batch
+        have converged or ``num_iter`` iterations are reached.
+
+    compact_batch: `bool`, (default `False`)
+        If `True`, converged codewords are removed from the batch such that
+        they do not consume compute in subsequent iterations. Requires
+        ``early_stop`` to be `True`. Note that this results in dynamic shapes
+        and is, thus, not compatible with XLA. Callbacks only receive the
+        messages of the remaining codewords.
+
+    return_num_iter: `bool`, (default `False`)
+        If `True`, the number of decoding iterations of each codeword is
+        returned as additional output.
+
     precision : `None` (default) | 'single' | 'double'
         Precision used for internal calculations and outputs.
         If set to `None`, :py:attr:`~sionna.phy.config.precision` is used.
@@ -156,6 +183,10 @@ class LDPCBPDecoder(Block):
         Tensor of VN messages representing the internal decoder state.
         Returned only if ``return_state`` is set to `True`.
 
+    : [...], tf.int32
+        Number of decoding iterations of each codeword.
+        Returned only if ``return_num_iter`` is set to `True`.
+
     Note
     ----
     As decoding input logits :math:`\operatorname{log} \frac{p(x=1)}{p(x=0)}`
@@ -177,12 +208,16 @@ class LDPCBPDecoder(Block):
                  cn_update="boxplus-phi",
                  vn_update="sum",
                  cn_schedule="flooding",
+                 edge_layout="ragged",
                  hard_out=True,
                  num_iter=20,
                  llr_max=20.,
                  v2c_callbacks=None,
                  c2v_callbacks=None,
                  return_state=False,
+                 early_stop=False,
+                 compact_batch=False,
+                 return_num_iter=False,
                  precision=None,
                  **kwargs):
 
@@ -197,6 +232,14 @@ class LDPCBPDecoder(Block):
             raise ValueError('num_iter cannot be negative.')
         if not isinstance(return_state, bool):
             raise TypeError('return_state must be bool.')
+        if not isinstance(early_stop, bool):
+            raise TypeError('early_stop must be bool.')
+        if not isinstance(compact_batch, bool):
+            raise TypeError('compact_batch must be bool.')
+        if compact_batch and not early_stop:
+            raise ValueError('compact_batch requires early_stop.')
+        if not isinstance(return_num_iter, bool):
+            raise TypeError('return_num_iter must be bool.')
 
         if isinstance(pcm, np.ndarray):
             if not np.array_equal(pcm, pcm.astype(bool)):
@@ -215,6 +258,9 @@ class LDPCBPDecoder(Block):
         self._hard_out = hard_out
         self._num_iter = tf.constant(num_iter, dtype=tf.int32)
         self._return_state = return_state
+        self._early_stop = early_stop
+        self._compact_batch = compact_batch
+        self._return_num_iter = return_num_iter
 
         self._num_cns = pcm.shape[0] # total number of check nodes
         self._num_vns = pcm.shape[1] # total number of variable nodes
@@ -340,6 +386,78 @@ class LDPCBPDecoder(Block):
                                 values=v2c_perm_inv,
                                 value_rowids=self._vn_idx)
 
+        if edge_layout=="ragged":
+            self._edge_layout = "ragged"
+        elif edge_layout=="dense":
+            self._edge_layout = "dense"
+            self._init_dense_layout(cn_update, vn_update, v2c_perm,
+                                    v2c_perm_inv)
+        else:
+            raise ValueError("edge_layout must be 'ragged' or 'dense'.")
+
+    def _init_dense_updates(self, cn_update, vn_update, edge_layout):
+        """Selects the node update functions for padded messages."""
+        if self._v2c_callbacks or self._c2v_callbacks:
+            raise ValueError("Callbacks are not supported for the "
+                             f"{edge_layout} edge_layout.")
+
+        cn_updates = {'boxplus': _cn_update_tanh_dense,
+                      'boxplus-phi': _cn_update_phi_dense,
+                      'minsum': _cn_update_minsum_dense,
+                      'min': _cn_update_minsum_dense,
+                      'offset-minsum': _cn_update_offset_minsum_dense,
+                      'identity': cn_node_update_identity}
+        vn_updates = {'sum': _vn_update_sum_dense,
+                      'identity': vn_node_update_identity}
+        if not (isinstance(cn_update, str) and cn_update in cn_updates):
+            raise ValueError(f"The {edge_layout} edge_layout requires a "
+                             "built-in cn_update.")
+        if not (isinstance(vn_update, str) and vn_update in vn_updates):
+            raise ValueError(f"The {edge_layout} edge_layout requires a "
+                             "built-in vn_update.")
+        self._cn_update_dense = cn_updates[cn_update]
+        self._vn_update_dense = vn_updates[vn_update]
+
+    def _init_dense_layout(self, cn_update, vn_update, v2c_perm,
+                           v2c_perm_inv):
+        """Initializes the index tensors of the padded message layout.
+
+        All padded positions point to the additional (dummy) edge with index
+        ``num_edges``.
+        """
+        self._init_dense_updates(cn_update, vn_update, "dense")
+
+        # CN perspective; position p of the CN-ordered edges
+        cn_of_pos = self._cn_idx[v2c_perm]
+        cn_deg = np.bincount(self._cn_idx, minlength=self._num_cns)
+        cn_slot = np.arange(self._num_edges) - (np.cumsum(cn_deg)
+                                                - cn_deg)[cn_of_pos]
+        max_dc = np.max(cn_deg)
+        # VN-ordered edge index of each CN slot
+        cn_edges = np.full([self._num_cns, max_dc], self._num_edges)
+        cn_edges[cn_of_pos, cn_slot] = v2c_perm
+        # CN-ordered edge position of each CN slot
+        cn_pos = np.full([self._num_cns, max_dc], self._num_edges)
+        cn_pos[cn_of_pos, cn_slot] = np.arange(self._num_edges)
+
+        # VN perspective; edges are sorted by VN index
+        vn_deg = np.bincount(self._vn_idx, minlength=self._num_vns)
+        vn_slot = np.arange(self._num_edges) - (np.cumsum(vn_deg)
+                                                - vn_deg)[self._vn_idx]
+        max_dv = np.max(vn_deg)
+        # CN-ordered edge position of each VN slot
+        vn_edges = np.full([self._num_vns, max_dv], self._num_edges)
+        vn_edges[self._vn_idx, vn_slot] = v2c_perm_inv
+
+        self._cn_edges_dense = tf.constant(cn_edges, tf.int32)
+        self._cn_pos_dense = tf.constant(cn_pos, tf.int32)
+        self._cn_mask_dense = tf.constant(cn_edges < self._num_edges)
+        self._vn_edges_dense = tf.constant(vn_edges, tf.int32)
+        # position of each edge in the flattened padded tensors
+        self._cn_flat_idx = tf.constant(cn_of_pos*max_dc + cn_slot, tf.int32)
+        self._vn_flat_idx = tf.constant(self._vn_idx*max_dv + vn_slot,
+                                        tf.int32)
+
     ###############################
     # Public methods and properties
     ###############################
@@ -405,6 +523,21 @@ class LDPCBPDecoder(Block):
         """Return internal decoder state for IDD schemes"""
         return self._return_state
 
+    @property
+    def edge_layout(self):
+        """Memory layout of the messages during the node updates"""
+        return self._edge_layout
+
+    @property
+    def early_stop(self):
+        """Stop decoding of codewords that fulfill all parity checks"""
+        return self._early_stop
+
+    @property
+    def return_num_iter(self):
+        """Return number of decoding iterations per codeword"""
+        return self._return_num_iter
+
     #########################
     # Decoding functions
     #########################
@@ -455,6 +588,10 @@ class LDPCBPDecoder(Block):
             Total number of decoding iterations
         """
 
+        if self._edge_layout=="dense":
+            return self._bp_iter_dense(msg_v2c, msg_c2v, llr_ch, x_hat, it,
+                                       num_iter)
+
         # Unroll loop to keep XLA / Keras compatibility
         # For flooding this will be unrolled to a single loop iteration
         for j in range(self._cn_schedule.shape[0]):
@@ -519,6 +656,68 @@ class LDPCBPDecoder(Block):
 
         return msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter
 
+    def _bp_iter_dense(self, msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter):
+        """Decoding iteration using the padded message layout.
+
+        Inputs and outputs are the same as for :meth:`_bp_iter`.
+        """
+        batch_size = tf.shape(msg_v2c)[1]
+        # message of the dummy edge used for padding
+        pad = tf.zeros([1, batch_size], self.rdtype)
+
+        # Unroll loop to keep XLA / Keras compatibility
+        # For flooding this will be unrolled to a single loop iteration
+        for j in range(self._cn_schedule.shape[0]):
+
+            # get active check nodes
+            if self._scheduling=="flooding":
+                cn_edges = self._cn_edges_dense
+                cn_mask = self._cn_mask_dense
+            else: # select active CNs for j-th subiteration
+                cn_idx = tf.gather(self._cn_schedule, j, axis=0)
+                cn_edges = tf.gather(self._cn_edges_dense, cn_idx, axis=0)
+                cn_mask = tf.gather(self._cn_mask_dense, cn_idx, axis=0)
+
+            # Padded incoming messages at CN of shape
+            # [num_cns, max_cn_degree, batch_size]
+            msg_cn = tf.gather(tf.concat([msg_v2c, pad], axis=0), cn_edges)
+
+            # Apply the CN update
+            msg_cn_ = self._cn_update_dense(msg_cn,
+                                            tf.expand_dims(cn_mask, axis=-1),
+                                            self.llr_max)
+            msg_cn_ = tf.reshape(msg_cn_, [-1, batch_size])
+
+            if self._scheduling!="flooding":
+                # update only active CNs; padded positions are written to
+                # the dummy edge
+                cn_pos = tf.gather(self._cn_pos_dense, cn_idx, axis=0)
+                msg_c2v = tf.tensor_scatter_nd_update(
+                                    tf.concat([msg_c2v, pad], axis=0),
+                                    tf.reshape(cn_pos, [-1, 1]),
+                                    msg_cn_)[:-1]
+            else:
+                # for flooding all nodes are updated
+                msg_c2v = tf.gather(msg_cn_, self._cn_flat_idx)
+
+            # Padded incoming messages at VN of shape
+            # [num_vns, max_vn_degree, batch_size]
+            msg_vn = tf.gather(tf.concat([msg_c2v, pad], axis=0),
+                               self._vn_edges_dense)
+
+            # Apply the VN update
+            msg_vn_, x_hat = self._vn_update_dense(msg_vn,
+                                                   llr_ch,
+                                                   self.llr_max)
+
+            msg_v2c = tf.gather(tf.reshape(msg_vn_, [-1, batch_size]),
+                                self._vn_flat_idx)
+
+        #increase iteration coutner
+        it += 1
+
+        return msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter
+
     # pylint: disable=unused-argument,unused-variable
     def _stop_cond(self, msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter):
         """stops decoding loop after num_iter iterations.
@@ -526,6 +725,145 @@ class LDPCBPDecoder(Block):
         """
         return it < num_iter
 
+    def _is_codeword(self, x_hat):
+        """Evaluates the syndrome of the hard-decided estimates.
+
+        Parameters
+        ----------
+        x_hat: [num_vns, batch_size], tf.float
+            Tensor of marginalized LLRs of each VN.
+
+        Returns
+        -------
+        : [batch_size], tf.bool
+            `True` for each codeword that fulfills all parity checks.
+        """
+        # hard-decide bits (same decision rule as for the hard output)
+        c = tf.cast(tf.greater_equal(tf.cast(0, x_hat.dtype), x_hat),
+                    tf.int32)
+        # sum over all connected VNs of each CN
+        syndrome = tf.math.unsorted_segment_sum(tf.gather(c, self._vn_idx),
+                                                self._cn_idx,
+                                                self._num_cns)
+        syndrome = tf.math.floormod(syndrome, 2)
+        return tf.reduce_all(tf.equal(syndrome, 0), axis=0)
+
+    def _decode_early_stop(self, msg_v2c, msg_c2v, llr_ch, num_iter):
+        """Decoding loop with syndrome-based early stopping.
+
+        Converged codewords are frozen and the loop stops once all
+        codewords have converged.
+
+        Returns
+        -------
+        msg_v2c: [num_edges, batch_size], tf.float
+            Final v2c messages.
+
+        x_hat: [num_vns, batch_size], tf.float
+            Marginalized LLRs of each VN.
+
+        num_iter_cw: [batch_size], tf.int32
+            Number of decoding iterations of each codeword.
+        """
+        batch_size = tf.shape(llr_ch)[1]
+
+        def _cond(msg_v2c, msg_c2v, x_hat, it, converged, num_iter_cw):
+            return tf.logical_and(it < num_iter,
+                                  tf.logical_not(tf.reduce_all(converged)))
+
+        def _body(msg_v2c, msg_c2v, x_hat, it, converged, num_iter_cw):
+            msg_v2c_, msg_c2v_, _, x_hat_, it, _ = self._bp_iter(msg_v2c,
+                                                                 msg_c2v,
+                                                                 llr_ch,
+                                                                 x_hat,
+                                                                 it,
+                                                                 num_iter)
+            # keep state of converged codewords
+            msg_v2c = tf.where(converged, msg_v2c, msg_v2c_)
+            msg_c2v = tf.where(converged, msg_c2v, msg_c2v_)
+            x_hat = tf.where(converged, x_hat, x_hat_)
+            num_iter_cw = tf.where(converged, num_iter_cw, it)
+            converged = tf.logical_or(converged, self._is_codeword(x_hat))
+            return msg_v2c, msg_c2v, x_hat, it, converged, num_iter_cw
+
+        inputs = (msg_v2c, msg_c2v, llr_ch, tf.constant(0, tf.int32),
+                  tf.zeros([batch_size], tf.bool),
+                  tf.zeros([batch_size], tf.int32))
+        msg_v2c, _, x_hat, _, _, num_iter_cw = tf.while_loop(
+                                                _cond, _body, inputs,
+                                                maximum_iterations=num_iter)
+        return msg_v2c, x_hat, num_iter_cw
+
+    def _decode_compact(self, msg_v2c, msg_c2v, llr_ch, num_iter):
+        """Decoding loop with syndrome-based early stopping that removes
+        converged codewords from the batch.
+
+        Returns the same outputs as :meth:`_decode_early_stop`.
+        """
+        batch_size = tf.shape(llr_ch)[1]
+
+        # final results are stored with batch dimension first to allow
+        # row-wise scatter updates
+        msg_v2c_out = tf.transpose(msg_v2c, (1, 0))
+        x_hat_out = tf.transpose(llr_ch, (1, 0))
+        num_iter_cw = tf.zeros([batch_size], tf.int32)
+        active_idx = tf.range(batch_size)
+
+        def _cond(msg_v2c, msg_c2v, llr_ch, x_hat, it, active_idx, *args):
+            return tf.size(active_idx) > 0
+
+        def _body(msg_v2c, msg_c2v, llr_ch, x_hat, it, active_idx,
+                  msg_v2c_out, x_hat_out, num_iter_cw):
+            msg_v2c, msg_c2v, _, x_hat, it, _ = self._bp_iter(msg_v2c,
+                                                              msg_c2v,
+                                                              llr_ch,
+                                                              x_hat,
+                                                              it,
+                                                              num_iter)
+            done = tf.logical_or(self._is_codeword(x_hat), it >= num_iter)
+
+            # write results of finished codewords
+            idx = tf.expand_dims(tf.boolean_mask(active_idx, done), axis=1)
+            msg_v2c_out = tf.tensor_scatter_nd_update(
+                        msg_v2c_out, idx,
+                        tf.transpose(tf.boolean_mask(msg_v2c, done, axis=1)))
+            x_hat_out = tf.tensor_scatter_nd_update(
+                        x_hat_out, idx,
+                        tf.transpose(tf.boolean_mask(x_hat, done, axis=1)))
+            num_iter_cw = tf.tensor_scatter_nd_update(
+                        num_iter_cw, idx, tf.fill([tf.shape(idx)[0]], it))
+
+            # and remove them from the batch
+            active = tf.logical_not(done)
+            msg_v2c = tf.boolean_mask(msg_v2c, active, axis=1)
+            msg_c2v = tf.boolean_mask(msg_c2v, active, axis=1)
+            llr_ch = tf.boolean_mask(llr_ch, active, axis=1)
+            x_hat = tf.boolean_mask(x_hat, active, axis=1)
+            active_idx = tf.boolean_mask(active_idx, active)
+            return (msg_v2c, msg_c2v, llr_ch, x_hat, it, active_idx,
+                    msg_v2c_out, x_hat_out, num_iter_cw)
+
+        # no iterations are required for num_iter=0
+        active_idx = active_idx[:batch_size*tf.cast(num_iter>0, tf.int32)]
+
+        inputs = (msg_v2c, msg_c2v, llr_ch, llr_ch, tf.constant(0, tf.int32),
+                  active_idx, msg_v2c_out, x_hat_out, num_iter_cw)
+        shape_invariants = (tf.TensorShape([self._num_edges, None]),
+                            tf.TensorShape([self._num_edges, None]),
+                            tf.TensorShape([self._num_vns, None]),
+                            tf.TensorShape([self._num_vns, None]),
+                            tf.TensorShape([]),
+                            tf.TensorShape([None]),
+                            msg_v2c_out.shape,
+                            x_hat_out.shape,
+                            num_iter_cw.shape)
+        outputs = tf.while_loop(_cond, _body, inputs,
+                                shape_invariants=shape_invariants)
+        msg_v2c_out, x_hat_out, num_iter_cw = outputs[6:]
+        return (tf.transpose(msg_v2c_out, (1, 0)),
+                tf.transpose(x_hat_out, (1, 0)),
+                num_iter_cw)
+
     #########################
     # Sionna Block functions
     #########################
@@ -600,13 +938,25 @@ class LDPCBPDecoder(Block):
         # tf.constant(0, tf.int32) : iteration counter
         # num_iter : total number of iterations
 
-        inputs = (msg_v2c, msg_c2v, llr_ch, llr_ch,
-                  tf.constant(0, tf.int32), num_iter)
+        if self._compact_batch:
+            msg_v2c, x_hat, num_iter_cw = self._decode_compact(msg_v2c,
+                                                               msg_c2v,
+                                                               llr_ch,
+                                                               num_iter)
+        elif self._early_stop:
+            msg_v2c, x_hat, num_iter_cw = self._decode_early_stop(msg_v2c,
+                                                                  msg_c2v,
+                                                                  llr_ch,
+                                                                  num_iter)
+        else:
+            inputs = (msg_v2c, msg_c2v, llr_ch, llr_ch,
+                      tf.constant(0, tf.int32), num_iter)
 
-        # and run main decoding loop for num_iter iterations
-        msg_v2c, _, _, x_hat, _, _ = tf.while_loop(
-                                        self._stop_cond,self._bp_iter,
-                                        inputs, maximum_iterations=num_iter)
+            # and run main decoding loop for num_iter iterations
+            msg_v2c, _, _, x_hat, _, _ = tf.while_loop(
+                                            self._stop_cond,self._bp_iter,
+                                            inputs, maximum_iterations=num_iter)
+            num_iter_cw = tf.fill([tf.shape(x_hat)[1]], num_iter)
 
         ######################
         # Post process outputs
@@ -626,11 +976,17 @@ class LDPCBPDecoder(Block):
         output_shape[0] = -1 # Dynamic batch dim
         x_reshaped = tf.reshape(x_hat, output_shape)
 
-        if not self._return_state:
+        outputs = [x_reshaped]
+        if self._return_state:
+            msg_v2c *= -1 # invert sign due to logit definition
+            outputs.append(msg_v2c)
+        if self._return_num_iter:
+            outputs.append(tf.reshape(num_iter_cw, output_shape[:-1]))
+
+        if len(outputs)==1:
             return x_reshaped
         else:
-            msg_v2c *= -1 # invert sign due to logit definition
-            return x_reshaped, msg_v2c
+            return tuple(outputs)
 
 #######################
 # Node update functions
@@ -1038,6 +1394,36 @@ def cn_update_tanh(msg, llr_clipping=None):
                                clip_value_max=llr_clipping)
     return msg
 
+def _phi(x):
+    # pylint: disable=line-too-long
+    r"""Utility function for the boxplus-phi check node update.
+
+    This function implements the (element-wise) `"phi"` function as defined
+    in [Ryan]_  :math:`\phi(x)=-\operatorname{log}(\operatorname{tanh} \left(\frac{x}{2}) \right)`.
+
+    Parameters
+    ----------
+    x : tf.float
+        Input tensor of arbitrary shape.
+
+    Returns
+    -------
+    : tf.float
+        Tensor of same shape and dtype as ``x``.
+
+    """
+    if x.dtype==tf.float32:
+        # the clipping values are optimized for tf.float32
+        x = tf.clip_by_value(x,
+                clip_value_min=8.5e-8, clip_value_max=16.635532)
+    elif x.dtype==tf.float64:
+        x = tf.clip_by_value(x,
+                clip_value_min=1e-12, clip_value_max=28.324079)
+    else:
+        raise TypeError("Unsupported dtype for phi function.")
+
+    return tf.math.log(tf.math.exp(x)+1) - tf.math.log(tf.math.exp(x)-1)
+
 def cn_update_phi(msg, llr_clipping=None):
     # pylint: disable=line-too-long
     r"""Check node update function implementing the `boxplus` operation.
@@ -1085,36 +1471,6 @@ def cn_update_phi(msg, llr_clipping=None):
         Ragged tensor of same shape as ``msg_c2v`` containing the updated c2v
         messages.
     """
-    def _phi(x):
-        # pylint: disable=line-too-long
-        r"""Utility function for the boxplus-phi check node update.
-
-        This function implements the (element-wise) `"phi"` function as defined
-        in [Ryan]_  :math:`\phi(x)=-\operatorname{log}(\operatorname{tanh} \left(\frac{x}{2}) \right)`.
-
-        Parameters
-        ----------
-        x : tf.float
-            Input tensor of arbitrary shape.
-
-        Returns
-        -------
-        : tf.float
-            Tensor of same shape and dtype as ``x``.
-
-        """
-        if x.dtype==tf.float32:
-            # the clipping values are optimized for tf.float32
-            x = tf.clip_by_value(x,
-                    clip_value_min=8.5e-8, clip_value_max=16.635532)
-        elif x.dtype==tf.float64:
-            x = tf.clip_by_value(x,
-                    clip_value_min=1e-12, clip_value_max=28.324079)
-        else:
-            raise TypeError("Unsupported dtype for phi function.")
-
-        return tf.math.log(tf.math.exp(x)+1) - tf.math.log(tf.math.exp(x)-1)
-
     ##################
     # Sign of messages
     ##################
@@ -1162,6 +1518,169 @@ def cn_update_phi(msg, llr_clipping=None):
     return msg_e
 
 
+def _vn_update_sum_dense(msg_c2v, llr_ch, llr_clipping=None):
+    r"""Variable node update function implementing the `sum` update for the
+    padded message layout.
+
+    Parameters
+    ----------
+    msg_c2v: [num_nodes, max_degree, batch_size], tf.float
+        Padded c2v messages. Padded positions must be zero.
+
+    llr_ch: [num_nodes, batch_size], tf.float
+        Tensor containing the channel LLRs.
+
+    llr_clipping: `None` (default) | float
+        Clipping value used for internal processing. If `None`, no internal
+        clipping is applied.
+
+    Returns
+    -------
+    msg_v2c : [num_nodes, max_degree, batch_size], tf.float
+        Updated v2c messages.
+
+    x_tot: [num_nodes, batch_size], tf.float
+        Mariginalized LLRs per variable node.
+    """
+    x_tot = tf.add(tf.reduce_sum(msg_c2v, axis=1), llr_ch)
+    x_e = -1.*msg_c2v + tf.expand_dims(x_tot, axis=1)
+
+    if llr_clipping is not None:
+        x_e = tf.clip_by_value(x_e,
+                    clip_value_min=-llr_clipping, clip_value_max=llr_clipping)
+        x_tot = tf.clip_by_value(x_tot,
+                    clip_value_min=-llr_clipping, clip_value_max=llr_clipping)
+    return x_e, x_tot
+
+def _sign_dense(msg, mask):
+    """Sign of the messages where 0 and padded positions count as +1."""
+    sign_val = tf.sign(msg)
+    sign_val = tf.where(tf.equal(sign_val, 0), tf.ones_like(sign_val),
+                        sign_val)
+    return tf.where(mask, sign_val, tf.ones_like(sign_val))
+
+def _cn_update_offset_minsum_dense(msg, mask, llr_clipping=None, offset=0.5):
+    r"""Check node update function implementing the offset corrected minsum
+    for the padded message layout.
+
+    Parameters
+    ----------
+    msg: [num_nodes, max_degree, batch_size], tf.float
+        Padded v2c messages.
+
+    mask: [num_nodes, max_degree, 1], tf.bool
+        `False` for padded positions.
+
+    llr_clipping: `None` (default) | float
+        Clipping value used for internal processing. If `None`, no internal
+        clipping is applied.
+
+    offset: float (default `0.5`)
+        Offset value to be subtracted from each outgoing message.
+
+    Returns
+    -------
+    msg_c2v : [num_nodes, max_degree, batch_size], tf.float
+        Updated c2v messages.
+    """
+    # a constant used to overwrite the first min
+    large_val = tf.cast(100000., msg.dtype)
+    msg = tf.clip_by_value(msg, clip_value_min=-large_val,
+                           clip_value_max=large_val)
+
+    # sign of outgoing messages
+    sign_val = _sign_dense(msg, mask)
+    sign_val *= tf.reduce_prod(sign_val, axis=1, keepdims=True)
+
+    # padded positions never contribute to the minimum
+    msg = tf.where(mask, tf.abs(msg), large_val)
+
+    # the extrinsic minimum equals the second smallest value at the position
+    # of the minimum and the minimum otherwise
+    min_val = tf.reduce_min(msg, axis=1, keepdims=True)
+    is_min = tf.one_hot(tf.argmin(msg, axis=1), tf.shape(msg)[1], axis=1,
+                        on_value=True, off_value=False)
+    min_val_2 = tf.reduce_min(tf.where(is_min, large_val, msg), axis=1,
+                              keepdims=True)
+    msg_e = tf.where(is_min, min_val_2, min_val)
+
+    # apply offset and sign
+    msg = sign_val * tf.maximum(msg_e - offset, 0)
+
+    if llr_clipping is not None:
+        msg = tf.clip_by_value(msg,
+                    clip_value_min=-llr_clipping, clip_value_max=llr_clipping)
+    return msg
+
+def _cn_update_minsum_dense(msg, mask, llr_clipping=None):
+    r"""Check node update function implementing the `minsum` update for the
+    padded message layout.
+
+    Inputs and outputs are the same as for
+    :func:`_cn_update_offset_minsum_dense`.
+    """
+    return _cn_update_offset_minsum_dense(msg, mask,
+                                          llr_clipping=llr_clipping,
+                                          offset=0)
+
+def _cn_update_tanh_dense(msg, mask, llr_clipping=None):
+    r"""Check node update function implementing the `boxplus` operation for
+    the padded message layout.
+
+    Inputs and outputs are the same as for
+    :func:`_cn_update_offset_minsum_dense`.
+    """
+    # clipping value for the atanh function is applied (tf.float32 is used)
+    atanh_clip_value = 1 - 1e-7
+
+    msg = tf.tanh(msg / 2)
+    msg = tf.where(tf.equal(msg, 0), tf.ones_like(msg) * 1e-12, msg)
+    # padded positions are neutral for the product
+    msg = tf.where(mask, msg, tf.ones_like(msg))
+
+    # remove own edge
+    msg = msg**-1 * tf.reduce_prod(msg, axis=1, keepdims=True)
+
+    # Overwrite small (numerical zeros) message values with exact zero
+    msg = tf.where(tf.less(tf.abs(msg), 1e-7), tf.zeros_like(msg), msg)
+
+    msg = tf.clip_by_value(msg,
+                           clip_value_min=-atanh_clip_value,
+                           clip_value_max=atanh_clip_value)
+    msg = 2 * tf.atanh(msg)
+
+    if llr_clipping is not None:
+        msg = tf.clip_by_value(msg,
+                               clip_value_min=-llr_clipping,
+                               clip_value_max=llr_clipping)
+    return msg
+
+def _cn_update_phi_dense(msg, mask, llr_clipping=None):
+    r"""Check node update function implementing the `boxplus-phi` operation
+    for the padded message layout.
+
+    Inputs and outputs are the same as for
+    :func:`_cn_update_offset_minsum_dense`.
+    """
+    # sign of outgoing messages
+    sign_val = _sign_dense(msg, mask)
+    sign_val *= tf.reduce_prod(sign_val, axis=1, keepdims=True)
+
+    # padded positions do not contribute to the sum
+    msg = tf.where(mask, _phi(tf.abs(msg)), tf.zeros_like(msg))
+    msg_sum = tf.reduce_sum(msg, axis=1, keepdims=True)
+
+    # remove own edge
+    msg = -1.*msg + msg_sum
+
+    msg_e = tf.stop_gradient(sign_val) * _phi(msg)
+
+    if llr_clipping is not None:
+        msg_e = tf.clip_by_value(msg_e,
+                    clip_value_min=-llr_clipping, clip_value_max=llr_clipping)
+    return msg_e
+
+
 class LDPC5GDecoder(LDPCBPDecoder):
     # pylint: disable=line-too-long
     r"""Iterative belief propagation decoder for 5G NR LDPC codes.
@@ -1206,6 +1725,29 @@ class LDPC5GDecoder(LDPCBPDecoder):
         be updated per subiteration. In this case each BP iteration runs
         `num_update_steps` subiterations, thus the decoder's level of
         parallelization is lower and usually the decoding throughput decreases.
+        For ``edge_layout="qc"``, "layered" runs a row-serial engine that
+        processes the rows of the base graph in order and incrementally
+        updates the a posteriori LLRs of all VNs. This typically requires
+        only about half the number of iterations of flooding, but the
+        decoder state cannot be returned or provided, i.e.,
+        ``return_state`` must be `False`.
+
+    edge_layout: "ragged" (default) | "dense" | "qc"
+        Memory layout of the messages during the node updates. "ragged"
+        uses ragged tensors to account for irregular node degrees. "dense"
+        stores the messages as padded tensors of shape
+        `[num_nodes, max_degree, batch_size]` together with a mask and
+        supports XLA. "qc" exploits the quasi-cyclic structure of the code
+        and operates directly on the base graph, i.e., the messages of each
+        base graph edge are stored as `[z, batch_size]` block which is
+        cyclically rolled between the check and variable node perspective.
+        This reduces the size of all index tensors by the lifting factor `z`
+        and supports XLA. Both, "dense" and "qc", require
+        ``cn_update`` to be one of the built-in update rules, "qc" further
+        requires ``vn_update="sum"``, flooding or layered scheduling and no
+        callbacks.
+        Note that the decoder state ``msg_v2c`` of the "qc" layout uses a
+        different edge ordering.
 
     hard_out: `bool`, (default `True`)
         If `True`,  the decoder provides hard-decided codeword bits instead of
@@ -1222,8 +1764,7 @@ class LDPC5GDecoder(LDPCBPDecoder):
         improved the decoding throughput and reduces the memory footprint.
 
     num_iter: `int` (default: 20)
-        Defining the number of decoder iterations (due to batching, no early
-        stopping used at the moment!).
+        Defining the (maximum) number of decoder iterations.
 
     llr_max: `float` (default: 20) | `None`
         Internal clipping value for all internal messages. If `None`, no
@@ -1250,6 +1791,24 @@ class LDPC5GDecoder(LDPCBPDecoder):
         second input when calling the decoder.
         This can be used for iterative demapping and decoding.
 
+    early_stop: `bool`, (default `False`)
+        If `True`, the syndrome of the current hard-decided estimate is
+        evaluated after each iteration. Codewords that fulfill all parity
+        checks are frozen, i.e., their messages and estimates are not updated
+        anymore, and decoding stops as soon as all codewords of the batch
+        have converged or ``num_iter`` iterations are reached.
+
+    compact_batch: `bool`, (default `False`)
+        If `True`, converged codewords are removed from the batch such that
+        they do not consume compute in subsequent iterations. Requires
+        ``early_stop`` to be `True`. Note that this results in dynamic shapes
+        and is, thus, not compatible with XLA. Callbacks only receive the
+        messages of the remaining codewords.
+
+    return_num_iter: `bool`, (default `False`)
+        If `True`, the number of decoding iterations of each codeword is
+        returned as additional output.
+
     precision : `None` (default) | "single" | "double"
         Precision used for internal calculations and outputs.
         If set to `None`, :py:attr:`~sionna.phy.config.precision` is used.
@@ -1278,6 +1837,10 @@ class LDPC5GDecoder(LDPCBPDecoder):
         Remark: always retruns entire decoder state, even if
         ``return_infobits`` is True.
 
+    : [...], tf.int32
+        Number of decoding iterations of each codeword.
+        Returned only if ``return_num_iter`` is set to `True`.
+
     Note
     ----
     As decoding input logits :math:`\operatorname{log} \frac{p(x=1)}{p(x=0)}`
@@ -1285,13 +1848,16 @@ class LDPC5GDecoder(LDPCBPDecoder):
     LLRs with definition :math:`\operatorname{log} \frac{p(x=0)}{p(x=1)}` are
     used.
 
-    The decoder is not (particularly) optimized for Quasi-cyclic (QC) LDPC
-    codes and, thus, supports arbitrary parity-check matrices.
+    With ``edge_layout="qc"``, the decoder exploits the quasi-cyclic (QC)
+    structure of the 5G codes: the messages are stored per base graph edge
+    as blocks of `z` messages, and the layered schedule runs a row-serial
+    engine over the rows of the base graph. Otherwise, the decoder is not
+    (particularly) optimized for QC LDPC codes.
 
-    The decoder is implemented by using '"ragged Tensors"' [TF_ragged]_ to
-    account for arbitrary node degrees. To avoid a performance degradation
-    caused by a severe indexing overhead, the batch-dimension is shifted to
-    the last dimension during decoding.
+    By default, the decoder is implemented by using '"ragged Tensors"'
+    [TF_ragged]_ to account for arbitrary node degrees. To avoid a
+    performance degradation caused by a severe indexing overhead, the
+    batch-dimension is shifted to the last dimension during decoding.
 
     """
 
@@ -1300,6 +1866,7 @@ class LDPC5GDecoder(LDPCBPDecoder):
                  cn_update="boxplus-phi",
                  vn_update="sum",
                  cn_schedule="flooding",
+                 edge_layout="ragged",
                  hard_out=True,
                  return_infobits=True,
                  num_iter=20,
@@ -1308,6 +1875,9 @@ class LDPC5GDecoder(LDPCBPDecoder):
                  c2v_callbacks=None,
                  prune_pcm=True,
                  return_state=False,
+                 early_stop=False,
+                 compact_batch=False,
+                 return_num_iter=False,
                  precision=None,
                  **kwargs):
 
@@ -1326,6 +1896,15 @@ class LDPC5GDecoder(LDPCBPDecoder):
             raise TypeError('return_state must be bool.')
         self._return_state = return_state
 
+        if not isinstance(early_stop, bool):
+            raise TypeError('early_stop must be bool.')
+        if not isinstance(compact_batch, bool):
+            raise TypeError('compact_batch must be bool.')
+        if compact_batch and not early_stop:
+            raise ValueError('compact_batch requires early_stop.')
+        if not isinstance(return_num_iter, bool):
+            raise TypeError('return_num_iter must be bool.')
+
         # prune punctured degree-1 VNs and connected CNs. A punctured
         # VN-1 node will always "send" llr=0 to the connected CN. Thus, this
         # CN will only send 0 messages to all other VNs, i.e., does not
@@ -1352,7 +1931,8 @@ class LDPC5GDecoder(LDPCBPDecoder):
             # if layered decoding is used, qunatized number of punctured bits
             # to a multiple of z; otherwise scheduling groups of Z CNs becomes
             # impossible
-            if cn_schedule=="layered":
+            # the same holds for the quasi-cyclic edge layout
+            if cn_schedule=="layered" or edge_layout=="qc":
                 nb_punc_bits = np.floor(nb_punc_bits/self.encoder.z) \
                              * self.encoder.z
                 nb_punc_bits = int (nb_punc_bits) # cast to int
@@ -1373,7 +1953,9 @@ class LDPC5GDecoder(LDPCBPDecoder):
             self._nb_pruned_nodes = 0
             self._n_pruned = encoder._n_ldpc
 
-        if cn_schedule=="layered":
+        self._layered = isinstance(cn_schedule, str) \
+                        and cn_schedule=="layered"
+        if self._layered:
             z = self._encoder.z
             num_blocks = int(pcm.shape[0]/z)
             cn_schedule = []
@@ -1381,19 +1963,92 @@ class LDPC5GDecoder(LDPCBPDecoder):
                 cn_schedule.append(np.arange(z) + i*z)
             cn_schedule = tf.stack(cn_schedule, axis=0)
 
+        # the quasi-cyclic layout is initialized on top of the ragged layout
+        self._qc_layout = edge_layout=="qc"
+
         super().__init__(pcm,
                          cn_update=cn_update,
                          vn_update=vn_update,
                          cn_schedule=cn_schedule,
+                         edge_layout="ragged" if self._qc_layout
+                                     else edge_layout,
                          hard_out=hard_out,
                          num_iter=num_iter,
                          llr_max=llr_max,
                          v2c_callbacks=v2c_callbacks,
                          c2v_callbacks=c2v_callbacks,
                          return_state=return_state,
+                         early_stop=early_stop,
+                         compact_batch=compact_batch,
+                         return_num_iter=return_num_iter,
                          precision=precision,
                          **kwargs)
 
+        if self._qc_layout:
+            self._edge_layout = "qc"
+            self._init_qc_layout(cn_update, vn_update)
+
+    def _init_qc_layout(self, cn_update, vn_update):
+        """Initializes the quasi-cyclic message layout.
+
+        The messages of each base graph edge are stored in the check node
+        (CN) perspective, i.e., the `i`-th message of the edge with shift `s`
+        connects CN `r*z+i` and variable node (VN) `c*z+(i+s)%z`.
+        """
+        # the layered schedule runs the row-serial engine
+        self._qc_layered = self._scheduling!="flooding"
+        if self._qc_layered and not self._layered:
+            raise ValueError("The qc edge_layout requires flooding or "
+                             "layered scheduling.")
+        if self._qc_layered and self._return_state:
+            raise ValueError("The layered schedule of the qc edge_layout "
+                             "does not support return_state.")
+        if vn_update!="sum":
+            raise ValueError("The qc edge_layout requires vn_update='sum'.")
+        # the CN update of the dense layout is applied to all z messages of
+        # a base graph edge jointly
+        self._init_dense_updates(cn_update, vn_update, "qc")
+
+        z = self._encoder.z
+        bm = self._encoder._bm[:self._num_cns//z, :self._num_vns//z]
+        row, col = np.where(bm>=0)
+        shifts = np.mod(bm[row, col], z).astype(int)
+        num_bg_edges = len(row)
+
+        # edges of the expanded graph in the order of the internal messages
+        i = np.arange(z)
+        self._cn_idx = (row[:, None]*z + i[None, :]).flatten()
+        self._vn_idx = (col[:, None]*z
+                        + np.mod(i[None, :] + shifts[:, None], z)).flatten()
+
+        # padded base graph edges per row and column
+        def _padded_edges(node_idx, num_nodes):
+            deg = np.bincount(node_idx, minlength=num_nodes)
+            order = np.argsort(node_idx, kind="stable")
+            slot = np.arange(num_bg_edges) - (np.cumsum(deg)
+                                              - deg)[node_idx[order]]
+            edges = np.full([num_nodes, np.max(deg)], num_bg_edges)
+            edges[node_idx[order], slot] = order
+            flat_idx = np.zeros(num_bg_edges, int)
+            flat_idx[order] = node_idx[order]*np.max(deg) + slot
+            return edges, flat_idx
+
+        row_edges, row_flat_idx = _padded_edges(row, bm.shape[0])
+        col_edges, _ = _padded_edges(col, bm.shape[1])
+
+        # base graph edges and columns of each row in the order of the
+        # layered schedule
+        self._qc_layers = [(np.where(row==r)[0], col[row==r])
+                           for r in range(bm.shape[0])]
+
+        self._num_bg_edges = num_bg_edges
+        self._qc_row_edges = tf.constant(row_edges, tf.int32)
+        self._qc_row_mask = tf.constant(row_edges<num_bg_edges)
+        self._qc_row_flat_idx = tf.constant(row_flat_idx, tf.int32)
+        self._qc_col_edges = tf.constant(col_edges, tf.int32)
+        self._qc_col = tf.constant(col, tf.int32)
+        self._qc_shifts = tf.constant(shifts, tf.int32)
+
     ###############################
     # Public methods and properties
     ###############################
@@ -1403,6 +2058,153 @@ class LDPC5GDecoder(LDPCBPDecoder):
         """LDPC Encoder used for rate-matching/recovery"""
         return self._encoder
 
+    #########################
+    # Decoding functions
+    #########################
+
+    def _qc_roll(self, msg, shifts):
+        """Cyclically rolls the `z` messages of each base graph edge.
+
+        Parameters
+        ----------
+        msg: [num_bg_edges, z, batch_size], tf.float
+            Messages per base graph edge.
+
+        shifts: [num_bg_edges], tf.int32
+            Shift of each base graph edge.
+
+        Returns
+        -------
+        : [num_bg_edges, z, batch_size], tf.float
+            Rolled messages, i.e., ``out[e, j] = msg[e, (j-shifts[e])%z]``.
+        """
+        z = self._encoder.z
+        idx = tf.math.floormod(tf.range(z)[tf.newaxis]
+                               - tf.expand_dims(shifts, axis=1), z)
+        return tf.gather(msg, idx, axis=1, batch_dims=1)
+
+    def _bp_iter(self, msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter):
+        """Main decoding loop; dispatches to the quasi-cyclic layout if
+        required."""
+        if self._edge_layout=="qc" and self._qc_layered:
+            return self._bp_iter_qc_layered(msg_v2c, msg_c2v, llr_ch, x_hat,
+                                            it, num_iter)
+        if self._edge_layout=="qc":
+            return self._bp_iter_qc(msg_v2c, msg_c2v, llr_ch, x_hat, it,
+                                    num_iter)
+        return super()._bp_iter(msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter)
+
+    def _bp_iter_qc(self, msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter):
+        """Decoding iteration operating on the base graph.
+
+        Inputs and outputs are the same as for :meth:`_bp_iter`.
+        """
+        z = self._encoder.z
+        num_rows, max_dc = self._qc_row_edges.shape
+        num_cols = self._qc_col_edges.shape[0]
+        batch_size = tf.shape(msg_v2c)[1]
+        pad = tf.zeros([1, z, batch_size], self.rdtype)
+
+        # messages per base graph edge in CN perspective
+        msg_v2c = tf.reshape(msg_v2c, [self._num_bg_edges, z, batch_size])
+
+        # Padded incoming messages at each row of the base graph; all z CNs
+        # of a row are updated jointly
+        msg_cn = tf.gather(tf.concat([msg_v2c, pad], axis=0),
+                           self._qc_row_edges)
+        msg_cn = tf.reshape(msg_cn, [num_rows, max_dc, -1])
+        msg_cn_ = self._cn_update_dense(msg_cn,
+                                        tf.expand_dims(self._qc_row_mask, -1),
+                                        self.llr_max)
+        msg_cn_ = tf.reshape(msg_cn_, [-1, z, batch_size])
+        msg_c2v = tf.gather(msg_cn_, self._qc_row_flat_idx)
+
+        # Roll messages into VN perspective and marginalize per column of the
+        # base graph
+        msg_vn = tf.gather(
+                    tf.concat([self._qc_roll(msg_c2v, self._qc_shifts), pad],
+                              axis=0),
+                    self._qc_col_edges)
+        x_tot = tf.reduce_sum(msg_vn, axis=1)
+        x_tot += tf.reshape(llr_ch, [num_cols, z, batch_size])
+
+        # extrinsic v2c messages in CN perspective
+        msg_v2c = self._qc_roll(tf.gather(x_tot, self._qc_col),
+                                -self._qc_shifts)
+        msg_v2c = -1.*msg_c2v + msg_v2c
+
+        msg_v2c = tf.clip_by_value(msg_v2c,
+                                   clip_value_min=-self.llr_max,
+                                   clip_value_max=self.llr_max)
+        x_tot = tf.clip_by_value(x_tot,
+                                 clip_value_min=-self.llr_max,
+                                 clip_value_max=self.llr_max)
+
+        msg_v2c = tf.reshape(msg_v2c, [-1, batch_size])
+        msg_c2v = tf.reshape(msg_c2v, [-1, batch_size])
+        x_hat = tf.reshape(x_tot, [-1, batch_size])
+        it += 1
+
+        return msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter
+
+    def _bp_iter_qc_layered(self, msg_v2c, msg_c2v, llr_ch, x_hat, it,
+                            num_iter):
+        """Layered decoding iteration operating on the base graph.
+
+        The rows of the base graph are processed sequentially. Each row
+        reads the a posteriori LLRs ``x_hat`` of its connected VNs, removes
+        its previous c2v messages and writes the updated LLRs back, i.e.,
+        ``x_hat`` is carried as running estimate across rows and iterations.
+        As every column appears at most once per row, all `z` CNs of a row
+        are updated in parallel.
+
+        Inputs and outputs are the same as for :meth:`_bp_iter`. The v2c
+        messages are not part of the layered decoder state and returned
+        unchanged.
+        """
+        z = self._encoder.z
+        num_cols = self._qc_col_edges.shape[0]
+        batch_size = tf.shape(msg_v2c)[1]
+
+        # a posteriori LLRs in VN perspective and c2v messages in CN
+        # perspective
+        x_tot = tf.reshape(x_hat, [num_cols, z, batch_size])
+        msg_c2v = tf.reshape(msg_c2v, [self._num_bg_edges, z, batch_size])
+
+        # Unroll loop over the rows of the base graph to keep XLA
+        # compatibility
+        for edges, cols in self._qc_layers:
+            shifts = tf.gather(self._qc_shifts, edges)
+            edges = tf.constant(edges[:, None], tf.int32)
+            cols = tf.constant(cols[:, None], tf.int32)
+
+            # incoming v2c messages in CN perspective
+            msg_cn = self._qc_roll(tf.gather_nd(x_tot, cols), -shifts)
+            msg_cn -= tf.gather_nd(msg_c2v, edges)
+            msg_cn = tf.clip_by_value(msg_cn,
+                                      clip_value_min=-self.llr_max,
+                                      clip_value_max=self.llr_max)
+
+            # Apply the CN update to all z CNs of the row jointly
+            msg_cn_ = self._cn_update_dense(
+                        tf.reshape(msg_cn, [1, -1, z*batch_size]),
+                        tf.ones([1, edges.shape[0], 1], tf.bool),
+                        self.llr_max)
+            msg_cn_ = tf.reshape(msg_cn_, [-1, z, batch_size])
+
+            # incremental update of the a posteriori LLRs
+            x_new = tf.clip_by_value(self._qc_roll(msg_cn + msg_cn_, shifts),
+                                     clip_value_min=-self.llr_max,
+                                     clip_value_max=self.llr_max)
+            x_tot = tf.tensor_scatter_nd_update(x_tot, cols, x_new)
+            msg_c2v = tf.tensor_scatter_nd_update(msg_c2v, edges, msg_cn_)
+
+        msg_c2v = tf.reshape(msg_c2v, [-1, batch_size])
+        x_hat = tf.reshape(x_tot, [-1, batch_size])
+        it += 1
+
+        return msg_v2c, msg_c2v, llr_ch, x_hat, it, num_iter
+
     ########################
     # Sionna block functions
     ########################
@@ -1420,6 +2222,10 @@ class LDPC5GDecoder(LDPCBPDecoder):
         """Iterative BP decoding function and rate matching.
         """
 
+        if msg_v2c is not None and self._qc_layout and self._qc_layered:
+            raise ValueError("The layered schedule of the qc edge_layout "
+                             "does not support msg_v2c.")
+
         llr_ch_shape = llr_ch.get_shape().as_list()
         new_shape = [-1, self.encoder.n]
         llr_ch_reshaped = tf.reshape(llr_ch, new_shape)
@@ -1469,11 +2275,15 @@ class LDPC5GDecoder(LDPCBPDecoder):
         # and run the core decoder
         output = super().call(llr_5g, num_iter=num_iter, msg_v2c=msg_v2c)
 
-        if self._return_state:
-            x_hat, msg_v2c = output
+        extra_outputs = []
+        if self._return_state or self._return_num_iter:
+            x_hat, *extra_outputs = output
         else:
             x_hat = output
-
+        if self._return_num_iter:
+            # restore original batch dimensions
+            extra_outputs[-1] = tf.reshape(extra_outputs[-1],
+                                           [-1] + llr_ch_shape[1:-1])
 
         if self._return_infobits:# return only info bits
             # reconstruct u_hat
@@ -1485,8 +2295,8 @@ class LDPC5GDecoder(LDPCBPDecoder):
             output_shape[0] = -1
             u_reshaped = tf.reshape(u_hat, output_shape)
 
-            if self._return_state:
-                return u_reshaped, msg_v2c
+            if extra_outputs:
+                return (u_reshaped, *extra_outputs)
             else:
                 return u_reshaped
 
@@ -1522,7 +2332,7 @@ class LDPC5GDecoder(LDPCBPDecoder):
             llr_ch_shape[0] = -1
             x_short= tf.reshape(x_short, llr_ch_shape)
 
-            if self._return_state:
-                return x_short, msg_v2c
+            if extra_outputs:
+                return (x_short, *extra_outputs)
             else:
                 return x_short
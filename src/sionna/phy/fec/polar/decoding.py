@@ -4,6 +4,8 @@
 """Blocks for Polar decoding such as successive cancellation (SC), successive
 cancellation list (SCL) and iterative belief propagation (BP) decoding."""
 
+import copy
+from concurrent.futures import ThreadPoolExecutor
 import tensorflow as tf
 import numpy as np
 import warnings
@@ -12,6 +14,74 @@ from sionna.phy.fec.crc import CRCDecoder, CRCEncoder
 from sionna.phy.fec.polar.encoding import Polar5GEncoder
 import numbers
 
+def _polar_tree_schedule(frozen_ind, prune_rate0=False, prune_rep=False):
+    """Schedule of the node operations of the SC decoding tree.
+
+    The decoding tree is traversed depth-first and each visited node results
+    in one or more operations of type "left" (update LLRs of the left
+    child), "right" (update LLRs of the right child), "combine" (update
+    partial sums), "leaf_frozen", "leaf_info", "rate0" or "rep". The latter
+    two are used for pruned sub-trees as in [Hashemi_SSCL]_. The partial
+    sums of the root node are not computed.
+
+    Returns a list of `(op, stage, offset)` tuples, where `offset` is the
+    index of the first codeword position of the node.
+    """
+    num_stages = int(np.log2(len(frozen_ind)))
+    schedule = []
+
+    def _visit(stage, offset):
+        n = 2**stage
+        frozen = frozen_ind[offset:offset+n]
+        if stage==0:
+            op = "leaf_frozen" if frozen[0]==1 else "leaf_info"
+            schedule.append((op, 0, offset))
+            return
+        if prune_rate0 and np.sum(frozen)==n:
+            schedule.append(("rate0", stage, offset))
+            return
+        if prune_rep and frozen[-1]==0 and np.sum(frozen[:-1])==n-1:
+            schedule.append(("rep", stage, offset))
+            return
+        schedule.append(("left", stage, offset))
+        _visit(stage-1, offset)
+        schedule.append(("right", stage, offset))
+        _visit(stage-1, offset + n//2)
+        if stage<num_stages:
+            schedule.append(("combine", stage, offset))
+
+    _visit(num_stages, 0)
+    return schedule
+
+def _run_polar_schedule(schedule, branch_fn, state):
+    """Runs the node operations of ``schedule`` within a `tf.while_loop`.
+
+    ``branch_fn(op, stage)`` must return a callable that takes the offset of
+    the node and the decoder ``state`` and returns the updated state. One
+    branch of `tf.switch_case` is generated per pair of operation type and
+    stage, i.e., the graph size does not grow with the number of
+    operations.
+    """
+    if not schedule:
+        return state
+
+    keys = sorted({(op, stage) for op, stage, _ in schedule})
+    branch_ind = {key: i for i, key in enumerate(keys)}
+    sched = tf.constant([[branch_ind[(op, stage)], offset]
+                         for op, stage, offset in schedule], tf.int32)
+    branches = [branch_fn(op, stage) for op, stage in keys]
+
+    def _body(t, *state):
+        b, offset = sched[t, 0], sched[t, 1]
+        state = tf.switch_case(b, [lambda f=f: f(offset, *state)
+                                   for f in branches])
+        return (t+1, *state)
+
+    outputs = tf.while_loop(lambda t, *_: t<len(schedule),
+                            _body,
+                            (tf.constant(0, tf.int32), *state))
+    return outputs[1:]
+
 class PolarSCDecoder(Block):
     """Successive cancellation (SC) decoder [Arikan_Polar]_ for Polar codes and
     Polar-like codes.
@@ -24,6 +94,13 @@ class PolarSCDecoder(Block):
     n: int
         Defining the codeword length.
 
+    use_loop: `bool`, (default `False`)
+        If `True`, the decoding tree is traversed by a precomputed schedule
+        within a `tf.while_loop` instead of being unrolled into the graph.
+        LLRs and partial sums are stored in memories indexed by stage.
+        The graph size is thus (almost) independent of ``n`` which keeps
+        the tracing and compilation time low for large ``n``.
+
     precision : `None` (default) | 'single' | 'double'
         Precision used for internal calculations and outputs.
         If set to `None`, :py:attr:`~sionna.phy.config.precision` is used.
@@ -52,7 +129,8 @@ class PolarSCDecoder(Block):
     `all-zero` codeword is not necessarily part of the code any more.
     """
 
-    def __init__(self, frozen_pos, n, precision=None, **kwargs):
+    def __init__(self, frozen_pos, n, use_loop=False, precision=None,
+                 **kwargs):
 
         super().__init__(precision=precision, **kwargs)
 
@@ -60,6 +138,8 @@ class PolarSCDecoder(Block):
         if not isinstance(n, numbers.Number):
             raise TypeError( "n must be a number.")
         n = int(n) # n can be float (e.g. as result of n=k*r)
+        if not isinstance(use_loop, bool):
+            raise TypeError("use_loop must be bool.")
 
         if not np.issubdtype(frozen_pos.dtype, int):
             raise TypeError("frozen_pos contains non int.")
@@ -86,6 +166,13 @@ class PolarSCDecoder(Block):
         # enable graph pruning
         self._use_fast_sc = False
 
+        # schedule of the loop-based decoder
+        self._use_loop = use_loop
+        self._n_stages = int(np.log2(self._n))
+        if self._use_loop:
+            self._schedule = _polar_tree_schedule(self._frozen_ind,
+                                                  prune_rate0=True)
+
     ###############################
     # Public methods and properties
     ###############################
@@ -213,6 +300,69 @@ class PolarSCDecoder(Block):
                 u_hat_up = u_hat
         return u_hat, u_hat_up
 
+    def _polar_decode_sc_loop(self, llr_ch):
+        """SC decoding function based on a `tf.while_loop`.
+
+        Only the messages of the currently processed node are stored per
+        stage, i.e., the LLR memory of stage `s` has `2^s` entries and the
+        partial sum memory of stage `s` has `2^(s+1)` entries (both children
+        of a node of stage `s+1`). The LLRs of the last stage are the channel
+        LLRs. Every node writes its partial sums before they are read by its
+        parent, thus no stale entries are read.
+
+        Returns the u_hat decisions of shape `[n, batch_size]`.
+        """
+        num_stages = self._n_stages
+        llr_ch = tf.transpose(llr_ch, (1, 0))
+        batch_size = tf.shape(llr_ch)[1]
+
+        def _branch(op, stage):
+            def _op(offset, u_hat, *mem):
+                llr_mem = list(mem[:num_stages]) + [llr_ch]
+                u_mem = list(mem[num_stages:])
+                if op in ("left", "right"):
+                    h = 2**(stage-1)
+                    llr = llr_mem[stage]
+                    if op=="left":
+                        llr_mem[stage-1] = self._cn_op_tf(llr[:h], llr[h:])
+                    else:
+                        llr_mem[stage-1] = self._vn_op_tf(llr[:h], llr[h:],
+                                                          u_mem[stage-1][:h])
+                else:
+                    if op=="combine":
+                        h = 2**(stage-1)
+                        u = u_mem[stage-1]
+                        # combine u_hat via bitwise_xor
+                        u_left = tf.bitwise.bitwise_xor(
+                                                tf.cast(u[:h], tf.int8),
+                                                tf.cast(u[h:], tf.int8))
+                        u = tf.concat([tf.cast(u_left, self.rdtype), u[h:]], 0)
+                    elif op=="leaf_info": # hard decide
+                        u = 0.5 * (1. - tf.sign(llr_mem[0]))
+                        #remove "exact 0 llrs" leading to u_hat=0.5
+                        u = tf.where(tf.equal(u, 0.5), tf.ones_like(u), u)
+                        u_hat = tf.tensor_scatter_nd_update(u_hat,
+                                                            [[offset]], u)
+                    else: # leaf_frozen or rate0
+                        u = tf.zeros([2**stage, batch_size], self.rdtype)
+                    # write partial sums into the memory of the parent node
+                    if stage<num_stages:
+                        ind = offset % 2**(stage+1) + tf.range(2**stage)
+                        u_mem[stage] = tf.tensor_scatter_nd_update(
+                                    u_mem[stage], tf.expand_dims(ind, -1), u)
+                return (u_hat, *llr_mem[:num_stages], *u_mem)
+            return _op
+
+        u_hat = tf.zeros([self._n, batch_size], self.rdtype)
+        llr_mem = [tf.zeros([2**s, batch_size], self.rdtype)
+                   for s in range(num_stages)]
+        u_mem = [tf.zeros([2**(s+1), batch_size], self.rdtype)
+                 for s in range(num_stages)]
+        outputs = _run_polar_schedule(self._schedule,
+                                      _branch,
+                                      (u_hat, *llr_mem, *u_mem))
+        return outputs[0]
+
     ########################
     # Sionna Block functions
     ########################
@@ -240,7 +390,7 @@ class PolarSCDecoder(Block):
         Note:
             This function recursively unrolls the SC decoding tree, thus,
             for larger values of ``n`` building the decoding graph can become
-            time consuming.
+            time consuming. Please consider the ``use_loop`` option instead.
         """
 
         # Reshape inputs to [-1, n]
@@ -251,7 +401,10 @@ class PolarSCDecoder(Block):
         llr_ch = -1. * llr_ch # logits are converted into "true" llrs
 
         # and decode
-        u_hat_n, _ = self._polar_decode_sc_tf(llr_ch, self._frozen_ind)
+        if self._use_loop:
+            u_hat_n = tf.transpose(self._polar_decode_sc_loop(llr_ch), (1, 0))
+        else:
+            u_hat_n, _ = self._polar_decode_sc_tf(llr_ch, self._frozen_ind)
 
         # and recover the k information bit positions
         u_hat = tf.gather(u_hat_n, self._info_pos, axis=1)
@@ -315,6 +468,18 @@ class PolarSCLDecoder(Block):
         if a codeword was (most likely) correctly recovered. This is only
         available if ``crc_degree`` is not None.
 
+    num_workers: int, (default 1)
+        Number of worker threads across which the batch is split if
+        ``cpu_only`` or ``use_hybrid_sc`` is `True`. Each worker decodes its
+        part of the batch with the vectorized Numpy decoder.
+
+    use_loop: `bool`, (default `False`)
+        If `True`, the TensorFlow decoder traverses the decoding tree by a
+        precomputed schedule within a `tf.while_loop` instead of unrolling
+        it into the graph. The graph size is thus (almost) independent of
+        ``n`` which keeps the tracing and compilation time low for large
+        ``n``. Has no effect if ``cpu_only`` or ``use_hybrid_sc`` is `True`.
+
     precision : `None` (default) | 'single' | 'double'
         Precision used for internal calculations and outputs.
         If set to `None`, :py:attr:`~sionna.phy.config.precision` is used.
@@ -354,7 +519,7 @@ class PolarSCLDecoder(Block):
     embedded Numpy decoder. Further, this function recursively unrolls the
     SCL decoding tree, thus, for larger values of ``n`` building the
     decoding graph can become time consuming. Please consider the
-    ``cpu_only`` option if building the graph takes to long.
+    ``use_loop`` or ``cpu_only`` option if building the graph takes to long.
 
     A hybrid SC/SCL decoder as proposed in [Cammerer_Hybrid_SCL]_ (using SC
     instead of BP) can be activated with option ``use_hybrid_sc`` iff an
@@ -378,6 +543,8 @@ class PolarSCLDecoder(Block):
                  use_scatter=False,
                  ind_iil_inv=None,
                  return_crc_status=False,
+                 num_workers=1,
+                 use_loop=False,
                  precision=None,
                  **kwargs):
 
@@ -399,6 +566,12 @@ class PolarSCLDecoder(Block):
             raise TypeError("use_hybrid_sc must be bool.")
         if not isinstance(return_crc_status, bool):
             raise TypeError("return_crc_status must be bool.")
+        if not isinstance(num_workers, int):
+            raise TypeError("num_workers must be int.")
+        if num_workers<1:
+            raise ValueError("num_workers must be positive.")
+        if not isinstance(use_loop, bool):
+            raise TypeError("use_loop must be bool.")
 
         if not np.issubdtype(frozen_pos.dtype, int):
             raise TypeError("frozen_pos contains non int.")
@@ -411,7 +584,8 @@ class PolarSCLDecoder(Block):
             raise ValueError("list_size must be a power of 2.")
 
         # CPU mode is recommended for larger values of n
-        if n>128 and cpu_only is False and use_hybrid_sc is False:
+        if (n>128 and cpu_only is False and use_hybrid_sc is False
+            and use_loop is False):
             warnings.warn("Required resource allocation is large " \
             "for the selected blocklength. Consider option `cpu_only=True`.")
 
@@ -425,6 +599,8 @@ class PolarSCLDecoder(Block):
         self._use_scatter = use_scatter # slower but more memory friendly
         self._cpu_only = cpu_only # run numpy decoder
         self._use_hybrid_sc = use_hybrid_sc
+        self._num_workers = num_workers # threads of the numpy decoder
+        self._use_loop = use_loop # tf.while_loop instead of unrolled graph
 
         # store internal attributes
         self._n = n
@@ -441,6 +617,12 @@ class PolarSCLDecoder(Block):
         self._frozen_ind[self._frozen_pos] = 1
         self._cw_ind = np.arange(self._n)
         self._n_stages = int(np.log2(self._n)) # number of decoding stages
+        self._dup_ranges_cache = {} # messages copied by the numpy decoder
+        if self._use_loop:
+            self._schedule = _polar_tree_schedule(
+                                            self._frozen_ind,
+                                            prune_rate0=self._use_fast_scl,
+                                            prune_rep=self._use_fast_scl)
 
         # init CRC check (if needed)
         if crc_degree is not None:
@@ -1044,6 +1226,128 @@ class PolarSCLDecoder(Block):
                                                         msg_llr)
         return [msg_uhat, msg_pm]
 
+    def _decode_tf_loop(self, llr_ch):
+        """Decoding function in TF based on a `tf.while_loop`.
+
+        Same algorithm as :meth:`_decode_tf`, but the nodes of the decoding
+        tree are processed according to a precomputed schedule. Per stage
+        `s`, only the LLRs (`2^s` entries) and partial sums (both children of
+        a node of stage `s+1`) of the currently processed nodes are stored.
+        Path duplication is implemented as gather along the path dimension.
+
+        Returns the estimated u_hat of shape `[batch_size, 2*list_size, 1, n]`
+        and the path metrics of shape `[batch_size, 2*list_size]`.
+        """
+        num_stages = self._n_stages
+        l = self._list_size
+        batch_size = tf.shape(llr_ch)[0]
+
+        # init all 2*l decoders with same llr_ch
+        llr_ch = tf.tile(tf.expand_dims(llr_ch, 1), [1, 2*l, 1])
+        # the upper l decoders decide for 1 in case of a branch
+        u_up = tf.constant([0.]*l + [1.]*l, self.rdtype)
+
+        def _clip(llr):
+            return tf.clip_by_value(llr,
+                                    clip_value_min=-self._llr_max,
+                                    clip_value_max=self._llr_max)
+
+        def _write_u(u_mem, stage, offset, u):
+            # write u into the left or right half of the parent node memory
+            half = tf.equal(tf.range(2), (offset // 2**stage) % 2)
+            return tf.where(tf.reshape(half, [1, 1, 2, 1]),
+                            tf.expand_dims(u, 2),
+                            u_mem)
+
+        def _write_u_hat(u_hat, pos, u):
+            return tf.where(tf.equal(tf.range(self._n), pos),
+                            tf.expand_dims(u, -1),
+                            u_hat)
+
+        def _duplicate(msg_pm, mem):
+            # sort decoders and copy the l best decoders to pos l:2*l
+            ind = tf.argsort(msg_pm, axis=-1)
+            ind = tf.concat([ind[:, :l], ind[:, :l]], 1)
+            msg_pm = tf.gather(msg_pm, ind, batch_dims=1)
+            mem = [tf.gather(m, ind, axis=1, batch_dims=1) for m in mem]
+            return msg_pm, mem
+
+        def _branch(op, stage):
+            def _op(offset, msg_pm, u_hat, *mem):
+                llr_mem = list(mem[:num_stages]) + [llr_ch]
+                u_mem = list(mem[num_stages:])
+                branch = False
+                if op in ("left", "right"):
+                    h = 2**(stage-1)
+                    llr = llr_mem[stage]
+                    if op=="left":
+                        llr_mem[stage-1] = self._cn_op(llr[..., :h],
+                                                       llr[..., h:])
+                    else:
+                        llr_mem[stage-1] = self._vn_op(llr[..., :h],
+                                                       llr[..., h:],
+                                                       u_mem[stage-1][:,:,0])
+                else:
+                    llr = _clip(llr_mem[stage]) # unused by "combine"
+                    if op=="combine":
+                        u = u_mem[stage-1]
+                        # combine u_hat via bitwise_xor
+                        u_left = tf.bitwise.bitwise_xor(
+                                            tf.cast(u[:, :, 0], tf.int32),
+                                            tf.cast(u[:, :, 1], tf.int32))
+                        u = tf.concat([tf.cast(u_left, self.rdtype),
+                                       u[:, :, 1]], -1)
+                    elif op in ("leaf_frozen", "rate0"):
+                        u = tf.zeros_like(llr)
+                        msg_pm += tf.reduce_sum(tf.math.softplus(-1.*llr), -1)
+                    elif op=="leaf_info":
+                        u = tf.broadcast_to(tf.expand_dims(u_up, -1),
+                                            tf.shape(llr))
+                        u_hat = _write_u_hat(u_hat, offset, u[..., 0])
+                        msg_pm += tf.math.softplus(
+                                    -tf.multiply((1 - 2*u[..., 0]), llr[..., 0]))
+                        branch = True
+                    else: # rep
+                        u = tf.broadcast_to(tf.expand_dims(u_up, -1),
+                                            tf.shape(llr))
+                        u_hat = _write_u_hat(u_hat, offset + 2**stage - 1,
+                                             u[..., 0])
+                        # upper branch has negative llr values (bit is 1)
+                        llr_pm = tf.concat([llr[:, :l], -llr[:, l:]], 1)
+                        msg_pm += tf.reduce_sum(tf.math.softplus(-1.*llr_pm),
+                                                -1)
+                        branch = True
+                    # write partial sums into the memory of the parent node
+                    if stage<num_stages:
+                        u_mem[stage] = _write_u(u_mem[stage], stage, offset, u)
+
+                mem = [u_hat, *llr_mem[:num_stages], *u_mem]
+                if branch:
+                    msg_pm, mem = _duplicate(msg_pm, mem)
+                return (msg_pm, *mem)
+            return _op
+
+        # init all remaining L-1 decoders with high penalty
+        pm0 = tf.zeros([batch_size, 1], self.rdtype)
+        pm1 = self._llr_max * tf.ones([batch_size, l-1], self.rdtype)
+        msg_pm = tf.concat([pm0, pm1, pm0, pm1], 1)
+
+        u_hat = tf.zeros([batch_size, 2*l, self._n], self.rdtype)
+        llr_mem = [tf.zeros([batch_size, 2*l, 2**s], self.rdtype)
+                   for s in range(num_stages)]
+        u_mem = [tf.zeros([batch_size, 2*l, 2, 2**s], self.rdtype)
+                 for s in range(num_stages)]
+        outputs = _run_polar_schedule(self._schedule,
+                                      _branch,
+                                      (msg_pm, u_hat, *llr_mem, *u_mem))
+        msg_pm, u_hat = outputs[0], outputs[1]
+
+        # and sort output
+        ind = tf.argsort(msg_pm, axis=-1)
+        msg_pm = tf.gather(msg_pm, ind, batch_dims=1)
+        u_hat = tf.gather(u_hat, ind, batch_dims=1)
+        return [tf.expand_dims(u_hat, 2), msg_pm]
+
     ####################################
     # Helper functions for Numpy decoder
     ####################################
@@ -1074,13 +1378,11 @@ class PolarSCLDecoder(Block):
         """
         n = len(cw_ind)
         stage_ind = int(np.log2(n))
-        bs = self._dec_pointer.shape[0]
+        ind_bs = self._batch_ind_np()
 
         # update PM
-        llr = np.zeros([bs, 2*self._list_size, n])
-        for i in range(bs):
-            llr_i = self.msg_llr[i, self._dec_pointer[i, :], stage_ind, :]
-            llr[i, :, :] = llr_i[:, cw_ind]
+        llr = self.msg_llr[ind_bs, self._dec_pointer, stage_ind,
+                           cw_ind[0]:cw_ind[-1]+1]
 
         # upper branch has negative llr values (bit is 1)
         llr[:, self._list_size:, :] = - llr[:, self._list_size:, :]
@@ -1088,15 +1390,13 @@ class PolarSCLDecoder(Block):
         pm_val = np.sum(np.log(1 + np.exp(-llr_in)), axis=-1)
         self.msg_pm += pm_val
 
-        for i in range(bs):
-            ind_dec = self._dec_pointer[i, self._list_size:]
-            for j in cw_ind:
-                self.msg_uhat[i, ind_dec, stage_ind, j] = 1
+        ind_dec = self._dec_pointer[:, self._list_size:]
+        self.msg_uhat[ind_bs, ind_dec, stage_ind, cw_ind[0]:cw_ind[-1]+1] = 1
 
         # branch last bit and update pm at pos cw_ind[-1]
         self._update_single_bit_np([cw_ind[-1]])
         self._sort_decoders_np()
-        self._duplicate_paths_np()
+        self._duplicate_paths_np(cw_ind[-1])
 
     def _update_single_bit_np(self, ind_u):
         """Update single bit at position ``ind_u`` of all decoders in Numpy."""
@@ -1149,19 +1449,50 @@ class PolarSCLDecoder(Block):
         """Variable node update (boxplus) for LLRs in Numpy."""
         return np.multiply((1-2*u_hat), x) + y
 
-    def _duplicate_paths_np(self):
+    def _batch_ind_np(self):
+        """Batch indices of shape `[bs, 1]` that broadcast against
+        ``self._dec_pointer`` for advanced indexing in Numpy."""
+        return np.arange(self._dec_pointer.shape[0])[:, np.newaxis]
+
+    def _dup_ranges_np(self, ind_u):
+        """Ranges of the messages that are still read after the decision on
+        bit ``ind_u``.
+
+        These are the LLRs of all sub-codes containing ``ind_u``, the partial
+        sums of their children and all previous decisions. The LLRs of the
+        last stage are the channel LLRs and thus identical for all paths.
+        Returns a list of `(stage, start, stop)` tuples for the llr and the
+        u_hat messages, respectively.
+        """
+        if ind_u not in self._dup_ranges_cache:
+            ranges_llr = []
+            ranges_uhat = [(0, 0, ind_u+1)]
+            for s in range(self._n_stages):
+                start = (ind_u >> s) << s
+                ranges_llr.append((s, start, start + 2**s))
+                if s>0:
+                    start = (ind_u >> (s+1)) << (s+1)
+                    ranges_uhat.append((s, start, start + 2**(s+1)))
+            self._dup_ranges_cache[ind_u] = (ranges_llr, ranges_uhat)
+        return self._dup_ranges_cache[ind_u]
+
+    def _duplicate_paths_np(self, ind_u):
         """Copy first ``list_size``/2 paths into lower part in Numpy.
 
-        Decoder indices are encoded in ``self._dec_pointer``.
+        Only messages that are read after the decision on bit ``ind_u``
+        are copied. Decoder indices are encoded in ``self._dec_pointer``.
         """
+        ind_bs = self._batch_ind_np()
         ind_low = self._dec_pointer[:, :self._list_size]
         ind_up = self._dec_pointer[:, self._list_size:]
+        ranges_llr, ranges_uhat = self._dup_ranges_np(int(ind_u))
 
-        for i in range(ind_up.shape[0]):
-            self.msg_uhat[i, ind_up[i,:], :, :] = self.msg_uhat[i,
-                                                                ind_low[i,:],
-                                                                :, :]
-            self.msg_llr[i, ind_up[i,:],:,:] = self.msg_llr[i, ind_low[i,:],:,:]
+        for s, start, stop in ranges_uhat:
+            self.msg_uhat[ind_bs, ind_up, s, start:stop] = \
+                                self.msg_uhat[ind_bs, ind_low, s, start:stop]
+        for s, start, stop in ranges_llr:
+            self.msg_llr[ind_bs, ind_up, s, start:stop] = \
+                                self.msg_llr[ind_bs, ind_low, s, start:stop]
 
         # pm must be sorted directly (not accessed via pointer)
         self.msg_pm[:, self._list_size:] = self.msg_pm[:, :self._list_size]
@@ -1243,19 +1574,40 @@ class PolarSCLDecoder(Block):
                 # sort list
                 self._sort_decoders_np()
                 # duplicate the best list_size decoders
-                self._duplicate_paths_np()
+                self._duplicate_paths_np(cw_ind[0])
         return
 
     def _decode_np_batch(self, llr_ch):
-        """Decode batch of ``llr_ch`` with Numpy decoder."""
+        """Decode batch of ``llr_ch`` with Numpy decoder.
+
+        If ``num_workers`` is larger than one, the batch is split across a
+        pool of threads. Each thread runs on a shallow copy of the decoder
+        such that the internal message buffers are not shared.
+        """
+
+        llr_ch = np.asarray(llr_ch)
+        num_workers = min(self._num_workers, llr_ch.shape[0])
+        if num_workers<=1:
+            return self._decode_np(llr_ch)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            outputs = list(pool.map(lambda x: copy.copy(self)._decode_np(x),
+                                    np.array_split(llr_ch, num_workers)))
+        msg_uhat, msg_pm = zip(*outputs)
+        return np.concatenate(msg_uhat, axis=0), np.concatenate(msg_pm, axis=0)
+
+    def _decode_np(self, llr_ch):
+        """Decode ``llr_ch`` with Numpy decoder within the calling thread."""
 
         bs = llr_ch.shape[0]
 
         # allocate memory for all 2*list_size decoders
+        # hard decisions are stored as int8 to reduce the memory traffic of
+        # the path duplication
         self.msg_uhat = np.zeros([bs,
                                   2*self._list_size,
                                   self._n_stages+1,
-                                  self._n])
+                                  self._n], dtype=np.int8)
         self.msg_llr = np.zeros([bs,
                                  2*self._list_size,
                                  self._n_stages+1,
@@ -1283,11 +1635,8 @@ class PolarSCLDecoder(Block):
         self._sort_decoders_np()
 
         # remove pointers
-        for ind in range(bs):
-            self.msg_uhat[ind, :, :, :] = self.msg_uhat[ind,
-                                                        self._dec_pointer[ind],
-                                                        :, :]
-        return self.msg_uhat, self.msg_pm
+        self.msg_uhat = self.msg_uhat[self._batch_ind_np(), self._dec_pointer]
+        return self.msg_uhat.astype(self.msg_pm.dtype), self.msg_pm
 
     def _decode_np_hybrid(self, llr_ch, u_hat_sc, crc_valid):
         """Hybrid SCL decoding stage that decodes iff CRC from previous SC
@@ -1323,13 +1672,9 @@ class PolarSCLDecoder(Block):
         # copy SC data
         msg_uhat[:, 0, 0, self._info_pos] = u_hat_sc
 
-        ind_hyb = 0
-        for ind in range(bs):
-            if not crc_valid[ind]:
-                #copy data from SCL
-                msg_uhat[ind, :, 0, :] = msg_uhat_hyb[ind_hyb, :, 0, :]
-                msg_pm[ind, :] = msg_pm_hyb[ind_hyb, :]
-                ind_hyb += 1
+        # copy data from SCL
+        msg_uhat[ind_invalid, :, 0, :] = msg_uhat_hyb[:, :, 0, :]
+        msg_pm[ind_invalid, :] = msg_pm_hyb
 
         return msg_uhat, msg_pm
 
@@ -1361,7 +1706,8 @@ class PolarSCLDecoder(Block):
         Note:
         This function recursively unrolls the SCL decoding tree, thus,
         for larger values of ``n`` building the decoding graph can become
-        time consuming. Please consider the ``cpu_only`` option instead.
+        time consuming. Please consider the ``use_loop`` or ``cpu_only``
+        option instead.
         """
 
         input_shape = llr_ch.shape
@@ -1390,6 +1736,8 @@ class PolarSCLDecoder(Block):
                 msg_uhat = tf.reshape(msg_uhat,
                             [-1, 2*self._list_size, self._n_stages+1, self._n])
                 msg_pm = tf.reshape(msg_pm, [-1, 2*self._list_size])
+            elif self._use_loop:
+                msg_uhat, msg_pm = self._decode_tf_loop(llr_ch)
             else:
                 msg_uhat, msg_pm = self._decode_tf(llr_ch)
 
@@ -9,6 +9,7 @@ from sionna.phy import Block
 from sionna.phy.fec import interleaving
 from sionna.phy.fec.conv.decoding import BCJRDecoder
 from sionna.phy.fec.conv.utils import Trellis
+from sionna.phy.fec.crc import CRCDecoder
 from sionna.phy.fec.turbo.utils import TurboTermination, polynomial_selector, \
                                        puncture_pattern
 
@@ -56,9 +57,9 @@ class TurboDecoder(Block):
         to have terminated to all zero state.
 
     num_iter: int
-        Number of iterations for the Turbo decoding to run. Each iteration of
-        Turbo decoding entails one BCJR decoder for each of the underlying
-        convolutional code components.
+        (Maximum) number of iterations for the Turbo decoding to run. Each
+        iteration of Turbo decoding entails one BCJR decoder for each of the
+        underlying convolutional code components.
 
     hard_out: `bool`, (default `True`)
         Indicates whether to output hard or soft
@@ -73,6 +74,36 @@ class TurboDecoder(Block):
         `maxlog` indicates the approximated MAP implementation in log-domain,
         where :math:`\log(e^{a}+e^{b}) \sim \max(a,b)`.
 
+    early_stop: `None` (default) | "crc" | "sign" | "cross_entropy"
+        Stopping criterion that is evaluated for each codeword after each
+        iteration. Codewords that fulfill the criterion are frozen, i.e.,
+        their LLRs are not updated anymore, and decoding stops as soon as all
+        codewords of the batch have converged or ``num_iter`` iterations are
+        reached. `"crc"` stops if the CRC of the hard-decided information
+        bits is valid (requires ``crc_decoder``). `"sign"` stops if the hard
+        decisions did not change w.r.t. the previous iteration.
+        `"cross_entropy"` stops if the (approximated) cross-entropy between
+        the outputs of two consecutive iterations dropped below
+        ``ce_threshold`` times its value after the first iteration. If `None`, all ``num_iter`` iterations are
+        run.
+
+    crc_decoder: `None` (default) | :class:`~sionna.phy.fec.crc.CRCDecoder`
+        CRC decoder used for the `"crc"` stopping criterion. The CRC parity
+        bits are assumed to be the last bits of the information bit vector.
+
+    ce_threshold: float, (default 1e-3)
+        Relative threshold of the `"cross_entropy"` stopping criterion.
+
+    compact_batch: `bool`, (default `False`)
+        If `True`, converged codewords are removed from the batch such that
+        they do not consume compute in subsequent iterations. Requires
+        ``early_stop`` to be set. Note that this results in dynamic shapes
+        and is, thus, not compatible with XLA.
+
+    return_num_iter: `bool`, (default `False`)
+        If `True`, the number of decoding iterations of each codeword is
+        returned as additional output.
+
     precision : `None` (default) | 'single' | 'double'
         Precision used for internal calculations and outputs.
         If set to `None`, :py:attr:`~sionna.phy.config.precision` is used.
@@ -89,6 +120,10 @@ class TurboDecoder(Block):
         Tensor of shape `[..., coderate * n]` containing the estimates of the
         information bit tensor.
 
+    : [...], tf.int32
+        Number of decoding iterations of each codeword.
+        Returned only if ``return_num_iter`` is set to `True`.
+
     Note
     ----
     For decoding, input `logits` defined as
@@ -108,6 +143,11 @@ class TurboDecoder(Block):
                  num_iter=6,
                  hard_out=True,
                  algorithm='map',
+                 early_stop=None,
+                 crc_decoder=None,
+                 ce_threshold=1e-3,
+                 compact_batch=False,
+                 return_num_iter=False,
                  precision=None,
                  **kwargs):
 
@@ -200,6 +240,25 @@ class TurboDecoder(Block):
         self.num_iter = num_iter
         self._hard_out = hard_out
 
+        if early_stop not in (None, "crc", "sign", "cross_entropy"):
+            raise ValueError("early_stop must be None, 'crc', 'sign' or " \
+                             "'cross_entropy'.")
+        if early_stop == "crc":
+            if not isinstance(crc_decoder, CRCDecoder):
+                raise TypeError("crc_decoder must be a CRCDecoder if " \
+                                "early_stop='crc'.")
+        if not isinstance(compact_batch, bool):
+            raise TypeError("compact_batch must be bool.")
+        if compact_batch and early_stop is None:
+            raise ValueError("compact_batch requires early_stop.")
+        if not isinstance(return_num_iter, bool):
+            raise TypeError("return_num_iter must be bool.")
+        self._early_stop = early_stop
+        self._crc_decoder = crc_decoder
+        self._ce_threshold = ce_threshold
+        self._compact_batch = compact_batch
+        self._return_num_iter = return_num_iter
+
         self.bcjrdecoder = BCJRDecoder(gen_poly=self._gen_poly,
                                        rsc=self.rsc,
                                        hard_out=False,
@@ -231,6 +290,16 @@ class TurboDecoder(Block):
         """Trellis object used during encoding"""
         return self._trellis
 
+    @property
+    def early_stop(self):
+        """Stopping criterion for early termination"""
+        return self._early_stop
+
+    @property
+    def return_num_iter(self):
+        """Return number of decoding iterations per codeword"""
+        return self._return_num_iter
+
     @property
     def k(self):
         """Number of information bits per codeword"""
@@ -354,18 +423,219 @@ class TurboDecoder(Block):
         mask_ = tf.squeeze(tf.reshape(mask_, (-1, )))
         self._punct_indices = tf.cast(tf.where(mask_), tf.int32)
 
+    def _turbo_iter(self, y1_cw, y2_cw, llr_ch, llr_ch2, llr_1e):
+        """Runs one Turbo iteration, i.e., both BCJR component decoders.
+
+        Returns the updated a priori LLRs ``llr_1e`` of the 1st component
+        decoder and the output LLRs ``llr_2i`` of the 2nd component decoder.
+        """
+        llr_max = 20.
+
+        # define zero LLR's for termination info bits
+        term_info_bits = self._mu if self._terminate else 0
+        llr_terminfo = tf.zeros(
+                        (tf.shape(llr_ch)[0], term_info_bits), self.rdtype)
+
+        # run 1st component decoder
+        llr_1i = self.bcjrdecoder(y1_cw, llr_a=llr_1e)
+        llr_1i = llr_1i[...,:self._k]
+        llr_extr = llr_1i - llr_ch - llr_1e[...,:self._k]
+
+        llr_2e = self.internal_interleaver(llr_extr)
+        llr_2e = tf.concat([llr_2e, llr_terminfo], axis=-1)
+        llr_2e = tf.clip_by_value(llr_2e,
+                                  clip_value_min=-llr_max,
+                                  clip_value_max=llr_max)
+        # run 2nd component decoder
+        llr_2i = self.bcjrdecoder(y2_cw, llr_a=llr_2e)
+        llr_2i = llr_2i[...,:self._k]
+        llr_extr = llr_2i - llr_2e[...,:self._k] - llr_ch2
+
+        llr_1e = self.internal_interleaver(llr_extr, inverse=True)
+
+        llr_1e = tf.clip_by_value(llr_1e,
+                                  clip_value_min=-llr_max,
+                                  clip_value_max=llr_max)
+
+        llr_1e = tf.concat([llr_1e, llr_terminfo], axis=-1)
+        return llr_1e, llr_2i
+
+    def _is_converged(self, llr_1e, llr_1e_prev, llr_out, llr_out_prev,
+                      ce_ref, it):
+        """Evaluates the stopping criterion of each codeword.
+
+        Parameters
+        ----------
+        llr_1e, llr_1e_prev: [batch_size, num_syms], tf.float
+            Extrinsic LLRs of the 2nd component decoder (deinterleaved) of
+            the current and previous iteration.
+
+        llr_out, llr_out_prev: [batch_size, k], tf.float
+            Output LLRs (deinterleaved) of the current and previous
+            iteration.
+
+        ce_ref: [batch_size], tf.float
+            Cross-entropy after the first iteration.
+
+        it: tf.int32
+            Current iteration (starting at 1).
+
+        Returns
+        -------
+        converged: [batch_size], tf.bool
+            `True` for each codeword that fulfills the stopping criterion.
+
+        ce_ref: [batch_size], tf.float
+            Updated cross-entropy after the first iteration.
+        """
+        if self._early_stop == "crc":
+            u_hat = tf.cast(tf.less(0.0, llr_out), self.rdtype)
+            _, crc_valid = self._crc_decoder(u_hat)
+            converged = tf.squeeze(crc_valid, axis=-1)
+        elif self._early_stop == "sign":
+            converged = tf.reduce_all(
+                        tf.equal(tf.less(0.0, llr_out),
+                                 tf.less(0.0, llr_out_prev)), axis=-1)
+            # no previous decisions available in the first iteration
+            converged = tf.logical_and(converged, it > 1)
+        else: # cross-entropy criterion
+            # approximated cross-entropy of consecutive iterations
+            delta = llr_1e[...,:self._k] - llr_1e_prev[...,:self._k]
+            ce = tf.reduce_sum(tf.square(delta)*tf.exp(-tf.abs(llr_out)),
+                               axis=-1)
+            ce_ref = tf.where(it == 1, ce, ce_ref)
+            converged = tf.logical_and(
+                            ce <= tf.cast(self._ce_threshold, self.rdtype)
+                                  * ce_ref,
+                            it > 1)
+        return converged, ce_ref
+
+    def _decode_early_stop(self, y1_cw, y2_cw, llr_ch, llr_ch2, llr_1e):
+        """Decoding loop with early stopping.
+
+        Converged codewords are frozen and the loop stops once all
+        codewords have converged.
+
+        Returns
+        -------
+        llr_out: [batch_size, k], tf.float
+            Output LLRs (deinterleaved) of the 2nd component decoder.
+
+        num_iter_cw: [batch_size], tf.int32
+            Number of decoding iterations of each codeword.
+        """
+        batch_size = tf.shape(llr_ch)[0]
+
+        def _cond(it, llr_1e, llr_out, ce_ref, converged, num_iter_cw):
+            return tf.logical_and(it < self.num_iter,
+                                  tf.logical_not(tf.reduce_all(converged)))
+
+        def _body(it, llr_1e, llr_out, ce_ref, converged, num_iter_cw):
+            it += 1
+            llr_1e_, llr_2i = self._turbo_iter(y1_cw, y2_cw, llr_ch,
+                                               llr_ch2, llr_1e)
+            llr_out_ = self.internal_interleaver(llr_2i, inverse=True)
+            converged_, ce_ref = self._is_converged(llr_1e_, llr_1e,
+                                                    llr_out_, llr_out,
+                                                    ce_ref, it)
+            # keep state of converged codewords
+            llr_1e = tf.where(converged[:,None], llr_1e, llr_1e_)
+            llr_out = tf.where(converged[:,None], llr_out, llr_out_)
+            num_iter_cw = tf.where(converged, num_iter_cw, it)
+            converged = tf.logical_or(converged, converged_)
+            return it, llr_1e, llr_out, ce_ref, converged, num_iter_cw
+
+        inputs = (tf.constant(0, tf.int32),
+                  llr_1e,
+                  tf.zeros_like(llr_ch),
+                  tf.zeros([batch_size], self.rdtype),
+                  tf.zeros([batch_size], tf.bool),
+                  tf.zeros([batch_size], tf.int32))
+        outputs = tf.while_loop(_cond, _body, inputs)
+        return outputs[2], outputs[5]
+
+    def _decode_compact(self, y1_cw, y2_cw, llr_ch, llr_ch2, llr_1e):
+        """Decoding loop with early stopping that removes converged
+        codewords from the batch.
+
+        Returns the same outputs as :meth:`_decode_early_stop`.
+        """
+        batch_size = tf.shape(llr_ch)[0]
+
+        llr_out_final = tf.zeros_like(llr_ch)
+        num_iter_cw = tf.zeros([batch_size], tf.int32)
+        active_idx = tf.range(batch_size)
+
+        # no iterations are required for num_iter=0
+        active_idx = active_idx[
+                        :batch_size*tf.cast(self.num_iter>0, tf.int32)]
+
+        def _cond(it, active_idx, *args):
+            return tf.size(active_idx) > 0
+
+        def _body(it, active_idx, y1_cw, y2_cw, llr_ch, llr_ch2, llr_1e,
+                  llr_out, ce_ref, llr_out_final, num_iter_cw):
+            it += 1
+            llr_1e_, llr_2i = self._turbo_iter(y1_cw, y2_cw, llr_ch,
+                                               llr_ch2, llr_1e)
+            llr_out_ = self.internal_interleaver(llr_2i, inverse=True)
+            converged, ce_ref = self._is_converged(llr_1e_, llr_1e,
+                                                   llr_out_, llr_out,
+                                                   ce_ref, it)
+            llr_1e = llr_1e_
+            llr_out = llr_out_
+            done = tf.logical_or(converged, it >= self.num_iter)
+
+            # write results of finished codewords
+            idx = tf.expand_dims(tf.boolean_mask(active_idx, done), axis=1)
+            llr_out_final = tf.tensor_scatter_nd_update(
+                                llr_out_final, idx,
+                                tf.boolean_mask(llr_out, done))
+            num_iter_cw = tf.tensor_scatter_nd_update(
+                                num_iter_cw, idx, tf.fill([tf.shape(idx)[0]],
+                                                          it))
+
+            # and remove them from the batch
+            active = tf.logical_not(done)
+            active_idx = tf.boolean_mask(active_idx, active)
+            y1_cw = tf.boolean_mask(y1_cw, active)
+            y2_cw = tf.boolean_mask(y2_cw, active)
+            llr_ch = tf.boolean_mask(llr_ch, active)
+            llr_ch2 = tf.boolean_mask(llr_ch2, active)
+            llr_1e = tf.boolean_mask(llr_1e, active)
+            llr_out = tf.boolean_mask(llr_out, active)
+            ce_ref = tf.boolean_mask(ce_ref, active)
+            return (it, active_idx, y1_cw, y2_cw, llr_ch, llr_ch2, llr_1e,
+                    llr_out, ce_ref, llr_out_final, num_iter_cw)
+
+        inputs = (tf.constant(0, tf.int32), active_idx, y1_cw, y2_cw, llr_ch,
+                  llr_ch2, llr_1e, tf.zeros_like(llr_ch),
+                  tf.zeros([batch_size], self.rdtype), llr_out_final,
+                  num_iter_cw)
+        shape_invariants = (tf.TensorShape([]),
+                            tf.TensorShape([None]),
+                            tf.TensorShape([None, y1_cw.shape[-1]]),
+                            tf.TensorShape([None, y2_cw.shape[-1]]),
+                            tf.TensorShape([None, self._k]),
+                            tf.TensorShape([None, self._k]),
+                            tf.TensorShape([None, self._convenc_numsyms]),
+                            tf.TensorShape([None, self._k]),
+                            tf.TensorShape([None]),
+                            llr_out_final.shape,
+                            num_iter_cw.shape)
+        outputs = tf.while_loop(_cond, _body, inputs,
+                                shape_invariants=shape_invariants)
+        return outputs[9], outputs[10]
+
     def call(self, llr_ch, /):
         """
         Decoder for Turbo code.
 
         Runs BCJR decoder on both the constituent convolutional codes
-        iteratively `num_iter` times. At the end, the resultant LLRs are
-        computed and the decoded message vector (termination bits are
-        excluded) is output.
+        iteratively `num_iter` times (or until the stopping criterion is
+        fulfilled). At the end, the resultant LLRs are computed and the
+        decoded message vector (termination bits are excluded) is output.
         """
-        print(llr_ch.dtype)
-        llr_max = 20.
-
         output_shape = llr_ch.get_shape().as_list()
 
         # allow different codeword lengths in eager mode
@@ -390,46 +660,34 @@ class TurboDecoder(Block):
 
         llr_1e = tf.zeros((tf.shape(llr_ch)[0], self._convenc_numsyms),
                           dtype=self.rdtype)
-        # define zero LLR's for termination info bits
-        term_info_bits = self._mu if self._terminate else 0
-        llr_terminfo = tf.zeros(
-                        (tf.shape(llr_ch)[0], term_info_bits), self.rdtype)
-
-        # needs to be initialized for XLA before entering the loop
-        llr_2i = tf.zeros_like(llr_ch2)
-
-        # run decoding loop
-        for _ in tf.range(self.num_iter):
-
-            # run 1st component decoder
-            llr_1i = self.bcjrdecoder(y1_cw, llr_a=llr_1e)
-            llr_1i = llr_1i[...,:self._k]
-            llr_extr = llr_1i - llr_ch - llr_1e[...,:self._k]
 
-            llr_2e = self.internal_interleaver(llr_extr)
-            llr_2e = tf.concat([llr_2e, llr_terminfo], axis=-1)
-            llr_2e = tf.clip_by_value(llr_2e,
-                                      clip_value_min=-llr_max,
-                                      clip_value_max=llr_max)
-            # run 2nd component decoder
-            llr_2i = self.bcjrdecoder(y2_cw, llr_a=llr_2e)
-            llr_2i = llr_2i[...,:self._k]
-            llr_extr = llr_2i - llr_2e[...,:self._k] - llr_ch2
-
-            llr_1e = self.internal_interleaver(llr_extr, inverse=True)
-
-            llr_1e = tf.clip_by_value(llr_1e,
-                                      clip_value_min=-llr_max,
-                                      clip_value_max=llr_max)
+        if self._compact_batch:
+            output, num_iter_cw = self._decode_compact(y1_cw, y2_cw, llr_ch,
+                                                       llr_ch2, llr_1e)
+        elif self._early_stop is not None:
+            output, num_iter_cw = self._decode_early_stop(y1_cw, y2_cw,
+                                                          llr_ch, llr_ch2,
+                                                          llr_1e)
+        else:
+            # needs to be initialized for XLA before entering the loop
+            llr_2i = tf.zeros_like(llr_ch2)
 
-            llr_1e = tf.concat([llr_1e, llr_terminfo], axis=-1)
+            # run decoding loop
+            for _ in tf.range(self.num_iter):
+                llr_1e, llr_2i = self._turbo_iter(y1_cw, y2_cw, llr_ch,
+                                                  llr_ch2, llr_1e)
 
-        # use latest output of 2nd decoder
-        output = self.internal_interleaver(llr_2i, inverse=True)
+            # use latest output of 2nd decoder
+            output = self.internal_interleaver(llr_2i, inverse=True)
+            num_iter_cw = tf.fill([tf.shape(output)[0]], self.num_iter)
 
         if self._hard_out: # hard decide decoder output if required
             output = tf.less(0.0, output)
         output = tf.cast(output, self.rdtype)
 
         output_reshaped = tf.reshape(output, output_shape)
+
+        if self._return_num_iter:
+            num_iter_cw = tf.cast(num_iter_cw, tf.int32)
+            return output_reshaped, tf.reshape(num_iter_cw, output_shape[:-1])
         return output_reshaped
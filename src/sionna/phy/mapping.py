@@ -624,6 +624,18 @@ class Demapper(Block):
                  \max_{c\in\mathcal{C}_{i,1}}\left( \ln\left(\Pr\left(c\lvert\mathbf{p}\right)\right) - \frac{|y-c|^2}{N_o}\right)
                 .
         \end{align}
+
+    For QAM constellations (``constellation_type`` "qam"), the Gray labelling
+    assigns the even and odd bits of every symbol to the in-phase and
+    quadrature components, respectively. As the squared distance
+    :math:`|y-c|^2` and the prior :math:`\Pr\left(c\lvert\mathbf{p}\right)`
+    both factorize over the two components, the LLRs of the even (odd) bits
+    only depend on :math:`\Re\{y\}` (:math:`\Im\{y\}`). The demapper
+    hence computes them from two PAM demappings with
+    :math:`2^{\text{num_bits_per_symbol}/2}` points each, rather than from
+    the distances to all :math:`2^{\text{num_bits_per_symbol}}`
+    constellation points. This reduces complexity and memory for high-order
+    QAM and yields the same LLRs for both demapping methods.
     """
     def __init__(self,
                  demapping_method,
@@ -653,6 +665,28 @@ class Demapper(Block):
         self._no_threshold = tf.cast(np.finfo(self.rdtype.as_numpy_dtype).tiny,
                                      self.rdtype)
 
+        # QAM symbols are demapped separately in both dimensions
+        self._separable = self._constellation.constellation_type == "qam"
+        if self._separable:
+            num_bits_per_dim = num_bits_per_symbol//2
+            self._pam_logits2llrs = SymbolLogits2LLRs(demapping_method,
+                                                      num_bits_per_dim,
+                                                      hard_out=hard_out,
+                                                      precision=precision,
+                                                      **kwargs)
+            # Indices of the QAM points whose label has only zeros in the
+            # odd (even) bits, ordered by the label of the even (odd) bits.
+            # The real (imaginary) parts of these points are the PAM points
+            # of the in-phase (quadrature) component.
+            # [2, 2**num_bits_per_dim]
+            pam_ind = np.zeros([2, 2**num_bits_per_dim], np.int32)
+            for i in range(2**num_bits_per_dim):
+                for j in range(num_bits_per_dim):
+                    bit = (i >> (num_bits_per_dim-1-j)) & 1
+                    pam_ind[0, i] += bit << (num_bits_per_symbol-1-2*j)
+                    pam_ind[1, i] += bit << (num_bits_per_symbol-2-2*j)
+            self._pam_ind = tf.constant(pam_ind, tf.int32)
+
     @property
     def constellation(self):
         """
@@ -661,8 +695,64 @@ class Demapper(Block):
         """
         return self._constellation
 
+    def _call_separable(self, y, no, prior):
+        """Demaps QAM symbols through PAM demappings of both components"""
+        points = self.constellation.points
+
+        # PAM points of the in-phase and quadrature components
+        # [2, num_pam_points]
+        pam_points = tf.stack([tf.math.real(tf.gather(points,
+                                                      self._pam_ind[0])),
+                               tf.math.imag(tf.gather(points,
+                                                      self._pam_ind[1]))])
+
+        # Received components
+        # [..., n, 2, 1]
+        y = tf.stack([tf.math.real(y), tf.math.imag(y)], axis=-1)
+        y = tf.expand_dims(y, axis=-1)
+
+        # Compute squared distances to the PAM points
+        # [..., n, 2, num_pam_points]
+        squared_dist = tf.square(y - pam_points)
+
+        # Add dummy dimensions for broadcasting
+        no = tf.expand_dims(tf.expand_dims(no, axis=-1), axis=-1)
+        no = tf.math.maximum(no, self._no_threshold)
+
+        exponents = -squared_dist/no
+
+        # Split the prior on the bits of both components
+        # [..., n or 1, 2, num_bits_per_symbol/2]
+        if prior is not None:
+            prior = split_dim(prior, [-1, 2], tf.rank(prior)-1)
+            prior = tf.linalg.matrix_transpose(prior)
+
+        # [..., n, 2, num_bits_per_symbol/2]
+        llr = self._pam_logits2llrs(exponents, prior)
+
+        # Interleave the bits of both components
+        # [..., n, num_bits_per_symbol]
+        return tf.reshape(tf.linalg.matrix_transpose(llr),
+                          tf.concat([tf.shape(llr)[:-2], [-1]], 0))
+
     def call(self, y, no, prior=None):
 
+        if self._separable:
+            llr = self._call_separable(y, no, prior)
+        else:
+            llr = self._call_full(y, no, prior)
+
+        # Reshape LLRs to [...,n*num_bits_per_symbol]
+        out_shape = tf.concat([tf.shape(y)[:-1],
+                               [y.shape[-1] * \
+                                self.constellation.num_bits_per_symbol]], 0)
+        llr_reshaped = tf.reshape(llr, out_shape)
+
+        return llr_reshaped
+
+    def _call_full(self, y, no, prior):
+        """Demaps symbols using the distances to all constellation points"""
+
         # Reshape constellation points to [1,...1,num_points]
         points_shape = [1]*y.shape.rank + self.constellation.points.shape
         points = tf.reshape(self.constellation.points, points_shape)
@@ -680,15 +770,7 @@ class Demapper(Block):
         # Compute exponents
         exponents = -squared_dist/no
 
-        llr = self._logits2llrs(exponents, prior)
-
-        # Reshape LLRs to [...,n*num_bits_per_symbol]
-        out_shape = tf.concat([tf.shape(y)[:-1],
-                               [y.shape[-1] * \
-                                self.constellation.num_bits_per_symbol]], 0)
-        llr_reshaped = tf.reshape(llr, out_shape)
-
-        return llr_reshaped
+        return self._logits2llrs(exponents, prior)
 
 class SymbolDemapper(Block):
     # pylint: disable=line-too-long
@@ -21,6 +21,46 @@ from sionna.phy.mimo.utils import complex2real_channel, whiten_channel, \
 from sionna.phy.mimo.equalization import lmmse_equalizer, zf_equalizer, \
                                          mf_equalizer
 
+def _sorted_qr(y, h):
+    """
+    Sorts the columns of the (whitened) channel matrices by decreasing norm,
+    computes the QR decomposition of the sorted channel matrices, and
+    projects the received signals onto Q'
+
+    Input
+    -----
+    y : [batch_size, M], tf.complex
+        Whitened received signals
+
+    h : [batch_size, M, num_streams], tf.complex
+        Whitened channel matrices
+
+    Output
+    ------
+    y : [batch_size, num_streams], tf.complex
+        Projected received signals
+
+    r : [batch_size, num_streams, num_streams], tf.complex
+        Upper-triangular matrices of the QR decomposition
+
+    column_order : [batch_size, num_streams], tf.int32
+        Order of the columns of the sorted channel matrices
+    """
+    # Order columns of H in order of decreasing norm
+    h_norm = tf.reduce_sum(tf.abs(h)**2, axis=1)
+    column_order = tf.argsort(h_norm, axis=-1, direction="DESCENDING")
+    h = tf.gather(h, column_order, axis=-1, batch_dims=1)
+
+    # Compute QR decomposition of sorted channel
+    # r is upper triangular
+    q, r = tf.linalg.qr(h)
+
+    # Project y on Q'
+    y = tf.squeeze(tf.matmul(q, tf.expand_dims(y, -1), adjoint_a=True),
+                   -1)
+
+    return y, r, column_order
+
 class LinearDetector(Block):
     # pylint: disable=line-too-long
     r"""
@@ -263,13 +303,43 @@ class MaximumLikelihoodDetector(Block):
 
     where :math:`\mathcal{C}` is the set of constellation points.
 
+    **Sphere decoding:**
+
+    By default, the distances of all :math:`|\mathcal{C}|^K` possible vectors
+    :math:`\mathbf{x}` are computed, which quickly becomes prohibitive as the
+    number of streams or the constellation size grows.
+    If ``search`` is set to "sphere", the "maxlog" quantities are instead
+    computed exactly with a depth-first sphere decoder.
+    As for :class:`~sionna.phy.mimo.KBestDetector`, the columns of
+    :math:`\tilde{\mathbf{H}}` are sorted by decreasing norm and the QR
+    decomposition :math:`\tilde{\mathbf{H}} = \mathbf{Q}\mathbf{R}` of the
+    sorted channel is computed, such that
+    :math:`\lVert\tilde{\mathbf{y}}-\tilde{\mathbf{H}}\mathbf{x}\rVert^2`
+    equals, up to a constant, the sum of the non-negative contributions
+    :math:`\lvert\bar{y}_k - \sum_{j\geq k} R_{k,j}x_j\rvert^2` of the
+    streams :math:`k=K,\dots,1`.
+    The tree of partial symbol vectors is explored depth-first, visiting
+    the children of each node in order of increasing partial distance
+    (Schnorr-Euchner enumeration).
+    The search keeps track of the smallest distance found so far for
+    every hypothesis, i.e., for every value of every bit if ``output``
+    equals "bit", for every constellation point of every stream if
+    ``output`` equals "symbol", and for the ML solution only if
+    ``hard_out`` is `True`. A subtree is pruned as soon as its partial
+    distance exceeds all the hypothesis metrics it could still improve,
+    so that the counter-hypotheses are found within the same search.
+    Priors are included as additional non-negative per-stream costs.
+    The search runs in lockstep for all batch examples until the last
+    one has completed.
+
     Parameters
     -----------
     output : "bit" | "symbol"
         Type of output, either LLRs on bits or logits on constellation symbols
 
     demapping_method : "app" | "maxlog"
-        Demapping method to be used
+        Demapping method to be used. Only "maxlog" is supported if ``search``
+        equals "sphere".
 
     num_streams : `int`
         Number of transmitted streams
@@ -290,6 +360,12 @@ class MaximumLikelihoodDetector(Block):
         If `True`, the detector computes hard-decided bit values or
         constellation point indices instead of soft-values.
 
+    search : "exhaustive" (default) | "sphere"
+        If "exhaustive", the distances of all possible transmitted vectors
+        are computed. If "sphere", a sphere decoder is used, which requires
+        the number of receive antennas not to be smaller than
+        ``num_streams``.
+
     precision : `None` (default) | "single" | "double"
         Precision used for internal calculations and outputs.
         If set to `None`,
@@ -331,6 +407,7 @@ class MaximumLikelihoodDetector(Block):
                  num_bits_per_symbol=None,
                  constellation=None,
                  hard_out=False,
+                 search="exhaustive",
                  precision=None,
                  **kwargs):
         super().__init__(precision=precision, **kwargs)
@@ -339,9 +416,15 @@ class MaximumLikelihoodDetector(Block):
 
         assert demapping_method in ("app","maxlog"), "Unknown demapping method"
 
+        assert search in ("exhaustive", "sphere"), "Unknown search"
+        assert search=="exhaustive" or demapping_method=="maxlog", \
+            "Sphere decoding only supports the 'maxlog' demapping method"
+
         self._output = output
         self._demapping_method = demapping_method
         self._hard_out = hard_out
+        self._search = search
+        self._num_streams = num_streams
 
         # Determine the reduce function for LLR computation
         if self._demapping_method == "app":
@@ -356,17 +439,23 @@ class MaximumLikelihoodDetector(Block):
                                 constellation=constellation,
                                 precision=precision)
 
-        # Utility function to compute
-        # vecs : [num_vecs, num_streams] The list of all possible transmitted vectors.
-        # vecs_ind : [num_vecs, num_streams] The list of all possible transmitted vectors
-        #   constellation indices
-        # c : [num_vecs/num_points, num_streams, num_points] Which is such that `c[:,k,s]`
-        #   gives the symbol indices in the first dimension of `vecs` for which
-        #   the `k`th stream transmitted the `s`th constellation point.
-        vecs, vecs_ind, c = self._build_vecs(num_streams)
-        self._vecs = tf.cast(vecs, self.cdtype)
-        self._vecs_ind = tf.cast(vecs_ind, tf.int32)
-        self._c = tf.cast(c, tf.int32)
+        if search == "exhaustive":
+            # Utility function to compute
+            # vecs : [num_vecs, num_streams] The list of all possible transmitted vectors.
+            # vecs_ind : [num_vecs, num_streams] The list of all possible transmitted vectors
+            #   constellation indices
+            # c : [num_vecs/num_points, num_streams, num_points] Which is such that `c[:,k,s]`
+            #   gives the symbol indices in the first dimension of `vecs` for which
+            #   the `k`th stream transmitted the `s`th constellation point.
+            vecs, vecs_ind, c = self._build_vecs(num_streams)
+            self._vecs = tf.cast(vecs, self.cdtype)
+            self._vecs_ind = tf.cast(vecs_ind, tf.int32)
+            self._c = tf.cast(c, tf.int32)
+        else:
+            # hyp : [num_points, num_hyp] Which is such that `hyp[s,e]`
+            #   indicates if the `s`th constellation point belongs to the
+            #   `e`th hypothesis tracked by the sphere decoder.
+            self._hyp = tf.constant(self._build_hypotheses(), tf.bool)
 
         if output == 'bit':
             num_bits_per_symbol = self._constellation.num_bits_per_symbol
@@ -381,11 +470,44 @@ class MaximumLikelihoodDetector(Block):
                                     hard_out=False,
                                     precision=precision,
                                     **kwargs)
+            if search == "sphere" and hard_out:
+                self._symbolinds2bits = SymbolInds2Bits(
+                                    num_bits_per_symbol,
+                                    precision=precision,
+                                    **kwargs)
 
     @property
     def constellation(self):
         return self._constellation
 
+    def _build_hypotheses(self):
+        """
+        Utility function for building the membership of the constellation
+        points to the hypotheses whose metrics are tracked by the sphere
+        decoder for every stream
+
+        Output
+        -------
+        hyp : [num_points, num_hyp], bool
+            `hyp[s,e]` is `True` if the `s`th constellation point
+            belongs to the `e`th hypothesis. For hard decisions, the only
+            hypothesis is the ML solution. For bits, the hypothesis `2i+b`
+            corresponds to the `i`th bit being equal to `b`. For symbols, the
+            hypothesis `e` corresponds to the `e`th constellation point.
+        """
+        num_points = self._constellation.num_points
+        if self._hard_out:
+            return np.ones([num_points, 1], bool)
+        if self._output == "symbol":
+            return np.eye(num_points, dtype=bool)
+        num_bits_per_symbol = self._constellation.num_bits_per_symbol
+        hyp = np.zeros([num_points, num_bits_per_symbol, 2], bool)
+        for s in range(num_points):
+            b = np.binary_repr(s, num_bits_per_symbol)
+            for i in range(num_bits_per_symbol):
+                hyp[s, i, int(b[i])] = True
+        return np.reshape(hyp, [num_points, -1])
+
     def _build_vecs(self, num_streams):
         """
         Utility function for building the list of all possible transmitted
@@ -470,6 +592,227 @@ class MaximumLikelihoodDetector(Block):
 
         return vecs, vecs_ind, c
 
+    def _sphere_decoding(self, y, r, prior_cost):
+        """
+        Batched depth-first sphere decoder with Schnorr-Euchner enumeration
+
+        Input
+        ------
+        y : [batch_size, K], tf.complex
+            Received signals projected onto Q'
+
+        r : [batch_size, K, K], tf.complex
+            Upper-triangular channel matrices
+
+        prior_cost : [batch_size, K, num_points], tf.float
+            Non-negative prior costs of the constellation points
+
+        Output
+        -------
+        metrics : [batch_size, K, num_hyp], tf.float
+            Smallest distance of all vectors belonging to every hypothesis
+            of every stream
+
+        x_ml : [batch_size, K], tf.int32
+            Symbol indices of the ML solution
+        """
+        num_streams = self._num_streams
+        points = self._constellation()
+        num_points = points.shape[0]
+        num_hyp = self._hyp.shape[1]
+        batch_size = tf.shape(y)[0]
+        inf = tf.constant(np.inf, self.rdtype)
+        streams = tf.range(num_streams)
+
+        def children_costs(level, x):
+            # Sorted costs of all children of the current node at `level`
+            # [batch_size, K]
+            r_row = tf.gather(r, level, axis=1, batch_dims=1)
+            # [batch_size]
+            r_diag = tf.gather(r_row, level, axis=1, batch_dims=1)
+            y_level = tf.gather(y, level, axis=1, batch_dims=1)
+            # Interference of the symbols already detected
+            is_above = streams[tf.newaxis] > level[:, tf.newaxis]
+            interf = tf.where(is_above, r_row*tf.gather(points, x),
+                              tf.zeros_like(r_row))
+            b = y_level - tf.reduce_sum(interf, axis=-1)
+            # [batch_size, num_points]
+            cost = tf.abs(b[:, tf.newaxis] -
+                          r_diag[:, tf.newaxis]*points[tf.newaxis])**2
+            cost += tf.gather(prior_cost, level, axis=1, batch_dims=1)
+            order = tf.argsort(cost, axis=-1, stable=True)
+            cost = tf.gather(cost, order, axis=-1, batch_dims=1)
+            return order, cost
+
+        def set_level(tensor, level, value):
+            # Replaces the entries of `tensor` at `level`
+            mask = tf.one_hot(level, tensor.shape[1], on_value=True,
+                              off_value=False, dtype=tf.bool)
+            mask = expand_to_rank(mask, tensor.shape.rank, axis=-1)
+            value = tf.expand_dims(value, axis=1)
+            return tf.where(mask, value, tensor)
+
+        def body(level, pos, order, cost, pd, x, metrics, x_ml, d_ml, done):
+            active = tf.logical_not(done)
+            # Largest metric of each stream and of the hypotheses to which
+            # the detected symbols belong
+            # [batch_size, K]
+            max_metric = tf.reduce_max(metrics, axis=-1)
+            sel_metric = tf.reduce_max(tf.where(tf.gather(self._hyp, x),
+                                                metrics, -inf), axis=-1)
+            is_above = streams[tf.newaxis] > level[:, tf.newaxis]
+            is_below = streams[tf.newaxis] < level[:, tf.newaxis]
+            # [batch_size]
+            t_fixed = tf.maximum(
+                tf.reduce_max(tf.where(is_above, sel_metric, -inf), axis=-1),
+                tf.reduce_max(tf.where(is_below, max_metric, -inf), axis=-1))
+            # Radius for all children of the current node
+            t_node = tf.maximum(t_fixed,
+                                tf.gather(max_metric, level, axis=1,
+                                          batch_dims=1))
+
+            # Next child to visit
+            pos_level = tf.gather(pos, level, axis=1, batch_dims=1)
+            has_child = pos_level < num_points
+            pos_level_c = tf.minimum(pos_level, num_points-1)
+            child = tf.gather(tf.gather(order, level, axis=1, batch_dims=1),
+                              pos_level_c, axis=1, batch_dims=1)
+            d = tf.gather(pd, level+1, axis=1, batch_dims=1) + \
+                tf.gather(tf.gather(cost, level, axis=1, batch_dims=1),
+                          pos_level_c, axis=1, batch_dims=1)
+            # Radius for the child
+            t_child = tf.maximum(t_fixed, tf.reduce_max(
+                tf.where(tf.gather(self._hyp, child),
+                         tf.gather(metrics, level, axis=1, batch_dims=1),
+                         -inf), axis=-1))
+
+            # As children are sorted by increasing distance, none of the
+            # remaining children can be within the radius of the node
+            go_up = active & (tf.logical_not(has_child) | (d >= t_node))
+            # Otherwise, the child is either visited or skipped
+            visit = active & tf.logical_not(go_up) & (d < t_child)
+            is_leaf = visit & tf.equal(level, 0)
+            go_down = visit & tf.logical_not(is_leaf)
+
+            pos = tf.where((active & tf.logical_not(go_up))[:, tf.newaxis],
+                           set_level(pos, level, pos_level+1), pos)
+            x = tf.where(visit[:, tf.newaxis], set_level(x, level, child), x)
+            pd = tf.where(visit[:, tf.newaxis], set_level(pd, level, d), pd)
+
+            # Update the metrics of the hypotheses to which the leaf belongs
+            update = is_leaf[:, tf.newaxis, tf.newaxis] & \
+                tf.gather(self._hyp, x)
+            metrics = tf.where(update, tf.minimum(metrics, d[:, tf.newaxis,
+                                                             tf.newaxis]),
+                               metrics)
+            is_ml = is_leaf & (d < d_ml)
+            x_ml = tf.where(is_ml[:, tf.newaxis], x, x_ml)
+            d_ml = tf.where(is_ml, d, d_ml)
+
+            # Move down or up the tree
+            next_level = tf.where(go_down, level-1, level)
+            next_level = tf.where(go_up, level+1, next_level)
+            done = done | tf.equal(next_level, num_streams)
+            level = tf.minimum(next_level, num_streams-1)
+            new_order, new_cost = children_costs(level, x)
+            order = tf.where(go_down[:, tf.newaxis, tf.newaxis],
+                             set_level(order, level, new_order), order)
+            cost = tf.where(go_down[:, tf.newaxis, tf.newaxis],
+                            set_level(cost, level, new_cost), cost)
+            pos = tf.where(go_down[:, tf.newaxis],
+                           set_level(pos, level,
+                                     tf.zeros([batch_size], tf.int32)), pos)
+
+            return level, pos, order, cost, pd, x, metrics, x_ml, d_ml, done
+
+        def cond(*args):
+            return tf.logical_not(tf.reduce_all(args[-1]))
+
+        # Detection starts with the last stream
+        level = tf.fill([batch_size], num_streams-1)
+        x = tf.zeros([batch_size, num_streams], tf.int32)
+        order, cost = children_costs(level, x)
+        order = tf.tile(order[:, tf.newaxis], [1, num_streams, 1])
+        cost = tf.tile(cost[:, tf.newaxis], [1, num_streams, 1])
+        pos = tf.zeros([batch_size, num_streams], tf.int32)
+        # Partial distances. The last entry corresponds to the root node.
+        pd = tf.zeros([batch_size, num_streams+1], self.rdtype)
+        metrics = tf.fill([batch_size, num_streams, num_hyp], inf)
+        x_ml = tf.zeros([batch_size, num_streams], tf.int32)
+        d_ml = tf.fill([batch_size], inf)
+        done = tf.zeros([batch_size], tf.bool)
+
+        _, _, _, _, _, _, metrics, x_ml, _, _ = tf.while_loop(
+            cond, body,
+            [level, pos, order, cost, pd, x, metrics, x_ml, d_ml, done])
+
+        return metrics, x_ml
+
+    def _call_sphere(self, y, h, s, prior):
+        # Flatten the batch dimensions
+        batch_shape = tf.shape(y)[:-1]
+        y = tf.reshape(y, tf.concat([[-1], tf.shape(y)[-1:]], 0))
+        h = tf.reshape(h, tf.concat([[-1], tf.shape(h)[-2:]], 0))
+        s = tf.broadcast_to(s, tf.concat([batch_shape, tf.shape(s)[-2:]], 0))
+        s = tf.reshape(s, tf.concat([[-1], tf.shape(s)[-2:]], 0))
+
+        # Whiten channel
+        y, h = whiten_channel(y, h, s, return_s=False) # pylint: disable=W0632
+        # Energy of the received signal outside of the span of H, which
+        # is added to the distances of all vectors
+        y_norm = tf.reduce_sum(tf.abs(y)**2, axis=-1)
+
+        # Sort columns of H, compute its QR decomposition, and project y
+        y, r, column_order = _sorted_qr(y, h)
+        offset = y_norm - tf.reduce_sum(tf.abs(y)**2, axis=-1)
+
+        # Prior costs are the negative log-probabilities of the points
+        # [batch_size, K, num_points]
+        num_points = self._constellation.num_points
+        if prior is not None:
+            prior = tf.reshape(prior, [-1, self._num_streams, num_points])
+            prior = tf.broadcast_to(prior, [tf.shape(y)[0],
+                                            self._num_streams, num_points])
+            prior_norm = tf.reduce_logsumexp(prior, axis=-1)
+            prior_cost = prior_norm[..., tf.newaxis] - prior
+            prior_cost = tf.gather(prior_cost, column_order, axis=1,
+                                   batch_dims=1)
+            offset -= tf.reduce_sum(prior_norm, axis=-1)
+        else:
+            prior_cost = tf.zeros([tf.shape(y)[0], self._num_streams,
+                                   num_points], self.rdtype)
+
+        metrics, x_ml = self._sphere_decoding(y, r, prior_cost)
+
+        # Undo the column sorting
+        unsort_inds = tf.argsort(column_order, axis=-1)
+        metrics = tf.gather(metrics, unsort_inds, axis=1, batch_dims=1)
+        x_ml = tf.gather(x_ml, unsort_inds, axis=1, batch_dims=1)
+
+        if self._hard_out:
+            if self._output == "bit":
+                # [batch_size, K, num_bits_per_symbol]
+                out = self._symbolinds2bits(x_ml)
+            else:
+                out = x_ml
+        elif self._output == "bit":
+            # [batch_size, K, num_bits_per_symbol, 2]
+            metrics = tf.reshape(metrics, [-1, self._num_streams,
+                                           self._hyp.shape[1]//2, 2])
+            out = metrics[..., 0] - metrics[..., 1]
+        else:
+            out = -metrics - offset[:, tf.newaxis, tf.newaxis]
+
+        # Reshape batch dimensions
+        out_shape = tf.concat([batch_shape, tf.shape(out)[1:]], 0)
+        return tf.reshape(out, out_shape)
+
+    def build(self, *input_shapes):
+        if self._search == "sphere":
+            assert input_shapes[1][-2]>=input_shapes[1][-1], \
+                "The number of receive antennas cannot be smaller \
+                 than the number of streams"
+
     def call(self, y, h, s, prior=None):
         # If operating on bits, computes prior on symbols from the prior
         # on bits
@@ -477,6 +820,9 @@ class MaximumLikelihoodDetector(Block):
             # [..., K, num_points]
             prior = self._llrs2logits(prior)
 
+        if self._search == "sphere":
+            return self._call_sphere(y, h, s, prior)
+
         # Whiten channel
         y, h = whiten_channel(y, h, s, return_s=False)
 
@@ -821,20 +1167,8 @@ class KBestDetector(Block):
         # Whiten channel
         y, h = whiten_channel(y, h, s, return_s=False) # pylint: disable=W0632
 
-        # Order columns of H in order of decreasing norm
-        h_norm = tf.reduce_sum(tf.abs(h)**2, axis=1)
-        column_order = tf.argsort(h_norm, axis=-1, direction="DESCENDING")
-        h = tf.gather(h, column_order, axis=-1, batch_dims=1)
-
-        # Compute QR decomposition of sorted channel
-        # r is upper triangular
-        q, r = tf.linalg.qr(h)
-
-        # Project y on Q'
-        y = tf.squeeze(tf.matmul(q, tf.expand_dims(y, -1), adjoint_a=True),
-                       -1)
-
-        return y, r, column_order
+        # Sort columns of H, compute its QR decomposition, and project y
+        return _sorted_qr(y, h)
 
     def _select_best_paths(self, dists, path_syms, path_inds):
 
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0#
 """Carrier configuration for the NR (5G) module of Sionna PHY"""
 
-from .config import Config
+from .config import Config, derived_property
 
 class CarrierConfig(Config):
     """
@@ -159,7 +159,7 @@ class CarrierConfig(Config):
         else:
             return 12
 
-    @property
+    @derived_property
     def num_slots_per_subframe(self):
         r"""
         `int`, (default 1) | 2 | 4 | 8 | 16 | 32 | 64 : Number of
@@ -192,7 +192,7 @@ class CarrierConfig(Config):
         """
         return 10*self.num_slots_per_subframe
 
-    @property
+    @derived_property
     def mu(self):
         r"""
         `int`, (default 0) | 1 | 2 | 3 | 4 | 5 | 6 : Subcarrier
@@ -240,7 +240,7 @@ class CarrierConfig(Config):
         """
         return 64.
 
-    @property
+    @derived_property
     def cyclic_prefix_length(self):
         r"""
         `float` : Cyclic prefix length
@@ -5,8 +5,44 @@
 
 from abc import ABC
 import copy
+import functools
+import itertools
 import numpy as np
 
+# Source of unique versions of configurations
+_versions = itertools.count(1)
+
+# Marks parameters that have not been set yet
+_UNSET = object()
+
+def derived_property(fget):
+    # pylint: disable=line-too-long
+    """Decorator for read-only properties derived from configurable parameters
+
+    The value of the property is computed once and cached. It is only
+    recomputed after a configurable parameter of the configuration or of
+    one of its sub-configurations, e.g., ``carrier`` or ``dmrs`` of a
+    :class:`~sionna.phy.nr.PUSCHConfig`, has been set to a new value.
+    In-place modifications of parameters, e.g., of the elements of a list,
+    are only detected once the parameter is set again. Copies of the cached
+    values are returned such that they can be safely modified by the caller.
+    """
+    @functools.wraps(fget)
+    def wrapper(self):
+        return self._get_derived(fget)
+    return property(wrapper)
+
+def _equal(a, b):
+    """Checks if two values of a configurable parameter are equal"""
+    if a is b:
+        return True
+    if isinstance(a, Config) or isinstance(b, Config):
+        return False
+    try:
+        return bool(a==b)
+    except ValueError:
+        return np.array_equal(a, b)
+
 class Config(ABC):
     # pylint: disable=line-too-long
     """Abstract configuration class for the nr (5G) sub-package of Sionna PHY
@@ -16,10 +52,49 @@ class Config(ABC):
             if key in dir(self):
                 setattr(self, key, value)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name[0]=="_":
+            return
+
+        # Changing a configurable parameter invalidates all derived
+        # properties. The new value is compared to a snapshot of the previous
+        # one, as mutable values might have been modified in place before
+        # being set again.
+        value = getattr(self, name)
+        if not isinstance(value, Config):
+            value = copy.deepcopy(value)
+        snapshots = self.__dict__.setdefault("_snapshots", {})
+        if not _equal(snapshots.get(name, _UNSET), value):
+            super().__setattr__("_version", next(_versions))
+        snapshots[name] = value
+
     def _ifndef(self, name, value):
         if not hasattr(self, f"_{name}"):
             setattr(self, f"_{name}", value)
 
+    def _state(self):
+        """Versions of the configuration and all its sub-configurations"""
+        state = (self.__dict__.get("_version", 0),)
+        for value in self.__dict__.values():
+            if isinstance(value, Config):
+                state += value._state()
+        return state
+
+    def _get_derived(self, fget):
+        """Returns the cached value of the derived property computed by
+        ``fget`` or computes it if the configuration has changed"""
+        cache = self.__dict__.setdefault("_derived_cache", {})
+        name = fget.__name__
+        if name in cache and cache[name][0]==self._state():
+            value = cache[name][1]
+        else:
+            value = fget(self)
+            # The state is read after the computation as some properties
+            # temporarily modify the configuration
+            cache[name] = (self._state(), value)
+        return copy.copy(value)
+
     def clone(self, deep=True):
         """Returns a copy of the Config object
 
@@ -5,7 +5,7 @@
 
 import numpy as np
 from .utils import generate_prng_seq
-from .config import Config
+from .config import Config, derived_property
 from sionna.phy import nr
 from .utils import calculate_tb_size
 
@@ -329,7 +329,7 @@ class PUSCHConfig(Config):
         elif self.dmrs.length==2:
             return [0, 1]
 
-    @property
+    @derived_property
     def l_bar(self):
         r"""
         `list`, elements in [0,...,11], read-only : List of possible values of
@@ -404,7 +404,7 @@ class PUSCHConfig(Config):
 
         return l_bar[ind][self.dmrs.additional_position]
 
-    @property
+    @derived_property
     def l(self):
         r"""
         `list`, `int`, read-only : List of possible values of the OFDM symbol
@@ -416,7 +416,7 @@ class PUSCHConfig(Config):
                 l.append(l_bar + l_prime)
         return l
 
-    @property
+    @derived_property
     def n(self):
         """
         `list`, `int`, read-only: List of possible values of n
@@ -428,7 +428,7 @@ class PUSCHConfig(Config):
             n_max = self.num_resource_blocks*12//6 -1
         return list(range(n_max+1))
 
-    @property
+    @derived_property
     def dmrs_symbol_indices(self):
         """
         `list`, `int`, read-only: Indices of DMRS symbols within a slot
@@ -454,7 +454,7 @@ class PUSCHConfig(Config):
         """
         return 12*self.num_resource_blocks
 
-    @property
+    @derived_property
     def num_res_per_prb(self):
         """
         `int`, read-only : Number of resource elements per PRB
@@ -477,7 +477,7 @@ class PUSCHConfig(Config):
 
         return num_data*num_res_data + num_dmrs*num_res_dmrs
 
-    @property
+    @derived_property
     def dmrs_mask(self):
         """
         `bool`, [num_subcarriers, num_symbols_per_slot], read-only : Masked
@@ -504,7 +504,7 @@ class PUSCHConfig(Config):
                     mask[cdm_ind[:, k] + 12*j, i] = True
         return mask
 
-    @property
+    @derived_property
     def dmrs_grid(self):
         # pylint: disable=line-too-long
         """
@@ -582,7 +582,7 @@ class PUSCHConfig(Config):
 
         return a
 
-    @property
+    @derived_property
     def dmrs_grid_precoded(self):
         if self.precoding=="non-codebook":
             return None
@@ -594,7 +594,7 @@ class PUSCHConfig(Config):
 
         return a
 
-    @property
+    @derived_property
     def precoding_matrix(self):
         r"""
         `nd_array`, `complex`, [num_antenna_ports, numLayers] : Precoding matrix
@@ -813,7 +813,7 @@ class PUSCHConfig(Config):
             due to additional overhead as specified by higher layer."""
         return 0
 
-    @property
+    @derived_property
     def num_coded_bits(self):
         r"""
         `int`, read-only: Number of coded bits that fit into one PUSCH slot."""
@@ -830,7 +830,7 @@ class PUSCHConfig(Config):
 
         return num_coded_bits
 
-    @property
+    @derived_property
     def tb_size(self):
         r"""`int`, read-only: Transport block size, i.e., how many information
             bits can be encoded into a slot for the given slot configuration"""
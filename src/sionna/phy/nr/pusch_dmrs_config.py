@@ -6,7 +6,7 @@
 from collections.abc import Sequence
 import numpy as np
 
-from .config import Config
+from .config import Config, derived_property
 
 class PUSCHDMRSConfig(Config):
     """
@@ -200,7 +200,7 @@ class PUSCHDMRSConfig(Config):
     #---Read-only parameters------#
     #-----------------------------#
 
-    @property
+    @derived_property
     def allowed_dmrs_ports(self):
         """
         `list`, [0,...,max_num_dmrs_ports-1], read-only : List of nominal
@@ -242,7 +242,7 @@ class PUSCHDMRSConfig(Config):
                 #max_num_dmrs_ports = self.num_cdm_groups_without_data*4
         #return list(range(max_num_dmrs_ports))
 
-    @property
+    @derived_property
     def cdm_groups(self):
         r"""
         `list`, elements in [0,1,2], read-only : List of CDM groups
@@ -258,7 +258,7 @@ class PUSCHDMRSConfig(Config):
             cdm_groups = [0,0,1,1,2,2,0,0,1,1,2,2]
         return [cdm_groups[port] for port in self.dmrs_port_set]
 
-    @property
+    @derived_property
     def deltas(self):
         r"""
         `list`, elements in [0,1,2,4], read-only : List of delta (frequency)
@@ -273,7 +273,7 @@ class PUSCHDMRSConfig(Config):
             deltas = [0,0,2,2,4,4,0,0,2,2,4,4]
         return [deltas[port] for port in self.dmrs_port_set]
 
-    @property
+    @derived_property
     def w_f(self):
         r"""
         `matrix`, elements in [-1,1], read-only : Frequency weight vectors
@@ -288,7 +288,7 @@ class PUSCHDMRSConfig(Config):
                             [1,-1,1,-1,1,-1,1,-1,1,-1,1,-1]])
         return w_f[:, self.dmrs_port_set]
 
-    @property
+    @derived_property
     def w_t(self):
         r"""
         `matrix`, elements in [-1,1], read-only : Time weight vectors
@@ -303,7 +303,7 @@ class PUSCHDMRSConfig(Config):
                             [1,1,1,1,1,1,-1,-1,-1,-1,-1,-1]])
         return w_t[:, self.dmrs_port_set]
 
-    @property
+    @derived_property
     def beta(self):
         r"""
         `float`, read-only : Ratio of PUSCH energy per resource element
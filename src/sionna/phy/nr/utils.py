@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0#
 """Utility functions for the NR (5G) module of Sionna PHY"""
 
+import functools
 import numpy as np
 import tensorflow as tf
 from sionna.phy.utils import tensor_values_are_in_set, insert_dims
@@ -13,6 +14,71 @@ from sionna.phy.channel import AWGN
 from sionna.phy.mapping import Mapper, Demapper, Constellation, BinarySource
 
 
+def _lfsr_jump_matrix(taps, n):
+    r"""Returns the GF(2) matrix which advances the state
+    :math:`[x(k),\dots,x(k+30)]` of the length-31 LFSR
+    :math:`x(k+31) = \sum_{t \in \text{taps}} x(k+t) \mod 2` by ``n`` steps"""
+    a = np.zeros([31, 31], np.int64)
+    a[np.arange(30), np.arange(1, 31)] = 1
+    a[30, list(taps)] = 1
+    # square-and-multiply
+    m = np.eye(31, dtype=np.int64)
+    while n > 0:
+        if n & 1:
+            m = np.mod(m @ a, 2)
+        a = np.mod(a @ a, 2)
+        n >>= 1
+    return m
+
+def _lfsr_seq(state, taps, length):
+    r"""Runs the length-31 LFSR with feedback ``taps`` from ``state``
+
+    As :math:`p(D)^{2^j} = p(D^{2^j})` over GF(2), the recursion also holds
+    for taps scaled by :math:`s=2^j`, i.e.,
+    :math:`x(k+31s) = \sum_{t \in \text{taps}} x(k+ts)`.
+    This allows to compute blocks of :math:`28s` bits at once, such that
+    the sequence is generated in a logarithmic number of vectorized steps.
+    """
+    x = np.zeros(max(length, 31), np.uint8)
+    x[:31] = state
+    m = 31 # number of computed bits
+    s = 1 # scaling of the taps
+    while m < length:
+        while 62*s <= m:
+            s *= 2
+        l = min(28*s, length - m)
+        start = m - 31*s
+        block = np.zeros(l, np.uint8)
+        for t in taps:
+            block ^= x[start+t*s:start+t*s+l]
+        x[m:m+l] = block
+        m += l
+    return x[:length]
+
+# Feedback taps of the two m-sequences, see Sec. 5.2.1 in [3GPP38211]
+_X1_TAPS = (0, 3)
+_X2_TAPS = (0, 1, 2, 3)
+# Number of initial bits which are discarded
+_N_C = 1600
+# State of both m-sequences after the first _N_C bits, given as a function
+# of their initial state
+_X1_JUMP = _lfsr_jump_matrix(_X1_TAPS, _N_C)
+_X2_JUMP = _lfsr_jump_matrix(_X2_TAPS, _N_C)
+
+@functools.lru_cache(maxsize=1024)
+def _gold_seq(length, c_init):
+    """Memoized generation of the Gold sequence as read-only `uint8` array"""
+    # initial states
+    x1 = np.zeros(31, np.int64)
+    x1[0] = 1
+    x2 = (c_init >> np.arange(31)) & 1
+    # skip the first n_c bits
+    x1 = np.mod(_X1_JUMP @ x1, 2)
+    x2 = np.mod(_X2_JUMP @ x2, 2)
+    c = _lfsr_seq(x1, _X1_TAPS, length) ^ _lfsr_seq(x2, _X2_TAPS, length)
+    c.setflags(write=False)
+    return c
+
 def generate_prng_seq(length, c_init):
     r"""Implements pseudo-random sequence generator as defined in Sec. 5.2.1
     in [3GPP38211]_ based on a length-31 Gold sequence.
@@ -35,6 +101,12 @@ def generate_prng_seq(length, c_init):
     ----
     The initialization sequence ``c_init`` is application specific and is
     usually provided be higher layer protocols.
+
+    The first :math:`N_c=1600` bits of both m-sequences are skipped by
+    multiplying their initial states by precomputed GF(2) jump-ahead
+    matrices, and the sequences are generated in vectorized blocks.
+    The most recently generated sequences are cached, such that repeated
+    calls with the same ``length`` and ``c_init`` are cheap.
     """
 
     # check inputs for consistency
@@ -47,34 +119,7 @@ def generate_prng_seq(length, c_init):
     assert(c_init<2**32), "c_init must be in [0, 2^32-1]."
     assert(c_init>=0), "c_init must be in [0, 2^32-1]."
 
-    # internal parameters
-    n_seq = 31 # length of gold sequence
-    n_c = 1600 # defined in 5.2.1 in 38.211
-
-    # init sequences
-    c = np.zeros(length)
-    x1 = np.zeros(length + n_c + n_seq)
-    x2 = np.zeros(length + n_c + n_seq)
-
-    #int2bin
-    bin_ = format(c_init, f'0{n_seq}b')
-    c_init = [int(x) for x in bin_[-n_seq:]] if n_seq else []
-    c_init = np.flip(c_init) # reverse order
-
-    # init x1 and x2
-    x1[0] = 1
-    x2[0:n_seq] = c_init
-
-    # and run the generator
-    for idx in range(length + n_c):
-        x1[idx+31] = np.mod(x1[idx+3] + x1[idx], 2)
-        x2[idx+31] = np.mod(x2[idx+3] + x2[idx+2] + x2[idx+1] + x2[idx], 2)
-
-    # update output sequence
-    for idx in range(length):
-        c[idx] = np.mod(x1[idx+n_c] + x2[idx+n_c], 2)
-
-    return c
+    return _gold_seq(length, c_init).astype(float)
 
 
 def decode_mcs_index(mcs_index,
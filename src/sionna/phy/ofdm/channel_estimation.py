@@ -7,6 +7,7 @@ import tensorflow as tf
 import numpy as np
 from scipy.special import jv
 import itertools
+import collections
 from abc import abstractmethod
 import json
 from importlib_resources import files
@@ -785,6 +786,16 @@ class LMMSEInterpolator1D(Object):
     rows may carry pilots on different elements and/or have different
     estimation error variances.
 
+    **Remark**: The interpolation matrices only depend on ``err_var``.
+    If the size of the batch, receiver, or receive antenna dimension of
+    ``err_var`` is one, the interpolation matrices are computed once and
+    shared across the corresponding dimension of ``h_hat``.
+    If ``cache_size`` is positive, interpolation matrices which are shared
+    across all these dimensions are moreover cached in eager mode.
+    They are then computed for the error variances quantized to a grid
+    with a step of ``cache_resolution_db`` dB, and reused by all
+    subsequent calls with error variances quantized to the same values.
+
     Parameters
     ----------
     pilot_mask : [:math:`N`, :math:`M`] : `int`
@@ -802,12 +813,20 @@ class LMMSEInterpolator1D(Object):
         If `True`, the the output is scaled to ensure its variance is as expected
         by the following interpolation step.
 
+    cache_size : `int` (default: 0)
+        Maximum number of cached interpolation matrices. The least recently
+        used matrices are evicted first. If 0, no cache is used.
+
+    cache_resolution_db : `float` (default: 0.1)
+        Quantization step [dB] of the error variances used to compute
+        the cached interpolation matrices
+
     Input
     -----
     h_hat : [batch_size, num_rx, num_rx_ant, num_tx, :math:`N`, :math:`M`], `tf.complex`
         Channel estimates
 
-    err_var : [batch_size, num_rx, num_rx_ant, num_tx, :math:`N`, :math:`M`], `tf.complex`
+    err_var : [batch_size or 1, num_rx or 1, num_rx_ant or 1, num_tx, :math:`N`, :math:`M`], `tf.complex`
         Channel estimation error variances
 
     Output
@@ -815,10 +834,11 @@ class LMMSEInterpolator1D(Object):
     h_hat : [batch_size, num_rx, num_rx_ant, num_tx, num_streams_per_tx, :math:`N`, :math:`M`], `tf.complex`
         Channel estimates interpolated across the inner dimension
 
-    err_var : Same shape as ``h_hat``, `tf.float`
+    err_var : Same shape as the input ``err_var``, `tf.float`
         The channel estimation error variances of the interpolated channel estimates
     """
-    def __init__(self, pilot_mask, cov_mat, last_step):
+    def __init__(self, pilot_mask, cov_mat, last_step, cache_size=0,
+                 cache_resolution_db=0.1):
 
         if cov_mat.dtype==tf.complex64:
             precision = "single"
@@ -849,6 +869,12 @@ class LMMSEInterpolator1D(Object):
         self._cov_mat = cov_mat
         self._last_step = last_step
 
+        # Least recently used cache of interpolation matrices, keyed by
+        # the quantized error variances
+        self._cache_size = int(cache_size)
+        self._cache_resolution_db = float(cache_resolution_db)
+        self._cache = collections.OrderedDict()
+
         # Computation of the interpolation matrix is done solving the
         # least-square problem:
         #
@@ -969,25 +995,29 @@ class LMMSEInterpolator1D(Object):
             err_var_mat[tx,st,oi] = cov_mat*mask
         self._err_var_mat = tf.constant(err_var_mat, self.cdtype)
 
-    def __call__(self, h_hat, err_var):
+    def _interpolation_matrix(self, err_var):
+        """
+        Computes the interpolation matrices for the given error variances
 
-        # h_hat : [batch_size, num_rx, num_rx_ant, num_tx,
-        #          num_streams_per_tx, outer_dim_size, inner_dim_size]
-        # err_var : [batch_size, num_rx, num_rx_ant, num_tx,
-        #          num_streams_per_tx, outer_dim_size, inner_dim_size]
+        Input
+        -----
+        err_var : [batch_size, num_rx, num_rx_ant, num_tx, num_streams_per_tx, outer_dim_size, inner_dim_size], tf.float
+            Channel estimation error variances
 
-        batch_size = tf.shape(h_hat)[0]
-        num_rx = tf.shape(h_hat)[1]
-        num_rx_ant = tf.shape(h_hat)[2]
-        num_tx = tf.shape(h_hat)[3]
-        num_tx_stream = tf.shape(h_hat)[4]
+        Output
+        ------
+        ext_mat : [batch_size, num_rx, num_rx_ant, num_tx, num_streams_per_tx, outer_dim_size, inner_dim_size, inner_dim_size], tf.complex
+            Interpolation matrices
+        """
+
+        batch_size = tf.shape(err_var)[0]
+        num_rx = tf.shape(err_var)[1]
+        num_rx_ant = tf.shape(err_var)[2]
+        num_tx = tf.shape(err_var)[3]
+        num_tx_stream = tf.shape(err_var)[4]
         outer_dim_size = self._outer_dim_size
         inner_dim_size = self._inner_dim_size
 
-        #####################################
-        # Compute the interpolation matrix
-        #####################################
-
         # Computation of the interpolation matrix is done solving the
         # least-square problem:
         #
@@ -1067,6 +1097,56 @@ class LMMSEInterpolator1D(Object):
         ext_mat = tf.transpose(ext_mat, [5, 6, 7, 0, 1, 2, 3, 4])
         ext_mat = ext_mat[...,:inner_dim_size,:inner_dim_size]
 
+        return ext_mat
+
+    def _cached_interpolation_matrix(self, err_var):
+        """
+        Returns the interpolation matrices for the error variances quantized
+        to the cache resolution, computing them only if they are not
+        already cached
+        """
+        err_var = err_var.numpy()
+        # Quantized error variances in units of the cache resolution [dB]
+        # Zero error variances are mapped to the smallest integer
+        positive = err_var > 0.
+        q = np.round(10.*np.log10(np.where(positive, err_var, 1.))
+                     / self._cache_resolution_db)
+        key = np.where(positive, q, np.iinfo(np.int64).min).astype(np.int64)
+        key = (key.shape, key.tobytes())
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        err_var_q = np.where(positive,
+                             10.**(q*self._cache_resolution_db/10.), 0.)
+        ext_mat = self._interpolation_matrix(tf.cast(err_var_q, self.rdtype))
+        self._cache[key] = ext_mat
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return ext_mat
+
+    def __call__(self, h_hat, err_var):
+
+        # h_hat : [batch_size, num_rx, num_rx_ant, num_tx,
+        #          num_streams_per_tx, outer_dim_size, inner_dim_size]
+        # err_var : [batch_size or 1, num_rx or 1, num_rx_ant or 1, num_tx,
+        #          num_streams_per_tx, outer_dim_size, inner_dim_size]
+
+        #####################################
+        # Compute the interpolation matrix
+        #####################################
+
+        # The interpolation matrices are only computed for the batch,
+        # receivers, and receive antennas for which err_var differs,
+        # and broadcast across the others.
+        # [batch_size or 1, num_rx or 1, num_rx_ant or 1, num_tx,
+        #  num_streams_per_tx, outer_dim_size, inner_dim_size, inner_dim_size]
+        shared = all(d == 1 for d in err_var.shape[:3])
+        if self._cache_size > 0 and shared and tf.executing_eagerly():
+            ext_mat = self._cached_interpolation_matrix(err_var)
+        else:
+            ext_mat = self._interpolation_matrix(err_var)
+
         ################################################
         # Apply interpolation over the inner dimension
         ################################################
@@ -1570,6 +1650,18 @@ class LMMSEInterpolator(BaseChannelInterpolator):
     interpolation, and, optionally, spatial smoothing are applied, is controlled using the
     ``order`` parameter.
 
+    **Remark:** The interpolation matrices :math:`\mathbf{A}_n` and :math:`\mathbf{B}_m`
+    only depend on the error variances. If ``err_var`` does not depend on the
+    batch example, receiver, or receive antenna, i.e., if its size along the
+    corresponding dimension is one as for :class:`~sionna.phy.ofdm.LSChannelEstimator`
+    with a noise variance ``no`` which does not depend on these dimensions, the
+    interpolation matrices are computed once and shared across them.
+    In eager mode, interpolation matrices shared across all these dimensions
+    can moreover be cached by setting ``cache_size`` to a positive value.
+    The matrices are then computed for the error variances quantized to a grid
+    with a step of ``cache_resolution_db`` dB, which avoids their recomputation
+    for every slot when the same noise variances are used repeatedly.
+
     Note
     ----
     This block does not support graph mode with XLA.
@@ -1602,6 +1694,14 @@ class LMMSEInterpolator(BaseChannelInterpolator):
         Time and frequency interpolation are not optional to ensure that a channel
         estimate is computed for all resource elements.
 
+    cache_size : `int` (default: 0)
+        Maximum number of interpolation matrices cached by every time and
+        frequency interpolation step. If 0, no cache is used.
+
+    cache_resolution_db : `float` (default: 0.1)
+        Quantization step [dB] of the error variances used to compute
+        the cached interpolation matrices
+
     Input
     -----
     h_hat : [batch_size, num_rx, num_rx_ant, num_tx, num_streams_per_tx, num_pilot_symbols], `tf.complex`
@@ -1621,7 +1721,8 @@ class LMMSEInterpolator(BaseChannelInterpolator):
         for all transmitters and streams
     """
     def __init__(self, pilot_pattern, cov_mat_time, cov_mat_freq,
-                    cov_mat_space=None, order='t-f'):
+                    cov_mat_space=None, order='t-f', cache_size=0,
+                    cache_resolution_db=0.1):
 
         super().__init__()
 
@@ -1677,7 +1778,9 @@ class LMMSEInterpolator(BaseChannelInterpolator):
             # Frequency
             if o == "f":
                 interpolator = LMMSEInterpolator1D(pilot_mask, cov_mat_freq,
-                                                        last_step=last_step)
+                                        last_step=last_step,
+                                        cache_size=cache_size,
+                                        cache_resolution_db=cache_resolution_db)
                 pilot_mask = self._update_pilot_mask_interp(pilot_mask)
                 err_var_mask = tf.cast(pilot_mask == 1,
                                         cov_mat_freq.dtype.real_dtype)
@@ -1685,7 +1788,9 @@ class LMMSEInterpolator(BaseChannelInterpolator):
             elif o == 't':
                 pilot_mask = tf.transpose(pilot_mask, [0, 1, 3, 2])
                 interpolator = LMMSEInterpolator1D(pilot_mask, cov_mat_time,
-                                                        last_step=last_step)
+                                        last_step=last_step,
+                                        cache_size=cache_size,
+                                        cache_resolution_db=cache_resolution_db)
                 pilot_mask = self._update_pilot_mask_interp(pilot_mask)
                 pilot_mask = tf.transpose(pilot_mask, [0, 1, 3, 2])
                 err_var_mask = tf.cast(pilot_mask == 1,
@@ -1787,8 +1892,17 @@ class LMMSEInterpolator(BaseChannelInterpolator):
         num_effective_subcarriers = self._num_effective_subcarriers
 
         # For some estimator, err_var might not have the same shape
-        # as h_hat
-        err_var = tf.broadcast_to(err_var, tf.shape(h_hat))
+        # as h_hat.
+        # It is only broadcast along the transmitters, streams, and pilots,
+        # such that interpolation matrices can be shared across the batch,
+        # receivers, and receive antennas if err_var does not depend on them.
+        # [batch_size or 1, num_rx or 1, num_rx_ant or 1, num_tx,
+        #   num_streams_per_tx, num_pilots]
+        err_var = expand_to_rank(err_var, h_hat.shape.rank, 0)
+        err_var = tf.broadcast_to(err_var,
+                                  tf.concat([tf.shape(err_var)[:3],
+                                             tf.shape(h_hat)[3:]], axis=0))
+        err_var_shape = tf.shape(err_var)
 
         # Mapping the channel estimates and error variances to a resource grid
         # all : [batch_size, num_rx, num_rx_ant, num_tx, num_streams_per_tx,
@@ -1804,7 +1918,9 @@ class LMMSEInterpolator(BaseChannelInterpolator):
                                             [num_tx, num_tx_stream,
                                              num_ofdm_symbols,
                                              num_effective_subcarriers,
-                                             batch_size, num_rx, num_rx_ant])
+                                             err_var_shape[0],
+                                             err_var_shape[1],
+                                             err_var_shape[2]])
         h_hat = tf.transpose(h_hat, [4, 5, 6, 0, 1, 2, 3])
         err_var = tf.transpose(err_var, [4, 5, 6, 0, 1, 2, 3])
 
@@ -1835,6 +1951,9 @@ class LMMSEInterpolator(BaseChannelInterpolator):
                 err_var = err_var*err_var_mask
             # Space
             elif o == 's':
+                # Spatial smoothing depends on the error variances of all
+                # receive antennas
+                err_var = tf.broadcast_to(err_var, tf.shape(h_hat))
                 # [batch_size, num_rx, num_tx, num_streams_per_tx,
                 #      num_ofdm_symbols, num_effective_subcarriers, num_rx_ant]
                 h_hat = tf.transpose(h_hat, [0, 1, 3, 4, 5, 6, 2])
@@ -1847,6 +1966,10 @@ class LMMSEInterpolator(BaseChannelInterpolator):
                 err_var_mask = expand_to_rank(err_var_mask, tf.rank(err_var), 0)
                 err_var = err_var*err_var_mask
 
+        # [batch_size, num_rx, num_rx_ant, num_tx, num_streams_per_tx,
+        #           num_ofdm_symbols, num_effective_subcarriers]
+        err_var = tf.broadcast_to(err_var, tf.shape(h_hat))
+
         return h_hat, err_var
 
 #######################################################
@@ -5,6 +5,7 @@
 """Miscellaneous utility functions of Sionna PHY and SYS"""
 
 from abc import ABC, abstractmethod
+import functools
 import time
 import numpy as np
 import tensorflow as tf
@@ -326,6 +327,45 @@ def sample_bernoulli(shape,
     return z
 
 
+@functools.lru_cache(maxsize=32)
+def _device_mc_loop(mc_fun, soft_estimates, jit_compile):
+    """Compiled Monte-Carlo loop of :func:`sim_ber` running up to
+    ``num_iter`` iterations of ``mc_fun`` without host synchronization
+
+    The loop is cached such that repeated calls of :func:`sim_ber` with the
+    same ``mc_fun`` are not traced again.
+    """
+    @tf.function(jit_compile=jit_compile)
+    def run(num_iter, batch_size, ebno_db, bit_errors_init,
+            block_errors_init, target_bit, target_block):
+        # returns the number of iterations and the accumulated statistics
+        def _cond(it, bit_e, block_e, bit_n, block_n):
+            # pylint: disable=unused-argument
+            return tf.logical_and(
+                        tf.less(it, num_iter),
+                        tf.logical_and(
+                            tf.less(bit_errors_init + bit_e, target_bit),
+                            tf.less(block_errors_init + block_e, target_block)))
+
+        def _body(it, bit_e, block_e, bit_n, block_n):
+            outputs = mc_fun(batch_size=batch_size, ebno_db=ebno_db)
+            b = outputs[0]
+            b_hat = outputs[1]
+            if soft_estimates:
+                b_hat = hard_decisions(b_hat)
+            bit_e += count_errors(b, b_hat)
+            block_e += count_block_errors(b, b_hat)
+            bit_n += tf.size(b, out_type=tf.int64)
+            block_n += tf.size(b[..., -1], out_type=tf.int64)
+            return it + 1, bit_e, block_e, bit_n, block_n
+
+        zero = tf.zeros([], tf.int64)
+        return tf.while_loop(_cond,
+                             _body,
+                             (tf.zeros([], tf.int32), zero, zero, zero, zero))
+    return run
+
+
 def sim_ber(mc_fun,
             ebno_dbs,
             batch_size,
@@ -341,6 +381,9 @@ def sim_ber(mc_fun,
             verbose=True,
             forward_keyboard_interrupt=True,
             callback=None,
+            device_loop=False,
+            sync_interval=None,
+            vectorize_snr=False,
             precision=None):
     # pylint: disable=line-too-long
     """Simulates until target number of errors is reached and returns BER/BLER
@@ -441,6 +484,38 @@ def sim_ber(mc_fun,
         immediately. For `sim_ber.CALLBACK_CONTINUE` continues with
         the simulation.
 
+    device_loop: `bool`, (default `False`)
+        If `True`, the Monte-Carlo iterations of an SNR point are executed
+        within a single compiled `tf.while_loop`. Errors are accumulated and
+        the stopping conditions ``num_target_bit_errors`` and
+        ``num_target_block_errors`` are evaluated on the device, such that
+        the host only synchronizes every ``sync_interval`` iterations.
+        ``mc_fun`` is always traced in this case, i.e., it must be
+        compatible with `tf.function`. If ``graph_mode`` is "xla", the
+        loop is compiled with XLA. Not supported in combination with
+        ``distribute``.
+
+    sync_interval: `None` (default) | `int`
+        Number of Monte-Carlo iterations that are executed on the device
+        before control is returned to Python for progress reporting and the
+        ``callback``. If `None`, the host only synchronizes once per SNR
+        point. Only used if ``device_loop`` is `True`.
+
+    vectorize_snr: `bool`, (default `False`)
+        If `True`, all SNR points are simulated jointly. In each Monte-Carlo
+        iteration, the batch is split across all SNR points that are still
+        active and ``mc_fun`` is called with a tensor ``ebno_db`` of shape
+        [``batch_size``] holding the Eb/No of each example. Errors are
+        counted per SNR point via a segmented reduction along the first
+        dimension of `b`. Once an SNR point has reached its stopping
+        condition, its share of the batch is redistributed to the remaining
+        ones. Each SNR point is simulated with up to
+        ``max_mc_iter`` x ``batch_size`` examples. Early stopping discards the
+        results of all SNR points larger than the first one that triggered
+        it, which is equivalent to the sequential simulation. The ``callback``
+        is called after each iteration for every active SNR point.
+        Not supported in combination with ``device_loop`` or ``distribute``.
+
     precision : `None` (default) | "single" | "double"
         Precision used for internal calculations and outputs.
         If set to `None`,
@@ -595,6 +670,9 @@ def sim_ber(mc_fun,
     if not isinstance(graph_mode, str):
         raise TypeError("graph_mode must be str.")
 
+    # the device loop compiles mc_fun itself and is cached for the
+    # unwrapped mc_fun
+    device_mc_fun = mc_fun
     if graph_mode == "default":
         pass  # nothing to do
     elif graph_mode == "graph":
@@ -611,6 +689,32 @@ def sim_ber(mc_fun,
     else:
         raise TypeError("Unknown graph_mode selected.")
 
+    if not isinstance(device_loop, bool):
+        raise TypeError("device_loop must be bool.")
+    if device_loop:
+        if distribute is not None:
+            raise ValueError("device_loop is not supported with distribute.")
+        if sync_interval is None:
+            sync_interval = max_mc_iter
+        if sync_interval < 1:
+            raise ValueError("sync_interval must be a positive integer.")
+        try:
+            run_device_loop = _device_mc_loop(device_mc_fun, soft_estimates,
+                                              graph_mode == "xla")
+        except TypeError:
+            # mc_fun is not hashable and the loop cannot be cached
+            run_device_loop = _device_mc_loop.__wrapped__(
+                                device_mc_fun, soft_estimates,
+                                graph_mode == "xla")
+    else:
+        sync_interval = 1
+
+    if not isinstance(vectorize_snr, bool):
+        raise TypeError("vectorize_snr must be bool.")
+    if vectorize_snr and (device_loop or distribute is not None):
+        raise ValueError("vectorize_snr is not supported with device_loop "
+                         "or distribute.")
+
     ############
     # Multi-GPU
     ############
@@ -685,150 +789,304 @@ def sim_ber(mc_fun,
     if num_target_block_errors is not None:
         num_target_block_errors = tf.cast(num_target_block_errors, tf.int64)
 
+    # stopping conditions evaluated on the device (deactivated if None)
+    target_bit = num_target_bit_errors if num_target_bit_errors is not None \
+                    else tf.constant(np.iinfo(np.int64).max, tf.int64)
+    target_block = num_target_block_errors \
+                    if num_target_block_errors is not None \
+                    else tf.constant(np.iinfo(np.int64).max, tf.int64)
+
+    def _stop_status(idx):
+        # early stopping status of a finished SNR point or None
+        if block_errors[idx] == 0:
+            return STATUS_NO_ERR
+        if bit_errors[idx] / nb_bits[idx] < target_ber:
+            return STATUS_TARGET_BER
+        if block_errors[idx] / nb_blocks[idx] < target_bler:
+            return STATUS_TARGET_BLER
+        return None
+
+    def _run_vectorized():
+        # simulates all SNR points jointly and splits the batch across all
+        # active SNR points
+        bs = int(batch_size)
+        n = int(num_points)
+        max_examples = int(max_mc_iter) * bs
+        num_examples = np.zeros(n, np.int64)
+        active = np.ones(n, bool)
+        ebno_np = ebno_dbs.numpy()
+        t_start = time.perf_counter()
+        mc_iter = -1
+        while np.any(active):
+            mc_iter += 1
+            # distribute the batch across active SNR points without exceeding
+            # the remaining number of examples of each point
+            counts = np.zeros(n, np.int64)
+            remaining = max_examples - num_examples
+            while np.any(active & (counts < remaining)):
+                open_idx = np.where(active & (counts < remaining))[0]
+                free = bs - np.sum(counts)
+                if free == 0:
+                    break
+                share = np.full(len(open_idx), free // len(open_idx))
+                share[:free % len(open_idx)] += 1
+                counts[open_idx] += np.minimum(share,
+                                               remaining[open_idx]
+                                                - counts[open_idx])
+            # unused examples are assigned to the dummy segment n
+            seg = np.repeat(np.arange(n), counts)
+            seg = np.pad(seg, (0, bs - len(seg)), constant_values=n)
+            ebno_vec = ebno_np[np.minimum(seg, n-1)]
+            ebno_vec = tf.cast(ebno_vec, rdtype)
+
+            outputs = mc_fun(batch_size=batch_size, ebno_db=ebno_vec)
+            b = outputs[0]
+            b_hat = outputs[1]
+            if soft_estimates:
+                b_hat = hard_decisions(b_hat)
+
+            # count errors per example [bs, num_blocks, block_length]
+            errors = tf.not_equal(b, tf.cast(b_hat, b.dtype))
+            errors = tf.reshape(errors, [bs, -1, tf.shape(b)[-1]])
+            bit_e = tf.reduce_sum(tf.cast(errors, tf.int64), axis=[1, 2])
+            block_e = tf.reduce_any(errors, axis=-1)
+            block_e = tf.reduce_sum(tf.cast(block_e, tf.int64), axis=-1)
+
+            # segmented reduction over the examples of each SNR point
+            bit_e = tf.math.unsorted_segment_sum(bit_e, seg, n+1)
+            block_e = tf.math.unsorted_segment_sum(block_e, seg, n+1)
+            bit_errors.assign_add(bit_e[:-1])
+            block_errors.assign_add(block_e[:-1])
+            num_bits_per_example = tf.size(b, out_type=tf.int64) // bs
+            num_blocks_per_example = tf.size(b[..., -1], out_type=tf.int64) // bs
+            nb_bits.assign_add(counts * num_bits_per_example)
+            nb_blocks.assign_add(counts * num_blocks_per_example)
+            num_examples += counts
+
+            # single host sync per iteration
+            bit_errors_np = bit_errors.numpy()
+            block_errors_np = block_errors.numpy()
+            for idx in np.where(active)[0]:
+                # SNR point might have been deactivated by an early stop
+                if not active[idx]:
+                    continue
+                new_status = STATUS_NA
+                if callback is not None:
+                    cb_state = callback(mc_iter, idx, ebno_dbs, bit_errors,
+                                        block_errors, nb_bits, nb_blocks)
+                    if cb_state in (sim_ber.CALLBACK_STOP,
+                                    sim_ber.CALLBACK_NEXT_SNR):
+                        new_status = STATUS_CB_STOP
+                    if cb_state == sim_ber.CALLBACK_STOP:
+                        active[:] = False
+                if new_status == STATUS_NA:
+                    if num_target_bit_errors is not None and \
+                       bit_errors_np[idx] >= num_target_bit_errors:
+                        new_status = STATUS_TARGET_BIT
+                    elif num_target_block_errors is not None and \
+                         block_errors_np[idx] >= num_target_block_errors:
+                        new_status = STATUS_TARGET_BLOCK
+                    elif num_examples[idx] >= max_examples:
+                        new_status = STATUS_MAX_IT
+                    else:
+                        continue
+                status[idx] = new_status
+                active[idx] = False
+                runtime[idx] = time.perf_counter() - t_start
+
+                # early stop discards all larger SNR points
+                if early_stop and new_status != STATUS_CB_STOP:
+                    stop_status = _stop_status(idx)
+                    if stop_status is not None:
+                        status[idx] = stop_status
+                        active[idx+1:] = False
+                        status[idx+1:] = STATUS_NA
+                        runtime[idx+1:] = 0
+                        num_examples[idx+1:] = 0
+                        zeros = tf.zeros([n-idx-1], tf.int64)
+                        for var in (bit_errors, block_errors,
+                                    nb_bits, nb_blocks):
+                            var[idx+1:].assign(zeros)
+
+        # runtime of SNR points that were stopped by the callback
+        unfinished = (status == STATUS_NA) & (num_examples > 0)
+        runtime[unfinished] = time.perf_counter() - t_start
+
+        if verbose:
+            _print_progress(is_final=True, rt=0, idx_snr=0, idx_it=0,
+                            header_text=header_text)
+            print('-' * 135)
+            for idx in np.where(num_examples > 0)[0]:
+                _print_progress(is_final=True,
+                                idx_snr=idx,
+                                idx_it=num_examples[idx] // bs,
+                                rt=runtime[idx])
+
     ####################
     # Run MC simulation
     ####################
 
     try:
-        # simulate until a target number of errors is reached
-        for i in tf.range(num_points):
-            runtime[i] = time.perf_counter()  # save start time
-            iter_count = -1  # for print in verbose mode
-            for ii in tf.range(max_mc_iter):
-
-                iter_count += 1
-
-                if run_multigpu:  # distributed execution
-                    b, b_hat = _run_distributed(strategy,
-                                                mc_fun,
-                                                batch_size,
-                                                ebno_dbs[i])
-                else:
-                    outputs = mc_fun(batch_size=batch_size, ebno_db=ebno_dbs[i])
-                    # assume first and second return value is b and b_hat
-                    # other returns are ignored
-                    b = outputs[0]
-                    b_hat = outputs[1]
-
-                if soft_estimates:
-                    b_hat = hard_decisions(b_hat)
-
-                # count errors
-                bit_e = count_errors(b, b_hat)
-                block_e = count_block_errors(b, b_hat)
-
-                # count total number of bits
-                bit_n = tf.size(b)
-                block_n = tf.size(b[..., -1])
-
-                # update variables
-                bit_errors.scatter_nd_add([[i]], tf.cast([bit_e], tf.int64))
-                block_errors.scatter_nd_add([[i]], tf.cast([block_e], tf.int64))
-                nb_bits.scatter_nd_add([[i]], tf.cast([bit_n], tf.int64))
-                nb_blocks.scatter_nd_add([[i]], tf.cast([block_n], tf.int64))
-
-                cb_state = sim_ber.CALLBACK_CONTINUE
-                if callback is not None:
-                    cb_state = callback(ii, i, ebno_dbs, bit_errors,
-                                        block_errors, nb_bits,
-                                        nb_blocks)
-                    if cb_state in (sim_ber.CALLBACK_STOP,
-                                    sim_ber.CALLBACK_NEXT_SNR):
+        if vectorize_snr:
+            _run_vectorized()
+        else:
+            # simulate until a target number of errors is reached
+            for i in tf.range(num_points):
+                runtime[i] = time.perf_counter()  # save start time
+                # index of the last simulated iteration
+                iter_count = -1  # for print in verbose mode
+                for ii in tf.range(0, max_mc_iter, sync_interval):
+
+                    if device_loop:
+                        # run up to sync_interval iterations on the device
+                        num_iter = tf.minimum(sync_interval, max_mc_iter - ii)
+                        num_it, bit_e, block_e, bit_n, block_n = \
+                            run_device_loop(num_iter,
+                                            batch_size,
+                                            ebno_dbs[i],
+                                            bit_errors[i],
+                                            block_errors[i],
+                                            target_bit,
+                                            target_block)
+                        # single host sync for all iterations of this chunk
+                        iter_count += int(num_it)
+                        it_idx = tf.constant(iter_count)
+                    else:
+                        iter_count += 1
+                        it_idx = ii
+
+                        if run_multigpu:  # distributed execution
+                            b, b_hat = _run_distributed(strategy,
+                                                        mc_fun,
+                                                        batch_size,
+                                                        ebno_dbs[i])
+                        else:
+                            outputs = mc_fun(batch_size=batch_size,
+                                             ebno_db=ebno_dbs[i])
+                            # assume first and second return value is b and b_hat
+                            # other returns are ignored
+                            b = outputs[0]
+                            b_hat = outputs[1]
+
+                        if soft_estimates:
+                            b_hat = hard_decisions(b_hat)
+
+                        # count errors
+                        bit_e = count_errors(b, b_hat)
+                        block_e = count_block_errors(b, b_hat)
+
+                        # count total number of bits
+                        bit_n = tf.size(b)
+                        block_n = tf.size(b[..., -1])
+
+                    # update variables
+                    bit_errors.scatter_nd_add([[i]], tf.cast([bit_e], tf.int64))
+                    block_errors.scatter_nd_add([[i]], tf.cast([block_e], tf.int64))
+                    nb_bits.scatter_nd_add([[i]], tf.cast([bit_n], tf.int64))
+                    nb_blocks.scatter_nd_add([[i]], tf.cast([block_n], tf.int64))
+
+                    cb_state = sim_ber.CALLBACK_CONTINUE
+                    if callback is not None:
+                        cb_state = callback(it_idx, i, ebno_dbs, bit_errors,
+                                            block_errors, nb_bits,
+                                            nb_blocks)
+                        if cb_state in (sim_ber.CALLBACK_STOP,
+                                        sim_ber.CALLBACK_NEXT_SNR):
+                            # stop runtime timer
+                            runtime[i] = time.perf_counter() - runtime[i]
+                            # change internal status for summary
+                            status[i] = STATUS_CB_STOP
+                            break  # stop for this SNR point have been simulated
+
+                    # print progress summary
+                    if verbose:
+                        # print summary header during first iteration
+                        if i == 0 and iter_count == 0:
+                            _print_progress(is_final=True,
+                                            rt=0,
+                                            idx_snr=0,
+                                            idx_it=0,
+                                            header_text=header_text)
+                            # print separator after headline
+                            print('-' * 135)
+
+                        # evaluate current runtime
+                        rt = time.perf_counter() - runtime[i]
+                        # print current progress
+                        _print_progress(is_final=False, idx_snr=i, idx_it=it_idx, rt=rt)
+
+                    # bit-error based stopping cond.
+                    if num_target_bit_errors is not None:
+                        if tf.greater_equal(bit_errors[i], num_target_bit_errors):
+                            # change internal status for summary
+                            status[i] = STATUS_TARGET_BIT
+                            # stop runtime timer
+                            runtime[i] = time.perf_counter() - runtime[i]
+                            break  # enough errors for SNR point have been simulated
+
+                    # block-error based stopping cond.
+                    if num_target_block_errors is not None:
+                        if tf.greater_equal(block_errors[i],
+                                            num_target_block_errors):
+                            # stop runtime timer
+                            runtime[i] = time.perf_counter() - runtime[i]
+                            # change internal status for summary
+                            status[i] = STATUS_TARGET_BLOCK
+                            break  # enough errors for SNR point have been simulated
+
+                    # max iter have been reached -> continue with next SNR point
+                    if iter_count == max_mc_iter-1:  # all iterations are done
                         # stop runtime timer
                         runtime[i] = time.perf_counter() - runtime[i]
                         # change internal status for summary
-                        status[i] = STATUS_CB_STOP
-                        break  # stop for this SNR point have been simulated
+                        status[i] = STATUS_MAX_IT
 
-                # print progress summary
+                # print results again AFTER last iteration / early stop (new status)
                 if verbose:
-                    # print summary header during first iteration
-                    if i == 0 and iter_count == 0:
-                        _print_progress(is_final=True,
-                                        rt=0,
-                                        idx_snr=0,
-                                        idx_it=0,
-                                        header_text=header_text)
-                        # print separator after headline
-                        print('-' * 135)
-
-                    # evaluate current runtime
-                    rt = time.perf_counter() - runtime[i]
-                    # print current progress
-                    _print_progress(is_final=False, idx_snr=i, idx_it=ii, rt=rt)
-
-                # bit-error based stopping cond.
-                if num_target_bit_errors is not None:
-                    if tf.greater_equal(bit_errors[i], num_target_bit_errors):
+                    _print_progress(is_final=True,
+                                    idx_snr=i,
+                                    idx_it=iter_count,
+                                    rt=runtime[i])
+
+                # early stop if no error occurred or target_ber/target_bler reached
+                if early_stop:  # only if early stop is active
+                    if block_errors[i] == 0:
                         # change internal status for summary
-                        status[i] = STATUS_TARGET_BIT
-                        # stop runtime timer
-                        runtime[i] = time.perf_counter() - runtime[i]
-                        break  # enough errors for SNR point have been simulated
-
-                # block-error based stopping cond.
-                if num_target_block_errors is not None:
-                    if tf.greater_equal(block_errors[i],
-                                        num_target_block_errors):
-                        # stop runtime timer
-                        runtime[i] = time.perf_counter() - runtime[i]
+                        status[i] = STATUS_NO_ERR
+                        if verbose:
+                            print("\nSimulation stopped as no error occurred "
+                                  f"@ EbNo = {ebno_dbs[i].numpy():.1f} dB.\n")
+                        break
+
+                    # check for target_ber / target_bler
+                    ber_true = bit_errors[i] / nb_bits[i]
+                    bler_true = block_errors[i] / nb_blocks[i]
+                    if ber_true < target_ber:
                         # change internal status for summary
-                        status[i] = STATUS_TARGET_BLOCK
-                        break  # enough errors for SNR point have been simulated
-
-                # max iter have been reached -> continue with next SNR point
-                if iter_count == max_mc_iter-1:  # all iterations are done
+                        status[i] = STATUS_TARGET_BER
+                        if verbose:
+                            print("\nSimulation stopped as target BER is reached"
+                                  f"@ EbNo = {ebno_dbs[i].numpy():.1f} dB.\n")
+                        break
+                    if bler_true < target_bler:
+                        # change internal status for summary
+                        status[i] = STATUS_TARGET_BLER
+                        if verbose:
+                            print("\nSimulation stopped as target BLER is "
+                                  f"reached @ EbNo = {ebno_dbs[i].numpy():.1f} "
+                                  "dB.\n")
+                        break
+
+                # allow callback to end the entire simulation
+                if cb_state is sim_ber.CALLBACK_STOP:
                     # stop runtime timer
-                    runtime[i] = time.perf_counter() - runtime[i]
                     # change internal status for summary
-                    status[i] = STATUS_MAX_IT
-
-            # print results again AFTER last iteration / early stop (new status)
-            if verbose:
-                _print_progress(is_final=True,
-                                idx_snr=i,
-                                idx_it=iter_count,
-                                rt=runtime[i])
-
-            # early stop if no error occurred or target_ber/target_bler reached
-            if early_stop:  # only if early stop is active
-                if block_errors[i] == 0:
-                    # change internal status for summary
-                    status[i] = STATUS_NO_ERR
+                    status[i] = STATUS_CB_STOP
                     if verbose:
-                        print("\nSimulation stopped as no error occurred "
+                        print("\nSimulation stopped by callback function "
                               f"@ EbNo = {ebno_dbs[i].numpy():.1f} dB.\n")
                     break
 
-                # check for target_ber / target_bler
-                ber_true = bit_errors[i] / nb_bits[i]
-                bler_true = block_errors[i] / nb_blocks[i]
-                if ber_true < target_ber:
-                    # change internal status for summary
-                    status[i] = STATUS_TARGET_BER
-                    if verbose:
-                        print("\nSimulation stopped as target BER is reached"
-                              f"@ EbNo = {ebno_dbs[i].numpy():.1f} dB.\n")
-                    break
-                if bler_true < target_bler:
-                    # change internal status for summary
-                    status[i] = STATUS_TARGET_BLER
-                    if verbose:
-                        print("\nSimulation stopped as target BLER is "
-                              f"reached @ EbNo = {ebno_dbs[i].numpy():.1f} "
-                              "dB.\n")
-                    break
-
-            # allow callback to end the entire simulation
-            if cb_state is sim_ber.CALLBACK_STOP:
-                # stop runtime timer
-                # change internal status for summary
-                status[i] = STATUS_CB_STOP
-                if verbose:
-                    print("\nSimulation stopped by callback function "
-                          f"@ EbNo = {ebno_dbs[i].numpy():.1f} dB.\n")
-                break
-
     # Stop if KeyboardInterrupt is detected and set remaining SNR points to -1
     except KeyboardInterrupt as e:
 
@@ -836,14 +1094,18 @@ def sim_ber(mc_fun,
         if forward_keyboard_interrupt:
             raise e
 
-        print("\nSimulation stopped by the user "
-              f"@ EbNo = {ebno_dbs[i].numpy()} dB.")
-        # overwrite remaining BER / BLER positions with -1
-        for idx in range(i+1, num_points):
-            bit_errors.scatter_nd_add([[idx]], tf.cast([-1], tf.int64))
-            block_errors.scatter_nd_add([[idx]], tf.cast([-1], tf.int64))
-            nb_bits.scatter_nd_add([[idx]], tf.cast([1], tf.int64))
-            nb_blocks.scatter_nd_add([[idx]], tf.cast([1], tf.int64))
+        if vectorize_snr:
+            # all SNR points keep their intermediate results
+            print("\nSimulation stopped by the user.")
+        else:
+            print("\nSimulation stopped by the user "
+                  f"@ EbNo = {ebno_dbs[i].numpy()} dB.")
+            # overwrite remaining BER / BLER positions with -1
+            for idx in range(i+1, num_points):
+                bit_errors.scatter_nd_add([[idx]], tf.cast([-1], tf.int64))
+                block_errors.scatter_nd_add([[idx]], tf.cast([-1], tf.int64))
+                nb_bits.scatter_nd_add([[idx]], tf.cast([1], tf.int64))
+                nb_blocks.scatter_nd_add([[idx]], tf.cast([1], tf.int64))
 
     # calculate BER / BLER
     ber = tf.cast(bit_errors, tf.float64) / tf.cast(nb_bits, tf.float64)
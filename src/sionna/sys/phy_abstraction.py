@@ -9,6 +9,8 @@ Physical layer abstraction for Sionna SYS
 import json
 import time
 import os
+import hashlib
+import tempfile
 import logging
 import warnings
 import datetime
@@ -95,6 +97,12 @@ class PHYAbstraction(Block):
     bler_interp_delta : `float` (default: 0.01)
         Spacing of the BLER grid at which SINR is interpolated
 
+    cache_dir : `str` | `None` (default)
+        Directory in which the interpolated BLER and SINR tables are
+        cached as `.npy` files. The files are identified by a hash of the BLER
+        tables, the interpolation grid and the interpolation function. If
+        `None`, no cache is used.
+
     precision : `None` (default) | "single" | "double"
         Precision used for internal calculations and outputs.
         If set to `None`,
@@ -230,6 +238,7 @@ class PHYAbstraction(Block):
                  snr_db_interp_min_max_delta=(-5, 30.01, .1),
                  cbs_interp_min_max_delta=(24, 8448, 100),
                  bler_interp_delta=0.01,
+                 cache_dir=None,
                  precision=None,
                  **kwargs):
 
@@ -266,6 +275,10 @@ class PHYAbstraction(Block):
         self._bler_table = None
         self._bler_table_interp = None
         self._snr_table_interp = None
+        # Directory of the cached interpolated tables
+        self._cache_dir = cache_dir
+        # Interpolation is deferred until all grids are set
+        self._defer_interp = True
 
         # ------------- #
         # Instantiation #
@@ -274,6 +287,8 @@ class PHYAbstraction(Block):
         self._bler_interp_fun = interp_fun.struct
         # Function interpolating (CBS, BLER) -> SNR
         self._snr_interp_fun = interp_fun.unstruct
+        self._interp_fun_name = f"{type(interp_fun).__module__}." \
+            f"{type(interp_fun).__qualname__}"
         # Function mapping MCS index to modulation order and coderate
         self._mcs_decoder_fun = mcs_decoder_fun
         # Function computing number and size of code blocks
@@ -307,6 +322,11 @@ class PHYAbstraction(Block):
         self.cbs_interp_min_max_delta = cbs_interp_min_max_delta
         self.bler_interp_delta = bler_interp_delta
 
+        # Interpolate BLER and SNR tables once
+        self._defer_interp = False
+        self._interpolate_bler()
+        self._interpolate_snr()
+
     @staticmethod
     def load_table(filename):
         r"""
@@ -444,7 +464,7 @@ class PHYAbstraction(Block):
                                          self._snr_db_interp_min_max_delta[2])
 
         if (self.bler_table is not None) and \
-                (self._cbs_interp is not None):
+                (self._cbs_interp is not None) and not self._defer_interp:
             # Interpolate BLER
             self._interpolate_bler()
 
@@ -467,7 +487,7 @@ class PHYAbstraction(Block):
         self._cbs_interp = np.arange(self._cbs_interp_min_max_delta[0],
                                      self._cbs_interp_min_max_delta[1],
                                      self._cbs_interp_min_max_delta[2])
-        if self.bler_table is not None:
+        if (self.bler_table is not None) and not self._defer_interp:
             if self._blers_interp is not None:
                 # Interpolate SNR
                 self._interpolate_snr()
@@ -489,8 +509,8 @@ class PHYAbstraction(Block):
         self._bler_interp_delta = value
         self._blers_interp = np.arange(0, 1, self._bler_interp_delta)
         if (self.bler_table is not None) and \
-                (self._cbs_interp is not None):
-            # Interpolate BLER
+                (self._cbs_interp is not None) and not self._defer_interp:
+            # Interpolate SNR
             self._interpolate_snr()
 
     def get_idx_from_grid(self,
@@ -717,6 +737,46 @@ class PHYAbstraction(Block):
     # -------------------- #
     # Interpolation method #
     # -------------------- #
+    def _interp_cache_file(self, name, *grids):
+        """
+        Returns the name of the cache file of an interpolated table, which
+        is identified by the hash of the BLER table, the interpolation grids
+        and the interpolation function. Returns `None` if no cache is used.
+        """
+        if self._cache_dir is None:
+            return None
+        key = hashlib.sha256()
+        key.update(json.dumps(self.bler_table,
+                              sort_keys=True,
+                              default=lambda x: np.asarray(x).tolist()
+                              ).encode())
+        for grid in grids:
+            key.update(np.asarray(grid, np.float64).tobytes())
+            key.update(b'|')
+        key.update(self._interp_fun_name.encode())
+        key.update(repr(sorted(self._kwargs.items())).encode())
+        return os.path.join(self._cache_dir,
+                            f"{name}_{key.hexdigest()[:32]}.npy")
+
+    def _save_interp_table(self, filename, table):
+        """
+        Stores an interpolated table in the cache. The file is written
+        atomically such that concurrent processes can share the cache.
+        """
+        os.makedirs(self._cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self._cache_dir,
+                                         suffix='.npy',
+                                         delete=False) as f:
+            np.save(f, table)
+        os.replace(f.name, filename)
+
+    def _load_interp_table(self, filename):
+        """
+        Loads an interpolated table from the cache
+        """
+        table = np.load(filename)
+        return tf.convert_to_tensor(table, dtype=self.rdtype)
+
     def _interpolate_bler(self):
         """
         Interpolates the BLER over a fine (CBS, SINR) grid
@@ -728,6 +788,14 @@ class PHYAbstraction(Block):
             raise ValueError('CBS interpolation grid is not provided; ' +
                              'Interpolation cannot be performed')
 
+        # Load the table from the cache, if available
+        cache_file = self._interp_cache_file('bler_table_interp',
+                                             self._cbs_interp,
+                                             self._snr_dbs_interp)
+        if cache_file is not None and os.path.isfile(cache_file):
+            self._bler_table_interp = self._load_interp_table(cache_file)
+            return
+
         interp_batch_size = self._get_batch_size_interp_mat()
 
         # [num_category, num_table_idx, num_mcs_index, num_cbs_interp, num_snr_interp]
@@ -776,6 +844,9 @@ class PHYAbstraction(Block):
                     self._bler_table_interp[
                         category, table_idx-1, mcs, ::] = bler_interp
 
+        if cache_file is not None:
+            self._save_interp_table(cache_file, self._bler_table_interp)
+
         # Convert to tensor
         self._bler_table_interp = \
             tf.convert_to_tensor(self._bler_table_interp,
@@ -792,6 +863,14 @@ class PHYAbstraction(Block):
             raise ValueError('BLER interpolation grid is not provided; ' +
                              'Interpolation cannot be performed')
 
+        # Load the table from the cache, if available
+        cache_file = self._interp_cache_file('snr_table_interp',
+                                             self._cbs_interp,
+                                             self._blers_interp)
+        if cache_file is not None and os.path.isfile(cache_file):
+            self._snr_table_interp = self._load_interp_table(cache_file)
+            return
+
         interp_batch_size = self._get_batch_size_interp_mat()
         self._snr_table_interp = np.full(interp_batch_size +
                                          [len(self._cbs_interp), len(self._blers_interp)], np.inf)
@@ -830,6 +909,9 @@ class PHYAbstraction(Block):
                     self._snr_table_interp[
                         category, table_index-1, mcs, ::] = snr_interp
 
+        if cache_file is not None:
+            self._save_interp_table(cache_file, self._snr_table_interp)
+
         # Convert to tensor
         self._snr_table_interp = \
             tf.convert_to_tensor(self._snr_table_interp,
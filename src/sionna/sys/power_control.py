@@ -9,7 +9,7 @@ Transmit power control for Sionna SYS
 import tensorflow as tf
 from sionna.phy import dtypes, config
 from sionna.phy.utils import scalar_to_shaped_tensor, lin_to_db, \
-    dbm_to_watt, bisection_method
+    dbm_to_watt
 
 
 def open_loop_uplink_power_control(pathloss,
@@ -221,6 +221,12 @@ def downlink_fair_power_control(pathloss,
     where :math:`\mu` is the Lagrangian multiplier associated with the
     constraint on the total transmit power.
 
+    For :math:`f=0`, the optimal :math:`\mu^{-1}` is computed exactly by
+    sorting the water levels at which users exceed their guaranteed power.
+    For :math:`f>0`, it is computed by a safeguarded Newton's method on
+    :math:`\log \mu^{-1}`, and the KKT conditions are solved for each user by
+    Newton's method, both of which converge quadratically.
+
     This function returns the optimal power allocation :math:`r_u p_u^*` and the
     corresponding utility :math:`r_u \log( 1 + p^*_u q_u)`, for each user
     :math:`u=1,\dots,U`. 
@@ -264,10 +270,11 @@ def downlink_fair_power_control(pathloss,
         :attr:`~sionna.phy.config.Config.precision` is used.
 
     kwargs : `dict`
-        Additional inputs for
-        :func:`~sionna.phy.utils.bisection_method` used to compute the optimal
-        power allocation, such as ``eps_x``, ``eps_y``, ``max_n_iter``,
-        ``step_expand`` 
+        Additional inputs for the solver used to compute the optimal power
+        allocation when ``fairness`` > 0: ``eps_x`` (default 1e-5) is the
+        tolerance on :math:`\log \mu^{-1}`, ``eps_y`` (default 1e-4) the
+        tolerance on the unused power [W], and ``max_n_iter`` (default 100)
+        the maximum number of iterations
 
     Output
     ------
@@ -378,74 +385,193 @@ def downlink_fair_power_control(pathloss,
     # ------------------- #
     # Auxiliary functions #
     # ------------------- #
-    def kkt_fun(p,
-                mu_inv,
-                fairness,
-                cq,
-                num_resources):
+    def water_filling(cq,
+                      num_resources,
+                      max_power_bs):
         r"""
-        Computes the Karush-Kuhn-Tucker (KKT) function, that must be 0 when the
-        solution is optimal
+        Computes the exact inverse Lagrangian multiplier for ``fairness``=0
+
+        The power allocated to user :math:`u` is
+        :math:`\max(\mu^{-1} - q_u^{-1}, p_u^{\min})`, i.e., the user exceeds
+        its minimum power if the water level :math:`\mu^{-1}` exceeds
+        :math:`p_u^{\min} + q_u^{-1}`. The total power is piecewise linear in
+        :math:`\mu^{-1}`, such that the optimal water level is found by sorting
+        these breakpoints.
         """
-        one = tf.cast(1, rdtype)
-        fairness = tf.cast(fairness, rdtype)
-        if fairness == 0:
-            return cq * mu_inv[..., tf.newaxis] - (one + p * cq)
-        else:
-            log_pow = tf.pow(num_resources *
-                             tf.math.log(one + p * cq), fairness)
-            return cq * mu_inv[..., tf.newaxis] - log_pow * (one + p * cq)
-
-    def get_p_star_mu(mu_inv,
+        # Water levels above which users exceed their minimum power
+        # [..., num_ut]
+        level = p_left + 1 / cq
+        ind = tf.argsort(level, axis=-1)
+        level = tf.gather(level, ind, batch_dims=rank)
+        r = tf.gather(num_resources, ind, batch_dims=rank)
+        r_inv_cq = tf.gather(num_resources / cq, ind, batch_dims=rank)
+        r_p_left = tf.gather(num_resources * p_left, ind, batch_dims=rank)
+
+        # Total power if the water level equals each of the breakpoints
+        r_cum = tf.cumsum(r, axis=-1)
+        r_p_left_cum = tf.cumsum(r_p_left, axis=-1)
+        power = level * r_cum - tf.cumsum(r_inv_cq, axis=-1) + \
+            r_p_left_cum[..., -1:] - r_p_left_cum
+
+        # Last breakpoint at which the power budget is not exceeded
+        # [..., 1]
+        k = tf.reduce_sum(
+            tf.cast(power <= max_power_bs[..., tf.newaxis], tf.int32),
+            axis=-1, keepdims=True) - 1
+        k = tf.maximum(k, 0)
+        level = tf.gather(level, k, batch_dims=rank)
+        power = tf.gather(power, k, batch_dims=rank)
+        r_cum = tf.gather(r_cum, k, batch_dims=rank)
+
+        # The total power is linear between two breakpoints
+        # [...]
+        mu_inv = tf.where(r_cum > 0,
+                          level + (max_power_bs[..., tf.newaxis] - power) /
+                          tf.where(r_cum > 0, r_cum, tf.cast(1, rdtype)),
+                          tf.cast(0, rdtype))
+        return mu_inv[..., 0]
+
+    def get_p_star_mu(log_mu_inv,
+                      z,
                       fairness,
                       cq,
                       num_resources):
-        """
+        r"""
         Computes the optimal power allocation given a certain (non-optimal, in
-        general) inverse Lagrangian multiplier ``mu_inv``
+        general) inverse Lagrangian multiplier :math:`\mu^{-1}`, for
+        ``fairness`` > 0, together with its derivative with respect to
+        :math:`\log \mu^{-1}`
+
+        With :math:`x_u=\log(1+p_u q_u)`, the logarithm of the KKT condition
+        reads :math:`f\log(r_u x_u) + x_u = \log(q_u\mu^{-1})`.
+        It is solved for :math:`z_u = \log x_u` with Newton's method, which
+        converges quadratically from any initial point ``z`` as the function
+        :math:`f z + e^z` is convex and increasing.
         """
+        one = tf.cast(1, rdtype)
         # [..., num_ut]
-        if fairness == 0:
-            p_star_mu = tf.maximum(
-                mu_inv[..., tf.newaxis] - tf.pow(cq, -1),
-                p_left)
-        else:
-            p_star_mu, _ = bisection_method(  # pylint: disable=unbalanced-tuple-unpacking
-                kkt_fun,
-                p_left,
-                p_right,
-                expand_to_right=False,
-                expand_to_left=False,
-                regula_falsi=False,
-                mu_inv=mu_inv,
-                fairness=fairness,
-                cq=cq,
-                num_resources=num_resources,
-                precision=precision,
-                **kwargs)
-        return p_star_mu
-
-    def constraint_slackness(mu_inv,
-                             fairness,
-                             cq,
-                             num_resources,
-                             max_power_bs):
+        c = log_mu_inv[..., tf.newaxis] + tf.math.log(cq) - \
+            fairness * tf.math.log(tf.where(num_resources > 0,
+                                            num_resources, one))
+
+        def cond(z, dz, n):
+            return (n < max_n_iter) & tf.reduce_any(tf.abs(dz) > eps_x)
+
+        def body(z, dz, n):
+            exp_z = tf.exp(z)
+            dz = (fairness * z + exp_z - c) / (fairness + exp_z)
+            return z - dz, dz, n + 1
+
+        z, _, _ = tf.while_loop(cond, body,
+                                (z, tf.ones_like(z), tf.constant(0)))
+
+        x = tf.exp(z)
+        p = tf.math.expm1(x) / cq
+        # Derivative of p with respect to log(mu_inv)
+        dp = tf.exp(x) * x / (cq * (fairness + x))
+        dp = tf.where((p > p_left) & (p < p_right), dp, tf.cast(0, rdtype))
+        p = tf.minimum(tf.maximum(p, p_left), p_right)
+        return p, z, dp
+
+    def init_z(log_mu_inv,
+               fairness,
+               cq,
+               num_resources):
         """
-        Computes the amount of unused power for the given Lagrangian multiplier
+        Computes an initial point for the Newton iterations of `get_p_star_mu`
         """
-        p_star_mu = get_p_star_mu(mu_inv,
-                                  fairness,
-                                  cq,
-                                  num_resources)
+        one = tf.cast(1, rdtype)
+        c = log_mu_inv[..., tf.newaxis] + tf.math.log(cq) - \
+            fairness * tf.math.log(tf.where(num_resources > 0,
+                                            num_resources, one))
+        return tf.minimum(c / fairness,
+                          tf.math.log(tf.maximum(c, tf.cast(1e-30, rdtype))))
+
+    def log_kkt_level(p,
+                      fairness,
+                      cq,
+                      num_resources):
+        """
+        Computes the value of log(mu_inv) for which ``p`` is the optimal power
+        """
+        x = tf.math.log1p(p * cq)
+        return fairness * tf.math.log(num_resources * x) + x - \
+            tf.math.log(cq)
+
+    def fair_allocation(fairness,
+                        cq,
+                        num_resources,
+                        max_power_bs):
+        r"""
+        Computes the inverse Lagrangian multiplier for ``fairness`` > 0 via a
+        safeguarded Newton's method on :math:`\log \mu^{-1}`
+        """
+        is_scheduled = num_resources > 0
+        inf = tf.cast(float("inf"), rdtype)
+
+        # Bracket of log(mu_inv)
+        # Below the lower end, users (almost) do not exceed their minimum
+        # power, so that the power budget is not exceeded.
+        # Above the upper end, all users get the maximum power, which
+        # exceeds the power budget.
         # [...]
-        slackness = max_power_bs - \
-            tf.reduce_sum(num_resources * p_star_mu, axis=-1)
-        return slackness
+        p_small = tf.maximum(p_left, 1e-9 * p_right)
+        lo = tf.reduce_min(tf.where(
+            is_scheduled,
+            log_kkt_level(p_small, fairness, cq, num_resources),
+            inf), axis=-1)
+        hi = tf.reduce_max(tf.where(
+            is_scheduled,
+            log_kkt_level(p_right, fairness, cq, num_resources),
+            -inf), axis=-1)
+        any_scheduled = tf.reduce_any(is_scheduled, axis=-1)
+        lo = tf.where(any_scheduled, lo, tf.cast(0, rdtype))
+        hi = tf.where(any_scheduled, hi, tf.cast(0, rdtype))
+
+        def cond(y, lo, hi, z, done, n):
+            return (n < max_n_iter) & tf.reduce_any(~done)
+
+        def body(y, lo, hi, z, done, n):
+            p, z, dp = get_p_star_mu(y, z, fairness, cq, num_resources)
+            # Unused power and its derivative
+            slackness = max_power_bs - \
+                tf.reduce_sum(num_resources * p, axis=-1)
+            d_slackness = - tf.reduce_sum(num_resources * dp, axis=-1)
+
+            # Update the bracket
+            lo = tf.where(slackness > 0, y, lo)
+            hi = tf.where(slackness > 0, hi, y)
+
+            # Newton step, or bisection if it leaves the bracket
+            y_new = y - slackness / tf.where(d_slackness < 0, d_slackness,
+                                             -tf.cast(1, rdtype))
+            y_new = tf.where((d_slackness < 0) & (y_new > lo) & (y_new < hi),
+                             y_new,
+                             (lo + hi) / 2)
+
+            converged = tf.abs(slackness) <= eps_y
+            y_new = tf.where(done | converged, y, y_new)
+            done = done | converged | (tf.abs(y_new - y) <= eps_x) | \
+                (hi - lo <= eps_x)
+            return y_new, lo, hi, z, done, n + 1
+
+        y = (lo + hi) / 2
+        z = init_z(y, fairness, cq, num_resources)
+        y, _, _, z, _, _ = tf.while_loop(
+            cond, body,
+            (y, lo, hi, z, ~any_scheduled, tf.constant(0)))
+
+        p, _, _ = get_p_star_mu(y, z, fairness, cq, num_resources)
+        return tf.exp(y), p
 
     # ----------- #
     # Cast inputs #
     # ----------- #
     batch_size, num_ut = pathloss.shape[:-1], pathloss.shape[-1]
+    rank = len(batch_size)
+    eps_x = kwargs.get("eps_x", 1e-5)
+    eps_y = kwargs.get("eps_y", 1e-4)
+    max_n_iter = kwargs.get("max_n_iter", 100)
     if precision is None:
         rdtype = config.tf_rdtype
     else:
@@ -501,41 +627,23 @@ def downlink_fair_power_control(pathloss,
                        tf.cast(0., rdtype),
                        p_right)
 
-    # (Soft) min/max value of Lagrangian multiplier inverse mu^-1
-    # Represents the "water level" for fairness=0
-    # [...]
-    mu_inv_left = tf.fill(batch_size, tf.cast(0., rdtype))
-    mu_inv_right = tf.fill(batch_size, tf.cast(1000., rdtype))
-
-    # ------------------------------------------ #
-    # (Inverse of) optimal Lagrangian multiplier #
-    # ------------------------------------------ #
+    # ------------------------------------------------------------ #
+    # (Inverse of) optimal Lagrangian multiplier and transmit power #
+    # ------------------------------------------------------------ #
     # Channel quality
     cq = 1 / (pathloss * interference_plus_noise)
-    # [...]
-    # pylint: disable=unbalanced-tuple-unpacking
-    mu_inv_star, _ = bisection_method(
-        constraint_slackness,
-        mu_inv_left,
-        mu_inv_right,
-        expand_to_right=True,
-        expand_to_left=False,
-        regula_falsi=False,
-        fairness=fairness,
-        cq=cq,
-        num_resources=num_allocated_re,
-        max_power_bs=max_power_bs,
-        precision=precision,
-        **kwargs)
-
-    # ---------------------- #
-    # Optimal transmit power #
-    # ---------------------- #
-    # [..., num_ut]
-    tx_power = get_p_star_mu(mu_inv_star,
-                             fairness,
-                             cq,
-                             num_allocated_re)
+    if fairness == 0:
+        # [...]
+        mu_inv_star = water_filling(cq,
+                                    num_allocated_re,
+                                    max_power_bs)
+        # [..., num_ut]
+        tx_power = tf.maximum(mu_inv_star[..., tf.newaxis] - 1 / cq, p_left)
+    else:
+        mu_inv_star, tx_power = fair_allocation(fairness,
+                                                cq,
+                                                num_allocated_re,
+                                                max_power_bs)
 
     # Compute total power across resources
     tx_power = tx_power * num_allocated_re
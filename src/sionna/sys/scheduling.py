@@ -30,6 +30,16 @@ class PFSchedulerSUMIMO(Block):
         \operatorname{argmax}_{u} \frac{\tilde{R}_{t}(u,i)}{T_{t-1}(u)}.
 
     All streams within a scheduled resource element are assigned to the selected user.
+
+    Resources can be scheduled at a coarser granularity than individual
+    frequency resources and OFDM symbols. With ``rbg_size`` > 1, the
+    frequency resources are grouped into resource block groups (RBGs) of
+    ``rbg_size`` consecutive resources, and with ``per_slot`` set to `True`,
+    a single decision is taken for all OFDM symbols of the slot.
+    The PF metric of an RBG is then computed from the sum of the achievable
+    rates over its resources.
+    If ``num_ut_per_rbg`` > 1, the ``num_ut_per_rbg`` users with highest
+    PF metric are scheduled on each RBG, e.g., for multi-user MIMO.
     
     Let :math:`R_t(u)` be the rate achieved by user :math:`u` in slot :math:`t`. 
     The throughput :math:`T` by each user :math:`u` is updated via
@@ -66,6 +76,25 @@ class PFSchedulerSUMIMO(Block):
         Discount factor for computing the time-averaged achieved rate. Must be
         within (0,1).
 
+    rbg_size : `int` (default: 1)
+        Number of consecutive frequency resources forming a resource block
+        group (RBG), i.e., the frequency granularity of the scheduling
+        decisions. The last RBG is smaller if ``num_freq_res`` is not a
+        multiple of ``rbg_size``.
+
+    per_slot : `bool` (default: `False`)
+        If `True`, users are scheduled once per slot for all OFDM symbols.
+        Otherwise, users are scheduled for each OFDM symbol.
+
+    num_ut_per_rbg : `int` (default: 1)
+        Number of users scheduled on each RBG
+
+    return_indices : `bool` (default: `False`)
+        If `True`, the indices of the scheduled users are returned instead of
+        the boolean allocation mask ``is_scheduled``. The mask can be
+        obtained from the indices with
+        :func:`~sionna.sys.scheduled_ut_to_mask`.
+
     precision : `None` (default) | "single" | "double"
         Precision used for internal calculations and outputs.
         If set to `None`,
@@ -85,7 +114,14 @@ class PFSchedulerSUMIMO(Block):
     ------
 
     is_scheduled: [batch_size, num_ofdm_sym, num_freq_res, num_ut, num_streams_per_ut], `tf.bool`
-        Whether a user is scheduled for transmission for each available resource
+        Whether a user is scheduled for transmission for each available
+        resource. Only returned if ``return_indices`` is `False`.
+
+    scheduled_ut: [batch_size, num_sched_sym, num_rbg, num_ut_per_rbg], `tf.int32`
+        Indices of the users scheduled on each RBG, sorted by decreasing PF
+        metric, where ``num_sched_sym`` is 1 if ``per_slot`` is `True` and
+        ``num_ofdm_sym`` otherwise. Only returned if ``return_indices`` is
+        `True`.
     """
     def __init__(self,
                  num_ut,
@@ -94,6 +130,10 @@ class PFSchedulerSUMIMO(Block):
                  batch_size=None,
                  num_streams_per_ut=1,
                  beta=.98,
+                 rbg_size=1,
+                 per_slot=False,
+                 num_ut_per_rbg=1,
+                 return_indices=False,
                  precision=None):
         super().__init__(precision=precision)
 
@@ -108,11 +148,23 @@ class PFSchedulerSUMIMO(Block):
         self._num_ofdm_sym = int(num_ofdm_sym)
         self._num_streams_per_ut = int(num_streams_per_ut)
         self.beta = beta
+
+        self._rbg_size = int(rbg_size)
+        if self._rbg_size < 1:
+            raise ValueError("'rbg_size' must be positive")
+        self._num_rbg = -(-self._num_freq_res // self._rbg_size)
+        self._per_slot = bool(per_slot)
+        self._num_ut_per_rbg = int(num_ut_per_rbg)
+        if not 1 <= self._num_ut_per_rbg <= self._num_ut:
+            raise ValueError("'num_ut_per_rbg' must be within [1;num_ut]")
+        self._return_indices = bool(return_indices)
+        num_sched_sym = 1 if self._per_slot else self._num_ofdm_sym
+
         self._rate_achieved_past = tf.Variable(
             tf.cast(tf.fill(list(batch_size) + [num_ut], 1), self.rdtype))
         self._pf_metric = tf.Variable(
             tf.zeros(list(batch_size) +
-                     [num_ofdm_sym, num_freq_res, num_ut],
+                     [num_sched_sym, self._num_rbg, num_ut],
                      self.rdtype))
 
     @property
@@ -126,11 +178,20 @@ class PFSchedulerSUMIMO(Block):
     @property
     def pf_metric(self):
         r"""
-        [batch_size, num_ofdm_sym, num_freq_res, num_ut], `tf.float` (read-only) : Proportional 
-        fairness (PF) metric in the last slot 
+        [batch_size, num_sched_sym, num_rbg, num_ut], `tf.float` (read-only) : Proportional
+        fairness (PF) metric of each RBG in the last slot, where
+        ``num_sched_sym`` is 1 if ``per_slot`` is `True` and ``num_ofdm_sym``
+        otherwise
         """
         return self._pf_metric
 
+    @property
+    def num_rbg(self):
+        r"""
+        `int` (read-only) : Number of resource block groups (RBGs)
+        """
+        return self._num_rbg
+
     @property
     def beta(self):
         r"""
@@ -182,25 +243,109 @@ class PFSchedulerSUMIMO(Block):
         # [batch_size, 1, 1, num_ut]
         rate_achieved_past = insert_dims(self._rate_achieved_past, 2, axis=-2)
 
+        # ------------------------------ #
+        # Achievable rate per RBG (slot) #
+        # ------------------------------ #
+        if self._rbg_size > 1:
+            # Zero-pad the last RBG
+            num_pad = self._num_rbg*self._rbg_size - self._num_freq_res
+            paddings = [[0, 0]]*(len(self._batch_size) + 1) + \
+                [[0, num_pad], [0, 0]]
+            rate_achievable_curr_slot = tf.pad(rate_achievable_curr_slot,
+                                               paddings)
+            # [batch_size, num_ofdm_sym, num_rbg, num_ut]
+            rate_achievable_curr_slot = tf.reduce_sum(tf.reshape(
+                rate_achievable_curr_slot,
+                self._batch_size + [self._num_ofdm_sym, self._num_rbg,
+                                    self._rbg_size, self._num_ut]), axis=-2)
+        if self._per_slot:
+            # [batch_size, 1, num_rbg, num_ut]
+            rate_achievable_curr_slot = tf.reduce_sum(
+                rate_achievable_curr_slot, axis=-3, keepdims=True)
+
         # ----------------- #
         # Compute PF metric #
         # ----------------- #
-        # [batch_size, num_ofdm_sym, num_freq_res, num_ut]
+        # [batch_size, num_sched_sym, num_rbg, num_ut]
         self._pf_metric.assign(
             rate_achievable_curr_slot / rate_achieved_past)
 
         # ------------ #
         # Schedule UTs #
         # ------------ #
-        # Assign each time/frequency resource to the user with highest PF metric
-        # [batch_size, num_ofdm_sym, num_freq_res]
-        scheduled_ut = tf.argmax(self._pf_metric, axis=-1)
-        # [batch_size, num_ofdm_sym, num_freq_res, num_ut]
-        is_scheduled = tf.one_hot(scheduled_ut, depth=self._num_ut)
-        # [batch_size, num_ofdm_sym, num_freq_res, num_ut, 1]
-        is_scheduled = tf.expand_dims(is_scheduled, axis=-1)
-        # [batch_size, num_ofdm_sym, num_freq_res, num_ut, num_streams]
-        is_scheduled = tf.tile(is_scheduled, [1]*(3 + len(self._batch_size)) +
-                               [self._num_streams_per_ut])
-
-        return tf.cast(is_scheduled, tf.bool)
+        # Assign each RBG to the user(s) with highest PF metric
+        if self._num_ut_per_rbg == 1:
+            # [batch_size, num_sched_sym, num_rbg, 1]
+            scheduled_ut = tf.argmax(self._pf_metric, axis=-1,
+                                     output_type=tf.int32)[..., tf.newaxis]
+        else:
+            # [batch_size, num_sched_sym, num_rbg, num_ut_per_rbg]
+            _, scheduled_ut = tf.math.top_k(self._pf_metric,
+                                            k=self._num_ut_per_rbg)
+        if self._return_indices:
+            return scheduled_ut
+
+        return scheduled_ut_to_mask(scheduled_ut,
+                                    self._num_ut,
+                                    self._num_freq_res,
+                                    self._num_ofdm_sym,
+                                    rbg_size=self._rbg_size,
+                                    num_streams_per_ut=self._num_streams_per_ut)
+
+
+def scheduled_ut_to_mask(scheduled_ut,
+                         num_ut,
+                         num_freq_res,
+                         num_ofdm_sym,
+                         rbg_size=1,
+                         num_streams_per_ut=1):
+    # pylint: disable=line-too-long
+    r"""
+    Expands the indices of the users scheduled on each resource block group
+    (RBG), as returned by :class:`~sionna.sys.PFSchedulerSUMIMO` with
+    ``return_indices`` set to `True`, into a boolean allocation mask over the
+    OFDM resource grid
+
+    Input
+    -----
+
+    scheduled_ut : [..., num_sched_sym, num_rbg, num_ut_per_rbg], `tf.int32`
+        Indices of the users scheduled on each RBG. ``num_sched_sym`` must be
+        either 1, i.e., the same users are scheduled across the slot, or
+        ``num_ofdm_sym``.
+
+    num_ut : `int`
+        Number of user terminals
+
+    num_freq_res : `int`
+        Number of frequency resources
+
+    num_ofdm_sym : `int`
+        Number of OFDM symbols in a slot
+
+    rbg_size : `int` (default: 1)
+        Number of consecutive frequency resources forming an RBG
+
+    num_streams_per_ut : `int` (default: 1)
+        Number of streams per user
+
+    Output
+    ------
+
+    is_scheduled : [..., num_ofdm_sym, num_freq_res, num_ut, num_streams_per_ut], `tf.bool`
+        Whether a user is scheduled for transmission for each available
+        resource
+    """
+    # [..., num_sched_sym, num_rbg, num_ut]
+    is_scheduled = tf.reduce_any(
+        tf.one_hot(scheduled_ut, depth=num_ut, on_value=True,
+                   off_value=False, dtype=tf.bool), axis=-2)
+    # [..., num_sched_sym, num_freq_res, num_ut]
+    if rbg_size > 1:
+        is_scheduled = tf.repeat(is_scheduled, rbg_size,
+                                 axis=-2)[..., :num_freq_res, :]
+    # [..., num_ofdm_sym, num_freq_res, num_ut, num_streams]
+    shape = tf.concat([tf.shape(is_scheduled)[:-3],
+                       [num_ofdm_sym, num_freq_res, num_ut,
+                        num_streams_per_ut]], axis=0)
+    return tf.broadcast_to(is_scheduled[..., tf.newaxis], shape)
@@ -0,0 +1,61 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2021-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0#
+"""Benchmark of the block-wise ApplyTimeChannel
+
+Measures the throughput and the peak memory of ``ApplyTimeChannel`` for
+different input lengths, channel filter lengths and block sizes.
+The peak memory is only reported if a GPU is available.
+
+Run with ``python bench_apply_time_channel.py``.
+"""
+
+import time
+import tensorflow as tf
+from sionna.phy import config
+from sionna.phy.channel import ApplyTimeChannel
+
+BATCH_SIZE = 8
+NUM_RX_ANT = 4
+NUM_TX_ANT = 4
+NUM_RUNS = 5
+
+# (num_time_samples, l_tot) pairs
+SIZES = [(2048, 16), (30720, 64), (30720, 256)]
+BLOCK_SIZES = [None, "auto", 256]
+
+def complex_normal(shape):
+    return tf.complex(config.tf_rng.normal(shape), config.tf_rng.normal(shape))
+
+def benchmark(num_time_samples, l_tot, block_size):
+    apply = ApplyTimeChannel(num_time_samples, l_tot, block_size=block_size)
+    x = complex_normal([BATCH_SIZE, 1, NUM_TX_ANT, num_time_samples])
+    h_time = complex_normal([BATCH_SIZE, 1, NUM_RX_ANT, 1, NUM_TX_ANT,
+                             num_time_samples+l_tot-1, l_tot])
+    f = tf.function(apply, jit_compile=True)
+    gpu = len(tf.config.list_physical_devices("GPU")) > 0
+    f(x, h_time).numpy() # warm-up
+    if gpu:
+        tf.config.experimental.reset_memory_stats("GPU:0")
+    t = time.perf_counter()
+    for _ in range(NUM_RUNS):
+        f(x, h_time).numpy()
+    tp = BATCH_SIZE*NUM_RUNS*num_time_samples/(time.perf_counter() - t)/1e6
+    mem = None
+    if gpu:
+        mem = tf.config.experimental.get_memory_info("GPU:0")["peak"]/2**20
+    return tp, mem, apply.block_size
+
+if __name__ == "__main__":
+    for num_time_samples, l_tot in SIZES:
+        for block_size in BLOCK_SIZES:
+            try:
+                tp, mem, bs = benchmark(num_time_samples, l_tot, block_size)
+            except tf.errors.ResourceExhaustedError:
+                print(f"N={num_time_samples:5d} L={l_tot:3d} "
+                      f"block_size={str(block_size):>4s}: out of memory")
+                continue
+            mem = "" if mem is None else f", peak memory {mem:8.1f} MiB"
+            print(f"N={num_time_samples:5d} L={l_tot:3d} "
+                  f"block_size={str(block_size):>4s} ({bs:5d}): "
+                  f"{tp:8.2f} Msamples/s{mem}")
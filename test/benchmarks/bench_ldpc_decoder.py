@@ -0,0 +1,56 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2021-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0#
+"""Benchmark of the LDPC5GDecoder engines
+
+Measures the decoding throughput of the different message layouts for
+base graph 1 and 2 at several lifting sizes.
+
+Run with ``python bench_ldpc_decoder.py``.
+"""
+
+import time
+import tensorflow as tf
+from sionna.phy.fec.ldpc import LDPC5GEncoder, LDPC5GDecoder
+from sionna.phy.mapping import BinarySource
+
+BATCH_SIZE = 32
+NUM_ITER = 10
+NUM_RUNS = 5
+
+# (k, n) pairs covering BG1 and BG2 at different lifting sizes
+CODES = [(8448, 16896), (2112, 2816), (504, 672),
+         (3840, 19200), (640, 1920), (120, 360)]
+
+# decoder configurations (keyword arguments, jit_compile)
+ENGINES = {"ragged" : ({"edge_layout" : "ragged"}, False),
+           "dense" : ({"edge_layout" : "dense"}, False),
+           "dense (xla)" : ({"edge_layout" : "dense"}, True),
+           "qc" : ({"edge_layout" : "qc"}, False),
+           "qc (xla)" : ({"edge_layout" : "qc"}, True),
+           "qc layered (xla)" : ({"edge_layout" : "qc",
+                                  "cn_schedule" : "layered"}, True)}
+
+def throughput(encoder, decoder, jit_compile):
+    source = BinarySource()
+
+    @tf.function(jit_compile=jit_compile)
+    def run(llr_ch):
+        return decoder(llr_ch)
+
+    c = encoder(source([BATCH_SIZE, encoder.k]))
+    llr_ch = 2*(2*c-1) + tf.random.normal(c.shape)
+    run(llr_ch).numpy() # warm-up to exclude tracing
+    t = time.perf_counter()
+    for _ in range(NUM_RUNS):
+        run(llr_ch).numpy()
+    return BATCH_SIZE*NUM_RUNS*encoder.k / (time.perf_counter() - t) / 1e6
+
+if __name__ == "__main__":
+    for k, n in CODES:
+        encoder = LDPC5GEncoder(k, n)
+        for name, (kwargs, jit_compile) in ENGINES.items():
+            decoder = LDPC5GDecoder(encoder, num_iter=NUM_ITER, **kwargs)
+            tp = throughput(encoder, decoder, jit_compile)
+            print(f"{encoder._bg.upper()} Z={encoder.z:3d} k={k:5d} "
+                  f"{name:>15}: {tp:8.2f} Mbit/s")
@@ -0,0 +1,48 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2021-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0#
+"""Benchmark of the CPU (Numpy) engine of the PolarSCLDecoder
+
+Measures the decoding throughput of ``cpu_only=True`` for different
+codeword lengths, list sizes and numbers of worker threads.
+
+Run with ``python bench_polar_scl_decoder.py``.
+"""
+
+import time
+import tensorflow as tf
+from sionna.phy.fec.polar import PolarEncoder, PolarSCLDecoder
+from sionna.phy.fec.polar.utils import generate_5g_ranking
+from sionna.phy.mapping import BinarySource
+
+BATCH_SIZE = 64
+NUM_RUNS = 3
+
+# (k, n) pairs
+CODES = [(256, 512), (512, 1024)]
+LIST_SIZES = [8, 32]
+NUM_WORKERS = [1, 4]
+
+def throughput(encoder, decoder):
+    source = BinarySource()
+    c = encoder(source([BATCH_SIZE, encoder.k]))
+    llr_ch = 2*(2*c-1) + tf.random.normal(c.shape)
+    decoder(llr_ch).numpy() # warm-up
+    t = time.perf_counter()
+    for _ in range(NUM_RUNS):
+        decoder(llr_ch).numpy()
+    return BATCH_SIZE*NUM_RUNS*encoder.k / (time.perf_counter() - t) / 1e3
+
+if __name__ == "__main__":
+    for k, n in CODES:
+        frozen_pos, _ = generate_5g_ranking(k, n)
+        encoder = PolarEncoder(frozen_pos, n)
+        for list_size in LIST_SIZES:
+            for num_workers in NUM_WORKERS:
+                decoder = PolarSCLDecoder(frozen_pos, n,
+                                          list_size=list_size,
+                                          cpu_only=True,
+                                          num_workers=num_workers)
+                tp = throughput(encoder, decoder)
+                print(f"n={n:4d} L={list_size:2d} workers={num_workers}: "
+                      f"{tp:8.2f} kbit/s")
@@ -746,6 +746,35 @@ class TestChannelCoefficientsGenerator(unittest.TestCase):
         max_err = self.max_rel_err(delays_nlos_ref, delays_nlos)
         self.assertLessEqual(max_err, err_tol)
 
+    def test_step_11_nlos_contracted(self):
+        """Test that the ray-contracted computation of the NLoS channel
+        matrix matches the computation through the full NLoS channel matrix,
+        with and without sub-clustering"""
+        phi = tf.constant(self.phi, tf.float64)
+        sample_times = tf.constant(self.sample_times, tf.float64)
+        for subclustering in [True, False]:
+            ccg = channel.tr38901.ChannelCoefficientsGenerator(
+                TestChannelCoefficientsGenerator.CARRIER_FREQUENCY,
+                tx_array=self.tx_array,
+                rx_array=self.rx_array,
+                subclustering=subclustering,
+                precision="double")
+
+            H_full = ccg._step_11_nlos(phi, self.topology, self.rays,
+                                       sample_times)
+            H_nlos_ref, delays_nlos_ref = ccg._step_11_reduce_nlos(
+                                                H_full, self.rays, self.c_ds)
+
+            H_nlos, delays_nlos = ccg._step_11_nlos_contracted(
+                                    phi, self.topology, self.rays,
+                                    sample_times, self.c_ds)
+
+            self.assertEqual(H_nlos.shape, H_nlos_ref.shape)
+            self.assertTrue(np.allclose(H_nlos_ref.numpy(), H_nlos.numpy(),
+                                        rtol=1e-9, atol=1e-12))
+            self.assertTrue(np.array_equal(delays_nlos_ref.numpy(),
+                                           delays_nlos.numpy()))
+
     def step_11_los_ref(self, t, topology):
         """Reference implementation: Compute the channel matrix of the NLoS
         component 2"""
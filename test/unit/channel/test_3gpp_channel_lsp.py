@@ -5,6 +5,7 @@ import tensorflow as tf
 import unittest
 import numpy as np
 from scipy.stats import kstest, norm
+from scipy.integrate import quad
 from sionna.phy import channel
 from sionna.phy import config
 from channel_test_utils import *
@@ -593,3 +594,158 @@ class TestLSP(unittest.TestCase):
                 max_err = np.max(np.abs(std_samples-pathloss_std(model, submodel)))
                 self.assertLessEqual(max_err, TestLSP.MAX_ERR_PATHLOSS_STD,
                     f"{model}:{submodel}")
+
+class TestLSPSumOfSinusoids(unittest.TestCase):
+    r"""Test the distribution, cross-correlation, and spatial correlation of
+    LSPs sampled with the sum-of-sinusoids spatial correlation method
+    """
+
+    CARRIER_FREQUENCY = 3.5e9 # Hz
+    H_UT = 1.5
+    H_BS = 10.0
+    BATCH_SIZE = 20000
+    NB_UT = 6
+
+    MAX_ERR_KS = 1.5e-2
+    MAX_ERR_CROSS_CORR = 3e-2
+    MAX_ERR_SPAT_CORR = 3e-2
+
+    def setUpClass():
+        r"""Sample LSPs from the UMi model with two groups of UTs in
+        different states"""
+        fc = TestLSPSumOfSinusoids.CARRIER_FREQUENCY
+        batch_size = TestLSPSumOfSinusoids.BATCH_SIZE
+        nb_ut = TestLSPSumOfSinusoids.NB_UT
+        h_ut = TestLSPSumOfSinusoids.H_UT
+        h_bs = TestLSPSumOfSinusoids.H_BS
+
+        bs_array = channel.tr38901.PanelArray(num_rows_per_panel=1,
+                                              num_cols_per_panel=1,
+                                              polarization='single',
+                                              polarization_type='V',
+                                              antenna_pattern='omni',
+                                              carrier_frequency=fc,
+                                              precision="double")
+        ut_array = bs_array
+        ut_orientations = tf.zeros([batch_size, nb_ut, 3], dtype=tf.float64)
+        bs_orientations = tf.zeros([batch_size, 1, 3], dtype=tf.float64)
+        ut_velocities = tf.zeros([batch_size, nb_ut, 3], dtype=tf.float64)
+
+        # UTs are dropped close to each other such that they are correlated
+        ut_loc = generate_random_loc(batch_size, nb_ut, (200,240),
+                                     (200,240), (h_ut, h_ut),
+                                     share_loc=True, dtype=tf.float64)
+        bs_loc = generate_random_loc(batch_size, 1, (0,10),
+                                     (0,10), (h_bs, h_bs),
+                                     share_loc=True, dtype=tf.float64)
+        # The first half of the UTs are outdoor, the other half indoor
+        in_state = tf.tile(tf.constant([[False]*(nb_ut//2)
+                                        + [True]*(nb_ut-nb_ut//2)]),
+                           [batch_size, 1])
+
+        scenario = channel.tr38901.UMiScenario(fc,
+                                               "low",
+                                               ut_array,
+                                               bs_array,
+                                               "uplink",
+                                               precision="double")
+        lsp_sampler = channel.tr38901.LSPGenerator(
+                                        scenario,
+                                        spatial_correlation_method="sos")
+        scenario.set_topology(ut_loc, bs_loc, ut_orientations, bs_orientations,
+                              ut_velocities, in_state, True)
+        lsp_sampler.topology_updated_callback()
+        lsp = lsp_sampler()
+
+        TestLSPSumOfSinusoids.d_2d = scenario.distance_2d[0,0].numpy()
+        TestLSPSumOfSinusoids.d_2d_ut = scenario.matrix_ut_distance_2d[0]\
+                                                                    .numpy()
+        TestLSPSumOfSinusoids.samples = {}
+        for name in ('ds', 'asd', 'asa', 'sf', 'k_factor', 'zsa', 'zsd'):
+            TestLSPSumOfSinusoids.samples[name] = np.log10(
+                                        getattr(lsp, name)[:,0,:].numpy())
+
+    def test_sf_dist(self):
+        """Test the distribution of the SF of outdoor UTs"""
+        samples = 10.0*TestLSPSumOfSinusoids.samples['sf'][:,0]
+        mu, std = log10SF_dB('umi', 'los', TestLSPSumOfSinusoids.d_2d[0],
+                             TestLSPSumOfSinusoids.CARRIER_FREQUENCY,
+                             TestLSPSumOfSinusoids.H_BS,
+                             TestLSPSumOfSinusoids.H_UT)
+        D,_ = kstest(samples, norm.cdf, args=(mu, std))
+        self.assertLessEqual(D, TestLSPSumOfSinusoids.MAX_ERR_KS)
+
+    def test_cross_correlation(self):
+        """Test the LSP cross correlation of outdoor UTs"""
+        samples = TestLSPSumOfSinusoids.samples
+        lsp_list = np.stack([samples[name][:,0] for name in
+                             ('ds', 'asd', 'asa', 'sf', 'k_factor', 'zsa',
+                              'zsd')], axis=1)
+        cross_corr_measured = np.corrcoef(lsp_list.T)
+        # As the LSPs have different correlation distances, their cross
+        # correlation is scaled by the coherence of the spatial filters
+        corr_dist = [f('umi', 'los') for f in (corr_dist_ds, corr_dist_asd,
+                                               corr_dist_asa, corr_dist_sf,
+                                               corr_dist_k, corr_dist_zsa,
+                                               corr_dist_zsd)]
+        coherence = np.array([[quad(lambda k, d1=d1, d2=d2:
+                                    d1*d2*k*((1+(d1*k)**2)
+                                             *(1+(d2*k)**2))**(-0.75),
+                                    0, np.inf)[0]
+                               for d2 in corr_dist] for d1 in corr_dist])
+        abs_err = np.abs(cross_corr('umi', 'los')*coherence
+                         - cross_corr_measured)
+        max_err = np.max(abs_err)
+        self.assertLessEqual(max_err, TestLSPSumOfSinusoids.MAX_ERR_CROSS_CORR)
+
+    def test_spatial_correlation(self):
+        """Test the spatial correlation of LSPs"""
+        nb_out = TestLSPSumOfSinusoids.NB_UT//2
+        d_2d_ut = TestLSPSumOfSinusoids.d_2d_ut
+        for name, corr_dist in (('ds', corr_dist_ds),
+                                ('asd', corr_dist_asd),
+                                ('asa', corr_dist_asa),
+                                ('sf', corr_dist_sf),
+                                ('zsa', corr_dist_zsa),
+                                ('zsd', corr_dist_zsd)):
+            c = np.corrcoef(TestLSPSumOfSinusoids.samples[name].T)
+            # Outdoor UTs
+            c_ref = np.exp(-d_2d_ut[:nb_out,:nb_out]/corr_dist('umi', 'los'))
+            max_err = np.max(np.abs(c[:nb_out,:nb_out] - c_ref))
+            self.assertLessEqual(max_err,
+                                 TestLSPSumOfSinusoids.MAX_ERR_SPAT_CORR, name)
+            # Indoor UTs
+            c_ref = np.exp(-d_2d_ut[nb_out:,nb_out:]/corr_dist('umi', 'o2i'))
+            max_err = np.max(np.abs(c[nb_out:,nb_out:] - c_ref))
+            self.assertLessEqual(max_err,
+                                 TestLSPSumOfSinusoids.MAX_ERR_SPAT_CORR, name)
+            # UTs in different states are not correlated
+            max_err = np.max(np.abs(c[:nb_out,nb_out:]))
+            self.assertLessEqual(max_err,
+                                 TestLSPSumOfSinusoids.MAX_ERR_SPAT_CORR, name)
+
+    def test_large_drop(self):
+        """LSPs can be sampled for a large number of UTs"""
+        fc = TestLSPSumOfSinusoids.CARRIER_FREQUENCY
+        nb_ut = 20000
+        bs_array = channel.tr38901.PanelArray(num_rows_per_panel=1,
+                                              num_cols_per_panel=1,
+                                              polarization='single',
+                                              polarization_type='V',
+                                              antenna_pattern='omni',
+                                              carrier_frequency=fc)
+        ut_loc = generate_random_loc(1, nb_ut, (-1000,1000), (-1000,1000),
+                                     (1.5, 1.5))
+        bs_loc = generate_random_loc(1, 3, (-10,10), (-10,10), (25., 25.))
+        scenario = channel.tr38901.UMaScenario(fc, "low", bs_array, bs_array,
+                                               "downlink")
+        lsp_sampler = channel.tr38901.LSPGenerator(
+                                        scenario,
+                                        spatial_correlation_method="sos")
+        scenario.set_topology(ut_loc, bs_loc, tf.zeros([1, nb_ut, 3]),
+                              tf.zeros([1, 3, 3]), tf.zeros([1, nb_ut, 3]),
+                              generate_random_bool(1, nb_ut, 0.5))
+        lsp_sampler.topology_updated_callback()
+        lsp = lsp_sampler()
+        self.assertEqual(lsp.sf.shape, [1, 3, nb_ut])
+        self.assertTrue(np.all(np.isfinite(lsp.sf.numpy())))
@@ -0,0 +1,372 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2021-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0#
+
+import unittest
+import numpy as np
+import tensorflow as tf
+from sionna.phy import config
+from sionna.phy.channel import GenerateOFDMChannel
+from sionna.phy.channel.tr38901 import UMi, PanelArray
+from sionna.phy.ofdm import ResourceGrid
+from sionna.sys import gen_hexgrid_topology
+
+
+class TestSystemLevelChannelLinkPruning(unittest.TestCase):
+    r"""Test the generation of the strongest links only"""
+
+    BATCH_SIZE = 2
+    NUM_UT_PER_SECTOR = 2
+    NUM_TIME_SAMPLES = 3
+    K = 3
+
+    def channel_models(self, direction):
+        bs_array = PanelArray(num_rows_per_panel=2,
+                              num_cols_per_panel=2,
+                              polarization='dual',
+                              polarization_type='VH',
+                              antenna_pattern='38.901',
+                              carrier_frequency=3.5e9)
+        ut_array = PanelArray(num_rows_per_panel=1,
+                              num_cols_per_panel=1,
+                              polarization='single',
+                              polarization_type='V',
+                              antenna_pattern='omni',
+                              carrier_frequency=3.5e9)
+        topology = gen_hexgrid_topology(batch_size=self.BATCH_SIZE,
+                                        num_rings=1,
+                                        num_ut_per_sector=self.NUM_UT_PER_SECTOR,
+                                        scenario='umi')
+        models = []
+        for num_strongest_links in [None, self.K]:
+            model = UMi(carrier_frequency=3.5e9,
+                        o2i_model='low',
+                        ut_array=ut_array,
+                        bs_array=bs_array,
+                        direction=direction,
+                        num_strongest_links=num_strongest_links)
+            config.seed = 1
+            model.set_topology(*topology)
+            models.append(model)
+        return models
+
+    def test_strongest_links(self):
+        """Outputs of the selected links match the full channel model"""
+        for direction in ["downlink", "uplink"]:
+            model_full, model = self.channel_models(direction)
+
+            # Record the large scale gains of the full model
+            gains = []
+            large_scale_gain = model_full._large_scale_gain
+            def record_gain(sf):
+                gains.append(large_scale_gain(sf))
+                return gains[-1]
+            model_full._large_scale_gain = record_gain
+
+            config.seed = 2
+            a_full, tau_full = model_full(self.NUM_TIME_SAMPLES, 1e6)
+            config.seed = 2
+            model.return_rays = True
+            a, tau, rays = model(self.NUM_TIME_SAMPLES, 1e6)
+            link_ind = model.link_ind
+            pl_gain = model.pl_gain
+
+            if direction == "uplink":
+                a_full = tf.transpose(a_full, [0, 3, 4, 1, 2, 5, 6])
+                tau_full = tf.transpose(tau_full, [0, 2, 1, 3])
+                a = tf.transpose(a, [0, 3, 4, 1, 2, 5, 6])
+                tau = tf.transpose(tau, [0, 2, 1, 3])
+                pl_gain = tf.transpose(pl_gain, [0, 2, 1])
+                rays_powers = rays.powers
+            else:
+                rays_powers = tf.transpose(rays.powers, [0, 2, 1, 3])
+            # From here on, UTs are the first dimension after the batch
+            num_bs = a_full.shape[3]
+            num_ut = a_full.shape[1]
+            self.assertEqual(pl_gain.shape,
+                             [self.BATCH_SIZE, num_ut, num_bs])
+            self.assertEqual(link_ind.shape,
+                             [self.BATCH_SIZE, num_ut, self.K])
+            self.assertEqual(a.shape[:3], a_full.shape[:3])
+            self.assertEqual(a.shape[3], self.K)
+            self.assertEqual(a.shape[4:], a_full.shape[4:])
+            # Rays have the layout of the path delays
+            self.assertEqual(rays_powers.shape[:3], tau.shape[:3])
+
+            # The selected links are the strongest ones
+            link_ind = link_ind.numpy()
+            pl_gain = pl_gain.numpy()
+            ref_ind = np.argsort(-pl_gain, axis=-1)[..., :self.K]
+            self.assertTrue(np.array_equal(np.sort(link_ind, axis=-1),
+                                           np.sort(ref_ind, axis=-1)))
+
+            # Delays of the selected links are the ones of the full model
+            tau_ref = np.take_along_axis(tau_full.numpy(),
+                                         link_ind[..., None], axis=2)
+            self.assertTrue(np.allclose(tau, tau_ref))
+
+            # The large scale gains are the ones of the full model
+            # [batch size, num_ut, num_bs]
+            gain_full = np.transpose(np.square(gains[0].numpy()), [0, 2, 1])
+            self.assertTrue(np.allclose(pl_gain, gain_full, rtol=1e-6, atol=0))
+
+            # The selected links have the largest gains of the full model,
+            # sorted by decreasing gain
+            gain_ref = np.take_along_axis(gain_full, link_ind, axis=2)
+            gain_sorted = -np.sort(-gain_full, axis=-1)[..., :self.K]
+            self.assertTrue(np.allclose(gain_ref, gain_sorted,
+                                        rtol=1e-6, atol=0))
+            self.assertTrue(np.allclose(
+                np.take_along_axis(pl_gain, link_ind, axis=2), gain_ref,
+                rtol=1e-6, atol=0))
+
+    def test_strongest_links_ofdm_channel(self):
+        """The model with pruned links can be used by the channel blocks"""
+        for direction in ["downlink", "uplink"]:
+            _, model = self.channel_models(direction)
+            rg = ResourceGrid(num_ofdm_symbols=2,
+                              fft_size=12,
+                              subcarrier_spacing=30e3)
+            h_freq = GenerateOFDMChannel(model, rg)()
+            if direction == "downlink":
+                num_tx = self.K
+                num_rx = model.link_ind.shape[1]
+            else:
+                num_tx = model.link_ind.shape[1]
+                num_rx = self.K
+            self.assertEqual(h_freq.shape, [self.BATCH_SIZE, num_rx,
+                                            h_freq.shape[2], num_tx,
+                                            h_freq.shape[4], 2, 12])
+
+
+class TestSystemLevelChannelSpatialCorrelation(unittest.TestCase):
+    r"""Test the selection of the LSP spatial correlation method"""
+
+    def test_spatial_correlation_method(self):
+        """The spatial correlation method can be set through the model"""
+        array = PanelArray(num_rows_per_panel=1,
+                           num_cols_per_panel=1,
+                           polarization='single',
+                           polarization_type='V',
+                           antenna_pattern='omni',
+                           carrier_frequency=3.5e9)
+        topology = gen_hexgrid_topology(batch_size=2,
+                                        num_rings=1,
+                                        num_ut_per_sector=2,
+                                        scenario='umi')
+        outputs = []
+        for method in ["cholesky", "sos"]:
+            model = UMi(carrier_frequency=3.5e9,
+                        o2i_model='low',
+                        ut_array=array,
+                        bs_array=array,
+                        direction="downlink",
+                        spatial_correlation_method=method)
+            model.set_topology(*topology)
+            outputs.append(model(1, 1.))
+        # Both methods lead to the same shapes of the path coefficients and
+        # delays
+        for x_cholesky, x_sos in zip(*outputs):
+            self.assertEqual(x_cholesky.shape, x_sos.shape)
+            self.assertTrue(np.all(np.isfinite(x_sos.numpy())))
+
+        with self.assertRaises(ValueError):
+            UMi(carrier_frequency=3.5e9,
+                o2i_model='low',
+                ut_array=array,
+                bs_array=array,
+                direction="downlink",
+                spatial_correlation_method="auto")
+
+
+class TestSystemLevelChannelDropMode(unittest.TestCase):
+    r"""Test the temporally continuous channel evolution within a drop"""
+
+    BATCH_SIZE = 2
+    NUM_UT_PER_SECTOR = 2
+    SAMPLING_FREQUENCY = 1e3
+
+    def channel_model(self, drop_mode, direction="downlink",
+                      num_strongest_links=None, enable_pathloss=True):
+        bs_array = PanelArray(num_rows_per_panel=1,
+                              num_cols_per_panel=2,
+                              polarization='dual',
+                              polarization_type='cross',
+                              antenna_pattern='38.901',
+                              carrier_frequency=3.5e9)
+        ut_array = PanelArray(num_rows_per_panel=1,
+                              num_cols_per_panel=1,
+                              polarization='single',
+                              polarization_type='V',
+                              antenna_pattern='omni',
+                              carrier_frequency=3.5e9)
+        config.seed = 1
+        topology = gen_hexgrid_topology(batch_size=self.BATCH_SIZE,
+                                        num_rings=1,
+                                        num_ut_per_sector=self.NUM_UT_PER_SECTOR,
+                                        min_ut_velocity=10.,
+                                        max_ut_velocity=10.,
+                                        scenario='umi')
+        model = UMi(carrier_frequency=3.5e9,
+                    o2i_model='low',
+                    ut_array=ut_array,
+                    bs_array=bs_array,
+                    direction=direction,
+                    enable_pathloss=enable_pathloss,
+                    num_strongest_links=num_strongest_links,
+                    drop_mode=drop_mode)
+        model.set_topology(*topology)
+        return model, topology
+
+    def test_reference(self):
+        """The first call of a drop matches the model without drop mode"""
+        # Pathloss is disabled as the random O2I losses would otherwise be
+        # sampled in a different order
+        h = []
+        for drop_mode in [False, True]:
+            model, _ = self.channel_model(drop_mode, enable_pathloss=False)
+            config.seed = 2
+            if drop_mode:
+                model.new_drop()
+            h.append(model(4, self.SAMPLING_FREQUENCY)[0].numpy())
+        self.assertTrue(np.allclose(h[0], h[1], atol=1e-6))
+
+    def test_continuity(self):
+        """Consecutive calls continue the channel evolution"""
+        for direction, k in [("downlink", None), ("uplink", None),
+                             ("downlink", 3), ("uplink", 3)]:
+            model, _ = self.channel_model(True, direction, k)
+            a_ref, tau_ref = model(6, self.SAMPLING_FREQUENCY)[:2]
+            self.assertAlmostEqual(model.drop_time.numpy(),
+                                   6/self.SAMPLING_FREQUENCY)
+
+            # Restart the drop at time zero and generate it in pieces
+            model.drop_time = 0.
+            a = []
+            for n in [1, 2, 3]:
+                a_, tau = model(n, self.SAMPLING_FREQUENCY)[:2]
+                a.append(a_.numpy())
+                self.assertTrue(np.array_equal(tau.numpy(), tau_ref.numpy()))
+            a = np.concatenate(a, axis=-1)
+            self.assertTrue(np.allclose(a, a_ref.numpy(), atol=1e-6))
+
+            # The channel is not constant over time
+            self.assertFalse(np.allclose(a[...,0], a[...,-1], atol=1e-6))
+
+            # A new drop yields a different channel
+            model.new_drop()
+            self.assertEqual(model.drop_time.numpy(), 0.)
+            a_new = model(6, self.SAMPLING_FREQUENCY)[0]
+            self.assertEqual(a_new.shape, a_ref.shape)
+            self.assertFalse(np.allclose(a_new.numpy(), a_ref.numpy()))
+
+    def test_graph_mode(self):
+        """Drop mode can be used in graph mode"""
+        # Pathloss is disabled as the random O2I losses are sampled again
+        # for every topology
+        model, topology = self.channel_model(True, enable_pathloss=False)
+        # Force LoS states of outdoor UTs to obtain deterministic topologies
+        topology = list(topology)
+        topology[6] = True
+        model.set_topology(*topology)
+
+        @tf.function
+        def run_graph():
+            return model(2, self.SAMPLING_FREQUENCY)[0]
+
+        # The drop is sampled when the topology is set, such that the first
+        # call can be in graph mode and be followed by topology updates and
+        # eager calls
+        a = np.concatenate([run_graph().numpy(), run_graph().numpy()], -1)
+        model.set_topology(*topology)
+        model.drop_time = 0.
+        a_ref = model(4, self.SAMPLING_FREQUENCY)[0].numpy()
+        self.assertTrue(np.allclose(a, a_ref, atol=1e-6))
+
+        # New drops are used by the traced function
+        model.new_drop()
+        a_new = np.concatenate([run_graph().numpy(), run_graph().numpy()], -1)
+        self.assertFalse(np.allclose(a_new, a_ref))
+
+    def test_topology_update(self):
+        """Updating the topology within a drop keeps the rays and phases of
+        the drop and updates the geometry-dependent terms"""
+        # Pathloss is disabled as the random O2I losses are sampled again
+        # for every topology
+        model, topology = self.channel_model(True, enable_pathloss=False)
+        # Force LoS states of outdoor UTs to obtain deterministic topologies
+        topology = list(topology)
+        topology[6] = True
+        model.set_topology(*topology)
+        model.return_rays = True
+        a, _, rays = model(1, self.SAMPLING_FREQUENCY)
+
+        # Move the UTs
+        topology_new = list(topology)
+        topology_new[0] = topology[0] + tf.constant([5., 5., 0.],
+                                                    topology[0].dtype)
+        model.set_topology(*topology_new)
+        # The time of the drop continues
+        self.assertAlmostEqual(model.drop_time.numpy(),
+                               1/self.SAMPLING_FREQUENCY)
+        model.drop_time = 0.
+        a_new, _, rays_new = model(1, self.SAMPLING_FREQUENCY)
+
+        # Rays of the drop are kept
+        self.assertTrue(np.array_equal(rays.powers.numpy(),
+                                       rays_new.powers.numpy()))
+        self.assertTrue(np.array_equal(rays.aoa.numpy(),
+                                       rays_new.aoa.numpy()))
+        # while the channel changes with the geometry
+        self.assertFalse(np.allclose(a.numpy(), a_new.numpy()))
+
+        # Moving back to the initial topology recovers the channel
+        model.set_topology(*topology)
+        model.drop_time = 0.
+        a_back = model(1, self.SAMPLING_FREQUENCY)[0]
+        self.assertTrue(np.allclose(a.numpy(), a_back.numpy(), atol=1e-6))
+
+    def test_topology_update_continuity(self):
+        """The channel evolves continuously across topology updates within a
+        drop"""
+        for direction, k in [("downlink", None), ("uplink", 3)]:
+            for update in ["velocity", "location"]:
+                # Pathloss is disabled as the random O2I losses are sampled
+                # again for every topology
+                model, topology = self.channel_model(True, direction, k,
+                                                     enable_pathloss=False)
+                # Force LoS states of outdoor UTs to obtain deterministic
+                # topologies
+                topology = list(topology)
+                topology[6] = True
+                model.set_topology(*topology)
+                a_ref = model(6, self.SAMPLING_FREQUENCY)[0].numpy()
+
+                # Update the topology after half of the time samples
+                model.drop_time = 0.
+                model(3, self.SAMPLING_FREQUENCY)
+                topology_new = list(topology)
+                if update == "velocity":
+                    topology_new[4] = -topology[4]
+                else:
+                    # The UTs move according to their velocities
+                    topology_new[0] = topology[0] +\
+                        topology[4]*3/self.SAMPLING_FREQUENCY
+                model.set_topology(*topology_new)
+                self.assertAlmostEqual(model.drop_time.numpy(),
+                                       3/self.SAMPLING_FREQUENCY)
+                a = model(3, self.SAMPLING_FREQUENCY)[0].numpy()
+
+                if update == "velocity":
+                    # The phases are continuous at the update, after which
+                    # the channel evolves differently
+                    self.assertTrue(np.allclose(a[...,0], a_ref[...,3],
+                                                atol=1e-5))
+                    self.assertFalse(np.allclose(a[...,-1], a_ref[...,-1],
+                                                 atol=1e-3))
+                else:
+                    # The LoS phase progress due to the displacement is not
+                    # counted twice, such that the channel is the one
+                    # without update up to the small change of the angles
+                    err = np.linalg.norm(a - a_ref[...,3:])
+                    self.assertLess(err/np.linalg.norm(a_ref[...,3:]), 1e-2)
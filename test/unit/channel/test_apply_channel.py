@@ -57,6 +57,35 @@ class TestApplyTimeChannel(unittest.TestCase):
                                     y_ref[b,rx,ra,t] += np.sum(x_[:,:,t-l]*h_[:,:,l])
                 self.assertTrue(np.allclose(y_ref, y, atol=1e-5))
 
+    def test_block_size(self):
+        """Outputs do not depend on the block size"""
+        batch_size = 4
+        num_time_samples = 100
+        l_tot = 7
+        x = config.tf_rng.normal([batch_size, 2, 2, num_time_samples])
+        x = tf.complex(x, x)
+        h_time = config.tf_rng.normal([batch_size, 3, 2, 2, 2,
+                                       num_time_samples+l_tot-1, l_tot])
+        h_time = tf.complex(h_time, h_time)
+        y_ref = ApplyTimeChannel(num_time_samples, l_tot, block_size=None)(
+                                                                x, h_time)
+        for block_size in [1, 5, 16, 105, 106, 1000]:
+            apply = ApplyTimeChannel(num_time_samples, l_tot,
+                                     block_size=block_size)
+            y = apply(x, h_time)
+            self.assertTrue(np.allclose(y_ref, y, atol=1e-5))
+            y = tf.function(apply, jit_compile=True)(x, h_time)
+            self.assertTrue(np.allclose(y_ref, y, atol=1e-5))
+
+        # Automatic block size for long inputs
+        apply = ApplyTimeChannel(30000, 64)
+        self.assertEqual(apply.block_size, 2**18//64)
+        apply = ApplyTimeChannel(num_time_samples, l_tot)
+        self.assertEqual(apply.block_size, num_time_samples+l_tot-1)
+
+        with self.assertRaises(ValueError):
+            ApplyTimeChannel(num_time_samples, l_tot, block_size=0)
+
 class TestApplyOFDMChannel(unittest.TestCase):
 
     def test_apply_ofdm_channel(self):
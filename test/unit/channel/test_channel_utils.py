@@ -6,7 +6,8 @@ import unittest
 import numpy as np
 import tensorflow as tf
 from sionna.phy.channel import exp_corr_mat, one_ring_corr_mat, \
-    cir_to_time_channel, time_to_ofdm_channel, ApplyTimeChannel
+    cir_to_time_channel, time_to_ofdm_channel, ApplyTimeChannel, \
+    cir_to_ofdm_channel, subcarrier_frequencies
 from sionna.phy.channel.tr38901 import TDL
 from sionna.phy.ofdm import ResourceGrid, ResourceGridMapper, OFDMModulator, OFDMDemodulator, LSChannelEstimator
 from sionna.phy.mimo import StreamManagement
@@ -130,3 +131,47 @@ class TestTimeToOFDMChannel(unittest.TestCase):
             for l_min in range(l_max-cyclic_prefix_length, 1):
                 self.assertTrue(run_time_to_ofdm_channel_test(l_min, l_max, cyclic_prefix_length))
 
+class TestCIRToOFDMChannel(unittest.TestCase):
+    def test_against_numpy(self):
+        """Test the frequency response against a Numpy reference for
+           both shapes of tau and different chunk sizes
+        """
+        fft_size = 36
+        frequencies = subcarrier_frequencies(fft_size, 30e3,
+                                             precision="double")
+        shape = [2, 3, 4, 2, 2, 10, 5]
+        a = config.np_rng.normal(size=shape) \
+            + 1j*config.np_rng.normal(size=shape)
+        for tau_shape in [[2, 3, 2, 10], [2, 3, 4, 2, 2, 10]]:
+            tau = config.np_rng.uniform(0, 1e-6, size=tau_shape)
+            if len(tau_shape)==4:
+                tau_ = tau[:, :, None, :, None]
+            else:
+                tau_ = tau
+            e = np.exp(-2j*np.pi*frequencies.numpy()*tau_[..., None])
+            h_ref = np.sum(a[..., None]*e[..., None, :], axis=-3)
+            for chunk_size in [None, 1, 7, fft_size, 2*fft_size]:
+                h_f = cir_to_ofdm_channel(frequencies,
+                                          tf.constant(a),
+                                          tf.constant(tau),
+                                          chunk_size=chunk_size)
+                self.assertTrue(np.allclose(h_f, h_ref))
+
+                h_f = cir_to_ofdm_channel(frequencies,
+                                          tf.constant(a),
+                                          tf.constant(tau),
+                                          normalize=True,
+                                          chunk_size=chunk_size)
+                c = np.mean(np.abs(h_ref)**2, axis=(2, 4, 5, 6),
+                            keepdims=True)
+                self.assertTrue(np.allclose(h_f, h_ref/np.sqrt(c)))
+
+    def test_invalid_chunk_size(self):
+        """Test that invalid chunk sizes raise an error"""
+        frequencies = subcarrier_frequencies(12, 30e3)
+        a = tf.zeros([1, 1, 1, 1, 1, 2, 1], tf.complex64)
+        tau = tf.zeros([1, 1, 1, 2])
+        with self.assertRaises(ValueError):
+            cir_to_ofdm_channel(frequencies, a, tau, chunk_size=0)
+        with self.assertRaises(TypeError):
+            cir_to_ofdm_channel(frequencies, a, tau, chunk_size=2.)
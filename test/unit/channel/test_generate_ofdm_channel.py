@@ -0,0 +1,108 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2021-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0#
+import unittest
+import numpy as np
+import tensorflow as tf
+from sionna.phy import config
+from sionna.phy.channel import GenerateOFDMChannel, RayleighBlockFading, \
+                               ChannelModel, OFDMChannel, \
+                               subcarrier_frequencies
+from sionna.phy.channel.tr38901 import TDL
+from sionna.phy.ofdm import ResourceGrid
+
+
+class TestGenerateOFDMChannel(unittest.TestCase):
+    """Tests for the GenerateOFDMChannel class"""
+
+    BATCH_SIZE = 8
+
+    def setUp(self):
+        self.rg = ResourceGrid(num_ofdm_symbols=14,
+                               fft_size=72,
+                               subcarrier_spacing=30e3,
+                               num_guard_carriers=(5, 6),
+                               dc_null=True)
+
+    def test_subcarrier_ind(self):
+        """Frequency responses on a subset of subcarriers match the
+        corresponding subcarriers of the full frequency responses"""
+        model = TDL("A", 100e-9, 3.5e9, min_speed=10., num_rx_ant=2,
+                    num_tx_ant=4)
+        gen_full = GenerateOFDMChannel(model, self.rg)
+        config.seed = 1
+        h_full = gen_full(self.BATCH_SIZE).numpy()
+        self.assertEqual(h_full.shape[-1], self.rg.fft_size)
+
+        ind_alloc = np.arange(24, 36)
+        for subcarrier_ind, ind in [("effective",
+                                     self.rg.effective_subcarrier_ind),
+                                    (ind_alloc, ind_alloc)]:
+            gen = GenerateOFDMChannel(model, self.rg,
+                                      subcarrier_ind=subcarrier_ind)
+            config.seed = 1
+            h = gen(self.BATCH_SIZE).numpy()
+            self.assertEqual(h.shape[-1], len(ind))
+            self.assertTrue(np.allclose(h, h_full[..., ind], atol=1e-5))
+
+        # Normalization is performed over the selected subcarriers
+        gen = GenerateOFDMChannel(model, self.rg, normalize_channel=True,
+                                  subcarrier_ind=ind_alloc)
+        h = gen(self.BATCH_SIZE).numpy()
+        e = np.mean(np.abs(h)**2, axis=(2, 4, 5, 6))
+        self.assertTrue(np.allclose(e, 1., atol=1e-5))
+
+        with self.assertRaises(ValueError):
+            GenerateOFDMChannel(model, self.rg, subcarrier_ind="guard")
+        for subcarrier_ind in [[[0, 1]], [-1, 2], [0, self.rg.fft_size]]:
+            with self.assertRaises(ValueError):
+                GenerateOFDMChannel(model, self.rg,
+                                    subcarrier_ind=subcarrier_ind)
+
+    def test_rayleigh_frequency_response(self):
+        """The frequency response of RayleighBlockFading matches the one
+        computed from the channel impulse response"""
+        model = RayleighBlockFading(num_rx=2, num_rx_ant=2, num_tx=3,
+                                    num_tx_ant=4)
+        frequencies = subcarrier_frequencies(self.rg.fft_size,
+                                             self.rg.subcarrier_spacing)
+        config.seed = 2
+        h = model.frequency_response(self.BATCH_SIZE, 14, 1., frequencies)
+        config.seed = 2
+        h_ref = ChannelModel.frequency_response(model, self.BATCH_SIZE, 14, 1.,
+                                                frequencies)
+        self.assertEqual(h.shape, h_ref.shape)
+        self.assertTrue(np.allclose(h.numpy(), h_ref.numpy()))
+
+    def test_non_channel_model(self):
+        """Callables that are not a ChannelModel can still be used"""
+        model = RayleighBlockFading(num_rx=1, num_rx_ant=2, num_tx=1,
+                                    num_tx_ant=2)
+        gen = GenerateOFDMChannel(model, self.rg, subcarrier_ind="effective")
+        gen_fn = GenerateOFDMChannel(lambda *args: model(*args), self.rg,
+                                     subcarrier_ind="effective")
+        config.seed = 3
+        h = gen(self.BATCH_SIZE)
+        config.seed = 3
+        h_fn = gen_fn(self.BATCH_SIZE)
+        self.assertTrue(np.allclose(h.numpy(), h_fn.numpy()))
+
+        @tf.function(jit_compile=True)
+        def run_graph(batch_size):
+            return gen(batch_size)
+        self.assertEqual(run_graph(self.BATCH_SIZE).shape[-1],
+                         self.rg.num_effective_subcarriers)
+
+    def test_positional_precision(self):
+        """The precision can be provided as positional argument"""
+        model = RayleighBlockFading(num_rx=1, num_rx_ant=2, num_tx=1,
+                                    num_tx_ant=2, precision="double")
+        gen = GenerateOFDMChannel(model, self.rg, False, "double")
+        self.assertEqual(gen(self.BATCH_SIZE).dtype, tf.complex128)
+
+        channel = OFDMChannel(model, self.rg, False, True, "double")
+        x = tf.zeros([self.BATCH_SIZE, 1, 2, self.rg.num_ofdm_symbols,
+                      self.rg.fft_size], tf.complex128)
+        y, h = channel(x, 0.1)
+        self.assertEqual(y.dtype, tf.complex128)
+        self.assertEqual(h.dtype, tf.complex128)
@@ -219,3 +219,53 @@ class TestCRC(unittest.TestCase):
                     self.assertTrue(u.dtype==dt_in)
                     self.assertTrue(x.dtype==dt_enc)
                     self.assertTrue(y.dtype==dt_dec)
+
+    def test_packed_method(self):
+        """Test that the packed method is bit-exact with the matrix method
+        and validates codewords in graph and XLA mode."""
+
+        shapes = [[1, 1], [10, 7], [4, 3, 100], [2, 8448]]
+        source = BinarySource()
+
+        for pol in VALID_POLS:
+            crc_enc_ref = CRCEncoder(pol)
+            crc_dec_ref = CRCDecoder(crc_enc_ref)
+            crc_enc = CRCEncoder(pol, method="packed")
+            crc_dec = CRCDecoder(crc_enc)
+            self.assertEqual(crc_enc.method, "packed")
+
+            @tf.function(jit_compile=True)
+            def run_xla(u):
+                x = crc_enc(u)
+                return x, crc_dec(x)
+
+            for s in shapes:
+                u = source(s)
+                x_ref = crc_enc_ref(u)
+                for fun in [crc_enc, run_xla]:
+                    x = fun(u)
+                    if isinstance(x, tuple):
+                        x = x[0]
+                    self.assertTrue(np.array_equal(x.numpy(), x_ref.numpy()))
+                self.assertEqual(crc_enc.k, s[-1])
+                self.assertEqual(crc_enc.n, s[-1]+crc_enc.crc_length)
+
+                # valid codewords
+                u_hat, crc_valid = crc_dec(x_ref)
+                self.assertTrue(np.array_equal(u_hat.numpy(), u.numpy()))
+                self.assertTrue(np.all(crc_valid.numpy()))
+                self.assertEqual(crc_valid.shape, s[:-1] + [1])
+
+                # single bit errors are always detected
+                e = tf.one_hot(config.tf_rng.uniform(s[:-1], maxval=x.shape[-1],
+                                                     dtype=tf.int32),
+                               x.shape[-1])
+                x_err = tf.math.mod(x_ref + e, 2)
+                _, crc_valid = crc_dec(x_err)
+                _, crc_valid_ref = crc_dec_ref(x_err)
+                self.assertFalse(np.any(crc_valid.numpy()))
+                self.assertTrue(np.array_equal(crc_valid.numpy(),
+                                               crc_valid_ref.numpy()))
+
+        with self.assertRaises(ValueError):
+            CRCEncoder("CRC24A", method="lut")
@@ -1038,3 +1038,339 @@ def test_rate_matching_5g(parameters, batch_size=100):
     # check if return after 0 iterations equals input
     c_hat = dec(llr)
     assert np.array_equal(c_hat.numpy(), llr.numpy())
+
+@pytest.mark.parametrize("compact_batch", [False, True])
+@pytest.mark.parametrize("mode", ["eager", "graph", "xla"])
+def test_early_stop_5g(compact_batch, mode, k=400, n=800, batch_size=50):
+    """Test that syndrome-based early stopping yields valid codewords and
+    returns the number of iterations per codeword."""
+
+    if compact_batch and mode=="xla":
+        pytest.skip("XLA does not support batch compaction.")
+
+    source = BinarySource()
+    channel = AWGN()
+    encoder = LDPC5GEncoder(k, n)
+    decoder = LDPC5GDecoder(encoder,
+                            num_iter=20,
+                            return_infobits=False,
+                            early_stop=True,
+                            compact_batch=compact_batch,
+                            return_num_iter=True)
+    decoder_ref = LDPC5GDecoder(encoder,
+                                num_iter=20,
+                                return_infobits=False,
+                                return_num_iter=True)
+
+    def run(batch_size, no):
+        bits = source([batch_size, 2, k])
+        c = encoder(bits)
+        y = channel(tf.cast(2*c-1, tf.complex64), no)
+        llr_ch = tf.math.real(2/no * y)
+        return c, decoder(llr_ch), decoder_ref(llr_ch)
+
+    if mode=="graph":
+        run = tf.function(run)
+    elif mode=="xla":
+        run = tf.function(run, jit_compile=True)
+
+    # medium SNR; most codewords converge after a few iterations
+    c, (c_hat, num_iter), (c_hat_ref, num_iter_ref) = run(batch_size, 0.5)
+    assert num_iter.shape==[batch_size, 2]
+    assert np.all(num_iter_ref.numpy()==20)
+    assert np.all(num_iter.numpy()<=20)
+    assert np.mean(num_iter.numpy())<20
+    # converged codewords are correctly decoded
+    converged = num_iter.numpy()<20
+    assert np.array_equal(c.numpy()[converged], c_hat.numpy()[converged])
+    assert np.array_equal(c_hat.numpy(), c_hat_ref.numpy())
+
+    # low SNR; some codewords do not converge
+    c, (c_hat, num_iter), _ = run(batch_size, 5.)
+    assert np.any(num_iter.numpy()==20)
+    assert c_hat.shape==c.shape
+
+@pytest.mark.parametrize("num_iter", [0, 1, 10])
+def test_early_stop_state(num_iter, pcm_id=2, batch_size=10):
+    """Test that early stopping returns consistent states and the
+    compacted batch yields the same results as the masked decoder."""
+
+    pcm, k, n, _ = load_parity_check_examples(pcm_id=pcm_id)
+    source = GaussianPriorSource()
+    llr_ch = source([batch_size, n], 1.5)
+
+    outputs = []
+    for compact_batch in [False, True]:
+        dec = LDPCBPDecoder(pcm,
+                            num_iter=num_iter,
+                            hard_out=False,
+                            return_state=True,
+                            early_stop=True,
+                            compact_batch=compact_batch,
+                            return_num_iter=True)
+        outputs.append(dec(llr_ch))
+
+    for x, y in zip(*outputs):
+        assert np.allclose(x.numpy(), y.numpy())
+    assert outputs[0][1].shape==[dec.num_edges, batch_size]
+    assert np.all(outputs[0][2].numpy()<=num_iter)
+
+def test_early_stop_invalid_args(k=100, n=200):
+    """Test that invalid early stopping parameters raise an error."""
+
+    pcm, _, _, _ = load_parity_check_examples(pcm_id=2)
+    encoder = LDPC5GEncoder(k, n)
+    for dec in [lambda **kwargs: LDPCBPDecoder(pcm, **kwargs),
+                lambda **kwargs: LDPC5GDecoder(encoder, **kwargs)]:
+        # batch compaction requires early stopping
+        with pytest.raises(ValueError):
+            dec(compact_batch=True)
+        with pytest.raises(ValueError):
+            dec(early_stop=False, compact_batch=True)
+        for arg in ["early_stop", "compact_batch", "return_num_iter"]:
+            with pytest.raises(TypeError):
+                dec(**{arg: 1})
+
+@pytest.mark.parametrize("cn_update", CN_UPDATES + ["identity"])
+@pytest.mark.parametrize("pcm_id", [0, 2, 3])
+@pytest.mark.parametrize("prec", ["single", "double"])
+def test_dense_layout(cn_update, pcm_id, prec, num_iter=10, batch_size=10):
+    """Test that the dense edge layout yields the same results as the ragged
+    layout."""
+
+    pcm, _, n, _ = load_parity_check_examples(pcm_id=pcm_id)
+    source = GaussianPriorSource(precision=prec)
+    llr_ch = source([batch_size, n], 1.)
+
+    outputs = []
+    for edge_layout in ["ragged", "dense"]:
+        dec = LDPCBPDecoder(pcm,
+                            cn_update=cn_update,
+                            num_iter=num_iter,
+                            hard_out=False,
+                            return_state=True,
+                            edge_layout=edge_layout,
+                            precision=prec)
+        outputs.append(dec(llr_ch))
+
+    for x, y in zip(*outputs):
+        assert np.allclose(x.numpy(), y.numpy(), atol=1e-4)
+
+@pytest.mark.parametrize("cn_update", CN_UPDATES)
+@pytest.mark.parametrize("cn_schedule", ["flooding", "layered"])
+def test_dense_layout_5g_xla(cn_update, cn_schedule, k=100, n=200,
+                             batch_size=10):
+    """Test that the dense edge layout supports XLA for all CN updates and
+    yields the same results as the ragged layout."""
+
+    source = BinarySource()
+    encoder = LDPC5GEncoder(k, n)
+    dec_ref = LDPC5GDecoder(encoder,
+                            cn_update=cn_update,
+                            cn_schedule=cn_schedule,
+                            hard_out=False)
+    dec = LDPC5GDecoder(encoder,
+                        cn_update=cn_update,
+                        cn_schedule=cn_schedule,
+                        hard_out=False,
+                        edge_layout="dense")
+
+    @tf.function(jit_compile=True)
+    def run_xla(llr_ch):
+        return dec(llr_ch)
+
+    c = encoder(source([batch_size, k]))
+    llr_ch = 2*(2*c-1) + config.tf_rng.normal([batch_size, n])
+    y_ref = dec_ref(llr_ch)
+    y = run_xla(llr_ch)
+    assert np.allclose(y_ref.numpy(), y.numpy(), atol=1e-4)
+
+def test_dense_layout_invalid(pcm_id=0):
+    """Test that unsupported options raise an error."""
+    pcm, _, _, _ = load_parity_check_examples(pcm_id=pcm_id)
+    with pytest.raises(ValueError):
+        LDPCBPDecoder(pcm, edge_layout="dense", cn_update=cn_update_phi)
+    with pytest.raises(ValueError):
+        LDPCBPDecoder(pcm, edge_layout="dense",
+                      c2v_callbacks=[lambda x, it: x])
+    with pytest.raises(ValueError):
+        LDPCBPDecoder(pcm, edge_layout="sparse")
+
+@pytest.mark.parametrize("cn_update", CN_UPDATES)
+@pytest.mark.parametrize("parameters", [(100, 200, None, True),
+                                        (500, 600, 4, True),
+                                        (2000, 6000, None, False),
+                                        (4000, 6000, 2, True)])
+@pytest.mark.parametrize("mode", ["eager", "xla"])
+def test_qc_layout_5g(cn_update, parameters, mode, batch_size=10):
+    """Test that the quasi-cyclic edge layout yields the same results as the
+    ragged layout."""
+
+    k, n, num_bits_per_symbol, prune_pcm = parameters
+    source = BinarySource()
+    encoder = LDPC5GEncoder(k, n, num_bits_per_symbol=num_bits_per_symbol)
+    dec_ref = LDPC5GDecoder(encoder,
+                            cn_update=cn_update,
+                            prune_pcm=prune_pcm,
+                            hard_out=False,
+                            return_infobits=False,
+                            num_iter=10,
+                            precision="double")
+    dec = LDPC5GDecoder(encoder,
+                        cn_update=cn_update,
+                        prune_pcm=prune_pcm,
+                        hard_out=False,
+                        return_infobits=False,
+                        num_iter=10,
+                        edge_layout="qc",
+                        precision="double")
+    # the number of pruned nodes is quantized to a multiple of z
+    assert dec._n_pruned%encoder.z==0
+
+    run = dec
+    if mode=="xla":
+        run = tf.function(dec, jit_compile=True)
+
+    c = encoder(source([batch_size, k]))
+    llr_ch = 2*(2*c-1) + 1.5*config.tf_rng.normal([batch_size, n])
+    # the boxplus updates are numerically sensitive to the summation order
+    llr_ch = tf.cast(llr_ch, tf.float64)
+    y_ref = dec_ref(llr_ch)
+    y = run(llr_ch)
+    assert np.allclose(y_ref.numpy(), y.numpy(), atol=1e-4)
+
+@pytest.mark.parametrize("num_iter", [1, 10])
+def test_qc_layout_internal_state_5g(num_iter, k=50, n=100, batch_size=10):
+    """Test that the decoder state of the quasi-cyclic layout can be used to
+    continue decoding."""
+
+    source = GaussianPriorSource()
+    encoder = LDPC5GEncoder(k, n)
+    dec = LDPC5GDecoder(encoder,
+                        num_iter=num_iter,
+                        hard_out=False,
+                        return_state=True,
+                        edge_layout="qc")
+    llr_ch = source([batch_size, n], 1.)
+
+    y_ref, msg_ref = dec(llr_ch)
+    dec.num_iter = 1
+    msg = None
+    for _ in range(num_iter):
+        y, msg = dec(llr_ch, msg_v2c=msg)
+    assert np.allclose(y_ref.numpy(), y.numpy(), atol=1e-4)
+    assert np.allclose(msg_ref.numpy(), msg.numpy(), atol=1e-4)
+    assert msg.shape==[dec.num_edges, batch_size]
+
+def test_qc_layout_invalid(k=50, n=100):
+    """Test that unsupported options raise an error."""
+    encoder = LDPC5GEncoder(k, n)
+    with pytest.raises(ValueError):
+        LDPC5GDecoder(encoder, edge_layout="qc", vn_update="identity")
+    with pytest.raises(ValueError):
+        LDPC5GDecoder(encoder, edge_layout="qc",
+                      v2c_callbacks=[lambda x, it, x_hat: x])
+
+@pytest.mark.parametrize("cn_update", CN_UPDATES)
+@pytest.mark.parametrize("parameters", [(100, 200, True),
+                                        (2000, 6000, False),
+                                        (4000, 6000, True)])
+def test_qc_layered_xla(cn_update, parameters, batch_size=10):
+    """Test that the layered schedule of the quasi-cyclic layout yields the
+    same results in eager and XLA mode."""
+
+    k, n, prune_pcm = parameters
+    source = BinarySource()
+    encoder = LDPC5GEncoder(k, n)
+    dec = LDPC5GDecoder(encoder,
+                        cn_update=cn_update,
+                        cn_schedule="layered",
+                        edge_layout="qc",
+                        prune_pcm=prune_pcm,
+                        hard_out=False,
+                        num_iter=5,
+                        precision="double")
+    run_xla = tf.function(dec, jit_compile=True)
+
+    c = encoder(source([batch_size, k]))
+    llr_ch = 2*(2*c-1) + 1.5*config.tf_rng.normal([batch_size, n])
+    llr_ch = tf.cast(llr_ch, tf.float64)
+    assert np.allclose(dec(llr_ch).numpy(), run_xla(llr_ch).numpy(),
+                       atol=1e-4)
+
+def test_qc_layered_reference(k=100, n=200, batch_size=4, num_iter=3):
+    """Test the layered schedule of the quasi-cyclic layout against a
+    NumPy reference of row-serial layered min-sum decoding."""
+
+    encoder = LDPC5GEncoder(k, n)
+    dec = LDPC5GDecoder(encoder,
+                        cn_update="minsum",
+                        cn_schedule="layered",
+                        edge_layout="qc",
+                        precision="double")
+    pcm = dec._pcm
+    if sp.sparse.issparse(pcm):
+        pcm = pcm.toarray()
+    num_cns, num_vns = pcm.shape
+    llr_max = dec.llr_max.numpy()
+
+    llr_ch = 3*config.np_rng.normal(size=[num_vns, batch_size])
+
+    # decoder engine
+    msg = tf.zeros([dec.num_edges, batch_size], tf.float64)
+    x_hat = tf.constant(llr_ch)
+    for _ in range(num_iter):
+        _, msg, _, x_hat, _, _ = dec._bp_iter_qc_layered(msg, msg, llr_ch,
+                                                         x_hat, 0, num_iter)
+
+    # reference; the CNs are updated one after the other
+    x_ref = llr_ch.copy()
+    msg_c2v = np.zeros([num_cns, num_vns, batch_size])
+    for _ in range(num_iter):
+        for cn in range(num_cns):
+            vns = np.where(pcm[cn])[0]
+            q = np.clip(x_ref[vns] - msg_c2v[cn, vns], -llr_max, llr_max)
+            for i, vn in enumerate(vns):
+                others = np.delete(q, i, axis=0)
+                sign = np.prod(np.where(others<0, -1., 1.), axis=0)
+                msg_c2v[cn, vn] = np.clip(sign*np.min(np.abs(others), axis=0),
+                                          -llr_max, llr_max)
+            x_ref[vns] = np.clip(q + msg_c2v[cn, vns], -llr_max, llr_max)
+
+    assert np.allclose(x_hat.numpy(), x_ref)
+
+def test_qc_layered_convergence(k=400, n=800, batch_size=200):
+    """Test that the layered schedule requires less iterations than
+    flooding."""
+
+    source = BinarySource()
+    encoder = LDPC5GEncoder(k, n)
+    c = encoder(source([batch_size, k]))
+    llr_ch = 2*(2*c-1) + 1.2*config.tf_rng.normal([batch_size, n])
+
+    num_iter = {}
+    for cn_schedule in ("flooding", "layered"):
+        dec = LDPC5GDecoder(encoder,
+                            cn_schedule=cn_schedule,
+                            edge_layout="qc",
+                            return_infobits=False,
+                            num_iter=50,
+                            early_stop=True,
+                            return_num_iter=True)
+        c_hat, it = dec(llr_ch)
+        num_iter[cn_schedule] = np.mean(it.numpy())
+        # all codewords are decoded correctly at this SNR
+        assert np.array_equal(c.numpy(), c_hat.numpy())
+
+    assert num_iter["layered"] < 0.75*num_iter["flooding"]
+
+def test_qc_layered_invalid(k=50, n=100):
+    """Test that the decoder state is not supported by the layered schedule
+    of the quasi-cyclic layout."""
+    encoder = LDPC5GEncoder(k, n)
+    with pytest.raises(ValueError):
+        LDPC5GDecoder(encoder, edge_layout="qc", cn_schedule="layered",
+                      return_state=True)
+    dec = LDPC5GDecoder(encoder, edge_layout="qc", cn_schedule="layered")
+    with pytest.raises(ValueError):
+        dec(tf.zeros([1, n]), msg_v2c=tf.zeros([dec.num_edges, 1]))
@@ -235,6 +235,41 @@ class TestPolarDecodingSC(unittest.TestCase):
             # the output should be equal to the reference
             self.assertTrue(np.array_equal(u_hat_tf, u_hat))
 
+    def test_use_loop(self):
+        """Test that the loop-based decoder yields the same results as the
+        unrolled decoder (also in graph mode and with XLA)."""
+
+        bs = 20
+        source = BinarySource()
+        for k, n in [[1, 32], [12, 32], [60, 128], [100, 256]]:
+            frozen_pos, _ = generate_5g_ranking(k, n)
+            enc = PolarEncoder(frozen_pos, n)
+            c = enc(source([bs, k]))
+            llr_ch = 2.*(2.*c-1) + 1.5*tf.random.normal([bs, n])
+
+            dec_ref = PolarSCDecoder(frozen_pos, n)
+            dec = PolarSCDecoder(frozen_pos, n, use_loop=True)
+            u_ref = dec_ref(llr_ch).numpy()
+            self.assertTrue(np.array_equal(u_ref, dec(llr_ch).numpy()))
+            u_hat = tf.function(dec)(llr_ch).numpy()
+            self.assertTrue(np.array_equal(u_ref, u_hat))
+            u_hat = tf.function(dec, jit_compile=True)(llr_ch).numpy()
+            self.assertTrue(np.array_equal(u_ref, u_hat))
+
+        # test against pre-calculated reference results
+        ref_path = test_dir + '/codes/polar/'
+        for f in ["P_128_37", "P_128_110", "P_256_128"]:
+            A = np.load(ref_path + f + "_Avec.npy")
+            llr_ch = np.load(ref_path + f + "_Lch.npy")
+            u_hat = np.load(ref_path + f + "_uhat.npy")
+            frozen_pos = np.array(np.where(A==0)[0])
+            dec = PolarSCDecoder(frozen_pos, len(A), use_loop=True)
+            u_hat_tf = dec(tf.constant(-1. * llr_ch, tf.float32)).numpy()
+            self.assertTrue(np.array_equal(u_hat_tf, u_hat))
+
+        with self.assertRaises(TypeError):
+            PolarSCDecoder(frozen_pos, n, use_loop=1)
+
     def test_dtype_flexible(self):
         """Test that output_dtype can be flexible."""
 
@@ -627,6 +662,72 @@ class TestPolarDecodingSCL(unittest.TestCase):
             u = source([bs+1, n])
             x = run_graph(u).numpy()
 
+    # Filter warnings related to large resource allocation
+    @pytest.mark.filterwarnings("ignore: Required resource allocation")
+    def test_num_workers(self):
+        """Test that splitting the batch across several threads yields the
+        same results as the TF decoder."""
+
+        bs = 20
+        n = 64
+        k = 32
+        list_size = 8
+
+        frozen_pos, _ = generate_5g_ranking(k, n)
+        source = BinarySource()
+        enc = PolarEncoder(frozen_pos, n)
+        c = enc(source([bs, k]))
+        llr_ch = 2.*(2.*c-1) + 1.5*tf.random.normal([bs, n])
+
+        for use_fast_scl in [False, True]:
+            dec_ref = PolarSCLDecoder(frozen_pos, n, list_size=list_size,
+                                      use_fast_scl=use_fast_scl)
+            u_ref = dec_ref(llr_ch).numpy()
+            for num_workers in [1, 3, 32]:
+                dec = PolarSCLDecoder(frozen_pos, n, list_size=list_size,
+                                      use_fast_scl=use_fast_scl,
+                                      cpu_only=True,
+                                      num_workers=num_workers)
+                u_hat = dec(llr_ch).numpy()
+                self.assertTrue(np.array_equal(u_ref, u_hat))
+
+        with self.assertRaises(ValueError):
+            PolarSCLDecoder(frozen_pos, n, cpu_only=True, num_workers=0)
+        with self.assertRaises(TypeError):
+            PolarSCLDecoder(frozen_pos, n, cpu_only=True, num_workers=2.)
+
+    def test_use_loop(self):
+        """Test that the loop-based decoder yields the same results as the
+        unrolled decoder (also in graph mode and with XLA)."""
+
+        bs = 20
+        source = BinarySource()
+        for k, n, list_size, crc_degree in [[12, 32, 4, None],
+                                            [40, 64, 8, "CRC11"],
+                                            [60, 128, 2, None]]:
+            frozen_pos, _ = generate_5g_ranking(k, n)
+            enc = PolarEncoder(frozen_pos, n)
+            c = enc(source([bs, k]))
+            llr_ch = 2.*(2.*c-1) + 1.5*tf.random.normal([bs, n])
+
+            for use_fast_scl in [False, True]:
+                dec_ref = PolarSCLDecoder(frozen_pos, n, list_size=list_size,
+                                          crc_degree=crc_degree,
+                                          use_fast_scl=use_fast_scl)
+                dec = PolarSCLDecoder(frozen_pos, n, list_size=list_size,
+                                      crc_degree=crc_degree,
+                                      use_fast_scl=use_fast_scl,
+                                      use_loop=True)
+                u_ref = dec_ref(llr_ch).numpy()
+                self.assertTrue(np.array_equal(u_ref, dec(llr_ch).numpy()))
+                u_hat = tf.function(dec)(llr_ch).numpy()
+                self.assertTrue(np.array_equal(u_ref, u_hat))
+                u_hat = tf.function(dec, jit_compile=True)(llr_ch).numpy()
+                self.assertTrue(np.array_equal(u_ref, u_hat))
+
+        with self.assertRaises(TypeError):
+            PolarSCLDecoder(frozen_pos, n, use_loop=1)
+
     def test_dtype_flexible(self):
         """Test that output_dtype is variable."""
 
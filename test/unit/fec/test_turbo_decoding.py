@@ -9,6 +9,7 @@ import numpy as np
 import tensorflow as tf
 from sionna.phy import config
 from sionna.phy.fec.turbo import TurboEncoder, TurboDecoder
+from sionna.phy.fec.crc import CRCEncoder, CRCDecoder
 from sionna.phy.fec.utils import GaussianPriorSource
 from sionna.phy.utils import sim_ber, ebnodb2no
 from sionna.phy.channel import AWGN
@@ -298,3 +299,69 @@ class TestTurboDecoding(unittest.TestCase):
             return u_hat
 
         run_graph(tf.constant(1))
+
+    def test_early_stop(self):
+        """Test the early stopping criteria and the compacted batch mode."""
+        bs = 20
+        k = 104
+        num_iter = 8
+
+        crc_enc = CRCEncoder("CRC16")
+        crc_dec = CRCDecoder(crc_enc)
+        enc = TurboEncoder(constraint_length=4, rate=1/3, terminate=True)
+
+        u = crc_enc(BinarySource()([bs, k]))
+        cw = enc(u)
+        llr_ch = 2. * (2. * cw - 1)
+        llr_ch += config.np_rng.normal(size=cw.shape, scale=1.2)
+
+        # default mode runs all iterations
+        dec = TurboDecoder(enc, num_iter=num_iter, return_num_iter=True)
+        u_ref, it = dec(llr_ch)
+        self.assertTrue(np.all(it.numpy()==num_iter))
+
+        for criterion in ["crc", "sign", "cross_entropy"]:
+            decs = [TurboDecoder(enc, num_iter=num_iter, early_stop=criterion,
+                                 crc_decoder=crc_dec, return_num_iter=True,
+                                 compact_batch=compact)
+                    for compact in [False, True]]
+            u_hat, it = decs[0](llr_ch)
+            it = it.numpy()
+            self.assertEqual(it.shape, (bs,))
+            self.assertTrue(np.all(it>=1))
+            self.assertTrue(np.all(it<=num_iter))
+            # decoding converges early at this SNR
+            self.assertTrue(np.mean(it)<num_iter)
+
+            # codewords that were decoded with all iterations are unchanged
+            idx = it==num_iter
+            self.assertTrue(np.array_equal(u_hat.numpy()[idx],
+                                           u_ref.numpy()[idx]))
+            if criterion=="crc":
+                # CRC only stops for correctly decoded codewords
+                _, crc_valid = crc_dec(u_hat)
+                crc_valid = crc_valid.numpy()[:,0]
+                self.assertTrue(np.all(crc_valid[it<num_iter]))
+
+            # compacting the batch yields the same results
+            u_hat_c, it_c = decs[1](llr_ch)
+            self.assertTrue(np.array_equal(u_hat.numpy(), u_hat_c.numpy()))
+            self.assertTrue(np.array_equal(it, it_c.numpy()))
+
+            # and both modes can be used in graph mode
+            for dec, xla in zip(decs, [True, False]):
+                @tf.function(jit_compile=xla)
+                def run_graph(llr):
+                    return dec(llr)
+                u_hat_g, it_g = run_graph(llr_ch)
+                self.assertTrue(np.array_equal(u_hat.numpy(),
+                                               u_hat_g.numpy()))
+                self.assertTrue(np.array_equal(it, it_g.numpy()))
+
+        # invalid configurations
+        with self.assertRaises(ValueError):
+            TurboDecoder(enc, early_stop="syndrome")
+        with self.assertRaises(TypeError):
+            TurboDecoder(enc, early_stop="crc")
+        with self.assertRaises(ValueError):
+            TurboDecoder(enc, compact_batch=True)
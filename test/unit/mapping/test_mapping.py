@@ -294,6 +294,44 @@ class TestDemapper(unittest.TestCase):
         self.assertEqual(run(100).shape, [100, 3, 400])
         self.assertEqual(run(400).shape, [400, 3, 400])
 
+    def test_separable_qam(self):
+        "Separable QAM demapping matches demapping over all points"
+        for num_bits_per_symbol in [2, 8, 10]:
+            c = Constellation("qam", num_bits_per_symbol)
+            c_full = Constellation("custom", num_bits_per_symbol,
+                                   points=c.points)
+            m = Mapper(constellation=c)
+            b = config.tf_rng.uniform([4, 50*num_bits_per_symbol],
+                                      minval=0, maxval=2, dtype=tf.int32)
+            x = m(b)
+            no = config.tf_rng.uniform(x.shape, minval=0.01, maxval=1.)
+            y = AWGN()(x, no)
+            for prior in [None,
+                          config.tf_rng.normal([num_bits_per_symbol]),
+                          config.tf_rng.normal([4, 50, num_bits_per_symbol])]:
+                for method in ["app", "maxlog"]:
+                    for hard_out in [False, True]:
+                        d = Demapper(method, constellation=c,
+                                     hard_out=hard_out)
+                        d_full = Demapper(method, constellation=c_full,
+                                          hard_out=hard_out)
+                        llr = d(y, no, prior)
+                        llr_full = d_full(y, no, prior)
+                        self.assertEqual(llr.shape, llr_full.shape)
+                        self.assertTrue(np.allclose(llr, llr_full,
+                                                    rtol=1e-4, atol=1e-3))
+
+        # Noiseless symbols are correctly demapped
+        d = Demapper("maxlog", constellation=c, hard_out=True)
+        self.assertTrue(np.array_equal(d(x, 0.01),
+                                       tf.cast(b, tf.float32)))
+
+        # Graph mode with XLA
+        @tf.function(jit_compile=True)
+        def run(y, no):
+            return d(y, no)
+        self.assertTrue(np.array_equal(run(y, no), d(y, no)))
+
 class TestDemapperWithPrior(unittest.TestCase):
     def test_assert_demapping_method(self):
         c = Constellation("qam", 6)
@@ -413,4 +413,60 @@ def test_logits_calc_jit(num_bits_per_symbol, num_streams, num_rx_ant, with_prio
         test_logits = call_sys_maxlog(  tf.cast(y, tf.complex128),
                                         tf.cast(h, tf.complex128),
                                         tf.cast(s, tf.complex128)).numpy()
-        assert np.allclose(test_logits, ref_maxlog, atol=1e-5)
\ No newline at end of file
+        assert np.allclose(test_logits, ref_maxlog, atol=1e-5)
+
+
+@pytest.mark.parametrize("output", ["bit", "symbol"])
+@pytest.mark.parametrize("hard_out", [False, True])
+@pytest.mark.parametrize("with_prior", [False, True])
+def test_sphere_decoding(output, hard_out, with_prior):
+    """
+    Test that sphere decoding produces the same outputs as the exhaustive
+    search for the "maxlog" demapping method
+    """
+    num_bits_per_symbol = 4
+    num_streams = 3
+    num_rx_ant = 4
+    batch_size = [16, 4]
+    num_points = 2**num_bits_per_symbol
+
+    def gaussian(shape):
+        return tf.complex(config.tf_rng.normal(shape, dtype=tf.float64),
+                          config.tf_rng.normal(shape, dtype=tf.float64))
+
+    y = gaussian(batch_size + [num_rx_ant])
+    h = gaussian(batch_size + [num_rx_ant, num_streams])
+    s = 0.1*tf.eye(num_rx_ant, dtype=tf.complex128)
+    if output == "bit":
+        prior = config.tf_rng.normal(batch_size +
+                                     [num_streams, num_bits_per_symbol],
+                                     dtype=tf.float64)
+    else:
+        prior = config.tf_rng.normal(batch_size + [num_streams, num_points],
+                                     dtype=tf.float64)
+    inputs = (y, h, s, prior) if with_prior else (y, h, s)
+
+    kwargs = {"output": output,
+              "demapping_method": "maxlog",
+              "num_streams": num_streams,
+              "constellation_type": "qam",
+              "num_bits_per_symbol": num_bits_per_symbol,
+              "hard_out": hard_out,
+              "precision": "double"}
+    ml = MaximumLikelihoodDetector(search="exhaustive", **kwargs)
+    sd = MaximumLikelihoodDetector(search="sphere", **kwargs)
+    ref = ml(*inputs).numpy()
+
+    @tf.function(jit_compile=True)
+    def sd_xla(*inputs):
+        return sd(*inputs)
+
+    for fun in [sd, sd_xla]:
+        out = fun(*inputs).numpy()
+        assert out.shape == ref.shape
+        assert np.allclose(out, ref, atol=1e-6)
+
+def test_sphere_decoding_app():
+    """Sphere decoding does not support the "app" demapping method"""
+    with pytest.raises(AssertionError):
+        MaximumLikelihoodDetector("bit", "app", 2, "qam", 4, search="sphere")
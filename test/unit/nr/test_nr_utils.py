@@ -296,6 +296,32 @@ class TestNRUtils(unittest.TestCase):
         s = generate_prng_seq(l, c_init+1)
         self.assertFalse(np.array_equal(s, s_ref))
 
+    def test_gen_rand_seq_lfsr(self):
+        """Test the vectorized random sequence generator against a bitwise
+        implementation of the LFSRs."""
+
+        def prng_seq_ref(length, c_init):
+            n_c = 1600
+            x1 = np.zeros(length + n_c + 31, int)
+            x2 = np.zeros(length + n_c + 31, int)
+            x1[0] = 1
+            x2[:31] = [(c_init >> i) & 1 for i in range(31)]
+            for idx in range(length + n_c):
+                x1[idx+31] = (x1[idx+3] + x1[idx]) % 2
+                x2[idx+31] = (x2[idx+3] + x2[idx+2] + x2[idx+1] + x2[idx]) % 2
+            return np.mod(x1[n_c:n_c+length] + x2[n_c:n_c+length], 2)
+
+        for length in [1, 31, 32, 100, 3000]:
+            for c_init in [0, 1, 2**31-1, 2**32-1, 1234567]:
+                s = generate_prng_seq(length, c_init)
+                self.assertTrue(np.array_equal(s, prng_seq_ref(length, c_init)))
+
+        # modifying the output does not alter the cached sequences
+        s = generate_prng_seq(100, 42)
+        s_ref = s.copy()
+        s[:] = 2
+        self.assertTrue(np.array_equal(generate_prng_seq(100, 42), s_ref))
+
 
     def test_tb_size(self):
         """Test TB size calculation"""
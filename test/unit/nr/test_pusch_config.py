@@ -226,3 +226,69 @@ class TestPUSCHDMRS(unittest.TestCase):
         for i in range(5):
             pusch_config.tpmi = i
             self.assertTrue(np.allclose(pusch_config.dmrs_grid_precoded/np.sqrt(3), ref[i]))
+
+    def test_derived_property_cache(self):
+        """Test that cached derived properties are updated when the
+           configuration or one of its sub-configurations changes
+        """
+        def new_config(**kwargs):
+            pusch_config = PUSCHConfig(**kwargs)
+            pusch_config.carrier.n_size_grid = 4
+            return pusch_config
+
+        pusch_config = new_config()
+        a = pusch_config.dmrs_grid
+        state = pusch_config._state()
+
+        # Modifying the returned value does not modify the cache
+        a[:] = 0
+        self.assertTrue(np.array_equal(pusch_config.dmrs_grid,
+                                       new_config().dmrs_grid))
+
+        # Setting parameters to their current values does not invalidate
+        # the cache
+        pusch_config.check_config()
+        self.assertEqual(pusch_config._state(), state)
+
+        # Changes of the configuration and its sub-configurations
+        pusch_config.num_layers = 2
+        pusch_config.num_antenna_ports = 2
+        pusch_config.carrier.n_cell_id = 5
+        pusch_config.dmrs.n_scid = 1
+        pusch_config.tb.mcs_index = 20
+        ref_config = new_config(num_layers=2, num_antenna_ports=2)
+        ref_config.carrier.n_cell_id = 5
+        ref_config.dmrs.n_scid = 1
+        ref_config.tb.mcs_index = 20
+        for name in ["dmrs_grid", "dmrs_mask", "l_bar", "num_coded_bits",
+                     "tb_size"]:
+            self.assertTrue(np.array_equal(getattr(pusch_config, name),
+                                           getattr(ref_config, name)))
+
+        # Mutable parameters modified in place and set again
+        pusch_config = new_config()
+        num_coded_bits = pusch_config.num_coded_bits
+        symbol_allocation = pusch_config.symbol_allocation
+        symbol_allocation[1] = 12
+        pusch_config.symbol_allocation = symbol_allocation
+        self.assertEqual(pusch_config.l_d, 12)
+        self.assertTrue(np.array_equal(pusch_config.dmrs_mask,
+                            new_config(symbol_allocation=[0, 12]).dmrs_mask))
+        self.assertLess(pusch_config.num_coded_bits, num_coded_bits)
+
+        pusch_config.dmrs.dmrs_port_set = [0]
+        a = pusch_config.dmrs_grid
+        dmrs_port_set = pusch_config.dmrs.dmrs_port_set
+        dmrs_port_set[0] = 2
+        pusch_config.dmrs.dmrs_port_set = dmrs_port_set
+        ref_config = new_config(symbol_allocation=[0, 12])
+        ref_config.dmrs.dmrs_port_set = [2]
+        self.assertFalse(np.array_equal(pusch_config.dmrs_grid, a))
+        self.assertTrue(np.array_equal(pusch_config.dmrs_grid,
+                                       ref_config.dmrs_grid))
+
+        # Sub-configurations shared by multiple configurations
+        pusch_config_2 = new_config(carrier_config=pusch_config.carrier)
+        a = pusch_config_2.dmrs_grid
+        pusch_config.carrier.slot_number = 3
+        self.assertFalse(np.array_equal(pusch_config_2.dmrs_grid, a))
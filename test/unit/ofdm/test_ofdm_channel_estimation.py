@@ -5,6 +5,7 @@ import unittest
 import numpy as np
 import tensorflow as tf
 import itertools
+from sionna.phy import config
 from sionna.phy.mimo import StreamManagement
 from sionna.phy.ofdm import ResourceGrid, ResourceGridMapper, LSChannelEstimator, PilotPattern, KroneckerPilotPattern, LMMSEInterpolator, tdl_freq_cov_mat, tdl_time_cov_mat
 from sionna.phy.channel.tr38901 import Antenna, AntennaArray, UMi, TDL
@@ -1011,4 +1012,86 @@ class TestLMMSEInterpolator(unittest.TestCase):
 
         # Test s but no spatial covariance matrix
         with self.assertRaises(AssertionError):
-            lmmse_inter_ft = LMMSEInterpolator(pilot_pattern, cov_mat_time, cov_mat_freq, order="f-t-s")
\ No newline at end of file
+            lmmse_inter_ft = LMMSEInterpolator(pilot_pattern, cov_mat_time, cov_mat_freq, order="f-t-s")
+
+    def test_shared_interpolation_matrices(self):
+        """Interpolation matrices shared across the batch, receivers, and
+        receive antennas, with and without cache, lead to the same outputs
+        as when computed for every batch example, receiver, and antenna"""
+
+        tdl_model = 'A'
+        subcarrier_spacing = 30e3 # Hz
+        delay_spread = 300e-9 # s
+        carrier_frequency = 3.5e9 # Hz
+        speed = 5. # m/s
+        los_angle_of_arrival=np.pi/4.
+        fft_size = 24
+        batch_size = 3
+        num_rx = 2
+        num_rx_ant = 4
+        num_tx = 2
+        num_streams_per_tx = 1
+        num_ofdm_symbols = 14
+        precision = "double"
+        rg = ResourceGrid(num_ofdm_symbols=num_ofdm_symbols,
+                  fft_size=fft_size,
+                  subcarrier_spacing=subcarrier_spacing,
+                  num_tx=num_tx,
+                  num_streams_per_tx=num_streams_per_tx,
+                  cyclic_prefix_length=0,
+                  pilot_pattern="kronecker",
+                  pilot_ofdm_symbol_indices=[2, 11],
+                  precision=precision)
+        pilot_pattern = rg.pilot_pattern
+        cov_mat_freq = tdl_freq_cov_mat(tdl_model, subcarrier_spacing, fft_size, delay_spread, precision)
+        cov_mat_time = tdl_time_cov_mat(tdl_model, speed, carrier_frequency, rg.ofdm_symbol_duration,
+                                        num_ofdm_symbols, los_angle_of_arrival, precision)
+        cov_mat_space = exp_corr_mat(0.9, num_rx_ant, precision=precision)
+
+        num_pilots = pilot_pattern.num_pilot_symbols
+        shape = [batch_size, num_rx, num_rx_ant, num_tx, num_streams_per_tx, num_pilots]
+        h_hat = tf.complex(config.tf_rng.normal(shape, dtype=tf.float64),
+                           config.tf_rng.normal(shape, dtype=tf.float64))
+        err_var = tf.fill([1, 1, 1, num_tx, num_streams_per_tx, num_pilots],
+                          tf.constant(0.1, tf.float64))
+        err_var_full = tf.broadcast_to(err_var, shape)
+
+        for order in ["f-t", "t-f", "t-s-f"]:
+            lmmse_inter = LMMSEInterpolator(pilot_pattern, cov_mat_time, cov_mat_freq,
+                                            cov_mat_space, order=order)
+            # Fine quantization of the error variances such that the
+            # cached matrices are close to the exact ones
+            lmmse_inter_cache = LMMSEInterpolator(pilot_pattern, cov_mat_time, cov_mat_freq,
+                                                  cov_mat_space, order=order, cache_size=2,
+                                                  cache_resolution_db=1e-6)
+            h_ref, err_var_ref = lmmse_inter(h_hat, err_var_full)
+            for interp, atol in [(lmmse_inter, self.ATOL_HIGH_PREC),
+                                 (tf.function(lmmse_inter), self.ATOL_HIGH_PREC),
+                                 (lmmse_inter_cache, self.ATOL_LOW_PREC),
+                                 (lmmse_inter_cache, self.ATOL_LOW_PREC)]:
+                h, e = interp(h_hat, err_var)
+                self.assertEqual(e.shape, err_var_ref.shape)
+                self.assertTrue(np.allclose(h, h_ref, atol=atol))
+                self.assertTrue(np.allclose(e, err_var_ref, atol=atol))
+
+            # Exactly one matrix was computed per interpolation step that
+            # received error variances shared across the batch, receivers,
+            # and receive antennas, as the second call reused it. Spatial
+            # filtering yields per-antenna error variances, such that the
+            # subsequent steps are not cached.
+            caches = []
+            shared = True
+            for o, interp in zip(order.split("-"),
+                                 lmmse_inter_cache._interpolators):
+                if o == "s":
+                    shared = False
+                    continue
+                self.assertEqual(len(interp._cache), 1 if shared else 0)
+                caches.append((interp._cache, dict(interp._cache)))
+
+            # Further calls reuse the cached matrices
+            lmmse_inter_cache(h_hat, err_var)
+            for cache, entries in caches:
+                self.assertEqual(cache.keys(), entries.keys())
+                for key, ext_mat in entries.items():
+                    self.assertIs(cache[key], ext_mat)
@@ -6,6 +6,7 @@
 import unittest
 import numpy as np
 import os
+import tempfile
 import tensorflow as tf
 
 from sionna.phy import config
@@ -235,6 +236,42 @@ class TestPHYAbstraction(unittest.TestCase):
                         delta=1
                     )
 
+    def test_interp_cache(self):
+        """
+        Validate that cached interpolated tables equal the freshly
+        interpolated ones
+        """
+        phy_abs_ref = PHYAbstraction()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # the first instance populates the cache
+            phy_abs = PHYAbstraction(cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            # the second instance loads the tables from the cache
+            phy_abs = PHYAbstraction(cache_dir=cache_dir)
+            self.assertTrue(np.array_equal(phy_abs.bler_table_interp,
+                                           phy_abs_ref.bler_table_interp))
+            self.assertTrue(np.array_equal(phy_abs.snr_table_interp,
+                                           phy_abs_ref.snr_table_interp,
+                                           equal_nan=True))
+
+            # the tables loaded from the cache can be first read in graph
+            # mode and then in eager mode
+            phy_abs_graph = PHYAbstraction(cache_dir=cache_dir)
+            snr_eff = tf.constant(10, phy_abs_graph.rdtype)
+            bler_graph = tf.function(phy_abs_graph.get_bler)(
+                10, 1, 0, 500, snr_eff)
+            bler_eager = phy_abs_graph.get_bler(10, 1, 0, 500, snr_eff)
+            self.assertEqual(bler_graph.numpy(), bler_eager.numpy())
+
+            # a different grid results in a new cache entry
+            phy_abs.bler_interp_delta = 0.02
+            phy_abs_ref.bler_interp_delta = 0.02
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+            self.assertTrue(np.array_equal(phy_abs.snr_table_interp,
+                                           phy_abs_ref.snr_table_interp,
+                                           equal_nan=True))
+
     def test_get_bler(self):
         """Test get_bler method"""
 
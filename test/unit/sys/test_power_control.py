@@ -190,3 +190,50 @@ class TestPowerControl(unittest.TestCase):
 
                         err_kkt_rel_mean = np.mean(np.abs(err_kkt_rel))
                         self.assertAlmostEqual(err_kkt_rel_mean, 0, delta=1e-2)
+
+    def test_downlink_fair_convergence(self):
+        """
+        Test that ~sionna.sys.downlink_fair_power_control satisfies the power
+        constraint and the KKT conditions after few iterations
+        """
+        precision = 'double'
+        batch_size = [4]
+        num_ut = 50
+
+        pathloss = db_to_lin(config.tf_rng.uniform(
+            batch_size + [num_ut], minval=70, maxval=140, dtype=tf.float64))
+        interference_plus_noise = db_to_lin(config.tf_rng.uniform(
+            batch_size + [num_ut], minval=-120, maxval=-115,
+            dtype=tf.float64))
+        num_resources = tf.cast(config.tf_rng.uniform(
+            batch_size + [num_ut], minval=1, maxval=5, dtype=tf.int32),
+            tf.float64)
+        max_power_bs = dbm_to_watt(56., precision=precision).numpy()
+        cq = (1 / (pathloss * interference_plus_noise)).numpy()
+
+        for fairness in [.5, 1., 3.]:
+            tx_power, _, mu_inv_star = downlink_fair_power_control(
+                pathloss,
+                interference_plus_noise,
+                num_resources,
+                bs_max_power_dbm=56.,
+                fairness=fairness,
+                guaranteed_power_ratio=0,
+                return_lagrangian=True,
+                precision=precision,
+                max_n_iter=15)
+
+            # Power constraint
+            err_constr = np.abs(np.sum(tx_power.numpy(), axis=-1)
+                                - max_power_bs)
+            self.assertLess(np.max(err_constr), 1e-4)
+
+            # KKT conditions for UTs with non-zero power
+            r = num_resources.numpy()
+            p = tx_power.numpy() / r
+            term = 1 + p * cq
+            term1 = np.power(r * np.log(term), fairness) * term
+            err_kkt = cq * mu_inv_star.numpy()[..., np.newaxis] - term1
+            ind = p > 1e-9
+            err_kkt_rel = np.abs(err_kkt[ind] / term1[ind])
+            self.assertLess(np.max(err_kkt_rel), 1e-6)
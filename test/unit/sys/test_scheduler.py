@@ -7,7 +7,7 @@ import numpy as np
 import tensorflow as tf
 from sionna.phy import config
 from sionna.phy.utils import insert_dims
-from sionna.sys import PFSchedulerSUMIMO
+from sionna.sys import PFSchedulerSUMIMO, scheduled_ut_to_mask
 from sys_utils import pf_scheduler_multislot, pf_scheduler_multislot_xla
 
 
@@ -108,3 +108,76 @@ class TestPFSchedulerSUMIMO(unittest.TestCase):
                 axis=1) - num_allocated_res.min(axis=1)) / num_allocated_res.sum(axis=1)
 
             self.assertTrue(np.all(unbalancedness < 1e-2))
+
+    def test_rbg_top_k(self):
+        """
+        Checks that, at the first slot, the users with highest achievable rate
+        summed over each RBG are scheduled, and that the returned indices are
+        consistent with the allocation mask
+        """
+        batch_size = [4]
+        num_ut = 6
+        num_freq_res = 11
+        num_ofdm_sym = 3
+        num_streams = 2
+        rbg_size = 4
+        num_rbg = 3
+
+        # [batch_size, num_ofdm_sym, num_freq_res, num_ut]
+        rate_achievable = config.tf_rng.uniform(
+            batch_size + [num_ofdm_sym, num_freq_res, num_ut],
+            minval=0, maxval=10, dtype=tf.float64)
+        rate_last_slot = tf.zeros(batch_size + [num_ut], tf.float64)
+
+        for per_slot in [False, True]:
+            for k in [1, 3]:
+                kwargs = {'batch_size': batch_size,
+                          'num_streams_per_ut': num_streams,
+                          'rbg_size': rbg_size,
+                          'per_slot': per_slot,
+                          'num_ut_per_rbg': k,
+                          'precision': 'double'}
+                pf_sched_ind = PFSchedulerSUMIMO(num_ut, num_freq_res,
+                                                 num_ofdm_sym,
+                                                 return_indices=True,
+                                                 **kwargs)
+                pf_sched = PFSchedulerSUMIMO(num_ut, num_freq_res,
+                                             num_ofdm_sym, **kwargs)
+                self.assertEqual(pf_sched.num_rbg, num_rbg)
+
+                scheduled_ut = pf_sched_ind(rate_last_slot,
+                                            rate_achievable).numpy()
+                is_scheduled = pf_sched(rate_last_slot, rate_achievable)
+                num_sched_sym = 1 if per_slot else num_ofdm_sym
+                self.assertEqual(list(scheduled_ut.shape),
+                                 batch_size + [num_sched_sym, num_rbg, k])
+                self.assertEqual(is_scheduled.shape,
+                                 batch_size + [num_ofdm_sym, num_freq_res,
+                                               num_ut, num_streams])
+
+                # Reference: achievable rate summed over each RBG
+                rate = rate_achievable.numpy()
+                rate = np.pad(rate, [[0, 0], [0, 0],
+                                     [0, num_rbg*rbg_size - num_freq_res],
+                                     [0, 0]])
+                rate = rate.reshape(batch_size + [num_ofdm_sym, num_rbg,
+                                                  rbg_size, num_ut]).sum(-2)
+                if per_slot:
+                    rate = rate.sum(-3, keepdims=True)
+                ref = np.argsort(-rate, axis=-1)[..., :k]
+                self.assertTrue(np.array_equal(scheduled_ut, ref))
+
+                # Mask is the expansion of the indices
+                mask = scheduled_ut_to_mask(scheduled_ut, num_ut,
+                                            num_freq_res, num_ofdm_sym,
+                                            rbg_size=rbg_size,
+                                            num_streams_per_ut=num_streams)
+                self.assertTrue(np.array_equal(mask.numpy(),
+                                               is_scheduled.numpy()))
+                # Exactly k users per resource
+                self.assertTrue(np.all(np.sum(is_scheduled.numpy()[..., 0],
+                                              axis=-1) == k))
+
+        with self.assertRaises(ValueError):
+            PFSchedulerSUMIMO(num_ut, num_freq_res, num_ofdm_sym,
+                              num_ut_per_rbg=num_ut + 1)
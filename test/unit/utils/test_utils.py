@@ -127,6 +127,148 @@ class TestUtils(unittest.TestCase):
                             batch_size=1)
             self.assertTrue(np.any(ber==0.5))
 
+    def test_ber_sim_device_loop(self):
+        """Test that the device loop yields the same statistics as the
+        Python loop"""
+
+        shape = [20, 50]
+
+        def _run_sim(batch_size, ebno_db):
+            # deterministic number of errors per batch depending on ebno_db
+            num_err = tf.cast(10 - ebno_db, tf.int32)
+            b = tf.zeros([batch_size, shape[1]])
+            b_hat = tf.range(batch_size*shape[1]) < num_err
+            b_hat = tf.reshape(tf.cast(b_hat, tf.float32), tf.shape(b))
+            return b, b_hat
+
+        ebno_dbs = np.arange(0, 11, 2)
+        for mode in [None, "graph", "xla"]:
+            for targets in [{}, {"num_target_bit_errors": 35},
+                            {"num_target_block_errors": 12}]:
+                ber_ref, bler_ref = sim_ber(_run_sim,
+                                            ebno_dbs,
+                                            batch_size=shape[0],
+                                            max_mc_iter=17,
+                                            graph_mode=mode,
+                                            verbose=False,
+                                            **targets)
+                for sync_interval in [None, 1, 5]:
+                    ber, bler = sim_ber(_run_sim,
+                                        ebno_dbs,
+                                        batch_size=shape[0],
+                                        max_mc_iter=17,
+                                        graph_mode=mode,
+                                        device_loop=True,
+                                        sync_interval=sync_interval,
+                                        verbose=False,
+                                        **targets)
+                    self.assertTrue(np.array_equal(ber_ref, ber))
+                    self.assertTrue(np.array_equal(bler_ref, bler))
+
+    def test_ber_sim_device_loop_callback(self):
+        """Test that the callback is called once per sync interval"""
+
+        mc_iters = []
+        def _callback(mc_iter, snr_idx, *args):
+            # pylint: disable=unused-argument
+            mc_iters.append(int(mc_iter))
+            return sim_ber.CALLBACK_CONTINUE
+
+        def _run_sim(batch_size, ebno_db):
+            # pylint: disable=unused-argument
+            b = tf.zeros([batch_size, 10])
+            return b, tf.ones_like(b)
+
+        sim_ber(_run_sim, [0.], batch_size=4, max_mc_iter=10,
+                device_loop=True, sync_interval=4, callback=_callback,
+                verbose=False)
+        self.assertEqual(mc_iters, [3, 7, 9])
+
+    def test_ber_sim_vectorize_snr(self):
+        """Test that the joint simulation of all SNR points yields the same
+        results as the sequential simulation"""
+
+        def _run_sim(batch_size, ebno_db):
+            # deterministic number of errors per example depending on ebno_db
+            num_err = tf.cast(10 - ebno_db, tf.int32)
+            b = tf.zeros([batch_size, 3, 100])
+            b_hat = tf.range(100)[tf.newaxis] < num_err[..., tf.newaxis]
+            b_hat = tf.cast(b_hat, tf.float32)[:, tf.newaxis]
+            return b, tf.broadcast_to(b_hat, tf.shape(b))
+
+        ebno_dbs = np.array([0., 2., 4., 8., 10., 6.])
+        for mode in [None, "graph", "xla"]:
+            for kwargs in [{"early_stop": False}, {"early_stop": True},
+                           {"num_target_block_errors": 50},
+                           {"target_ber": 0.05}]:
+                ber_ref, bler_ref = sim_ber(
+                                    lambda batch_size, ebno_db:
+                                        _run_sim(batch_size,
+                                                 tf.fill([batch_size], ebno_db)),
+                                    ebno_dbs,
+                                    batch_size=7,
+                                    max_mc_iter=5,
+                                    graph_mode=mode,
+                                    verbose=False,
+                                    **kwargs)
+                ber, bler = sim_ber(_run_sim,
+                                    ebno_dbs,
+                                    batch_size=7,
+                                    max_mc_iter=5,
+                                    graph_mode=mode,
+                                    vectorize_snr=True,
+                                    verbose=False,
+                                    **kwargs)
+                self.assertTrue(np.allclose(ber_ref, ber))
+                self.assertTrue(np.allclose(bler_ref, bler))
+
+    def test_ber_sim_vectorize_snr_awgn(self):
+        """Test joint simulation of all SNR points for an AWGN channel"""
+        channel = AWGN()
+
+        def _run_sim(batch_size, ebno_db):
+            no = 10**(-ebno_db/10)
+            b = tf.ones((batch_size, 100), tf.complex64)
+            y = channel(b, tf.cast(no, tf.float32)[:, tf.newaxis])
+            return tf.math.real(b), tf.math.real(y)
+
+        ebno_dbs = np.arange(-5, 3, 1)
+        ber_ref, _ = sim_ber(lambda batch_size, ebno_db:
+                                _run_sim(batch_size,
+                                         tf.fill([batch_size], ebno_db)),
+                             ebno_dbs,
+                             batch_size=1000,
+                             max_mc_iter=20,
+                             early_stop=False,
+                             soft_estimates=True,
+                             verbose=False)
+        ber, _ = sim_ber(_run_sim,
+                         ebno_dbs,
+                         batch_size=1000,
+                         max_mc_iter=20,
+                         early_stop=False,
+                         soft_estimates=True,
+                         vectorize_snr=True,
+                         verbose=False)
+        self.assertTrue(np.allclose(ber_ref, ber, rtol=0.05))
+
+    def test_ber_sim_device_loop_tracing(self):
+        """Test that repeated simulations reuse the traced device loop"""
+
+        num_traces = []
+        def _run_sim(batch_size, ebno_db):
+            # pylint: disable=unused-argument
+            # only executed while tracing
+            num_traces.append(1)
+            b = tf.zeros([batch_size, 10])
+            return b, tf.ones_like(b)
+
+        for max_mc_iter in [5, 5, 7]:
+            sim_ber(_run_sim, [0., 1.], batch_size=4, max_mc_iter=max_mc_iter,
+                    device_loop=True, sync_interval=2, early_stop=False,
+                    verbose=False)
+        self.assertEqual(len(num_traces), 1)
+
     def test_compute_ber(self):
         """Test that compute_ber returns the correct value."""
 